@@ -137,6 +137,8 @@ class CorrelationIdMiddleware(BaseHTTPMiddleware):
 
 class JWTReissueMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next):
+        from airflow.api_fastapi.execution_api.security import token_needs_refresh
+
         response: Response = await call_next(request)
 
         refreshed_token: str | None = None
@@ -154,11 +156,7 @@ class JWTReissueMiddleware(BaseHTTPMiddleware):
                     if claims.get("scope") == "workload":
                         return response
 
-                    now = int(time.time())
-                    token_lifetime = int(claims.get("exp", 0)) - int(claims.get("iat", 0))
-                    refresh_when_less_than = max(int(token_lifetime * 0.20), 30)
-                    valid_left = int(claims.get("exp", 0)) - now
-                    if valid_left <= refresh_when_less_than:
+                    if token_needs_refresh(claims, int(time.time())):
                         generator: JWTGenerator = await services.aget(JWTGenerator)
                         refreshed_token = generator.generate(claims)
             except Exception as err:
@@ -271,6 +271,37 @@ class TIHeartbeatInfo(StrictBaseModel):
     pid: int
 
 
+class TIBatchHeartbeatItem(TIHeartbeatInfo):
+    """Heartbeat of a single TaskInstance in a batch heartbeat."""
+
+    id: uuid.UUID
+    token: str
+    """The execution token of the TaskInstance, which authorizes its heartbeat."""
+
+
+class TIBatchHeartbeatPayload(StrictBaseModel):
+    """Schema for the TaskInstance batch heartbeat endpoint."""
+
+    heartbeats: list[TIBatchHeartbeatItem]
+
+
+class TIHeartbeatFailure(BaseModel):
+    """A heartbeat in a batch that was rejected, with the error the single heartbeat endpoint would return."""
+
+    id: uuid.UUID
+    status_code: int
+    detail: dict[str, Any]
+
+
+class TIBatchHeartbeatResponse(BaseModel):
+    """Response of the TaskInstance batch heartbeat endpoint."""
+
+    failures: list[TIHeartbeatFailure]
+    """Heartbeats that were not recorded. The TaskInstances of all others were updated."""
+    refreshed_tokens: dict[uuid.UUID, str] = {}
+    """Reissued execution tokens for the TaskInstances whose tokens are close to expiry."""
+
+
 # This model is not used in the API, but it is included in generated OpenAPI schema
 # for use in the client SDKs.
 class TaskInstance(BaseModel):
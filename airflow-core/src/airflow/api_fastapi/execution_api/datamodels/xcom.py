@@ -17,9 +17,9 @@
 
 from __future__ import annotations
 
-from pydantic import JsonValue, RootModel
+from pydantic import Field, JsonValue, RootModel
 
-from airflow.api_fastapi.core_api.base import BaseModel
+from airflow.api_fastapi.core_api.base import BaseModel, StrictBaseModel
 
 
 class XComResponse(BaseModel):
@@ -40,3 +40,32 @@ class XComSequenceSliceResponse(RootModel):
     """XCom schema with minimal structure for slice-based access."""
 
     root: list[JsonValue]
+
+
+class XComBatchRequest(StrictBaseModel):
+    """Schema for fetching the XComs of several tasks and map indexes in one request."""
+
+    key: str = Field(min_length=1)
+    task_ids: list[str] = Field(min_length=1)
+    map_indexes: list[int] | None = [-1]
+    """The map indexes to fetch, or *None* for all the map indexes of the tasks."""
+    include_prior_dates: bool = False
+
+
+class XComBatchItem(BaseModel):
+    """The XCom value of one task and map index in a batch response."""
+
+    task_id: str
+    map_index: int
+    value: JsonValue
+
+
+class XComBatchResponse(BaseModel):
+    """XCom values of several tasks and map indexes, fetched in one request."""
+
+    xcoms: list[XComBatchItem]
+    """
+    The values found, XComs that don't exist are left out.
+
+    When all the map indexes are requested, the values of each task are ordered by map index.
+    """
@@ -20,6 +20,7 @@ from __future__ import annotations
 import contextlib
 import itertools
 import json
+import time
 from collections import defaultdict
 from collections.abc import Callable, Iterator, Sequence
 from typing import TYPE_CHECKING, Annotated, Any, NoReturn, cast
@@ -28,7 +29,7 @@ from uuid import UUID
 import attrs
 import structlog
 from cadwyn import VersionedAPIRouter
-from fastapi import Body, HTTPException, Query, Response, Security, status
+from fastapi import Body, Depends, HTTPException, Query, Request, Response, Security, status
 from opentelemetry import trace
 from opentelemetry.trace import StatusCode
 from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
@@ -43,7 +44,7 @@ from structlog.contextvars import bind_contextvars
 from airflow._shared.observability.traces import override_ids
 from airflow._shared.state import TaskScope
 from airflow._shared.timezones import timezone
-from airflow.api_fastapi.auth.tokens import JWTGenerator
+from airflow.api_fastapi.auth.tokens import JWTGenerator, JWTValidator
 from airflow.api_fastapi.common.dagbag import DagBagDep, get_latest_version_of_dag
 from airflow.api_fastapi.common.db.common import SessionDep
 from airflow.api_fastapi.common.types import UtcDateTime
@@ -56,8 +57,12 @@ from airflow.api_fastapi.execution_api.datamodels.taskinstance import (
     TaskBreadcrumbsResponse,
     TaskStatesResponse,
     TIAwaitingInputStatePayload,
+    TIBatchHeartbeatItem,
+    TIBatchHeartbeatPayload,
+    TIBatchHeartbeatResponse,
     TIDeferredStatePayload,
     TIEnterRunningPayload,
+    TIHeartbeatFailure,
     TIHeartbeatInfo,
     TIRescheduleStatePayload,
     TIRetryStatePayload,
@@ -74,6 +79,7 @@ from airflow.api_fastapi.execution_api.security import (
     ExecutionAPIRoute,
     get_team_name_for_ti,
     require_auth,
+    token_needs_refresh,
 )
 from airflow.configuration import conf
 from airflow.exceptions import InvalidPartitionKeyError, TaskNotFound
@@ -106,6 +112,10 @@ ti_id_router = VersionedAPIRouter(
     ],
 )
 
+# Not behind ``require_auth``: each heartbeat of a batch is authorized by the execution token of its own
+# TaskInstance alone, see ``_authorize_batch_heartbeats``.
+batch_heartbeat_router = VersionedAPIRouter()
+
 
 log = structlog.get_logger(__name__)
 tracer = trace.get_tracer(__name__)
@@ -865,13 +875,11 @@ def ti_skip_downstream(
     log.info("Downstream tasks skipped", tasks_skipped=getattr(result, "rowcount", 0))
 
 
-def _raise_ti_not_in_live_table(task_instance_id: UUID, session: SessionDep) -> NoReturn:
-    """Raise 410 Gone if the missing TI id was archived to history, else 404 Not Found."""
-    if session.scalar(
-        select(func.count(TIH.task_instance_id)).where(TIH.task_instance_id == task_instance_id)
-    ):
+def _ti_not_in_live_table_error(task_instance_id: UUID, *, archived: bool) -> HTTPException:
+    """Return 410 Gone if the missing TI id was archived to history, else 404 Not Found."""
+    if archived:
         log.error("TaskInstance not in live table but archived in history", ti_id=str(task_instance_id))
-        raise HTTPException(
+        return HTTPException(
             status_code=status.HTTP_410_GONE,
             detail={
                 "reason": "not_found",
@@ -879,7 +887,7 @@ def _raise_ti_not_in_live_table(task_instance_id: UUID, session: SessionDep) ->
             },
         )
     log.error("Task Instance not found", ti_id=str(task_instance_id))
-    raise HTTPException(
+    return HTTPException(
         status_code=status.HTTP_404_NOT_FOUND,
         detail={
             "reason": "not_found",
@@ -888,6 +896,51 @@ def _raise_ti_not_in_live_table(task_instance_id: UUID, session: SessionDep) ->
     )
 
 
+def _raise_ti_not_in_live_table(task_instance_id: UUID, session: SessionDep) -> NoReturn:
+    """Raise 410 Gone if the missing TI id was archived to history, else 404 Not Found."""
+    archived = bool(
+        session.scalar(
+            select(func.count(TIH.task_instance_id)).where(TIH.task_instance_id == task_instance_id)
+        )
+    )
+    raise _ti_not_in_live_table_error(task_instance_id, archived=archived)
+
+
+def _heartbeat_conflict_error(
+    previous_state: str | None, hostname: str | None, pid: int | None, ti_payload: TIHeartbeatInfo
+) -> HTTPException | None:
+    """Return the 409 Conflict for a heartbeat from a TI that should be terminated, if any."""
+    if hostname != ti_payload.hostname or pid != ti_payload.pid:
+        log.warning(
+            "Task running elsewhere",
+            current_hostname=hostname,
+            current_pid=pid,
+            requested_hostname=ti_payload.hostname,
+            requested_pid=ti_payload.pid,
+        )
+        return HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail={
+                "reason": "running_elsewhere",
+                "message": "TI is already running elsewhere",
+                "current_hostname": hostname,
+                "current_pid": pid,
+            },
+        )
+
+    if previous_state != TaskInstanceState.RUNNING:
+        log.warning("Task not in running state", current_state=previous_state)
+        return HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail={
+                "reason": "not_running",
+                "message": "TI is no longer in the running state and task should terminate",
+                "current_state": previous_state,
+            },
+        )
+    return None
+
+
 @ti_id_router.put(
     "/{task_instance_id}/heartbeat",
     status_code=status.HTTP_204_NO_CONTENT,
@@ -950,40 +1003,139 @@ def ti_heartbeat(
         # instead of 404 Not Found to give the client a more specific signal.
         _raise_ti_not_in_live_table(task_instance_id, session)
 
-    if hostname != ti_payload.hostname or pid != ti_payload.pid:
-        log.warning(
-            "Task running elsewhere",
-            current_hostname=hostname,
-            current_pid=pid,
-            requested_hostname=ti_payload.hostname,
-            requested_pid=ti_payload.pid,
-        )
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail={
-                "reason": "running_elsewhere",
-                "message": "TI is already running elsewhere",
-                "current_hostname": hostname,
-                "current_pid": pid,
-            },
-        )
-
-    if previous_state != TaskInstanceState.RUNNING:
-        log.warning("Task not in running state", current_state=previous_state)
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail={
-                "reason": "not_running",
-                "message": "TI is no longer in the running state and task should terminate",
-                "current_state": previous_state,
-            },
-        )
+    if conflict := _heartbeat_conflict_error(previous_state, hostname, pid, ti_payload):
+        raise conflict
 
     # Update the last heartbeat time!
     session.execute(update(TI).where(TI.id == task_instance_id).values(last_heartbeat_at=timezone.utcnow()))
     log.debug("Heartbeat updated", state=previous_state)
 
 
+@attrs.define
+class _AuthorizedHeartbeats:
+    """The heartbeats of a batch whose tokens were valid, and the failures of those whose were not."""
+
+    heartbeats: dict[UUID, TIBatchHeartbeatItem] = attrs.field(factory=dict)
+    failures: list[TIHeartbeatFailure] = attrs.field(factory=list)
+    refreshed_tokens: dict[UUID, str] = attrs.field(factory=dict)
+
+
+async def _authorize_batch_heartbeats(
+    request: Request, payload: TIBatchHeartbeatPayload, services=DepContainer
+) -> _AuthorizedHeartbeats:
+    """
+    Validate the execution token carried by each heartbeat of a batch.
+
+    The batch endpoint takes no token of its own, so each heartbeat proves that it comes from the
+    TaskInstance it is for, just as ``ti:self`` does for the single heartbeat endpoint. A heartbeat whose
+    token is invalid is rejected without affecting the others. Tokens close to expiry are reissued, as
+    ``JWTReissueMiddleware`` does for the token of a request.
+    """
+    # Validate the tokens once per request, not again when Cadwyn replays the dependencies.
+    if cached := request.scope.get("authorized_heartbeats"):
+        return cached
+
+    validator: JWTValidator = await services.aget(JWTValidator)
+    generator: JWTGenerator | None = None
+    now = int(time.time())
+    authorized = _AuthorizedHeartbeats()
+    for heartbeat in payload.heartbeats:
+        try:
+            claims = await validator.avalidated_claims(heartbeat.token, {"sub": str(heartbeat.id)})
+        except Exception:
+            log.warning("Invalid token for TaskInstance heartbeat", ti_id=str(heartbeat.id), exc_info=True)
+            claims = None
+        if claims is None or claims.setdefault("scope", "execution") != "execution":
+            authorized.failures.append(
+                TIHeartbeatFailure(
+                    id=heartbeat.id,
+                    status_code=status.HTTP_403_FORBIDDEN,
+                    detail={"reason": "invalid_token", "message": "Invalid auth token for Task Instance"},
+                )
+            )
+            continue
+        authorized.heartbeats[heartbeat.id] = heartbeat
+        if token_needs_refresh(claims, now):
+            generator = generator or await services.aget(JWTGenerator)
+            authorized.refreshed_tokens[heartbeat.id] = generator.generate(claims)
+    request.scope["authorized_heartbeats"] = authorized
+    return authorized
+
+
+@batch_heartbeat_router.put(
+    "/heartbeats",
+    status_code=status.HTTP_200_OK,
+    responses=create_openapi_http_exception_doc(
+        [(HTTP_422_UNPROCESSABLE_CONTENT, "Invalid payload for the batch heartbeat")]
+    ),
+)
+def ti_batch_heartbeat(
+    authorized: Annotated[_AuthorizedHeartbeats, Depends(_authorize_batch_heartbeats)],
+    session: SessionDep,
+) -> TIBatchHeartbeatResponse:
+    """
+    Update the heartbeats of many TaskInstances at once.
+
+    Each heartbeat carries the execution token of its TaskInstance. Heartbeats of TaskInstances still
+    running on the same host and pid are recorded with a single UPDATE; the others are reported back
+    with the status code and detail the single heartbeat endpoint would have returned for them.
+    """
+    heartbeats = authorized.heartbeats
+    response = TIBatchHeartbeatResponse(
+        failures=authorized.failures, refreshed_tokens=authorized.refreshed_tokens
+    )
+    if not heartbeats:
+        return response
+
+    result = cast(
+        "CursorResult[Any]",
+        session.execute(
+            update(TI)
+            .where(
+                TI.state == TaskInstanceState.RUNNING,
+                tuple_(TI.id, TI.hostname, TI.pid).in_(
+                    [(ti_id, hb.hostname, hb.pid) for ti_id, hb in heartbeats.items()]
+                ),
+            )
+            .values(last_heartbeat_at=timezone.utcnow())
+            .execution_options(synchronize_session=False)
+        ),
+    )
+    log.debug("Batch heartbeat updated", requested=len(heartbeats), updated=result.rowcount)
+    if result.rowcount is not None and result.rowcount >= len(heartbeats):
+        return response
+
+    # Some heartbeats missed: look up the current state of the TIs to tell which, and why.
+    current = {
+        ti_id: (state, hostname, pid)
+        for ti_id, state, hostname, pid in session.execute(
+            select(TI.id, TI.state, TI.hostname, TI.pid).where(TI.id.in_(heartbeats))
+        )
+    }
+    missing = heartbeats.keys() - current.keys()
+    archived = (
+        set(session.scalars(select(TIH.task_instance_id).where(TIH.task_instance_id.in_(missing)).distinct()))
+        if missing
+        else set()
+    )
+    for ti_id, heartbeat in heartbeats.items():
+        error: HTTPException | None
+        if ti_id in missing:
+            error = _ti_not_in_live_table_error(ti_id, archived=ti_id in archived)
+        else:
+            # A TI that matches now was either updated above or started running right after; either way
+            # its next heartbeat is the one that counts.
+            error = _heartbeat_conflict_error(*current[ti_id], heartbeat)
+        if error:
+            response.failures.append(
+                TIHeartbeatFailure(
+                    id=ti_id, status_code=error.status_code, detail=cast("dict[str, Any]", error.detail)
+                )
+            )
+            response.refreshed_tokens.pop(ti_id, None)
+    return response
+
+
 @ti_id_router.put(
     "/{task_instance_id}/rtif",
     status_code=status.HTTP_201_CREATED,
@@ -18,7 +18,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 from fastapi import APIRouter, Body, Depends, HTTPException, Path, Query, Request, Response, status
 from pydantic import JsonValue
@@ -28,6 +28,9 @@ from sqlalchemy.sql.selectable import Select
 from airflow.api_fastapi.common.db.common import SessionDep
 from airflow.api_fastapi.core_api.base import BaseModel
 from airflow.api_fastapi.execution_api.datamodels.xcom import (
+    XComBatchItem,
+    XComBatchRequest,
+    XComBatchResponse,
     XComResponse,
     XComSequenceIndexResponse,
     XComSequenceSliceResponse,
@@ -37,6 +40,11 @@ from airflow.models.taskmap import TaskMap
 from airflow.models.xcom import XComModel
 from airflow.utils.db import get_query_count
 
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
+    from airflow.api_fastapi.execution_api.datamodels.token import TIToken
+
 
 def has_xcom_access(
     dag_id: str,
@@ -65,8 +73,6 @@ def has_xcom_access(
     API only; it does not constrain code paths with direct database access (e.g.
     the Dag File Processor or Triggerer).
     """
-    from airflow.configuration import conf
-
     write = request.method not in {"GET", "HEAD", "OPTIONS"}
 
     log.debug(
@@ -76,6 +82,17 @@ def has_xcom_access(
         xcom_key,
         dag_id,
     )
+    return _check_team_access(dag_id, write=write, session=session, token=token)
+
+
+def has_dag_xcom_read_access(dag_id: str, session: SessionDep, token=CurrentTIToken) -> bool:
+    """Check whether the requesting task may read the XComs of ``dag_id``, see :func:`has_xcom_access`."""
+    log.debug("Checking read XCom access for task instance '%s' on dag '%s'", token.id, dag_id)
+    return _check_team_access(dag_id, write=False, session=session, token=token)
+
+
+def _check_team_access(dag_id: str, *, write: bool, session: Session, token: TIToken) -> bool:
+    from airflow.configuration import conf
 
     if not conf.getboolean("core", "multi_team"):
         return True
@@ -113,6 +130,15 @@ router = APIRouter(
     dependencies=[Depends(has_xcom_access)],
 )
 
+# Routes that read the XComs of many tasks at once, and so can't use the per-XCom access check of ``router``
+batch_router = APIRouter(
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {"description": "Unauthorized"},
+        status.HTTP_403_FORBIDDEN: {"description": "Task does not have access to the XComs"},
+    },
+    dependencies=[Depends(has_dag_xcom_read_access)],
+)
+
 log = logging.getLogger(__name__)
 
 
@@ -260,6 +286,47 @@ def get_mapped_xcom_by_slice(
     return XComSequenceSliceResponse(values)
 
 
+@batch_router.post(
+    "/{dag_id}/{run_id}",
+    description="Get the XCom values of every combination of the given tasks and map indexes in one request",
+)
+def get_xcom_batch(
+    dag_id: str,
+    run_id: str,
+    body: XComBatchRequest,
+    session: SessionDep,
+) -> XComBatchResponse:
+    query = XComModel.get_many(
+        run_id=run_id,
+        key=body.key,
+        task_ids=body.task_ids,
+        dag_ids=dag_id,
+        map_indexes=body.map_indexes,
+        include_prior_dates=body.include_prior_dates,
+    )
+    query = query.with_only_columns(XComModel.task_id, XComModel.map_index, XComModel.value)
+
+    if body.map_indexes is None:
+        # Like ``get_mapped_xcom_by_slice`` without bounds, return every match ordered by map index
+        query = query.order_by(None).order_by(XComModel.task_id, XComModel.map_index.asc())
+        return XComBatchResponse(
+            xcoms=[
+                XComBatchItem(task_id=row.task_id, map_index=row.map_index, value=row.value)
+                for row in session.execute(query)
+            ]
+        )
+
+    # Like ``get_xcom``, keep the first match of each task and map index, which is the latest one when prior
+    # dates are included
+    xcoms: dict[tuple[str, int], XComBatchItem] = {}
+    for row in session.execute(query):
+        if (row.task_id, row.map_index) not in xcoms:
+            xcoms[row.task_id, row.map_index] = XComBatchItem(
+                task_id=row.task_id, map_index=row.map_index, value=row.value
+            )
+    return XComBatchResponse(xcoms=list(xcoms.values()))
+
+
 @router.head(
     "/{dag_id}/{run_id}/{task_id}/{key:path}",
     responses={
@@ -143,6 +143,14 @@ class JWTBearer(HTTPBearer):
 _jwt_bearer = JWTBearer()
 
 
+def token_needs_refresh(claims: dict[str, Any], now: int) -> bool:
+    """Whether a token is in the last fifth of its lifetime (and at least 30s from expiry) and should be reissued."""
+    token_lifetime = int(claims.get("exp", 0)) - int(claims.get("iat", 0))
+    refresh_when_less_than = max(int(token_lifetime * 0.20), 30)
+    valid_left = int(claims.get("exp", 0)) - now
+    return valid_left <= refresh_when_less_than
+
+
 async def require_auth(
     security_scopes: SecurityScopes,
     request: Request,
@@ -51,9 +51,14 @@ from airflow.api_fastapi.execution_api.versions.v2026_06_30 import (
     AddTeamNameField,
     AddVariableKeysEndpoint,
 )
+from airflow.api_fastapi.execution_api.versions.v2026_10_18 import (
+    AddBatchHeartbeatEndpoint,
+    AddXComBatchEndpoint,
+)
 
 bundle = VersionBundle(
     HeadVersion(),
+    Version("2026-10-18", AddBatchHeartbeatEndpoint, AddXComBatchEndpoint),
     Version(
         "2026-06-30",
         AddVariableKeysEndpoint,
@@ -266,6 +266,7 @@ class AirflowConfigParser(_SharedAirflowConfigParser):
     enums_options = {
         ("core", "default_task_weight_rule"): sorted(WeightRule.all_weight_rules()),
         ("core", "dag_ignore_file_syntax"): ["regexp", "glob"],
+        ("core", "serialized_dag_storage_format"): ["json", "msgpack"],
         ("dag_processor", "file_parsing_sort_mode"): [
             "modified_time",
             "random_seeded_by_host",
@@ -35,6 +35,7 @@ from sqlalchemy import delete, false, func, insert, select, tuple_, update
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import joinedload, load_only
 
+from airflow._shared.observability.metrics import stats
 from airflow._shared.timezones.timezone import utcnow
 from airflow.assets.manager import asset_manager
 from airflow.configuration import conf
@@ -269,11 +270,14 @@ def _serialize_dag_capturing_errors(
     bundle_version: str | None,
     version_data: dict | None = None,
     _prefetched: DagWriteMetadata | None = None,
+    write: bool = True,
 ):
     """
     Try to serialize the dag to the DB, but make a note of any errors.
 
     We can't place them directly in import_errors, as this may be retried, and work the next time
+
+    :param write: Whether to write the serialized DAG. DAG permissions are synced either way.
     """
     from airflow.models.dagcode import DagCode
 
@@ -283,19 +287,20 @@ def _serialize_dag_capturing_errors(
     )
 
     try:
-        # We can't use bulk_write_to_db as we want to capture each error individually
-        dag_was_updated = SerializedDagModel.write_dag(
-            dag,
-            bundle_name=bundle_name,
-            bundle_version=bundle_version,
-            version_data=version_data,
-            min_update_interval=MIN_SERIALIZED_DAG_UPDATE_INTERVAL,
-            session=session,
-            _prefetched=_prefetched,
-        )
-        if not dag_was_updated:
-            # Check and update DagCode
-            DagCode.update_source_code(dag.dag_id, dag.fileloc, session=session)
+        if write:
+            # We can't use bulk_write_to_db as we want to capture each error individually
+            dag_was_updated = SerializedDagModel.write_dag(
+                dag,
+                bundle_name=bundle_name,
+                bundle_version=bundle_version,
+                version_data=version_data,
+                min_update_interval=MIN_SERIALIZED_DAG_UPDATE_INTERVAL,
+                session=session,
+                _prefetched=_prefetched,
+            )
+            if not dag_was_updated:
+                # Check and update DagCode
+                DagCode.update_source_code(dag.dag_id, dag.fileloc, session=session)
         if "FabAuthManager" in conf.get("core", "auth_manager"):
             _sync_dag_perms(dag, session=session)
 
@@ -478,6 +483,38 @@ def _update_import_errors(
         )
 
 
+def _skip_unchanged_dags(
+    dags: Collection[LazyDeserializedDAG],
+    prefetched_metadata: dict[str, DagWriteMetadata],
+    bundle_name: str,
+    bundle_version: str | None,
+    version_data: dict | None,
+) -> list[LazyDeserializedDAG]:
+    """
+    Return the DAGs that still need to go through ``SerializedDagModel.write_dag``.
+
+    Only called when the DAG file is unchanged since its DAGs were last written, so their code is up to
+    date. A DAG whose latest serialized version also has the same hash and bundle version would be left
+    as it is by ``write_dag``, so it is skipped. Its permissions are still synced by the caller.
+    """
+    dags_to_write = []
+    for dag in dags:
+        metadata = prefetched_metadata.get(dag.dag_id)
+        if (
+            metadata is None
+            or dag.dag_hash is None
+            or metadata.dag_hash != dag.dag_hash
+            or metadata.dag_version is None
+            or metadata.dag_version.bundle_name != bundle_name
+            or metadata.dag_version.bundle_version != bundle_version
+            or metadata.dag_version.version_data != version_data
+        ):
+            dags_to_write.append(dag)
+    if skipped := len(dags) - len(dags_to_write):
+        stats.incr("dag_processing.unchanged_dag_writes_skipped", skipped, tags={"bundle_name": bundle_name})
+    return dags_to_write
+
+
 def update_dag_parsing_results_in_db(
     bundle_name: str,
     bundle_version: str | None,
@@ -494,6 +531,7 @@ def update_dag_parsing_results_in_db(
         DagWarningType.RUNTIME_VARYING_VALUE,
     ),
     files_parsed: set[tuple[str, str]] | None = None,
+    dags_unchanged: bool = False,
 ):
     """
     Update everything to do with DAG parsing in the DB.
@@ -515,6 +553,8 @@ def update_dag_parsing_results_in_db(
     :param files_parsed: Set of (bundle_name, relative_fileloc) tuples for all files that were parsed.
         If None, will be inferred from dags and import_errors. Passing this explicitly ensures that
         import errors are cleared for files that were parsed but no longer contain DAGs.
+    :param dags_unchanged: Whether the DAG processor found the file and its DAGs unchanged since they were
+        last written. DAGs whose latest serialized version matches are then not written again.
     """
     # Retry 'DAG.bulk_write_to_db' & 'SerializedDagModel.bulk_sync_to_db' in case
     # of any Operational Errors
@@ -546,6 +586,14 @@ def update_dag_parsing_results_in_db(
                 prefetched_metadata = SerializedDagModel._prefetch_dag_write_metadata(
                     [dag.dag_id for dag in dags], session=session
                 )
+                dag_ids_to_write = {dag.dag_id for dag in dags}
+                if dags_unchanged:
+                    dag_ids_to_write = {
+                        dag.dag_id
+                        for dag in _skip_unchanged_dags(
+                            dags, prefetched_metadata, bundle_name, bundle_version, version_data
+                        )
+                    }
                 # Write Serialized DAGs to DB, capturing errors
                 for dag in dags:
                     serialize_errors.extend(
@@ -556,6 +604,7 @@ def update_dag_parsing_results_in_db(
                             version_data=version_data,
                             session=session,
                             _prefetched=prefetched_metadata.get(dag.dag_id),
+                            write=dag.dag_id in dag_ids_to_write,
                         )
                     )
             except OperationalError:
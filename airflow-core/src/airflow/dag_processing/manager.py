@@ -21,6 +21,7 @@ from __future__ import annotations
 
 import functools
 import gc
+import importlib
 import inspect
 import logging
 import os
@@ -35,7 +36,7 @@ from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from operator import attrgetter, itemgetter
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Literal, NamedTuple, cast
+from typing import TYPE_CHECKING, Any, BinaryIO, Literal, NamedTuple, cast
 
 import attrs
 import structlog
@@ -55,7 +56,11 @@ from airflow.dag_processing.bundles.base import (
 )
 from airflow.dag_processing.bundles.manager import DagBundlesManager
 from airflow.dag_processing.collection import update_dag_parsing_results_in_db
-from airflow.dag_processing.processor import DagFileParsingResult, DagFileProcessorProcess
+from airflow.dag_processing.processor import (
+    DagFileParsingResult,
+    DagFileProcessorProcess,
+    ParserWorkerLogFile,
+)
 from airflow.exceptions import AirflowException
 from airflow.models.asset import remove_references_to_deleted_dags
 from airflow.models.dag import DagModel
@@ -66,6 +71,7 @@ from airflow.models.db_callback_request import DbCallbackRequest
 from airflow.models.errors import ParseImportError
 from airflow.observability.metrics import stats_utils
 from airflow.sdk import SecretCache
+from airflow.sdk.execution_time import supervisor
 from airflow.sdk.log import init_log_file, logging_processors
 from airflow.typing_compat import assert_never
 from airflow.utils.file import list_py_file_paths, might_contain_dag
@@ -131,6 +137,8 @@ class DagFileStat:
     last_duration: float | None = None
     run_count: int = 0
     last_num_of_db_queries: int = 0
+    unchanged_runs: int = 0
+    """Number of parses in a row that left the parsing result of the file unchanged"""
 
 
 @dataclass(frozen=True)
@@ -244,6 +252,9 @@ class DagFileProcessorManager(LoggingMixin):
     _file_process_interval: float = attrs.field(
         factory=_config_int_factory("dag_processor", "min_file_process_interval")
     )
+    _max_file_process_interval: float = attrs.field(
+        factory=_config_int_factory("dag_processor", "max_file_process_interval")
+    )
     stale_dag_threshold: float = attrs.field(
         factory=_config_int_factory("dag_processor", "stale_dag_threshold")
     )
@@ -271,6 +282,19 @@ class DagFileProcessorManager(LoggingMixin):
 
     _processors: dict[DagFileInfo, DagFileProcessorProcess] = attrs.field(factory=dict, init=False)
 
+    _parser_worker_max_files: int = attrs.field(
+        factory=_config_int_factory("dag_processor", "parsing_worker_max_files")
+    )
+    """Number of files a parser worker parses before it exits. 0 forks a new process for every file."""
+    _parser_worker_max_memory_growth: int = attrs.field(
+        factory=_config_int_factory("dag_processor", "parsing_worker_max_memory_growth")
+    )
+    """Growth of resident memory, in MiB, after which a parser worker exits. 0 means no limit."""
+    _idle_parser_workers: list[DagFileProcessorProcess] = attrs.field(factory=list, init=False)
+    """Parser workers waiting for their next file"""
+    _stopping_parser_workers: list[DagFileProcessorProcess] = attrs.field(factory=list, init=False)
+    """Parser workers told to exit, kept until their output is read and they can be closed"""
+
     _parsing_start_time: float | None = attrs.field(default=None, init=False)
     _num_run: int = attrs.field(default=0, init=False)
 
@@ -302,6 +326,24 @@ class DagFileProcessorManager(LoggingMixin):
     _api_server: InProcessExecutionAPI = attrs.field(init=False, factory=_make_execution_api)
     """API server to interact with Metadata DB"""
 
+    _parsing_preload_modules: str = attrs.field(
+        factory=_config_get_factory("dag_processor", "parsing_preload_modules")
+    )
+
+    _skip_unchanged_dag_writes: bool = attrs.field(
+        factory=_config_bool_factory("dag_processor", "skip_unchanged_dag_writes")
+    )
+    _persisted_fingerprints: dict[tuple[str, Path], tuple[str | None, str]] = attrs.field(
+        factory=dict, init=False
+    )
+    """Bundle version and parsing result fingerprint of the last result persisted for each file"""
+    _file_imports: dict[tuple[str, Path], frozenset[Path]] = attrs.field(factory=dict, init=False)
+    """Bundle modules each file imported when it was last parsed"""
+    _module_dependents: dict[Path, set[tuple[str, Path]]] = attrs.field(
+        factory=lambda: defaultdict(set), init=False
+    )
+    """Reverse of ``_file_imports``: the files that import each bundle module"""
+
     def register_exit_signals(self):
         """Register signals that stop child processes."""
         signal.signal(signal.SIGINT, self._exit_gracefully)
@@ -370,6 +412,7 @@ class DagFileProcessorManager(LoggingMixin):
         self.log.info("Process each file at most once every %s seconds", self._file_process_interval)
         self.prepare_bundles()
         self._symlink_latest_log_directory()
+        self.preload_parsing_modules()
         # To prevent COW in forked process parsing dag file
         gc.freeze()
 
@@ -404,6 +447,30 @@ class DagFileProcessorManager(LoggingMixin):
             export_legacy_names=conf.getboolean("metrics", "legacy_names_on"),
         )
 
+    def preload_parsing_modules(self) -> None:
+        """
+        Import ``[dag_processor] parsing_preload_modules`` once, before any DAG file processor is forked.
+
+        The processors are forked from this process, so they inherit the modules, copy-on-write, instead
+        of each importing them again. Processors started in a fresh interpreter (see
+        ``supervisor._should_use_exec``) would not benefit, so nothing is imported then.
+        """
+        modules = [module.strip() for module in self._parsing_preload_modules.split(",") if module.strip()]
+        if not modules:
+            return
+        if supervisor._should_use_exec():
+            self.log.info("Not preloading modules, as DAG file processors do not fork from this process")
+            return
+        with stats.timer("dag_processing.preload_modules_duration") as timer:
+            for module in modules:
+                try:
+                    importlib.import_module(module)
+                except Exception:
+                    self.log.exception("Failed to preload module %s for the DAG file processors", module)
+        self.log.info(
+            "Preloaded %d module(s) for the DAG file processors in %.2f ms", len(modules), timer.duration
+        )
+
     def prepare_bundles(self) -> None:
         """Sync bundle configuration to the DB and load bundles for parsing."""
         self.sync_bundles()
@@ -1196,6 +1263,10 @@ class DagFileProcessorManager(LoggingMixin):
         stats_to_remove = {file for file in self._file_stats if file.presence_key not in present_keys}
         for file in stats_to_remove:
             del self._file_stats[file]
+        for key in self._persisted_fingerprints.keys() - present_keys:
+            del self._persisted_fingerprints[key]
+        for key in self._file_imports.keys() - present_keys:
+            self._record_file_imports(key, frozenset())
 
     def terminate_orphan_processes(self, present: set[DagFileInfo]):
         """Stop processors that are working on deleted files."""
@@ -1268,18 +1339,36 @@ class DagFileProcessorManager(LoggingMixin):
             team_name=team_name,
         )
 
+        if is_callback_only:
+            next_stat.unchanged_runs = self._file_stats[file].unchanged_runs
+
         if proc.parsing_result is not None:
+            if proc.parsing_result.imported_modules is not None and file.bundle_path is not None:
+                self._record_file_imports(
+                    file.presence_key,
+                    frozenset(file.bundle_path / module for module in proc.parsing_result.imported_modules),
+                )
+            bundle_version = self._bundle_versions[file.bundle_name]
+            fingerprint = proc.parsing_result.fingerprint
+            result_unchanged = fingerprint is not None and self._persisted_fingerprints.get(
+                file.presence_key
+            ) == (bundle_version, fingerprint)
+            if result_unchanged:
+                next_stat.unchanged_runs = self._file_stats[file].unchanged_runs + 1
+            dags_unchanged = self._skip_unchanged_dag_writes and result_unchanged
             try:
                 self.persist_parsing_result(
                     bundle_name=file.bundle_name,
-                    bundle_version=self._bundle_versions[file.bundle_name],
+                    bundle_version=bundle_version,
                     version_data=self._bundle_version_data.get(file.bundle_name),
                     parsing_result=proc.parsing_result,
                     run_duration=run_duration,
                     relative_fileloc=str(file.rel_path),
                     session=session,
+                    dags_unchanged=dags_unchanged,
                 )
             except Exception:
+                self._persisted_fingerprints.pop(file.presence_key, None)
                 self.log.exception(
                     "Failed to persist parsing result for %s in bundle %s; "
                     "keeping previous persisted stats while throttling retries. "
@@ -1297,6 +1386,8 @@ class DagFileProcessorManager(LoggingMixin):
                     last_num_of_db_queries=current_stat.last_num_of_db_queries,
                 )
                 return
+            if fingerprint is not None:
+                self._persisted_fingerprints[file.presence_key] = (bundle_version, fingerprint)
 
         self._file_stats[file] = next_stat
 
@@ -1310,8 +1401,14 @@ class DagFileProcessorManager(LoggingMixin):
         run_duration: float,
         relative_fileloc: str | None,
         session: Session,
+        dags_unchanged: bool = False,
     ) -> None:
-        """Persist parsed DAG data to the metadata database."""
+        """
+        Persist parsed DAG data to the metadata database.
+
+        ``dags_unchanged`` is set when the fingerprint of the result matches the last one persisted for the
+        file, in which case the serialized DAGs do not need writing again.
+        """
         import_errors: dict[tuple[str, str], str] = {}
         if parsing_result.import_errors:
             import_errors = {
@@ -1339,6 +1436,7 @@ class DagFileProcessorManager(LoggingMixin):
             warnings=set(warnings),
             session=session,
             files_parsed=files_parsed,
+            dags_unchanged=dags_unchanged,
         )
 
     def _collect_results(self):
@@ -1352,7 +1450,36 @@ class DagFileProcessorManager(LoggingMixin):
 
         for file in finished:
             processor = self._processors.pop(file)
-            processor.close()
+            if not processor.is_idle:
+                processor.close()
+            elif self._should_recycle_parser_worker(processor):
+                processor.stop_worker()
+                self._stopping_parser_workers.append(processor)
+            else:
+                self._idle_parser_workers.append(processor)
+
+        self._reap_stopped_parser_workers()
+
+    def _should_recycle_parser_worker(self, processor: DagFileProcessorProcess) -> bool:
+        """Whether a parser worker has parsed enough files, or grown enough, to be replaced."""
+        if processor.files_parsed >= self._parser_worker_max_files:
+            return True
+        if not self._parser_worker_max_memory_growth or processor.initial_rss is None:
+            return False
+        rss = processor.memory_rss
+        if rss is None:
+            return True
+        return rss - processor.initial_rss > self._parser_worker_max_memory_growth * 1024 * 1024
+
+    def _reap_stopped_parser_workers(self) -> None:
+        """Close parser workers that exited, once all their output has been read."""
+        stopping = []
+        for processor in self._stopping_parser_workers:
+            if processor.is_ready:
+                processor.close()
+            else:
+                stopping.append(processor)
+        self._stopping_parser_workers = stopping
 
     def _get_log_dir(self) -> str:
         return os.path.join(self.base_log_dir, timezone.utcnow().strftime("%Y-%m-%d"))
@@ -1392,10 +1519,15 @@ class DagFileProcessorManager(LoggingMixin):
         relative_path = Path(dag_file.rel_path)
         return os.path.join(self._get_log_dir(), bundle.name, f"{relative_path}.log")
 
-    def _get_logger_for_dag_file(self, dag_file: DagFileInfo):
+    def _open_log_file(self, dag_file: DagFileInfo) -> BinaryIO:
         log_filename = self._render_log_filename(dag_file)
         log_file = init_log_file(log_filename)
-        logger_filehandle = log_file.open("ab")
+        return log_file.open("ab")
+
+    def _get_logger_for_dag_file(self, dag_file: DagFileInfo, *, parser_worker: bool = False):
+        logger_filehandle = self._open_log_file(dag_file)
+        if parser_worker:
+            logger_filehandle = cast("BinaryIO", ParserWorkerLogFile(logger_filehandle))
         underlying_logger = structlog.BytesLogger(logger_filehandle)
         processors = logging_processors(json_output=True)
         return structlog.wrap_logger(
@@ -1415,7 +1547,8 @@ class DagFileProcessorManager(LoggingMixin):
         id = uuid7()
 
         callback_to_execute_for_file = self._callback_to_execute.pop(dag_file, [])
-        logger, logger_filehandle = self._get_logger_for_dag_file(dag_file)
+        parser_worker = self._parser_worker_max_files > 0
+        logger, logger_filehandle = self._get_logger_for_dag_file(dag_file, parser_worker=parser_worker)
 
         return DagFileProcessorProcess.start(
             id=id,
@@ -1429,8 +1562,27 @@ class DagFileProcessorManager(LoggingMixin):
             logger_filehandle=logger_filehandle,
             subprocess_logs_to_stdout=conf.get("logging", "dag_processor_log_target") == "stdout",
             client=self.client,
+            parser_worker=parser_worker,
         )
 
+    def _reuse_parser_worker(self, dag_file: DagFileInfo) -> DagFileProcessorProcess | None:
+        """Hand the file to an idle parser worker, if there is one still alive."""
+        while self._idle_parser_workers:
+            processor = self._idle_parser_workers.pop()
+            if processor._check_subprocess_exit() is not None:
+                self._stopping_parser_workers.append(processor)
+                continue
+            processor.parse_next_file(
+                path=dag_file.absolute_path,
+                bundle_path=cast("Path", dag_file.bundle_path),
+                bundle_name=dag_file.bundle_name,
+                dag_file_rel_path=str(dag_file.rel_path),
+                callbacks=self._callback_to_execute.pop(dag_file, []),
+                logger_filehandle=self._open_log_file(dag_file),
+            )
+            return processor
+        return None
+
     def _start_new_processes(self):
         """Start more processors if we have enough slots and files to process."""
         bundle_to_team = self._get_team_names({file.bundle_name for file in self._file_queue})
@@ -1441,7 +1593,11 @@ class DagFileProcessorManager(LoggingMixin):
             if file in self._processors:
                 continue
 
-            processor = self._create_process(file)
+            with stats.timer(
+                "dag_processing.processor_start_duration",
+                tags=prune_dict({"team_name": bundle_to_team.get(file.bundle_name)}),
+            ):
+                processor = self._reuse_parser_worker(file) or self._create_process(file)
             stats.incr(
                 "dag_processing.processes",
                 tags=prune_dict(
@@ -1535,10 +1691,57 @@ class DagFileProcessorManager(LoggingMixin):
         if not last_time:
             return False
         elapsed_ss = (now - last_time).total_seconds()
-        if elapsed_ss < self._file_process_interval:
+        if elapsed_ss < self._get_file_process_interval(stat):
             return True
         return False
 
+    def _get_file_process_interval(self, stat: DagFileStat | None) -> float:
+        """
+        Return the interval between parses of a file.
+
+        It doubles with every parse in a row that left the parsing result unchanged, up to
+        ``[dag_processor] max_file_process_interval``.
+        """
+        if stat is None or self._max_file_process_interval <= self._file_process_interval:
+            return self._file_process_interval
+        return min(
+            self._file_process_interval * 2 ** min(stat.unchanged_runs, 32),
+            self._max_file_process_interval,
+        )
+
+    def _record_file_imports(self, presence_key: tuple[str, Path], modules: frozenset[Path]) -> None:
+        """Record the bundle modules a file imported, and update the reverse index to match."""
+        previous = self._file_imports.pop(presence_key, frozenset())
+        for module in previous - modules:
+            dependents = self._module_dependents[module]
+            dependents.discard(presence_key)
+            if not dependents:
+                del self._module_dependents[module]
+        for module in modules - previous:
+            self._module_dependents[module].add(presence_key)
+        if modules:
+            self._file_imports[presence_key] = modules
+
+    def _files_with_changed_imports(
+        self, file_stats_by_presence_key: dict[tuple[str, Path], DagFileStat]
+    ) -> set[tuple[str, Path]]:
+        """Return the presence keys of the files that import a bundle module changed since they were parsed."""
+        changed = set()
+        for module, dependents in self._module_dependents.items():
+            try:
+                modified_datetime: datetime | None = datetime.fromtimestamp(
+                    os.path.getmtime(module), tz=timezone.utc
+                )
+            except OSError:
+                # The module was removed, so the files importing it need to report the import error
+                modified_datetime = None
+            for presence_key in dependents:
+                stat = file_stats_by_presence_key.get(presence_key)
+                last_time = stat.last_finish_time if stat else None
+                if last_time and (modified_datetime is None or modified_datetime > last_time):
+                    changed.add(presence_key)
+        return changed
+
     def prepare_file_queue(self, known_files: dict[str, set[DagFileInfo]]):
         """
         Scan dags dir to generate more file paths to process.
@@ -1569,7 +1772,7 @@ class DagFileProcessorManager(LoggingMixin):
                 files.append(file)
                 stat = file_stats_by_presence_key.get(file.presence_key)
                 last_time = stat.last_finish_time if stat else None
-                if last_time and (now - last_time).total_seconds() < self._file_process_interval:
+                if last_time and (now - last_time).total_seconds() < self._get_file_process_interval(stat):
                     recently_processed.add(file)
 
         changed_recently: set[DagFileInfo] = set()
@@ -1589,12 +1792,20 @@ class DagFileProcessorManager(LoggingMixin):
         }
         to_exclude = in_progress_keys.union(at_run_limit_keys)
 
-        # exclude recently processed unless changed recently
-        to_exclude |= {file.presence_key for file in recently_processed - changed_recently}
+        # exclude recently processed unless changed recently, or a bundle module they import changed
+        imports_changed_keys = self._files_with_changed_imports(file_stats_by_presence_key)
+        to_exclude |= {
+            file.presence_key
+            for file in recently_processed - changed_recently
+            if file.presence_key not in imports_changed_keys
+        }
 
         # Do not convert the following list to set as set does not preserve the order
         # and we need to maintain the order of files for `[dag_processor] file_parsing_sort_mode`
         to_queue = [x for x in files if x.presence_key not in to_exclude]
+        if imports_changed_keys:
+            # Parse the files affected by a changed module first, keeping the sort order otherwise
+            to_queue.sort(key=lambda file: file.presence_key not in imports_changed_keys)
 
         if self.log.isEnabledFor(logging.DEBUG):
             for path, processor in self._processors.items():
@@ -1716,10 +1927,16 @@ class DagFileProcessorManager(LoggingMixin):
             )
             # SIGTERM, wait 5s, SIGKILL if still alive
             processor.kill(signal.SIGTERM, escalation_delay=5.0)
+        for processor in self._idle_parser_workers:
+            processor.stop_worker()
+        self._stopping_parser_workers.extend(self._idle_parser_workers)
+        self._idle_parser_workers.clear()
 
     def end(self):
         """Kill all child processes on exit since we don't want to leave them as orphaned."""
         pids_to_kill = [p.pid for p in self._processors.values()]
+        pids_to_kill.extend(p.pid for p in self._idle_parser_workers)
+        pids_to_kill.extend(p.pid for p in self._stopping_parser_workers)
         if pids_to_kill:
             kill_child_processes_by_pids(pids_to_kill)
 
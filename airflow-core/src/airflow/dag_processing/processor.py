@@ -20,12 +20,17 @@ import contextlib
 import importlib
 import logging
 import os
+import select
+import sys
+import time
 import traceback
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Generator, Iterable, Sequence
+from operator import attrgetter
 from pathlib import Path
 from typing import TYPE_CHECKING, Annotated, BinaryIO, ClassVar, Literal
 
 import attrs
+import psutil
 from pydantic import BaseModel, Field, TypeAdapter
 
 from airflow._shared.observability.metrics import stats
@@ -39,6 +44,7 @@ from airflow.configuration import conf
 from airflow.dag_processing.bundles.base import BundleVersionLock
 from airflow.dag_processing.dagbag import BundleDagBag, DagBag
 from airflow.models.dag import DagModel
+from airflow.models.serialized_dag import SerializedDagModel
 from airflow.sdk.exceptions import TaskNotFound
 from airflow.sdk.execution_time import supervisor
 from airflow.sdk.execution_time.comms import (
@@ -54,6 +60,7 @@ from airflow.sdk.execution_time.comms import (
     GetVariable,
     GetVariableKeys,
     GetXCom,
+    GetXComBatch,
     GetXComCount,
     GetXComSequenceItem,
     GetXComSequenceSlice,
@@ -66,6 +73,7 @@ from airflow.sdk.execution_time.comms import (
     TaskStatesResult,
     VariableKeysResult,
     VariableResult,
+    XComBatchResult,
     XComCountResponse,
     XComResult,
     XComSequenceIndexResult,
@@ -80,6 +88,7 @@ from airflow.sdk.execution_time.request_handlers import (
     handle_get_ti_count,
     handle_get_variable_keys,
     handle_get_xcom,
+    handle_get_xcom_batch,
     handle_get_xcom_count,
     handle_get_xcom_sequence_item,
     handle_get_xcom_sequence_slice,
@@ -90,8 +99,10 @@ from airflow.sdk.execution_time.supervisor import WatchedSubprocess
 from airflow.sdk.execution_time.task_runner import RuntimeTaskInstance, _send_error_email_notification
 from airflow.sdk.log import mask_secret
 from airflow.serialization.serialized_objects import DagSerialization, LazyDeserializedDAG
+from airflow.settings import json
 from airflow.utils.dag_version_inflation_checker import check_dag_file_stability
 from airflow.utils.file import iter_airflow_imports
+from airflow.utils.hashlib_wrapper import md5
 from airflow.utils.helpers import prune_dict
 from airflow.utils.log.logging_mixin import LoggingMixin
 from airflow.utils.state import TaskInstanceState
@@ -142,11 +153,35 @@ class DagFileParsingResult(BaseModel):
     serialized_dags: list[LazyDeserializedDAG]
     warnings: list | None = None
     import_errors: dict[str, str] | None = None
+    fingerprint: str | None = None
+    """
+    Hash of the inputs and outputs of the parse: the file's mtime and size, and the DAG hashes, import errors
+    and warnings. If it matches the previous result of the file, the manager skips rewriting its DAGs.
+    """
+    imported_modules: list[str] | None = None
+    """
+    Paths, relative to the bundle, of the modules from the bundle that the file imported. The manager reparses
+    the file when one of them changes.
+    """
     type: Literal["DagFileParsingResult"] = "DagFileParsingResult"
 
 
+class DagFileParsingDone(BaseModel):
+    """
+    Sent by a parser worker when it has finished with a file.
+
+    The worker then waits for the manager to reply with the next file to parse, or with an empty response
+    telling it to exit.
+    """
+
+    result: DagFileParsingResult | None = None
+    """The parsing result, or None if the worker only ran callbacks for the file."""
+    type: Literal["DagFileParsingDone"] = "DagFileParsingDone"
+
+
 ToManager = Annotated[
     DagFileParsingResult
+    | DagFileParsingDone
     | GetConnection
     | GetVariable
     | GetVariableKeys
@@ -158,6 +193,7 @@ ToManager = Annotated[
     | GetPreviousDagRun
     | GetPreviousTI
     | GetXCom
+    | GetXComBatch
     | GetXComCount
     | GetXComSequenceItem
     | GetXComSequenceSlice
@@ -176,6 +212,7 @@ ToDagProcessor = Annotated[
     | PrevSuccessfulDagRunResult
     | ErrorResponse
     | OKResponse
+    | XComBatchResult
     | XComCountResponse
     | XComResult
     | XComSequenceIndexResult
@@ -232,10 +269,96 @@ def _parse_file_entrypoint():
         comms_decoder.send(result)
 
 
+def _parser_worker_entrypoint():
+    """Parse the DAG files the manager sends, one at a time, until it tells the worker to exit."""
+    os.environ["_AIRFLOW_PROCESS_CONTEXT"] = "client"
+
+    import structlog
+
+    from airflow.sdk.execution_time import comms, task_runner
+
+    comms_decoder = comms.CommsDecoder[ToDagProcessor, ToManager](
+        body_decoder=TypeAdapter[ToDagProcessor](ToDagProcessor),
+    )
+
+    msg = comms_decoder._get_response()
+    task_runner.SUPERVISOR_COMMS = comms_decoder
+    log = structlog.get_logger(logger_name="task")
+
+    while msg is not None:
+        if not isinstance(msg, DagFileParseRequest):
+            raise RuntimeError(f"Expected a DagFileParseRequest, it was {msg}")
+        # Import the modules of the bundle afresh for every file, as a forked process would
+        _unload_bundle_modules(msg.bundle_path)
+        # The loggers of the manager are bound once per process, so tag log lines with the current file here
+        structlog.contextvars.bind_contextvars(
+            dag_file=os.path.relpath(msg.file, msg.bundle_path), bundle_name=msg.bundle_name
+        )
+        result = _parse_file(msg, log)
+        msg = comms_decoder.send(DagFileParsingDone(result=result))
+
+
+def _bundle_module_paths(bundle_path: Path, module_names: Iterable[str]) -> dict[str, str]:
+    """Return the names and file paths of the given imported modules that were loaded from the bundle."""
+    bundle_dir = os.path.join(os.fspath(bundle_path), "")
+    paths = {}
+    for name in module_names:
+        module_file = getattr(sys.modules.get(name), "__file__", None)
+        if isinstance(module_file, str) and module_file.startswith(bundle_dir):
+            paths[name] = module_file
+    return paths
+
+
+class _BundleImportRecorder:
+    """
+    Meta path finder recording the bundle files of the modules imported while it is installed.
+
+    Unlike ``sys.modules``, it also sees the modules whose import raised, which are removed from
+    ``sys.modules`` again, so that the files importing them are parsed again once they are fixed.
+    """
+
+    def __init__(self, bundle_path: Path):
+        self.bundle_dir = os.path.join(os.fspath(bundle_path), "")
+        self.module_files: set[str] = set()
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or (find_spec := getattr(finder, "find_spec", None)) is None:
+                continue
+            if (spec := find_spec(fullname, path, target)) is not None:
+                if isinstance(spec.origin, str) and spec.origin.startswith(self.bundle_dir):
+                    self.module_files.add(spec.origin)
+                return spec
+        return None
+
+
+@contextlib.contextmanager
+def _record_bundle_imports(bundle_path: Path) -> Generator[set[str], None, None]:
+    """Yield the set of the bundle files imported, or attempted to be, within the context."""
+    recorder = _BundleImportRecorder(bundle_path)
+    sys.meta_path.insert(0, recorder)
+    try:
+        yield recorder.module_files
+    finally:
+        sys.meta_path.remove(recorder)
+
+
+def _unload_bundle_modules(bundle_path: Path) -> None:
+    for name in _bundle_module_paths(bundle_path, list(sys.modules)):
+        del sys.modules[name]
+
+
 def _parse_file(msg: DagFileParseRequest, log: FilteringBoundLogger) -> DagFileParsingResult | None:
     # TODO: Set known_pool names on DagBag!
 
+    # Stat the file before parsing, so a change made while it is parsed shows up in the next fingerprint.
+    try:
+        file_stat: os.stat_result | None = os.stat(msg.file)
+    except OSError:
+        file_stat = None
+
     stability_check_result = check_dag_file_stability(os.fspath(msg.file))
+    modules_before_parse = set(sys.modules)
 
     if stability_check_error_dict := stability_check_result.get_error_format_dict(msg.file, msg.bundle_path):
         # If Dag stability check level is error, we shouldn't parse the Dags and return the result early
@@ -245,12 +368,13 @@ def _parse_file(msg: DagFileParseRequest, log: FilteringBoundLogger) -> DagFileP
             import_errors=stability_check_error_dict,
         )
 
-    bag = BundleDagBag(
-        dag_folder=msg.file,
-        bundle_path=msg.bundle_path,
-        bundle_name=msg.bundle_name,
-        load_op_links=False,
-    )
+    with _record_bundle_imports(msg.bundle_path) as attempted_module_files:
+        bag = BundleDagBag(
+            dag_folder=msg.file,
+            bundle_path=msg.bundle_path,
+            bundle_name=msg.bundle_name,
+            load_op_links=False,
+        )
 
     if msg.callback_requests:
         # If the request is for callback, we shouldn't serialize the Dags
@@ -264,10 +388,30 @@ def _parse_file(msg: DagFileParseRequest, log: FilteringBoundLogger) -> DagFileP
         serialized_dags=serialized_dags,
         import_errors=bag.import_errors,
         warnings=stability_check_result.get_formatted_warnings(bag.dag_ids),
+        imported_modules=sorted(
+            os.path.relpath(module_file, msg.bundle_path)
+            for module_file in attempted_module_files.union(
+                _bundle_module_paths(msg.bundle_path, sys.modules.keys() - modules_before_parse).values()
+            )
+            # Skip the DAG file itself, and modules loaded from within a zip file
+            if module_file != msg.file and os.path.isfile(module_file)
+        ),
     )
+    if file_stat is not None:
+        result.fingerprint = _fingerprint_parsing_result(file_stat, result)
     return result
 
 
+def _fingerprint_parsing_result(file_stat: os.stat_result, result: DagFileParsingResult) -> str:
+    fingerprint = md5(f"{file_stat.st_mtime_ns}:{file_stat.st_size}".encode())
+    for dag in sorted(result.serialized_dags, key=attrgetter("dag_id")):
+        fingerprint.update(f"{dag.dag_id}:{dag.dag_hash}".encode())
+    fingerprint.update(
+        json.dumps([result.import_errors, result.warnings], sort_keys=True, default=str).encode("utf-8")
+    )
+    return fingerprint.hexdigest()
+
+
 def _serialize_dags(
     bag: DagBag,
     log: FilteringBoundLogger,
@@ -277,7 +421,11 @@ def _serialize_dags(
     for dag in bag.dags.values():
         try:
             data = DagSerialization.to_dict(dag)
-            serialized_dags.append(LazyDeserializedDAG(data=data, last_loaded=dag.last_loaded))
+            serialized_dags.append(
+                LazyDeserializedDAG(
+                    data=data, last_loaded=dag.last_loaded, dag_hash=SerializedDagModel.hash(data)
+                )
+            )
         except Exception:
             log.exception("Failed to serialize DAG: %s", dag.fileloc)
             dagbag_import_error_traceback_depth = conf.getint(
@@ -550,6 +698,31 @@ def in_process_api_server() -> InProcessExecutionAPI:
     return api
 
 
+class ParserWorkerLogFile:
+    """
+    Log file of a parser worker, which follows the worker from the log of one DAG file to the next.
+
+    The loggers that child output is forwarded to are created once per process, so they write through this
+    object and :meth:`switch_to` points it at the log of the next file the worker parses.
+    """
+
+    def __init__(self, filehandle: BinaryIO):
+        self.filehandle = filehandle
+
+    def switch_to(self, filehandle: BinaryIO) -> None:
+        self.filehandle.close()
+        self.filehandle = filehandle
+
+    def write(self, data: bytes) -> int:
+        return self.filehandle.write(data)
+
+    def flush(self) -> None:
+        self.filehandle.flush()
+
+    def close(self) -> None:
+        self.filehandle.close()
+
+
 @attrs.define(kw_only=True)
 class DagFileProcessorProcess(WatchedSubprocess, LoggingMixin):
     """
@@ -573,6 +746,15 @@ class DagFileProcessorProcess(WatchedSubprocess, LoggingMixin):
     bundle_name: str
     dag_file_rel_path: str
 
+    parser_worker: bool = False
+    """Whether the process is a parser worker, which can be given more files once it is done with one."""
+    files_parsed: int = 0
+    """Number of files the process finished parsing."""
+    initial_rss: int | None = None
+    """Resident memory of a parser worker when it started, in bytes."""
+    _idle_request_id: int | None = attrs.field(default=None, init=False)
+    """ID of the request a parser worker is waiting on a reply to, if it is done with its file."""
+
     @classmethod
     def start(  # type: ignore[override]
         cls,
@@ -582,17 +764,23 @@ class DagFileProcessorProcess(WatchedSubprocess, LoggingMixin):
         bundle_name: str,
         dag_file_rel_path: str,
         callbacks: list[CallbackRequest],
-        target: Callable[[], None] = _parse_file_entrypoint,
+        target: Callable[[], None] | None = None,
         client: Client,
+        parser_worker: bool = False,
         **kwargs,
     ) -> Self:
         logger = kwargs["logger"]
 
+        if target is None:
+            target = _parser_worker_entrypoint if parser_worker else _parse_file_entrypoint
+
         # Parsing DAG files runs user code that can trigger macOS-unsafe ObjC
         # initialization (secret backends, connection/variable lookups, HTTP
         # clients). Fork+exec a clean interpreter there. Tests override `target`
         # with a stub to exercise the base infrastructure; keep bare fork for those.
-        use_exec = target is _parse_file_entrypoint and supervisor._should_use_exec()
+        use_exec = (
+            target in (_parse_file_entrypoint, _parser_worker_entrypoint) and supervisor._should_use_exec()
+        )
 
         # Pre-importing only helps the bare-fork child (it inherits the imports via
         # copy-on-write). An exec'd child re-imports from scratch, so skip it there
@@ -606,12 +794,88 @@ class DagFileProcessorProcess(WatchedSubprocess, LoggingMixin):
             bundle_name=bundle_name,
             dag_file_rel_path=dag_file_rel_path,
             use_exec=use_exec,
+            parser_worker=parser_worker,
             **kwargs,
         )
         proc.had_callbacks = bool(callbacks)  # Track if this process had callbacks
+        if parser_worker:
+            proc.initial_rss = proc.memory_rss
         proc._on_child_started(callbacks, path, bundle_path, bundle_name)
         return proc
 
+    def parse_next_file(
+        self,
+        *,
+        path: str | os.PathLike[str],
+        bundle_path: Path,
+        bundle_name: str,
+        dag_file_rel_path: str,
+        callbacks: list[CallbackRequest],
+        logger_filehandle: BinaryIO,
+    ) -> None:
+        """Hand an idle parser worker the next file to parse."""
+        if self._idle_request_id is None:
+            raise RuntimeError(f"Parser worker {self.pid} is not waiting for a file")
+        request_id, self._idle_request_id = self._idle_request_id, None
+
+        if isinstance(self.logger_filehandle, ParserWorkerLogFile):
+            # Output the worker wrote before it was done with the previous file belongs to that file's log
+            self._drain_log_output()
+            self.logger_filehandle.switch_to(logger_filehandle)
+        else:
+            logger_filehandle.close()
+        self.bundle_name = bundle_name
+        self.dag_file_rel_path = dag_file_rel_path
+        self.parsing_result = None
+        self.had_callbacks = bool(callbacks)
+        self.start_time = time.monotonic()
+        self.send_msg(
+            DagFileParseRequest(
+                file=os.fspath(path),
+                bundle_path=bundle_path,
+                bundle_name=bundle_name,
+                callback_requests=callbacks,
+            ),
+            request_id=request_id,
+        )
+
+    def stop_worker(self) -> None:
+        """Tell an idle parser worker to exit."""
+        if self._idle_request_id is None:
+            return
+        request_id, self._idle_request_id = self._idle_request_id, None
+        with contextlib.suppress(BrokenPipeError, ConnectionResetError):
+            self.send_msg(None, request_id=request_id)
+
+    def _drain_log_output(self) -> None:
+        """Forward everything the process already wrote to its output and log channels."""
+        while log_sockets := [sock for sock, kind in self._open_sockets.items() if kind != "requests"]:
+            readable, _, _ = select.select(log_sockets, [], [], 0)
+            if not readable:
+                return
+            for sock in readable:
+                socket_handler, on_close = self.selector.get_key(sock).data
+                try:
+                    need_more = socket_handler(sock)
+                except (BrokenPipeError, ConnectionResetError):
+                    need_more = False
+                if not need_more:
+                    on_close(sock)
+                    sock.close()
+
+    @property
+    def is_idle(self) -> bool:
+        """Whether the process is a parser worker waiting for its next file."""
+        return self._idle_request_id is not None
+
+    @property
+    def memory_rss(self) -> int | None:
+        """Resident memory of the process in bytes, or None if it cannot be read."""
+        try:
+            return psutil.Process(self.pid).memory_info().rss
+        except psutil.Error:
+            return None
+
     def _on_child_started(
         self,
         callbacks: list[CallbackRequest],
@@ -629,7 +893,8 @@ class DagFileProcessorProcess(WatchedSubprocess, LoggingMixin):
 
     def _get_target_loggers(self) -> tuple[FilteringBoundLogger, ...]:
         base = super()._get_target_loggers()
-        if not self.subprocess_logs_to_stdout:
+        if not self.subprocess_logs_to_stdout or self.parser_worker:
+            # A parser worker binds the file it is parsing to its own log lines
             return base
         return tuple(
             logger.bind(dag_file=self.dag_file_rel_path, bundle_name=self.bundle_name) for logger in base
@@ -660,6 +925,12 @@ class DagFileProcessorProcess(WatchedSubprocess, LoggingMixin):
         dump_opts: dict[str, bool] = {}
         if isinstance(msg, DagFileParsingResult):
             self.parsing_result = msg
+        elif isinstance(msg, DagFileParsingDone):
+            # Reply only once the manager has the next file for the worker, or wants it to exit
+            self.parsing_result = msg.result
+            self.files_parsed += 1
+            self._idle_request_id = req_id
+            return
         elif isinstance(msg, GetConnection):
             conn = self.client.connections.get(msg.conn_id)
             if isinstance(conn, ConnectionResponse):
@@ -694,6 +965,8 @@ class DagFileProcessorProcess(WatchedSubprocess, LoggingMixin):
             resp, dump_opts = handle_get_prev_successful_dag_run(self.client, self.id)
         elif isinstance(msg, GetXCom):
             resp, dump_opts = handle_get_xcom(self.client, msg)
+        elif isinstance(msg, GetXComBatch):
+            resp, dump_opts = handle_get_xcom_batch(self.client, msg)
         elif isinstance(msg, GetXComCount):
             resp, dump_opts = handle_get_xcom_count(self.client, msg)
         elif isinstance(msg, GetXComSequenceItem):
@@ -723,6 +996,9 @@ class DagFileProcessorProcess(WatchedSubprocess, LoggingMixin):
 
     @property
     def is_ready(self) -> bool:
+        if self.is_idle:
+            # A parser worker is done with its file and waiting for the next one
+            return True
         if self._check_subprocess_exit() is None:
             # Process still alive, def can't be finished yet
             return False
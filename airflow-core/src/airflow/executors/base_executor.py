@@ -152,6 +152,9 @@ class ExecutorConf:
     def getint(self, *args, **kwargs):
         return conf.getint(*args, **kwargs, team_name=self.team_name)
 
+    def getfloat(self, *args, **kwargs):
+        return conf.getfloat(*args, **kwargs, team_name=self.team_name)
+
     def getsection(self, section: str) -> dict[str, str | int | float | bool] | None:
         return conf.getsection(section, team_name=self.team_name)
 
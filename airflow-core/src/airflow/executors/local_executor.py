@@ -27,6 +27,7 @@ from __future__ import annotations
 
 import contextlib
 import ctypes
+import gc
 import multiprocessing
 import multiprocessing.sharedctypes
 import os
@@ -34,6 +35,7 @@ import sys
 from multiprocessing import Queue, SimpleQueue
 from typing import TYPE_CHECKING
 
+import psutil
 import structlog
 
 from airflow.executors.base_executor import BaseExecutor, get_execution_api_server_url
@@ -47,8 +49,11 @@ else:
     setproctitle = lambda title, logger: real_setproctitle(title)
 
 if TYPE_CHECKING:
+    from multiprocessing.connection import Connection
+
     from airflow.executors.workloads import ExecutorWorkload
     from airflow.executors.workloads.types import WorkloadResultType
+    from airflow.sdk.execution_time.heartbeat import HeartbeatAggregator
 
 
 def _get_executor_process_title_prefix(team_name: str | None) -> str:
@@ -67,6 +72,7 @@ def _run_worker(
     output: Queue[WorkloadResultType],
     unread_messages: multiprocessing.sharedctypes.Synchronized[int],
     team_conf,
+    heartbeat_conn: Connection | None = None,
 ):
     import signal
 
@@ -76,7 +82,32 @@ def _run_worker(
     log = structlog.get_logger(logger_name)
     log.info("Worker starting up pid=%d", os.getpid())
 
+    # The tasks are forked from this process: import what they need once here, and keep it out of the way of
+    # the garbage collector so that it stays shared with them.
+    from airflow.sdk.execution_time.supervisor import preload_task_modules
+
+    preload_task_modules()
+    gc.freeze()
+
+    if heartbeat_conn is not None:
+        from airflow.sdk.execution_time.heartbeat import HeartbeatRelay, set_heartbeat_relay
+
+        set_heartbeat_relay(HeartbeatRelay(heartbeat_conn))
+
+    max_workloads = team_conf.getint("workers", "local_executor_worker_max_tasks", fallback=0)
+    max_memory_growth = team_conf.getint("workers", "local_executor_worker_max_memory_growth", fallback=0)
+    process = psutil.Process()
+    initial_rss = process.memory_info().rss
+    workloads_run = 0
+
     while True:
+        if max_workloads and workloads_run >= max_workloads:
+            log.info("Worker ran %d workloads, exiting to be replaced", workloads_run)
+            return
+        if max_memory_growth and process.memory_info().rss - initial_rss > max_memory_growth * 1024 * 1024:
+            log.info("Worker memory grew by more than %d MiB, exiting to be replaced", max_memory_growth)
+            return
+
         setproctitle(f"{_get_executor_process_title_prefix(team_conf.team_name)} <idle>", log)
         try:
             workload = input.get()
@@ -96,6 +127,7 @@ def _run_worker(
         with unread_messages:
             unread_messages.value -= 1
 
+        workloads_run += 1
         if workload.running_state is not None:
             output.put((workload.key, workload.running_state, None))
 
@@ -132,6 +164,7 @@ class LocalExecutor(BaseExecutor):
     activity_queue: SimpleQueue[ExecutorWorkload | None]
     result_queue: SimpleQueue[WorkloadResultType]
     workers: dict[int, multiprocessing.Process]
+    _heartbeat_aggregator: HeartbeatAggregator | None = None
     _unread_messages: multiprocessing.sharedctypes.Synchronized[int]
 
     def __init__(self, *args, **kwargs):
@@ -165,6 +198,28 @@ class LocalExecutor(BaseExecutor):
 
         self._unread_messages = multiprocessing.Value(ctypes.c_uint)
 
+        heartbeat_batch_interval = self.conf.getfloat(
+            "workers", "local_executor_heartbeat_batch_interval", fallback=0
+        )
+        if heartbeat_batch_interval > 0:
+            from airflow.sdk.execution_time.heartbeat import HeartbeatAggregator
+
+            # A task counts a heartbeat that got no outcome by its next one as failed.
+            min_heartbeat_interval = self.conf.getint("workers", "min_heartbeat_interval")
+            if heartbeat_batch_interval >= min_heartbeat_interval:
+                self.log.warning(
+                    "[workers] local_executor_heartbeat_batch_interval (%s) must be lower than "
+                    "[workers] min_heartbeat_interval (%s); sending batch heartbeats every %s seconds instead",
+                    heartbeat_batch_interval,
+                    min_heartbeat_interval,
+                    min_heartbeat_interval / 2,
+                )
+                heartbeat_batch_interval = min_heartbeat_interval / 2
+            self._heartbeat_aggregator = HeartbeatAggregator(
+                server=get_execution_api_server_url(self.conf), interval=heartbeat_batch_interval
+            )
+            self._heartbeat_aggregator.start()
+
         if self.is_mp_using_fork:
             # This creates the maximum number of worker processes (parallelism) at once
             # to minimize gc freeze/unfreeze cycles when using fork in multiprocessing
@@ -203,6 +258,7 @@ class LocalExecutor(BaseExecutor):
                 self._spawn_worker()
 
     def _spawn_worker(self):
+        heartbeat_conn = self._heartbeat_aggregator.connect() if self._heartbeat_aggregator else None
         p = multiprocessing.Process(
             target=_run_worker,
             kwargs={
@@ -211,9 +267,13 @@ class LocalExecutor(BaseExecutor):
                 "output": self.result_queue,
                 "unread_messages": self._unread_messages,
                 "team_conf": self.conf,
+                "heartbeat_conn": heartbeat_conn,
             },
         )
         p.start()
+        if heartbeat_conn is not None:
+            # Only the worker keeps its end, so that the aggregator sees the pipe close when the worker exits
+            heartbeat_conn.close()
         if TYPE_CHECKING:
             assert p.pid  # Since we've called start
         self.workers[p.pid] = p
@@ -229,8 +289,6 @@ class LocalExecutor(BaseExecutor):
 
         Ref: https://docs.python.org/3/library/gc.html#gc.freeze
         """
-        import gc
-
         gc.freeze()
         try:
             for _ in range(spawn_number):
@@ -289,12 +347,19 @@ class LocalExecutor(BaseExecutor):
 
             self.activity_queue.close()
             self.result_queue.close()
+            self._stop_heartbeat_aggregator()
 
     def terminate(self):
         """Terminate all worker processes under control of the executor forcefully."""
         self.log.info("Terminating all LocalExecutor worker processes.")
         for proc in self.workers.values():
             self._terminate_worker_process(proc)
+        self._stop_heartbeat_aggregator()
+
+    def _stop_heartbeat_aggregator(self) -> None:
+        if self._heartbeat_aggregator is not None:
+            self._heartbeat_aggregator.stop()
+            self._heartbeat_aggregator = None
 
     def _terminate_worker_process(self, proc: multiprocessing.Process) -> None:
         """Terminate a worker process, escalating to kill if it stays alive."""
@@ -27,6 +27,7 @@ import sys
 import time
 from collections import Counter, defaultdict, deque
 from collections.abc import Callable, Collection, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import ExitStack
 from datetime import datetime, timedelta
 from functools import lru_cache, partial
@@ -118,7 +119,7 @@ from airflow.timetables.base import Timetable, compute_rollup_fingerprint
 from airflow.timetables.simple import AssetTriggeredTimetable
 from airflow.triggers.base import TriggerEvent
 from airflow.utils.event_scheduler import EventScheduler
-from airflow.utils.helpers import prune_dict
+from airflow.utils.helpers import chunks, prune_dict
 from airflow.utils.log.logging_mixin import LoggingMixin
 from airflow.utils.retries import MAX_DB_RETRIES, retry_db_transaction, run_with_db_retries
 from airflow.utils.session import NEW_SESSION, create_session, provide_session
@@ -277,6 +278,160 @@ class ConcurrencyMap:
             if state not in (TaskInstanceState.DEFERRED, TaskInstanceState.AWAITING_INPUT):
                 self.dag_run_active_tasks_map[dag_id, run_id] += count
 
+    def add_queued(self, ti: TI) -> None:
+        """Account for a task instance the scheduler is about to queue."""
+        self.dag_run_active_tasks_map[(ti.dag_id, ti.run_id)] += 1
+        self.task_concurrency_map[(ti.dag_id, ti.task_id)] += 1
+        self.task_dagrun_concurrency_map[(ti.dag_id, ti.run_id, ti.task_id)] += 1
+
+
+def _ti_key(dag_id: str, task_id: str, run_id: str, map_index: int, *_: Any) -> tuple[str, str, str, int]:
+    return dag_id, task_id, run_id, map_index
+
+
+class IncrementalConcurrencyMap(ConcurrencyMap):
+    """
+    Concurrency map that is kept up to date across scheduler loops instead of being rebuilt every time.
+
+    The map is seeded from every active task instance, and then updated from state transitions the
+    scheduler observes: task instances it queues itself, task instances queued by any scheduler since
+    the previous refresh, and task instances reported back by the executors. It also keeps the slots
+    occupied in each pool, so the critical section does not need to aggregate the task instance table
+    on every pass.
+
+    Task instances queued or running for other schedulers are looked up by id on every refresh until they
+    leave those states, as no executor event reports them to this scheduler. Other transitions that happen
+    elsewhere (e.g. a deferred task instance resumed by the triggerer) only ever leave the counters higher
+    than the truth, which can delay scheduling but never oversubscribes a limit. A full re-seed every
+    ``reseed_interval`` seconds corrects that drift.
+
+    :param reseed_interval: Number of seconds after which the map is fully re-seeded from the database.
+    """
+
+    # How far back to look for task instances queued since the previous refresh. Re-reading a task
+    # instance is idempotent, so this only needs to cover clock skew and transactions that committed
+    # after the previous refresh had already started.
+    REFRESH_OVERLAP = timedelta(seconds=60)
+    # Number of task instances looked up per query when following those observed in the database.
+    FOLLOW_BATCH_SIZE = 500
+
+    _COLUMNS = (TI.dag_id, TI.task_id, TI.run_id, TI.map_index, TI.pool, TI.pool_slots, TI.state)
+
+    def __init__(self, reseed_interval: float):
+        super().__init__()
+        self.reseed_interval = reseed_interval
+        self.pool_slots_map: Counter[tuple[str, str]] = Counter()
+        self._tracked: dict[tuple[str, str, str, int], tuple[str, int, str]] = {}
+        # Task instances of other schedulers, that no executor event of this scheduler reports.
+        self._followed: dict[tuple[str, str, str, int], UUID] = {}
+        self._last_seeded: float | None = None
+        self._last_refreshed: datetime | None = None
+
+    def load(self, session: Session, job_id: int | None = None) -> None:
+        self.dag_run_active_tasks_map.clear()
+        self.task_concurrency_map.clear()
+        self.task_dagrun_concurrency_map.clear()
+        self.pool_slots_map.clear()
+        self._tracked.clear()
+        self._followed.clear()
+        self._last_refreshed = timezone.utcnow()
+        self._last_seeded = time.monotonic()
+        query = session.execute(
+            select(TI.id, TI.queued_by_job_id, *self._COLUMNS).where(TI.state.in_(ACTIVE_STATES))
+        )
+        for ti_id, queued_by_job_id, *row in query:
+            self._apply(*row)
+            self._follow(ti_id, queued_by_job_id, job_id, *row)
+
+    def refresh(self, session: Session, job_id: int | None = None) -> None:
+        """
+        Pick up task instances queued since the previous refresh, re-seeding the map when it is due.
+
+        :param session: ORM Session
+        :param job_id: Id of this scheduler's job, whose task instances are reported by its executors.
+        """
+        if (
+            self._last_seeded is None
+            or self._last_refreshed is None
+            or time.monotonic() - self._last_seeded >= self.reseed_interval
+        ):
+            stats.incr("scheduler.concurrency_map.reseed")
+            self.load(session=session, job_id=job_id)
+            return
+
+        since = self._last_refreshed - self.REFRESH_OVERLAP
+        self._last_refreshed = timezone.utcnow()
+        query = session.execute(
+            select(TI.id, TI.queued_by_job_id, *self._COLUMNS).where(
+                TI.state.in_(EXECUTION_STATES), TI.queued_dttm >= since
+            )
+        )
+        for ti_id, queued_by_job_id, *row in query:
+            self._apply(*row)
+            self._follow(ti_id, queued_by_job_id, job_id, *row)
+
+        # Pick up the task instances of other schedulers that finished, or changed state.
+        followed = dict(self._followed)
+        for ids in chunks(list(followed.values()), self.FOLLOW_BATCH_SIZE):
+            for row in session.execute(select(*self._COLUMNS).where(TI.id.in_(ids))):
+                followed.pop(_ti_key(*row), None)
+                self._apply(*row)
+        # Task instances that are gone, e.g. with their Dag run.
+        for key in followed:
+            self._apply(*key, "", 0, None)
+
+    def add_queued(self, ti: TI) -> None:
+        self._followed.pop((ti.dag_id, ti.task_id, ti.run_id, ti.map_index), None)
+        self._apply(
+            ti.dag_id, ti.task_id, ti.run_id, ti.map_index, ti.pool, ti.pool_slots, TaskInstanceState.QUEUED
+        )
+
+    def _follow(self, ti_id: UUID, queued_by_job_id: int | None, job_id: int | None, *row: Any) -> None:
+        # Task instances this scheduler queued are reported back by its executors.
+        if row[-1] in EXECUTION_STATES and (job_id is None or queued_by_job_id != job_id):
+            self._followed[_ti_key(*row)] = ti_id
+
+    def apply_ti(self, ti: TI) -> None:
+        """Record the current state of a task instance loaded from the database."""
+        self._apply(ti.dag_id, ti.task_id, ti.run_id, ti.map_index, ti.pool, ti.pool_slots, ti.state)
+
+    def _apply(
+        self,
+        dag_id: str,
+        task_id: str,
+        run_id: str,
+        map_index: int,
+        pool: str,
+        pool_slots: int,
+        state: str | None,
+    ) -> None:
+        key = (dag_id, task_id, run_id, map_index)
+        if (previous := self._tracked.pop(key, None)) is not None:
+            self._count(key, *previous, delta=-1)
+        if state in ACTIVE_STATES:
+            self._tracked[key] = (pool, pool_slots, state)
+            self._count(key, pool, pool_slots, state, delta=1)
+        if state not in EXECUTION_STATES:
+            self._followed.pop(key, None)
+
+    def _count(
+        self, key: tuple[str, str, str, int], pool: str, pool_slots: int, state: str, delta: int
+    ) -> None:
+        dag_id, task_id, run_id, _ = key
+        _add_to_counter(self.task_concurrency_map, (dag_id, task_id), delta)
+        _add_to_counter(self.task_dagrun_concurrency_map, (dag_id, run_id, task_id), delta)
+        if state not in (TaskInstanceState.DEFERRED, TaskInstanceState.AWAITING_INPUT):
+            _add_to_counter(self.dag_run_active_tasks_map, (dag_id, run_id), delta)
+        # Like Pool.slots_stats, awaiting_input task instances never hold pool slots.
+        if state != TaskInstanceState.AWAITING_INPUT:
+            _add_to_counter(self.pool_slots_map, (pool, state), delta * pool_slots)
+
+
+def _add_to_counter(counter: Counter, key: tuple, amount: int) -> None:
+    counter[key] += amount
+    if counter[key] <= 0:
+        del counter[key]
+
 
 def _is_parent_process() -> bool:
     """
@@ -357,6 +512,14 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         self._multi_team = conf.getboolean("core", "multi_team")
         self._dag_tags_in_metrics = conf.getboolean("metrics", "dag_tags_in_metrics", fallback=False)
         self._max_partition_dag_runs_per_loop = MAX_PARTITION_DAG_RUNS_PER_LOOP
+        concurrency_map_reseed_interval = conf.getfloat("scheduler", "concurrency_map_reseed_interval")
+        self._concurrency_map: IncrementalConcurrencyMap | None = (
+            IncrementalConcurrencyMap(reseed_interval=concurrency_map_reseed_interval)
+            if concurrency_map_reseed_interval > 0
+            else None
+        )
+        self._dag_run_scheduling_workers = conf.getint("scheduler", "dag_run_scheduling_workers")
+        self._dag_run_scheduling_pool: ThreadPoolExecutor | None = None
         self._dag_id_to_team_name: dict[str, str | None] = {}
 
         self.executors: list[BaseExecutor] = executors if executors else ExecutorLoader.init_executors()
@@ -657,7 +820,19 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
 
         # Get the pool settings. We get a lock on the pool rows, treating this as a "critical section"
         # Throws an exception if lock cannot be obtained, rather than blocking
-        pools = Pool.slots_stats(lock_rows=True, session=session)
+        concurrency_map: ConcurrencyMap
+        if (incremental_map := self._concurrency_map) is not None:
+            concurrency_map = incremental_map
+
+            # Refresh only once the pool rows are locked, so task instances queued by other
+            # schedulers in their critical section are visible.
+            def _refreshed_pool_slots() -> Counter[tuple[str, str]]:
+                incremental_map.refresh(session=session, job_id=self.job.id)
+                return incremental_map.pool_slots_map
+
+            pools = Pool.slots_stats(lock_rows=True, occupied_slots=_refreshed_pool_slots, session=session)
+        else:
+            pools = Pool.slots_stats(lock_rows=True, session=session)
 
         # If the pools are full, there is no point doing anything!
         # If _somehow_ the pool is overfull, don't let the limit go negative - it breaks SQL
@@ -676,8 +851,9 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             pool_to_team_name = Pool.get_name_to_team_name_mapping(list(pools.keys()), session=session)
 
         # dag_id to # of running tasks and (dag_id, task_id) to # of running tasks.
-        concurrency_map = ConcurrencyMap()
-        concurrency_map.load(session=session)
+        if self._concurrency_map is None:
+            concurrency_map = ConcurrencyMap()
+            concurrency_map.load(session=session)
 
         # Number of tasks that cannot be scheduled because of no open slot in pool
         num_starving_tasks_total = 0
@@ -985,11 +1161,7 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
 
                 executable_tis.append(task_instance)
                 open_slots -= task_instance.pool_slots
-                concurrency_map.dag_run_active_tasks_map[dag_run_key] += 1
-                concurrency_map.task_concurrency_map[(task_instance.dag_id, task_instance.task_id)] += 1
-                concurrency_map.task_dagrun_concurrency_map[
-                    (task_instance.dag_id, task_instance.run_id, task_instance.task_id)
-                ] += 1
+                concurrency_map.add_queued(task_instance)
 
                 pool_stats["open"] = open_slots
 
@@ -1309,6 +1481,7 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                 scheduler_dag_bag=self.scheduler_dag_bag,
                 session=session,
                 eagerly_load_dag_tags=self._dag_tags_in_metrics,
+                concurrency_map=self._concurrency_map,
             )
         except Exception as exc:
             stats.incr("scheduler.executor_events.failed", tags={"exception_class": type(exc).__name__})
@@ -1327,6 +1500,7 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         scheduler_dag_bag: DBDagBag,
         session: Session,
         eagerly_load_dag_tags: bool = False,
+        concurrency_map: IncrementalConcurrencyMap | None = None,
     ) -> int:
         """
         Process task completion events from the executor and update task instance states.
@@ -1352,6 +1526,8 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         :param eagerly_load_dag_tags: When True, eager-load dag_model.tags so the per-finished-task
             metrics carry Dag tags without a per-TI lazy load. The scheduler passes its cached flag so
             the hot path never reads conf; other callers (e.g. ``dag.test()``) leave it at the default.
+        :param concurrency_map: When the scheduler runs with an incremental concurrency map, the final
+            state of every task instance reported by the executor is recorded into it.
 
         :return: Number of events processed from the executor event buffer
 
@@ -1452,7 +1628,7 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         # row lock this entire set of taskinstances to make sure the scheduler doesn't fail when we have
         # multi-schedulers
         locked_query = with_row_locks(query, of=TI, session=session, skip_locked=True)
-        tis: Iterator[TI] = session.scalars(locked_query)
+        tis = session.scalars(locked_query).all()
         for ti in tis:
             try_number = ti_primary_key_to_try_number_map[ti.key.primary]
             buffer_key = ti.key.with_try_number(try_number)
@@ -1665,6 +1841,10 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                 # Update task state - emails are handled by DAG processor now
                 ti.handle_failure(error=msg, session=session)
 
+        if concurrency_map is not None:
+            for ti in tis:
+                concurrency_map.apply_ti(ti)
+
         cls._emit_executor_events_batch_metrics(num_events)
         return len(event_buffer)
 
@@ -1712,6 +1892,10 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                 except Exception:
                     self.log.exception("Exception when executing Executor.end on %s", executor)
 
+            if self._dag_run_scheduling_pool is not None:
+                self._dag_run_scheduling_pool.shutdown(wait=True)
+                self._dag_run_scheduling_pool = None
+
             # Under normal execution, this doesn't matter, but by resetting signals it lets us run more things
             # in the same process under testing without leaking global state
             reset_signals.close()
@@ -1986,37 +2170,17 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             self._start_queued_dagruns(session)
             guard.commit()
 
-            # Bulk fetch the currently active dag runs for the dags we are
-            # examining, rather than making one query per DagRun.
-            # Materialize into a list because the multi-team block below iterates
-            # the result and ScalarResult is a one-pass iterator.
-            dag_runs = list(
-                DagRun.get_running_dag_runs_to_examine(
-                    session=session, eagerly_load_dag_tags=self._dag_tags_in_metrics
-                )
-            )
-
-            if self._multi_team and dag_runs:
-                unique_dag_ids = {dr.dag_id for dr in dag_runs}
-                dr_team_mapping = self._get_team_names_for_dag_ids(unique_dag_ids, session)
-                for dr in dag_runs:
-                    if team := dr_team_mapping.get(dr.dag_id):
-                        dr._team_name = team
-
-            callback_tuples = self._schedule_all_dag_runs(guard, dag_runs, session)
+            callback_tuples: list[tuple[DagRun, DagCallbackRequest | None]] = []
+            if self._dag_run_scheduling_workers > 1 and get_dialect_name(session) != "sqlite":
+                # Workers lock, schedule and commit their share of the Dag runs on their own sessions,
+                # and send the resulting callbacks themselves.
+                self._schedule_dag_runs_in_parallel(session)
+            else:
+                dag_runs = self._get_dag_runs_to_schedule(session)
+                callback_tuples = self._schedule_all_dag_runs(guard, dag_runs, session)
 
         # Send the callbacks after we commit to ensure the context is up to date when it gets run
-        # cache saves time during scheduling of many dag_runs for same dag
-        cached_get_dag: Callable[[DagRun], SerializedDAG | None] = lru_cache()(
-            partial(self.scheduler_dag_bag.get_dag_for_run, session=session)
-        )
-        for dag_run, callback_to_run in callback_tuples:
-            dag = cached_get_dag(dag_run)
-            if dag:
-                # Sending callbacks to the database, so it must be done outside of prohibit_commit.
-                self._send_dag_callbacks_to_processor(dag, callback_to_run)
-            else:
-                self.log.error("DAG '%s' not found in serialized_dag table", dag_run.dag_id)
+        self._send_dag_run_callbacks(callback_tuples, session)
 
         with prohibit_commit(session) as guard:
             # Without this, the session has an invalid view of the DB
@@ -2870,6 +3034,86 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             _update_state(dag, dag_run)
             dag_run.notify_dagrun_state_changed(msg="started")
 
+    def _get_dag_runs_to_schedule(
+        self, session: Session, dag_run_ids: Collection[int] | None = None
+    ) -> list[DagRun]:
+        """Lock the next running Dag runs to examine, optionally restricted to ``dag_run_ids``."""
+        # Bulk fetch the currently active dag runs for the dags we are
+        # examining, rather than making one query per DagRun.
+        # Materialize into a list because the multi-team block below iterates
+        # the result and ScalarResult is a one-pass iterator.
+        dag_runs = list(
+            DagRun.get_running_dag_runs_to_examine(
+                session=session, eagerly_load_dag_tags=self._dag_tags_in_metrics, dag_run_ids=dag_run_ids
+            )
+        )
+
+        if self._multi_team and dag_runs:
+            unique_dag_ids = {dr.dag_id for dr in dag_runs}
+            dr_team_mapping = self._get_team_names_for_dag_ids(unique_dag_ids, session)
+            for dr in dag_runs:
+                if team := dr_team_mapping.get(dr.dag_id):
+                    dr._team_name = team
+
+        return dag_runs
+
+    def _send_dag_run_callbacks(
+        self, callback_tuples: Iterable[tuple[DagRun, DagCallbackRequest | None]], session: Session
+    ) -> None:
+        # cache saves time during scheduling of many dag_runs for same dag
+        cached_get_dag: Callable[[DagRun], SerializedDAG | None] = lru_cache()(
+            partial(self.scheduler_dag_bag.get_dag_for_run, session=session)
+        )
+        for dag_run, callback_to_run in callback_tuples:
+            dag = cached_get_dag(dag_run)
+            if dag:
+                # Sending callbacks to the database, so it must be done outside of prohibit_commit.
+                self._send_dag_callbacks_to_processor(dag, callback_to_run)
+            else:
+                self.log.error("DAG '%s' not found in serialized_dag table", dag_run.dag_id)
+
+    def _schedule_dag_runs_in_parallel(self, session: Session) -> None:
+        """
+        Make scheduling decisions for the running Dag runs on several worker threads.
+
+        The Dag runs to examine are listed without locking them and split by ``dag_id``, so that all runs of
+        a Dag (which share their serialized Dag and DagModel row) are handled by the same worker. Each worker
+        then locks its share with ``SKIP LOCKED`` on its own session, so runs picked up by another scheduler
+        in the meantime are skipped, exactly as in the sequential path.
+        """
+        runs_by_dag: defaultdict[str, list[int]] = defaultdict(list)
+        for dag_id, dag_run_id in DagRun.get_running_dag_run_ids_to_examine(session=session):
+            runs_by_dag[dag_id].append(dag_run_id)
+        if not runs_by_dag:
+            return
+
+        # Greedily assign the Dags with the most runs first to the least loaded partition.
+        partitions: list[list[int]] = [
+            [] for _ in range(min(self._dag_run_scheduling_workers, len(runs_by_dag)))
+        ]
+        for dag_run_ids in sorted(runs_by_dag.values(), key=len, reverse=True):
+            min(partitions, key=len).extend(dag_run_ids)
+
+        if self._dag_run_scheduling_pool is None:
+            self._dag_run_scheduling_pool = ThreadPoolExecutor(
+                max_workers=self._dag_run_scheduling_workers, thread_name_prefix="scheduler-dag-runs"
+            )
+        futures = [
+            self._dag_run_scheduling_pool.submit(self._schedule_dag_run_partition, dag_run_ids)
+            for dag_run_ids in partitions
+        ]
+        # Wait for every partition before surfacing the first error, so no worker is left holding locks.
+        errors = [exc for future in futures if (exc := future.exception()) is not None]
+        if errors:
+            raise errors[0]
+
+    def _schedule_dag_run_partition(self, dag_run_ids: list[int]) -> None:
+        with create_session(scoped=False) as session:
+            with prohibit_commit(session) as guard:
+                dag_runs = self._get_dag_runs_to_schedule(session, dag_run_ids=dag_run_ids)
+                callback_tuples = self._schedule_all_dag_runs(guard, dag_runs, session)
+            self._send_dag_run_callbacks(callback_tuples, session)
+
     @retry_db_transaction
     def _schedule_all_dag_runs(
         self,
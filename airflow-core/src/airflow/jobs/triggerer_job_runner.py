@@ -85,6 +85,7 @@ from airflow.sdk.execution_time.comms import (
     GetVariable,
     GetVariableKeys,
     GetXCom,
+    GetXComBatch,
     MaskSecret,
     OKResponse,
     PutVariable,
@@ -96,6 +97,7 @@ from airflow.sdk.execution_time.comms import (
     UpdateHITLDetail,
     VariableKeysResult,
     VariableResult,
+    XComBatchResult,
     XComResult,
     _new_encoder,
     _RequestFrame,
@@ -119,6 +121,7 @@ from airflow.sdk.execution_time.request_handlers import (
     handle_get_variable,
     handle_get_variable_keys,
     handle_get_xcom,
+    handle_get_xcom_batch,
     handle_mask_secret,
     handle_put_variable,
     handle_set_asset_state_store_by_name,
@@ -367,6 +370,7 @@ ToTriggerRunner = Annotated[
     | ConnectionResult
     | VariableResult
     | VariableKeysResult
+    | XComBatchResult
     | XComResult
     | DagRunStateResult
     | DRCount
@@ -393,6 +397,7 @@ ToTriggerSupervisor = Annotated[
     | PutVariable
     | DeleteXCom
     | GetXCom
+    | GetXComBatch
     | SetXCom
     | GetTICount
     | GetTaskStates
@@ -635,8 +640,10 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
             resp, dump_opts = handle_delete_xcom(self.client, msg)
         elif isinstance(msg, GetXCom):
             resp, dump_opts = handle_get_xcom(self.client, msg)
+        elif isinstance(msg, GetXComBatch):
+            resp, dump_opts = handle_get_xcom_batch(self.client, msg)
         elif isinstance(msg, SetXCom):
-            resp, dump_opts = handle_set_xcom(self.client, msg)
+            resp, dump_opts = handle_set_xcom(self.client, msg, self._request_fds)
         elif isinstance(msg, GetDRCount):
             resp, dump_opts = handle_get_dr_count(self.client, msg)
         elif isinstance(msg, GetDagRunState):
@@ -1079,6 +1086,9 @@ class TriggerCommsDecoder(CommsDecoder[ToTriggerRunner, ToTriggerSupervisor]):
         factory=lambda: TypeAdapter(ToTriggerRunner), repr=False
     )
 
+    # Requests are written to the async stream, which can't carry file descriptors
+    supports_fds: ClassVar[bool] = False
+
     _pending: dict[int, asyncio.Future] = attrs.field(factory=dict, repr=False)
     _loop: asyncio.AbstractEventLoop | None = attrs.field(default=None, repr=False)
     _loop_thread_id: int | None = attrs.field(default=None, repr=False)
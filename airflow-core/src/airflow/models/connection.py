@@ -512,9 +512,12 @@ class Connection(Base, FernetFieldsMixin, LoggingMixin):
         try:
             uri = SecretCache.get_connection_uri(conn_id, team_name=team_name)
             return Connection(conn_id=conn_id, uri=uri)
+        except SecretCache.NotFoundException:
+            raise AirflowNotFoundException(f"The conn_id `{conn_id}` isn't defined") from None
         except SecretCache.NotPresentException:
             pass  # continue business
 
+        backend_failed = False
         # iterate over backends if not in cache (or expired)
         for secrets_backend in ensure_secrets_loaded():
             try:
@@ -528,12 +531,15 @@ class Connection(Base, FernetFieldsMixin, LoggingMixin):
                 # Authoritative deny — must NOT fall through to a less-restrictive backend.
                 raise
             except Exception:
+                backend_failed = True
                 log.debug(
                     "Unable to retrieve connection from secrets backend (%s). "
                     "Checking subsequent secrets backend.",
                     type(secrets_backend).__name__,
                 )
 
+        if not backend_failed:
+            SecretCache.save_connection_not_found(conn_id, team_name=team_name)
         raise AirflowNotFoundException(f"The conn_id `{conn_id}` isn't defined")
 
     def to_dict(self, *, prune_empty: bool = False, validate: bool = True) -> dict[str, Any]:
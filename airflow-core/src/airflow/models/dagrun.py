@@ -22,7 +22,7 @@ import logging
 import os
 import re
 from collections import defaultdict
-from collections.abc import Callable, Iterable, Iterator, Sequence
+from collections.abc import Callable, Collection, Iterable, Iterator, Sequence
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, NamedTuple, TypeVar, cast, overload
 from uuid import UUID
@@ -735,19 +735,7 @@ class DagRun(Base, LoggingMixin):
         return {dag_id: count for dag_id, count in session.execute(query)}
 
     @classmethod
-    @retry_db_transaction
-    def get_running_dag_runs_to_examine(
-        cls, *, session: Session, eagerly_load_dag_tags: bool
-    ) -> ScalarResult[DagRun]:
-        """
-        Return the next DagRuns that the scheduler should attempt to schedule.
-
-        This will return zero or more DagRun rows that are row-level-locked with a "SELECT ... FOR UPDATE"
-        query, you should ensure that any scheduling decisions are made in a single transaction -- as soon as
-        the transaction is committed it will be unlocked.
-
-        :meta private:
-        """
+    def _running_dag_runs_to_examine_query(cls, *, session: Session) -> Select[tuple[DagRun]]:
         from airflow.models.backfill import BackfillDagRun
         from airflow.models.dag import DagModel
 
@@ -768,6 +756,34 @@ class DagRun(Base, LoggingMixin):
             )
             .limit(cls.DEFAULT_DAGRUNS_TO_EXAMINE)
         )
+        return query.where(DagRun.run_after <= func.now())
+
+    @classmethod
+    @retry_db_transaction
+    def get_running_dag_runs_to_examine(
+        cls,
+        *,
+        session: Session,
+        eagerly_load_dag_tags: bool,
+        dag_run_ids: Collection[int] | None = None,
+    ) -> ScalarResult[DagRun]:
+        """
+        Return the next DagRuns that the scheduler should attempt to schedule.
+
+        This will return zero or more DagRun rows that are row-level-locked with a "SELECT ... FOR UPDATE"
+        query, you should ensure that any scheduling decisions are made in a single transaction -- as soon as
+        the transaction is committed it will be unlocked.
+
+        :param dag_run_ids: Only consider these DagRuns, as returned by
+            :meth:`get_running_dag_run_ids_to_examine`.
+
+        :meta private:
+        """
+        from airflow.models.dag import DagModel
+
+        query = cls._running_dag_runs_to_examine_query(session=session)
+        if dag_run_ids is not None:
+            query = query.where(cls.id.in_(dag_run_ids))
 
         # When dag tags are emitted as metric tags, eagerly load dag_model.tags so stats_tags does not
         # fire a per-DagRun N+1 lazy load in the scheduler loop. The caller owns the feature decision;
@@ -775,11 +791,23 @@ class DagRun(Base, LoggingMixin):
         if eagerly_load_dag_tags:
             query = query.options(joinedload(cls.dag_model).selectinload(DagModel.tags))
 
-        query = query.where(DagRun.run_after <= func.now())
-
         result = session.scalars(with_row_locks(query, of=cls, session=session, skip_locked=True)).unique()
         return result
 
+    @classmethod
+    @retry_db_transaction
+    def get_running_dag_run_ids_to_examine(cls, *, session: Session) -> list[tuple[str, int]]:
+        """
+        Return the ``(dag_id, id)`` of the next DagRuns that the scheduler should attempt to schedule.
+
+        Unlike :meth:`get_running_dag_runs_to_examine`, the rows are not locked. This lets the scheduler
+        split the DagRuns between several sessions, each locking its own share.
+
+        :meta private:
+        """
+        query = cls._running_dag_runs_to_examine_query(session=session).with_only_columns(cls.dag_id, cls.id)
+        return [(dag_id, dag_run_id) for dag_id, dag_run_id in session.execute(query)]
+
     @classmethod
     @retry_db_transaction
     def get_queued_dag_runs_to_set_running(cls, session: Session) -> ScalarResult[DagRun]:
@@ -1165,21 +1193,7 @@ class DagRun(Base, LoggingMixin):
         Teardown tasks by default are not considered for the purpose of dag run state.  But
         users may enable such consideration with on_failure_fail_dagrun.
         """
-
-        def is_effective_leaf(task):
-            for down_task_id in task.downstream_task_ids:
-                down_task = dag.get_task(down_task_id)
-                if not down_task.is_teardown or down_task.on_failure_fail_dagrun:
-                    # we found a down task that is not ignorable; not a leaf
-                    return False
-            # we found no ignorable downstreams
-            # evaluate whether task is itself ignorable
-            return not task.is_teardown or task.on_failure_fail_dagrun
-
-        leaf_task_ids = {x.task_id for x in dag.tasks if is_effective_leaf(x)}
-        if not leaf_task_ids:
-            # can happen if dag is exclusively teardown tasks
-            leaf_task_ids = {x.task_id for x in dag.tasks if not x.downstream_list}
+        leaf_task_ids = dag.graph.dagrun_state_leaf_task_ids
         leaf_tis = {ti for ti in tis if ti.task_id in leaf_task_ids if ti.state != TaskInstanceState.REMOVED}
         return leaf_tis
 
@@ -18,7 +18,7 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Sequence
+from collections.abc import Callable, Iterable, Mapping, Sequence
 from typing import TYPE_CHECKING, Any, TypedDict
 
 from sqlalchemy import Boolean, ForeignKey, Integer, String, Text, func, select
@@ -181,6 +181,7 @@ class Pool(Base):
     def slots_stats(
         *,
         lock_rows: bool = False,
+        occupied_slots: Callable[[], Mapping[tuple[str, str], int]] | None = None,
         session: Session = NEW_SESSION,
     ) -> dict[str, PoolStats]:
         """
@@ -191,6 +192,10 @@ class Pool(Base):
         OperationalError.
 
         :param lock_rows: Should we attempt to obtain a row-level lock on all the Pool rows returns
+        :param occupied_slots: Optional callable returning the slots used per ``(pool, state)``, for
+            callers that already keep track of them. It is called once the Pool rows have been read (and
+            locked), and replaces the aggregation over the task instance table. Scheduled task instances
+            are not counted in that case.
         :param session: SQLAlchemy ORM Session
         """
         from airflow.models.taskinstance import TaskInstance  # Avoid circular import
@@ -216,11 +221,17 @@ class Pool(Base):
             TaskInstanceState.DEFERRED,
             TaskInstanceState.SCHEDULED,
         }
-        state_count_by_pool = session.execute(
-            select(TaskInstance.pool, TaskInstance.state, func.sum(TaskInstance.pool_slots))
-            .filter(TaskInstance.state.in_(allowed_execution_states))
-            .group_by(TaskInstance.pool, TaskInstance.state)
-        )
+        state_count_by_pool: Iterable[Sequence[Any]]
+        if occupied_slots is not None:
+            state_count_by_pool = [
+                (pool_name, state, count) for (pool_name, state), count in occupied_slots().items()
+            ]
+        else:
+            state_count_by_pool = session.execute(
+                select(TaskInstance.pool, TaskInstance.state, func.sum(TaskInstance.pool_slots))
+                .filter(TaskInstance.state.in_(allowed_execution_states))
+                .group_by(TaskInstance.pool, TaskInstance.state)
+            )
 
         # calculate queued and running metrics
         for pool_name, state, decimal_count in state_count_by_pool:
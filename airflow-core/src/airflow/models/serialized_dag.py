@@ -26,6 +26,7 @@ from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Any, Literal, NamedTuple
 from uuid import UUID
 
+import msgspec
 import uuid6
 from sqlalchemy import JSON, ForeignKey, LargeBinary, String, Uuid, exists, select, tuple_, update
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB
@@ -58,7 +59,6 @@ from airflow.utils.sqlalchemy import UtcDateTime, get_dialect_name
 
 if TYPE_CHECKING:
     from sqlalchemy.orm import Session
-    from sqlalchemy.orm.attributes import InstrumentedAttribute
     from sqlalchemy.sql import Select
     from sqlalchemy.sql.elements import ColumnElement
 
@@ -71,6 +71,52 @@ log = logging.getLogger(__name__)
 # If set to True, serialized DAGs is compressed before writing to DB,
 _COMPRESS_SERIALIZED_DAGS = conf.getboolean("core", "compress_serialized_dags", fallback=False)
 
+# Encoding of serialized DAGs written to DB: "json" keeps them in the JSON ``data`` column (unless they
+# are compressed), "msgpack" always stores them in the binary ``data_compressed`` column.
+_SERIALIZED_DAG_STORAGE_FORMAT = conf.get("core", "serialized_dag_storage_format", fallback="json")
+
+_msgpack_encoder = msgspec.msgpack.Encoder()
+_msgpack_decoder = msgspec.msgpack.Decoder()
+
+
+def _encode_dag_data(dag_data: dict[str, Any]) -> bytes:
+    """Encode serialized DAG data for the ``data_compressed`` column, in the configured format."""
+    if _SERIALIZED_DAG_STORAGE_FORMAT == "msgpack":
+        encoded = _msgpack_encoder.encode(dag_data)
+    else:
+        # partially ordered json data
+        encoded = json.dumps(dag_data, sort_keys=True).encode("utf-8")
+    if _COMPRESS_SERIALIZED_DAGS:
+        return zlib.compress(encoded)
+    return encoded
+
+
+def _decode_dag_data(blob: bytes) -> dict[str, Any]:
+    """
+    Decode the ``data_compressed`` column, whatever the format it was written with.
+
+    A zlib stream starts with ``0x78``, a JSON document with ``{``, and neither is a valid first byte
+    of a msgpack map, so rows written before the storage format changed are still readable.
+    """
+    if blob[:1] == b"\x78":
+        blob = zlib.decompress(blob)
+    if blob[:1] == b"{":
+        return json.loads(blob)
+    return _msgpack_decoder.decode(blob)
+
+
+def _reencode_as_json(blob: bytes) -> bytes | None:
+    """
+    Re-encode a msgpack ``data_compressed`` value as compressed JSON, the format Airflow < 3.4 reads.
+
+    Return None if the value is JSON already.
+    """
+    decompressed = zlib.decompress(blob) if blob[:1] == b"\x78" else blob
+    if decompressed[:1] == b"{":
+        return None
+    dag_data = _msgpack_decoder.decode(decompressed)
+    return zlib.compress(json.dumps(dag_data, sort_keys=True).encode("utf-8"))
+
 
 class DagWriteMetadata(NamedTuple):
     """Pre-fetched metadata for write_dag to avoid per-DAG queries."""
@@ -345,23 +391,21 @@ class SerializedDagModel(Base):
 
     load_op_links = True
 
-    def __init__(self, dag: LazyDeserializedDAG) -> None:
+    def __init__(self, dag: LazyDeserializedDAG, *, dag_hash: str | None = None) -> None:
         self.dag_id = dag.dag_id
         dag_data = dag.data
-        self.dag_hash = SerializedDagModel.hash(dag_data)
-
-        # partially ordered json data
-        dag_data_json = json.dumps(dag_data, sort_keys=True).encode("utf-8")
+        # Callers that already hashed the data pass the hash in, to save sorting and dumping it again.
+        self.dag_hash = dag_hash or SerializedDagModel.hash(dag_data)
 
-        if _COMPRESS_SERIALIZED_DAGS:
+        if _COMPRESS_SERIALIZED_DAGS or _SERIALIZED_DAG_STORAGE_FORMAT == "msgpack":
             self._data = None
-            self._data_compressed = zlib.compress(dag_data_json)
+            self._data_compressed = _encode_dag_data(dag_data)
         else:
             self._data = dag_data
             self._data_compressed = None
 
         # serve as cache so no need to decompress and load, when accessing data field
-        # when COMPRESS_SERIALIZED_DAGS is True
+        # when the data is stored in the data_compressed column
         self.__data_cache: dict[Any, Any] | None = dag_data
 
     def __repr__(self) -> str:
@@ -687,7 +731,13 @@ class SerializedDagModel(Base):
         else:
             deadline_uuid_mapping = {}
 
-        new_dag_hash = cls.hash(dag.data)
+        new_dag_hash: str | None
+        if dag.dag_hash is not None and not dag.data.get("dag", {}).get("deadline"):
+            # Hashed by the DAG processor when it serialized the DAG; deadlines are excluded because the
+            # UUIDs generated above change the data.
+            new_dag_hash = dag.dag_hash
+        else:
+            new_dag_hash = cls.hash(dag.data)
 
         if serialized_dag_hash == new_dag_hash and dag_version and dag_version.bundle_name == bundle_name:
             # Serialized content is unchanged, so we don't create a new DagVersion.
@@ -727,7 +777,7 @@ class SerializedDagModel(Base):
             # This is for dynamic DAGs that the hashes changes often. We should update
             # the serialized dag, the dag_version and the dag_code instead of a new version
             # if the dag_version is not associated with any task instances
-            new_serialized_dag = cls(dag)
+            new_serialized_dag = cls(dag, dag_hash=new_dag_hash)
 
             # Use direct UPDATE to avoid loading the full serialized DAG
             result = session.execute(
@@ -778,8 +828,10 @@ class SerializedDagModel(Base):
         if reused_deadline_data:
             deadline_uuid_mapping = {str(uuid6.uuid7()): data for data in reused_deadline_data.values()}
             dag.data["dag"]["deadline"] = list(deadline_uuid_mapping.keys())
+            # The deadline UUIDs changed the data, so it has to be hashed again.
+            new_dag_hash = None
 
-        new_serialized_dag = cls(dag)
+        new_serialized_dag = cls(dag, dag_hash=new_dag_hash)
         new_serialized_dag.dag_version = dagv
         session.add(new_serialized_dag)
 
@@ -890,7 +942,7 @@ class SerializedDagModel(Base):
         # use __data_cache to avoid decompress and loads
         if not hasattr(self, "_SerializedDagModel__data_cache") or self.__data_cache is None:
             if self._data_compressed:
-                self.__data_cache = json.loads(zlib.decompress(self._data_compressed))
+                self.__data_cache = _decode_dag_data(self._data_compressed)
             else:
                 self.__data_cache = self._data
 
@@ -947,35 +999,34 @@ class SerializedDagModel(Base):
         :param session: ORM Session
         """
         load_json: Callable
-        data_col_to_select: ColumnElement[Any] | InstrumentedAttribute[bytes | None]
-        if _COMPRESS_SERIALIZED_DAGS is False:
-            dialect = get_dialect_name(session)
-            if dialect in ["sqlite", "mysql"]:
-                data_col_to_select = func.json_extract(cls._data, "$.dag.dag_dependencies")
-
-                def load_json(deps_data):
-                    return json.loads(deps_data) if deps_data else []
-            elif dialect == "postgresql":
-                # Use #> operator which works for both JSON and JSONB types
-                # Returns the JSON sub-object at the specified path
-                data_col_to_select = cls._data.op("#>")(
-                    literal(["dag", "dag_dependencies"], type_=ARRAY(String))
-                )
-                load_json = lambda x: x
-            else:
-                data_col_to_select = func.json_extract_path(cls._data, "dag", "dag_dependencies")
-                load_json = lambda x: x
-        else:
-            data_col_to_select = cls._data_compressed
+        data_col_to_select: ColumnElement[Any]
+        dialect = get_dialect_name(session)
+        if dialect in ["sqlite", "mysql"]:
+            data_col_to_select = func.json_extract(cls._data, "$.dag.dag_dependencies")
 
             def load_json(deps_data):
-                return json.loads(zlib.decompress(deps_data))["dag"]["dag_dependencies"] if deps_data else []
+                return json.loads(deps_data) if deps_data else []
+        elif dialect == "postgresql":
+            # Use #> operator which works for both JSON and JSONB types
+            # Returns the JSON sub-object at the specified path
+            data_col_to_select = cls._data.op("#>")(literal(["dag", "dag_dependencies"], type_=ARRAY(String)))
+            load_json = lambda x: x
+        else:
+            data_col_to_select = func.json_extract_path(cls._data, "dag", "dag_dependencies")
+            load_json = lambda x: x
+
+        def load_dependencies(deps_data, data_compressed):
+            # Rows are read from the column they were written to, whatever the current storage settings,
+            # as changing them does not rewrite the existing rows.
+            if data_compressed:
+                return _decode_dag_data(data_compressed)["dag"]["dag_dependencies"]
+            return load_json(deps_data) or []
 
         latest_sdag_subquery = (
             select(cls.dag_id, func.max(cls.created_at).label("max_created")).group_by(cls.dag_id).subquery()
         )
         query = session.execute(
-            select(cls.dag_id, data_col_to_select)
+            select(cls.dag_id, data_col_to_select, cls._data_compressed)
             .join(
                 latest_sdag_subquery,
                 (cls.dag_id == latest_sdag_subquery.c.dag_id)
@@ -984,7 +1035,10 @@ class SerializedDagModel(Base):
             .join(cls.dag_model)
             .where(~DagModel.is_stale)
         )
-        dag_depdendencies = [(str(dag_id), load_json(deps_data)) for dag_id, deps_data in query]
+        dag_depdendencies = [
+            (str(dag_id), load_dependencies(deps_data, data_compressed))
+            for dag_id, deps_data, data_compressed in query
+        ]
         resolver = _DagDependenciesResolver(dag_id_dependencies=dag_depdendencies, session=session)
         dag_depdendencies_by_dag = resolver.resolve()
         return dag_depdendencies_by_dag
@@ -20,7 +20,8 @@ from __future__ import annotations
 
 import datetime
 import functools
-from typing import TYPE_CHECKING, Any
+import threading
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 import methodtools
 
@@ -47,6 +48,14 @@ if TYPE_CHECKING:
     from airflow.ti_deps.deps.base_ti_dep import BaseTIDep
     from airflow.triggers.base import StartTriggerArgs
 
+T = TypeVar("T")
+
+# Guards decoding deferred fields, so two threads reading the same field do not both consume the encoded
+# value. Re-entrant as decoding a field may read other deferred fields.
+_deferred_fields_lock = threading.RLock()
+
+_MISSING = object()
+
 DEFAULT_OPERATOR_DEPS: frozenset[BaseTIDep] = frozenset(
     (
         NotInRetryPeriodDep(),
@@ -58,6 +67,41 @@ DEFAULT_OPERATOR_DEPS: frozenset[BaseTIDep] = frozenset(
 )
 
 
+class _DeferredField(Generic[T]):
+    """
+    Class-level default of an operator field that may be decoded on first access.
+
+    ``OperatorSerialization.populate_operator`` leaves the encoded value of some rarely used and
+    expensive fields in ``_deferred_fields``; reading the field decodes it and stores the result in
+    the instance ``__dict__``. Fields without a value, encoded or decoded, read as the default.
+    """
+
+    def __init__(self, default: T) -> None:
+        self.default = default
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: SerializedBaseOperator | None, owner: type | None = None) -> T:
+        if instance is None:
+            return self.default
+        try:
+            return instance.__dict__[self.name]
+        except KeyError:
+            pass
+        if self.name in instance.__dict__.get("_deferred_fields", ()):
+            return instance._decode_deferred_field(self.name)
+        return self.default
+
+    def __set__(self, instance: SerializedBaseOperator, value: T) -> None:
+        if self.name not in instance.__dict__.get("_deferred_fields", ()):
+            instance.__dict__[self.name] = value
+            return
+        with _deferred_fields_lock:
+            instance.__dict__["_deferred_fields"].pop(self.name, None)
+            instance.__dict__[self.name] = value
+
+
 class SerializedBaseOperator(DAGNode):
     """
     Serialized representation of a BaseOperator instance.
@@ -90,10 +134,10 @@ class SerializedBaseOperator(DAGNode):
 
     execution_timeout: datetime.timedelta | None = None
     executor: str | None = None
-    executor_config: dict = {}
+    executor_config: _DeferredField[dict] = _DeferredField({})
     ignore_first_depends_on_past: bool = False
 
-    inlets: Sequence = []
+    inlets: _DeferredField[Sequence] = _DeferredField([])
     is_setup: bool = False
     is_teardown: bool = False
 
@@ -113,9 +157,9 @@ class SerializedBaseOperator(DAGNode):
     operator_extra_links: Collection[XComOperatorLink] = []
     on_failure_fail_dagrun: bool = False
 
-    outlets: Sequence = []
+    outlets: _DeferredField[Sequence] = _DeferredField([])
     owner: str = "airflow"
-    params: SerializedParamsDict = SerializedParamsDict()
+    params: _DeferredField[SerializedParamsDict] = _DeferredField(SerializedParamsDict())
     pool: str = "default_pool"
     pool_slots: int = 1
     priority_weight: int = 1
@@ -318,7 +362,23 @@ class SerializedBaseOperator(DAGNode):
             return self._weight_rule
         return validate_and_load_priority_weight_strategy(self._weight_rule)
 
+    def _decode_deferred_field(self, name: str) -> Any:
+        """Decode a field left encoded by ``OperatorSerialization.populate_operator`` and store it."""
+        from airflow.serialization.serialized_objects import OperatorSerialization
+
+        with _deferred_fields_lock:
+            # Another thread may have decoded the field while this one waited for the lock.
+            if (encoded := self.__dict__["_deferred_fields"].get(name, _MISSING)) is _MISSING:
+                return self.__dict__[name]
+            value = OperatorSerialization.deserialize_deferred_field(name, encoded)
+            self.__dict__[name] = value
+            del self.__dict__["_deferred_fields"][name]
+        return value
+
     def __getattr__(self, name):
+        # Fields not declared on the class (e.g. operator specific attributes) may still be encoded
+        if name in self.__dict__.get("_deferred_fields", ()):
+            return self._decode_deferred_field(name)
         # Handle missing attributes with task_type instead of SerializedBaseOperator
         # Don't intercept special methods that Python internals might check
         if name.startswith("__") and name.endswith("__"):
@@ -73,6 +73,7 @@ if TYPE_CHECKING:
 
     from airflow.models.taskinstance import TaskInstance
     from airflow.sdk import DAG
+    from airflow.serialization.definitions.graph import SerializedDagGraph
     from airflow.serialization.definitions.taskgroup import SerializedTaskGroup
     from airflow.serialization.serialized_objects import LazyDeserializedDAG, SerializedOperator
     from airflow.timetables.base import Timetable
@@ -274,6 +275,17 @@ class SerializedDAG:
             return tg
         raise NodeNotFound(f"Task or group {node_id!r} not found")
 
+    @functools.cached_property
+    def graph(self) -> SerializedDagGraph:
+        """
+        Integer-indexed dependency graph of the tasks, built on first access.
+
+        ``DBDagBag`` keeps one SerializedDAG per Dag version, so the graph is built once per version.
+        """
+        from airflow.serialization.definitions.graph import SerializedDagGraph
+
+        return SerializedDagGraph.from_dag(self)
+
     @property
     def task_group_dict(self):
         return {k: v for k, v in self.task_group.get_task_group_dict().items() if k is not None}
@@ -296,6 +308,8 @@ class SerializedDAG:
         # deep-copying self.task_dict and self.task_group takes a long time, and we don't want all
         # the tasks anyway, so we copy the tasks manually later
         memo = {id(self.task_dict): None, id(self.task_group): None}
+        if "graph" in self.__dict__:
+            memo[id(self.graph)] = None
         dag = copy.deepcopy(self, memo)
 
         if isinstance(task_ids, str):
@@ -392,6 +406,8 @@ class SerializedDAG:
             t.downstream_task_ids.intersection_update(dag.task_dict)
 
         dag.partial = len(dag.tasks) < len(self.tasks)
+        # The graph was not copied, the subset builds its own when it is needed.
+        dag.__dict__.pop("graph", None)
 
         return dag
 
@@ -0,0 +1,148 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, Sequence
+
+    from airflow.serialization.definitions.dag import SerializedDAG, SerializedOperator
+
+__all__ = ["SerializedDagGraph"]
+
+
+def _to_csr(adjacency: Iterable[Iterable[int]]) -> tuple[array, array]:
+    """Pack per-node neighbour lists into CSR ``(offsets, indexes)`` arrays."""
+    offsets = array("I", [0])
+    indexes = array("I")
+    for neighbours in adjacency:
+        indexes.extend(sorted(neighbours))
+        offsets.append(len(indexes))
+    return offsets, indexes
+
+
+class SerializedDagGraph:
+    """
+    Integer-indexed dependency graph of a :class:`~airflow.serialization.definitions.dag.SerializedDAG`.
+
+    Tasks are numbered by their position in ``task_dict``, and upstream and downstream relations are
+    packed in CSR arrays, so walking the graph is index arithmetic instead of looking up sets of
+    task ids on each operator. The graph is built once per Dag version (see ``SerializedDAG.graph``)
+    and never changes after that; only the relevant setups are filled in lazily, per task.
+    """
+
+    __slots__ = (
+        "_downstream",
+        "_downstream_offsets",
+        "_index",
+        "_is_setup",
+        "_is_teardown",
+        "_relevant_setups",
+        "_upstream",
+        "_upstream_offsets",
+        "dagrun_state_leaf_task_ids",
+        "task_ids",
+    )
+
+    task_ids: tuple[str, ...]
+    """Task ids, by task index."""
+
+    dagrun_state_leaf_task_ids: frozenset[str]
+    """
+    Tasks whose state decides the state of a Dag run.
+
+    These are the leaves once teardowns that do not fail the Dag run are ignored, or the plain
+    leaves if that leaves nothing, e.g. when the Dag only has teardown tasks.
+    """
+
+    def __init__(self, tasks: Sequence[SerializedOperator]) -> None:
+        self.task_ids = tuple(task.task_id for task in tasks)
+        self._index: Mapping[str, int] = {task_id: i for i, task_id in enumerate(self.task_ids)}
+        self._upstream_offsets, self._upstream = _to_csr(
+            (self._index[u] for u in task.upstream_task_ids if u in self._index) for task in tasks
+        )
+        self._downstream_offsets, self._downstream = _to_csr(
+            (self._index[d] for d in task.downstream_task_ids if d in self._index) for task in tasks
+        )
+        self._is_setup = bytes(task.is_setup for task in tasks)
+        self._is_teardown = bytes(task.is_teardown for task in tasks)
+        self._relevant_setups: dict[int, tuple[str, ...]] = {}
+
+        def is_ignorable(i: int) -> bool:
+            return bool(self._is_teardown[i]) and not tasks[i].on_failure_fail_dagrun
+
+        self.dagrun_state_leaf_task_ids = frozenset(
+            task_id
+            for i, task_id in enumerate(self.task_ids)
+            if not is_ignorable(i) and all(is_ignorable(d) for d in self._downstream_indexes(i))
+        ) or frozenset(task_id for i, task_id in enumerate(self.task_ids) if not self._downstream_indexes(i))
+
+    @classmethod
+    def from_dag(cls, dag: SerializedDAG) -> SerializedDagGraph:
+        return cls(list(dag.task_dict.values()))
+
+    def __len__(self) -> int:
+        return len(self.task_ids)
+
+    def relevant_setup_task_ids(self, task_id: str) -> tuple[str, ...]:
+        """
+        Return the upstream setups a task has to wait for.
+
+        This matches ``get_upstreams_only_setups`` of the task: an upstream setup is relevant if it
+        has no teardowns, or if one of its teardowns is downstream of the task.
+        """
+        i = self._index[task_id]
+        if (setups := self._relevant_setups.get(i)) is not None:
+            return setups
+        if 1 not in self._is_setup:
+            setups = ()
+        else:
+            downstream_teardowns = {
+                j for j in self._flat_relative_indexes(i, upstream=False) if self._is_teardown[j]
+            }
+            relevant: list[str] = []
+            for j in sorted(self._flat_relative_indexes(i, upstream=True)):
+                if not self._is_setup[j]:
+                    continue
+                teardowns = {k for k in self._downstream_indexes(j) if self._is_teardown[k]}
+                if not teardowns or not teardowns.isdisjoint(downstream_teardowns):
+                    relevant.append(self.task_ids[j])
+            setups = tuple(relevant)
+        self._relevant_setups[i] = setups
+        return setups
+
+    def _upstream_indexes(self, i: int) -> Sequence[int]:
+        return self._upstream[self._upstream_offsets[i] : self._upstream_offsets[i + 1]]
+
+    def _downstream_indexes(self, i: int) -> Sequence[int]:
+        return self._downstream[self._downstream_offsets[i] : self._downstream_offsets[i + 1]]
+
+    def _flat_relative_indexes(self, i: int, upstream: bool = False) -> set[int]:
+        """Return the indexes of all the transitive upstream (or downstream) tasks of a task."""
+        neighbours = self._upstream_indexes if upstream else self._downstream_indexes
+        relatives: set[int] = set()
+        to_visit = list(neighbours(i))
+        while to_visit:
+            if (j := to_visit.pop()) in relatives:
+                continue
+            relatives.add(j)
+            to_visit.extend(neighbours(j))
+        return relatives
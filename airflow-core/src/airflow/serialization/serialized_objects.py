@@ -983,6 +983,11 @@ class OperatorSerialization(DAGNode, BaseSerialization):
 
     _decorated_fields = {"executor_config"}
 
+    # Leave the fields that need a full ``deserialize`` (or building params) encoded until they are
+    # first read, see ``_DeferredField``. Most of the scheduler only reads task_id, trigger_rule, pool,
+    # priority weight and the dependencies, so decoding everything up front wastes time and memory.
+    _deserialize_lazily = True
+
     _CONSTRUCTOR_PARAMS = {}
 
     _json_schema: ClassVar[Validator] = lazy_object_proxy.Proxy(load_dag_schema)
@@ -1142,6 +1147,7 @@ class OperatorSerialization(DAGNode, BaseSerialization):
                 )
 
         deserialized_partial_kwarg_defaults = {}
+        deferred_fields: dict[str, Any] = {}
 
         for k_in, v_in in encoded_op.items():
             k = k_in  # surpass PLW2901
@@ -1149,6 +1155,9 @@ class OperatorSerialization(DAGNode, BaseSerialization):
             # Use centralized field deserialization logic
             if k in encoded_op.get("template_fields", []):
                 pass  # Template fields are handled separately
+            elif cls._deserialize_lazily and not op.is_mapped and cls._is_deferrable_field(op, k):
+                deferred_fields[k] = v
+                continue
             elif k == "_operator_extra_links":
                 if cls._load_operator_extra_links:
                     op_predefined_extra_links = cls._deserialize_operator_extra_links(v)
@@ -1212,6 +1221,9 @@ class OperatorSerialization(DAGNode, BaseSerialization):
             # else use v as it is
             setattr(op, k, v)
 
+        if deferred_fields:
+            op.__dict__["_deferred_fields"] = deferred_fields
+
         # Apply the fields that belong in partial_kwargs for MappedOperator
         if op.is_mapped:
             for k, v in deserialized_partial_kwarg_defaults.items():
@@ -1243,6 +1255,27 @@ class OperatorSerialization(DAGNode, BaseSerialization):
         setattr(op, "start_trigger_args", start_trigger_args)
         setattr(op, "start_from_trigger", bool(encoded_op.get("start_from_trigger", False)))
 
+    @classmethod
+    def _is_deferrable_field(cls, op: SerializedOperator, field_name: str) -> bool:
+        """Whether ``populate_operator`` may leave the field encoded until it is first read."""
+        if field_name == "params" or field_name in cls._decorated_fields:
+            return True
+        if field_name in ("outlets", "inlets"):
+            return True
+        # Other fields are only read through ``__getattr__``, which a class attribute would shadow.
+        return (
+            field_name not in op.get_serialized_fields()
+            and not field_name.startswith("_")
+            and not hasattr(type(op), field_name)
+        )
+
+    @classmethod
+    def deserialize_deferred_field(cls, field_name: str, value: Any) -> Any:
+        """Decode a field that ``populate_operator`` left encoded, the way it would have decoded it."""
+        if field_name == "params":
+            return cls._deserialize_params_dict(value)
+        return cls.deserialize(value)
+
     @staticmethod
     def set_task_dag_references(task: SerializedOperator | MappedOperator, dag: SerializedDAG) -> None:
         """
@@ -2233,6 +2266,8 @@ class LazyDeserializedDAG(pydantic.BaseModel):
 
     data: dict
     last_loaded: datetime.datetime | None = None
+    dag_hash: str | None = None
+    """Hash of ``data``, if the DAG processor computed it when it serialized the DAG."""
 
     NULLABLE_PROPERTIES: ClassVar[set[str]] = {
         # Non attr fields that should be nullable, or attrs with a different default
@@ -18,6 +18,7 @@
 from __future__ import annotations
 
 import contextlib
+from collections import Counter
 from typing import TYPE_CHECKING
 
 import attr
@@ -107,6 +108,15 @@ class DepContext:
     fresh empty dict, so they would neither read the memo nor warm it for anything else.
     """
 
+    finished_ti_state_counts: dict[str, Counter[str]] | None = attr.ib(default=None, repr=False)
+    """
+    Number of finished task instances in each state, per task_id, aggregated from ``finished_tis``.
+
+    Built once by :meth:`ensure_finished_ti_state_counts` so the trigger rule of every task instance
+    evaluated in the pass can be checked against its upstream tasks without re-scanning ``finished_tis``.
+    Like ``upstream_task_id_counts`` it must be an ``init=True`` field to survive ``attrs.evolve``.
+    """
+
     def ensure_finished_tis(self, dag_run: DagRun, session: Session) -> list[TaskInstance]:
         """
         Ensure finished_tis is populated if it's currently None, which allows running tasks without dag_run.
@@ -134,3 +144,19 @@ class DepContext:
         later in the same pass recomputes the count instead of reading a stale one.
         """
         self.upstream_task_id_counts.clear()
+
+    def ensure_finished_ti_state_counts(self, dag_run: DagRun, session: Session) -> dict[str, Counter[str]]:
+        """
+        Ensure finished_ti_state_counts is populated from the finished task instances of ``dag_run``.
+
+        :param dag_run: The DagRun for which to count finished tasks
+        :return: The number of finished task instances in each state, per task_id
+        """
+        if self.finished_ti_state_counts is None:
+            counts: dict[str, Counter[str]] = {}
+            for ti in self.ensure_finished_tis(dag_run, session=session):
+                if TYPE_CHECKING:
+                    assert ti.state
+                counts.setdefault(ti.task_id, Counter())[ti.state] += 1
+            self.finished_ti_state_counts = counts
+        return self.finished_ti_state_counts
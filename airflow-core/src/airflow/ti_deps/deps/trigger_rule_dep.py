@@ -77,6 +77,34 @@ class _UpstreamTIStates(NamedTuple):
             counter.update(curr_state)
             if ti.task.is_setup:
                 setup_counter.update(curr_state)
+        return cls._from_counters(counter, setup_counter)
+
+    @classmethod
+    def calculate_from_task_counts(
+        cls, state_counts_by_task: Mapping[str, Counter[str]], upstream_tasks: Mapping[str, Operator]
+    ) -> _UpstreamTIStates:
+        """
+        Calculate states for a task instance from the finished task instances counted per task.
+
+        This gives the same result as :meth:`calculate` when every task instance of each upstream task is
+        relevant, i.e. when the task is not in a mapped task group, but only costs one lookup per upstream
+        task instead of a scan over all the finished task instances of the dag_run.
+
+        :param state_counts_by_task: number of finished task instances in each state, per task_id
+        :param upstream_tasks: the relevant upstream tasks, by task_id
+        """
+        counter: Counter[str] = Counter()
+        setup_counter: Counter[str] = Counter()
+        for task_id, upstream_task in upstream_tasks.items():
+            if not (state_counts := state_counts_by_task.get(task_id)):
+                continue
+            counter.update(state_counts)
+            if upstream_task.is_setup:
+                setup_counter.update(state_counts)
+        return cls._from_counters(counter, setup_counter)
+
+    @classmethod
+    def _from_counters(cls, counter: Counter[str], setup_counter: Counter[str]) -> _UpstreamTIStates:
         return _UpstreamTIStates(
             success=counter.get(TaskInstanceState.SUCCESS, 0),
             skipped=counter.get(TaskInstanceState.SKIPPED, 0),
@@ -89,6 +117,19 @@ class _UpstreamTIStates(NamedTuple):
         )
 
 
+def _get_relevant_setups(task: Operator) -> dict[str, Operator]:
+    """Return the upstream setups of a task that have to succeed, by task id."""
+    from airflow.serialization.definitions.dag import SerializedDAG
+
+    dag = task.dag
+    if isinstance(dag, SerializedDAG):
+        return {
+            setup_id: dag.task_dict[setup_id] for setup_id in dag.graph.relevant_setup_task_ids(task.task_id)
+        }
+    # Tasks that are not attached to a serialized Dag (e.g. SDK tasks) do not have a precomputed graph.
+    return {t.task_id: t for t in task.get_upstreams_only_setups()}
+
+
 class TriggerRuleDep(BaseTIDep):
     """Determines if a task's upstream tasks are in a state that allows a given task instance to run."""
 
@@ -269,6 +310,21 @@ class TriggerRuleDep(BaseTIDep):
                 else:
                     yield and_(TaskInstance.task_id == upstream_id, TaskInstance.map_index == map_indexes)
 
+        def _calculate_upstream_states(upstream_tasks: Mapping[str, Operator]) -> _UpstreamTIStates:
+            dag_run = ti.get_dagrun(session=session)
+            # Outside a mapped task group every task instance of an upstream task is relevant, so the
+            # counts can be read from the per-task aggregate shared by all the tis of this pass.
+            if task.get_closest_mapped_task_group() is None:
+                return _UpstreamTIStates.calculate_from_task_counts(
+                    dep_context.ensure_finished_ti_state_counts(dag_run, session=session),
+                    upstream_tasks,
+                )
+            return _UpstreamTIStates.calculate(
+                finished_ti
+                for finished_ti in dep_context.ensure_finished_tis(dag_run, session=session)
+                if _is_relevant_upstream(upstream=finished_ti, relevant_ids=upstream_tasks.keys())
+            )
+
         def _evaluate_setup_constraint(
             *, relevant_setups: Mapping[str, Operator]
         ) -> Iterator[tuple[TIDepStatus, bool]]:
@@ -281,12 +337,7 @@ class TriggerRuleDep(BaseTIDep):
                 return
 
             indirect_setups = {k: v for k, v in relevant_setups.items() if k not in task.upstream_task_ids}
-            finished_upstream_tis = (
-                x
-                for x in dep_context.ensure_finished_tis(ti.get_dagrun(session=session), session=session)
-                if _is_relevant_upstream(upstream=x, relevant_ids=indirect_setups.keys())
-            )
-            upstream_states = _UpstreamTIStates.calculate(finished_upstream_tis)
+            upstream_states = _calculate_upstream_states(upstream_tasks=indirect_setups)
 
             # all of these counts reflect indirect setups which are relevant for this ti
             success = upstream_states.success
@@ -364,14 +415,7 @@ class TriggerRuleDep(BaseTIDep):
             trigger_rule = task.trigger_rule
             trigger_rule_str = getattr(trigger_rule, "value", trigger_rule)
 
-            finished_upstream_tis = (
-                finished_ti
-                for finished_ti in dep_context.ensure_finished_tis(
-                    ti.get_dagrun(session=session), session=session
-                )
-                if _is_relevant_upstream(upstream=finished_ti, relevant_ids=task.upstream_task_ids)
-            )
-            upstream_states = _UpstreamTIStates.calculate(finished_upstream_tis)
+            upstream_states = _calculate_upstream_states(upstream_tasks=upstream_tasks)
 
             success = upstream_states.success
             skipped = upstream_states.skipped
@@ -725,7 +769,7 @@ class TriggerRuleDep(BaseTIDep):
 
         if not task.is_teardown:
             # a teardown cannot have any indirect setups
-            if relevant_setups := {t.task_id: t for t in task.get_upstreams_only_setups()}:
+            if relevant_setups := _get_relevant_setups(task):
                 for status, changed in _evaluate_setup_constraint(relevant_setups=relevant_setups):
                     yield status
                     if not status.passed and changed:
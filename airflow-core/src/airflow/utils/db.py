@@ -51,6 +51,7 @@ from sqlalchemy import (
     or_,
     select,
     text,
+    update,
 )
 
 import airflow
@@ -1424,16 +1425,62 @@ def downgrade(*, to_revision, from_revision=None, show_sql_only=False, session:
     ):
         if show_sql_only:
             log.warning("Generating sql scripts for manual migration.")
+            if _revision_greater(config, _REVISION_HEADS_MAP["3.3.0"], to_revision):
+                log.warning(
+                    "The generated scripts do not re-encode serialized Dags stored as msgpack, which "
+                    "Airflow < 3.4 cannot read. Downgrade without --show-sql-only if any Dag was stored "
+                    "with `[core] serialized_dag_storage_format` set to msgpack."
+                )
             if not from_revision:
                 from_revision = _get_current_revision(work_session)
             revision_range = f"{from_revision}:{to_revision}"
             _offline_migration(command.downgrade, config=config, revision=revision_range)
         else:
+            # Airflow < 3.4 cannot read serialized Dags stored as msgpack, nor can its migrations
+            if _revision_greater(config, _REVISION_HEADS_MAP["3.3.0"], to_revision):
+                _reencode_msgpack_serialized_dags(session=work_session)
             dialect_label = " (MySQL)" if get_dialect_name(work_session) == "mysql" else ""
             log.info("Applying downgrade migrations to Airflow database%s.", dialect_label)
             command.downgrade(config, revision=to_revision, sql=show_sql_only)
 
 
+def _reencode_msgpack_serialized_dags(*, session: Session, batch_size: int = 100) -> None:
+    """
+    Rewrite the serialized Dags stored as msgpack as compressed JSON.
+
+    Compressed JSON in the ``data_compressed`` column is readable by every Airflow 3 version, so the
+    rows stay readable whatever ``[core] serialized_dag_storage_format`` is set to after the downgrade.
+
+    :param session: sqlalchemy session for connection to airflow metadata database
+    :param batch_size: number of serialized Dags loaded at once
+    """
+    from airflow.models.serialized_dag import SerializedDagModel, _reencode_as_json
+
+    ids = session.scalars(
+        select(SerializedDagModel.id).where(SerializedDagModel._data_compressed.is_not(None))
+    ).all()
+    reencoded = 0
+    for batch in helpers.chunks(ids, batch_size):
+        rows = session.execute(
+            select(SerializedDagModel.id, SerializedDagModel._data_compressed).where(
+                SerializedDagModel.id.in_(batch)
+            )
+        )
+        for row_id, data_compressed in rows.all():
+            if (data_json := _reencode_as_json(data_compressed)) is None:
+                continue
+            session.execute(
+                update(SerializedDagModel)
+                .where(SerializedDagModel.id == row_id)
+                .values(_data_compressed=data_json)
+                .execution_options(synchronize_session=False)
+            )
+            reencoded += 1
+    session.commit()
+    if reencoded:
+        log.info("Re-encoded %d serialized Dags stored as msgpack to compressed JSON.", reencoded)
+
+
 def _get_fab_migration_version(*, session: Session) -> str | None:
     """
     Get the current FAB migration version from the database.
@@ -2995,6 +2995,194 @@ class TestTIHealthEndpoint:
         assert ti.last_heartbeat_at == new_time
 
 
+class TestTIBatchHeartbeat:
+    def setup_method(self):
+        clear_db_runs()
+
+    def teardown_method(self):
+        clear_db_runs()
+
+    @pytest.fixture
+    def validator(self):
+        """Accept a token ``token-<ti id>`` as valid for that TI only, and expiring far in the future."""
+        validator = mock.AsyncMock(spec=JWTValidator)
+
+        async def avalidated_claims(token, required_claims):
+            sub = token.removeprefix("token-")
+            if required_claims.get("sub") != sub:
+                raise ValueError("Invalid token")
+            return {"sub": sub, "exp": 9999999999, "iat": 1000000000, "nbf": 1000000000}
+
+        validator.avalidated_claims.side_effect = avalidated_claims
+        lifespan.registry.register_value(JWTValidator, validator)
+        return validator
+
+    @staticmethod
+    def _heartbeat(ti_id, hostname="random-hostname", pid=1789, token=None):
+        return {"id": str(ti_id), "hostname": hostname, "pid": pid, "token": token or f"token-{ti_id}"}
+
+    @pytest.mark.usefixtures("validator")
+    def test_ti_batch_heartbeat(self, client, session, create_task_instance, time_machine):
+        time_now = timezone.parse("2024-10-31T12:00:00Z")
+        time_machine.move_to(time_now, tick=False)
+
+        running, elsewhere, finished, cleared, forged = (
+            create_task_instance(
+                dag_id=f"test_ti_batch_heartbeat_{i}",
+                state=state,
+                hostname="random-hostname",
+                pid=1789,
+                session=session,
+            )
+            for i, state in enumerate(
+                [State.RUNNING, State.RUNNING, State.SUCCESS, State.RUNNING, State.RUNNING]
+            )
+        )
+        session.commit()
+        cleared_id = cleared.id
+        cleared.prepare_db_for_next_try(session)
+        session.commit()
+        missing_id = uuid6.uuid7()
+
+        response = client.put(
+            "/execution/task-instances/heartbeats",
+            json={
+                "heartbeats": [
+                    self._heartbeat(running.id),
+                    self._heartbeat(elsewhere.id, pid=1054),
+                    self._heartbeat(finished.id),
+                    self._heartbeat(cleared_id),
+                    self._heartbeat(missing_id),
+                    self._heartbeat(forged.id, token=f"token-{running.id}"),
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        failures = {
+            UUID(f["id"]): (f["status_code"], f["detail"]["reason"]) for f in response.json()["failures"]
+        }
+        assert failures == {
+            elsewhere.id: (409, "running_elsewhere"),
+            finished.id: (409, "not_running"),
+            cleared_id: (410, "not_found"),
+            missing_id: (404, "not_found"),
+            forged.id: (403, "invalid_token"),
+        }
+        assert response.json()["refreshed_tokens"] == {}
+
+        last_heartbeats = dict(
+            session.execute(
+                select(TaskInstance.id, TaskInstance.last_heartbeat_at).where(
+                    TaskInstance.id.in_([running.id, elsewhere.id, finished.id, forged.id])
+                )
+            ).all()
+        )
+        assert last_heartbeats == {
+            running.id: time_now,
+            elsewhere.id: None,
+            finished.id: None,
+            forged.id: None,
+        }
+
+    @pytest.mark.usefixtures("validator", "_use_real_jwt_bearer")
+    def test_ti_batch_heartbeat_authorized_by_heartbeat_tokens_only(
+        self, client, session, create_task_instance
+    ):
+        """The token the request is sent with, here an invalid one, plays no part in authorizing it."""
+        ti = create_task_instance(
+            task_id="test_ti_batch_heartbeat_tokens_only",
+            state=State.RUNNING,
+            hostname="random-hostname",
+            pid=1789,
+            session=session,
+        )
+        session.commit()
+
+        response = client.put(
+            "/execution/task-instances/heartbeats", json={"heartbeats": [self._heartbeat(ti.id)]}
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {"failures": [], "refreshed_tokens": {}}
+        session.expire_all()
+        assert session.get(TaskInstance, ti.id).last_heartbeat_at is not None
+
+    def test_ti_batch_heartbeat_refreshes_expiring_tokens(
+        self, client, session, create_task_instance, validator, time_machine
+    ):
+        time_machine.move_to(timezone.parse("2024-10-31T12:00:00Z"), tick=False)
+        ti = create_task_instance(
+            task_id="test_ti_batch_heartbeat_refresh",
+            state=State.RUNNING,
+            hostname="random-hostname",
+            pid=1789,
+            session=session,
+        )
+        session.commit()
+
+        now = int(timezone.utcnow().timestamp())
+        expiring_claims = {"sub": str(ti.id), "exp": now + 10, "iat": now - 590}
+
+        async def avalidated_claims(token, required_claims):
+            if token != f"token-{ti.id}":
+                raise ValueError("Invalid token")
+            return dict(expiring_claims)
+
+        validator.avalidated_claims.side_effect = avalidated_claims
+        generator = mock.Mock(spec=JWTGenerator)
+        generator.generate.return_value = "refreshed-token"
+        lifespan.registry.register_value(JWTGenerator, generator)
+
+        response = client.put(
+            "/execution/task-instances/heartbeats", json={"heartbeats": [self._heartbeat(ti.id)]}
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {"failures": [], "refreshed_tokens": {str(ti.id): "refreshed-token"}}
+        generator.generate.assert_called_once_with({**expiring_claims, "scope": "execution"})
+
+    @pytest.mark.usefixtures("validator")
+    def test_ti_batch_heartbeat_single_update_when_all_running(
+        self, client, session, create_task_instance, monkeypatch
+    ):
+        """When every heartbeat matches, the batch is one UPDATE with no diagnostic SELECT."""
+        tis = [
+            create_task_instance(
+                dag_id=f"test_ti_batch_heartbeat_single_{i}",
+                state=State.RUNNING,
+                hostname="random-hostname",
+                pid=1789,
+                session=session,
+            )
+            for i in range(3)
+        ]
+        session.commit()
+
+        original_execute = Session.execute
+        task_instance_updates = []
+        selects = []
+
+        def counting_execute(session_obj, statement, *args, **kwargs):
+            if _is_task_instance_update(statement):
+                task_instance_updates.append(statement)
+            if getattr(statement, "is_select", False):
+                selects.append(statement)
+            return original_execute(session_obj, statement, *args, **kwargs)
+
+        monkeypatch.setattr(Session, "execute", counting_execute)
+
+        response = client.put(
+            "/execution/task-instances/heartbeats",
+            json={"heartbeats": [self._heartbeat(ti.id) for ti in tis]},
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {"failures": [], "refreshed_tokens": {}}
+        assert len(task_instance_updates) == 1
+        assert selects == []
+
+
 class TestTIPutRTIF:
     def setup_method(self):
         clear_db_runs()
@@ -329,6 +329,79 @@ class TestXComsGetEndpoint:
         assert set(response.json()) == set(expected_xcoms)
 
 
+class TestXComsGetBatchEndpoint:
+    def test_xcom_get_batch(self, client, dag_maker, session):
+        with dag_maker(dag_id="dag"):
+            EmptyOperator.partial(task_id="mapped").expand(doc_md=["a", "b", "c"])
+            EmptyOperator(task_id="unmapped")
+        dag_run = dag_maker.create_dagrun(run_id="runid")
+
+        for task_id, map_index, value in [("mapped", 0, "m0"), ("mapped", 2, "m2"), ("unmapped", -1, "u")]:
+            session.add(
+                XComModel(
+                    key="xcom_1",
+                    value=value,
+                    dag_run_id=dag_run.id,
+                    run_id=dag_run.run_id,
+                    task_id=task_id,
+                    dag_id="dag",
+                    map_index=map_index,
+                )
+            )
+        session.commit()
+
+        response = client.post(
+            "/execution/xcoms/dag/runid",
+            json={"key": "xcom_1", "task_ids": ["mapped", "unmapped"], "map_indexes": [-1, 0, 1, 2]},
+        )
+
+        assert response.status_code == 200
+        # XComs that don't exist, like map index 1 of "mapped", are left out
+        assert sorted(response.json()["xcoms"], key=lambda x: (x["task_id"], x["map_index"])) == [
+            {"task_id": "mapped", "map_index": 0, "value": "m0"},
+            {"task_id": "mapped", "map_index": 2, "value": "m2"},
+            {"task_id": "unmapped", "map_index": -1, "value": "u"},
+        ]
+
+    def test_xcom_get_batch_all_map_indexes(self, client, dag_maker, session):
+        with dag_maker(dag_id="dag"):
+            EmptyOperator.partial(task_id="mapped").expand(doc_md=["a", "b", "c"])
+            EmptyOperator(task_id="unmapped")
+            EmptyOperator(task_id="other")
+        dag_run = dag_maker.create_dagrun(run_id="runid")
+
+        for task_id, map_index, value in [("mapped", 2, "m2"), ("mapped", 0, "m0"), ("unmapped", -1, "u")]:
+            session.add(
+                XComModel(
+                    key="xcom_1",
+                    value=value,
+                    dag_run_id=dag_run.id,
+                    run_id=dag_run.run_id,
+                    task_id=task_id,
+                    dag_id="dag",
+                    map_index=map_index,
+                )
+            )
+        session.commit()
+
+        response = client.post(
+            "/execution/xcoms/dag/runid",
+            json={"key": "xcom_1", "task_ids": ["unmapped", "mapped", "other"], "map_indexes": None},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["xcoms"] == [
+            {"task_id": "mapped", "map_index": 0, "value": "m0"},
+            {"task_id": "mapped", "map_index": 2, "value": "m2"},
+            {"task_id": "unmapped", "map_index": -1, "value": "u"},
+        ]
+
+    def test_xcom_get_batch_requires_task_ids(self, client):
+        response = client.post("/execution/xcoms/dag/runid", json={"key": "xcom_1"})
+
+        assert response.status_code == 422
+
+
 class TestXComsSetEndpoint:
     @pytest.mark.parametrize(
         ("value", "expected_value"),
@@ -735,6 +808,22 @@ class TestXComTeamAccess:
         assert response.status_code == 403, response.json()
         assert response.json()["detail"]["reason"] == "access_denied"
 
+    def test_cross_team_batch_read_forbidden(self, client, exec_app, session, dag_maker):
+        """A task cannot read another team's XComs in a batch either."""
+        _, requester_ti = self._make_dag(session, dag_maker, f"req_{uuid4().hex}", "team_a")
+        target_dag = f"tgt_{uuid4().hex}"
+        target_dr, _ = self._make_dag(session, dag_maker, target_dag, "team_b")
+        self._insert_xcom(session, target_dr, target_dag)
+        self._authenticate_as(exec_app, requester_ti.id)
+
+        with conf_vars({("core", "multi_team"): "True"}):
+            response = client.post(
+                f"/execution/xcoms/{target_dag}/run1", json={"key": "k", "task_ids": ["task"]}
+            )
+
+        assert response.status_code == 403, response.json()
+        assert response.json()["detail"]["reason"] == "access_denied"
+
     def test_global_dag_read_allowed_but_write_forbidden(self, client, exec_app, session, dag_maker):
         """A team task may read a global (teamless) dag's XCom but not mutate it."""
         _, requester_ti = self._make_dag(session, dag_maker, f"req_{uuid4().hex}", "team_a")
@@ -754,6 +754,17 @@ class TestConf:
         )
         assert message == exception
 
+    def test_enum_serialized_dag_storage_format(self):
+        test_conf = AirflowConfigParser(default_config="")
+        test_conf.read_dict({"core": {"serialized_dag_storage_format": "pickle"}})
+        with pytest.raises(AirflowConfigException) as ctx:
+            test_conf.validate()
+        exception = str(ctx.value)
+        message = (
+            "`[core] serialized_dag_storage_format` should not be 'pickle'. Possible values: json, msgpack."
+        )
+        assert message == exception
+
     def test_as_dict_works_without_sensitive_cmds(self):
         conf_materialize_cmds = conf.as_dict(display_sensitive=True, raw=True, include_cmds=True)
         conf_maintain_cmds = conf.as_dict(display_sensitive=True, raw=True, include_cmds=False)
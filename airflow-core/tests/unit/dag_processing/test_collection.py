@@ -773,6 +773,40 @@ class TestUpdateDagParsingResults:
         new_serialized_dags_count = session.scalar(select(func.count(SerializedDagModel.dag_id)))
         assert new_serialized_dags_count == 1
 
+    def test_unchanged_dags_are_not_written_again(self, testing_dag_bundle, session):
+        dag = LazyDeserializedDAG.from_dag(DAG(dag_id="test"))
+        dag.dag_hash = dag.hash
+
+        def update(dags_unchanged, bundle_version=None):
+            with (
+                mock.patch.object(
+                    SerializedDagModel, "write_dag", wraps=SerializedDagModel.write_dag
+                ) as mock_write_dag,
+                conf_vars({("core", "auth_manager"): "FabAuthManager"}),
+                mock.patch("airflow.dag_processing.collection._sync_dag_perms") as mock_sync_dag_perms,
+            ):
+                update_dag_parsing_results_in_db(
+                    bundle_name="testing",
+                    bundle_version=bundle_version,
+                    dags=[dag],
+                    import_errors={},
+                    parse_duration=None,
+                    warnings=set(),
+                    session=session,
+                    dags_unchanged=dags_unchanged,
+                )
+            # Permissions are synced whether the Dag is written or not.
+            mock_sync_dag_perms.assert_called_once_with(dag, session=session)
+            return mock_write_dag.call_count
+
+        # Nothing is stored yet, so the Dag is written even if the processor saw no change.
+        assert update(dags_unchanged=True) == 1
+        assert update(dags_unchanged=False) == 1
+        assert update(dags_unchanged=True) == 0
+        # The latest version points at another bundle version, which write_dag has to refresh.
+        assert update(dags_unchanged=True, bundle_version="v2") == 1
+        assert session.scalar(select(func.count(SerializedDagModel.dag_id))) == 1
+
     @pytest.mark.usefixtures("clean_db")
     def test_duplicate_dag_id_creates_dag_warning(self, testing_dag_bundle, session):
         session.add(
@@ -36,6 +36,7 @@ from unittest import mock
 from unittest.mock import MagicMock
 
 import msgspec
+import psutil
 import pytest
 import time_machine
 from sqlalchemy import func, select
@@ -894,6 +895,49 @@ class TestDagFileProcessorManager:
         assert known_file not in manager._file_stats
         assert versioned_file in manager._file_stats
 
+    @conf_vars({("dag_processor", "file_parsing_sort_mode"): "alphabetical"})
+    def test_prepare_file_queue_queues_files_importing_changed_module(self, tmp_path):
+        helper = tmp_path / "helper.py"
+        helper.write_text("")
+        importing_file, other_file = (
+            DagFileInfo(bundle_name="testing", rel_path=Path(name), bundle_path=tmp_path)
+            for name in ("b_imports_helper.py", "a_other.py")
+        )
+        manager = DagFileProcessorManager(max_runs=3)
+        manager._record_file_imports(importing_file.presence_key, frozenset([helper]))
+        assert manager._module_dependents == {helper: {importing_file.presence_key}}
+
+        parsed_at = timezone.utcnow() - timedelta(seconds=10)
+        os.utime(helper, (parsed_at.timestamp() - 10, parsed_at.timestamp() - 10))
+        for file in (importing_file, other_file):
+            manager._file_stats[file] = DagFileStat(last_finish_time=parsed_at, run_count=1)
+
+        known_files = {"testing": {importing_file, other_file}}
+        manager.prepare_file_queue(known_files=known_files)
+        assert manager._file_queue == OrderedDict()
+
+        os.utime(helper)
+        manager.prepare_file_queue(known_files=known_files)
+        assert manager._file_queue == OrderedDict.fromkeys([importing_file])
+
+        # Files dropping the import are removed from the reverse index
+        manager._record_file_imports(importing_file.presence_key, frozenset())
+        assert manager._module_dependents == {}
+        assert manager._file_imports == {}
+
+    @pytest.mark.parametrize(
+        ("max_interval", "unchanged_runs", "expected"),
+        [(0, 3, 30), (300, 0, 30), (300, 2, 120), (300, 4, 300)],
+    )
+    def test_file_process_interval_stretches_for_unchanged_files(
+        self, max_interval, unchanged_runs, expected
+    ):
+        manager = DagFileProcessorManager(max_runs=1)
+        manager._file_process_interval = 30
+        manager._max_file_process_interval = max_interval
+
+        assert manager._get_file_process_interval(DagFileStat(unchanged_runs=unchanged_runs)) == expected
+
     def test_file_paths_in_queue_sorted_by_priority(self):
         from airflow.models.dagbag import DagPriorityParsingRequest
 
@@ -1441,6 +1485,7 @@ class TestDagFileProcessorManager:
             run_duration=mock.ANY,
             relative_fileloc="abc.txt",
             session=session,
+            dags_unchanged=False,
         )
         assert manager._file_stats[file] is not original_stat
         assert manager._file_stats[file].run_count == 4
@@ -1448,6 +1493,56 @@ class TestDagFileProcessorManager:
         assert manager._file_stats[file].last_finish_time > original_stat.last_finish_time
         assert manager._file_stats[file].num_dags == 0
 
+    @pytest.mark.parametrize("use_exec", [False, True])
+    @conf_vars({("dag_processor", "parsing_preload_modules"): "json, missing_module_for_preload_test,"})
+    def test_preload_parsing_modules(self, use_exec):
+        manager = DagFileProcessorManager(max_runs=1)
+
+        with (
+            mock.patch("airflow.sdk.execution_time.supervisor._should_use_exec", return_value=use_exec),
+            mock.patch("importlib.import_module") as mock_import_module,
+        ):
+            mock_import_module.side_effect = [None, ImportError("missing")]
+            # A module that fails to import must not stop the Dag processor from starting.
+            manager.preload_parsing_modules()
+
+        if use_exec:
+            mock_import_module.assert_not_called()
+        else:
+            assert mock_import_module.call_args_list == [
+                mock.call("json"),
+                mock.call("missing_module_for_preload_test"),
+            ]
+
+    def test_handle_parsing_result_marks_unchanged_fingerprint(self, session):
+        manager = DagFileProcessorManager(max_runs=1)
+        file = DagFileInfo(bundle_name="testing", rel_path=Path("abc.txt"), bundle_path=TEST_DAGS_FOLDER)
+        manager._bundle_versions["testing"] = "v1"
+
+        def handle(fingerprint):
+            processor, _ = self.mock_processor(start_time=time.monotonic() - 1)
+            processor.had_callbacks = False
+            processor.parsing_result = DagFileParsingResult(
+                fileloc="abc.txt", serialized_dags=[], fingerprint=fingerprint
+            )
+            with mock.patch.object(manager, "persist_parsing_result") as mock_persist:
+                manager.handle_parsing_result(file, processor, session=session)
+            return mock_persist.call_args.kwargs["dags_unchanged"]
+
+        assert handle("a") is False
+        assert handle("a") is True
+        assert handle("a") is True
+        assert manager._file_stats[file].unchanged_runs == 2
+        assert handle("b") is False
+        assert manager._file_stats[file].unchanged_runs == 0
+        # A new bundle version is written even if the file parsed the same.
+        manager._bundle_versions["testing"] = "v2"
+        assert handle("b") is False
+        assert handle("b") is True
+
+        manager.remove_orphaned_file_stats(present=set())
+        assert manager._persisted_fingerprints == {}
+
     def test_collect_results_processes_remaining_files_when_one_persist_fails(self, session):
         manager = DagFileProcessorManager(max_runs=1)
         file_a = DagFileInfo(bundle_name="testing", rel_path=Path("a.py"), bundle_path=TEST_DAGS_FOLDER)
@@ -1509,6 +1604,64 @@ class TestDagFileProcessorManager:
 
         assert len(manager._processors) == 0
 
+    @pytest.mark.parametrize(("files_parsed", "recycled"), [(1, False), (2, True)])
+    def test_collect_results_keeps_or_recycles_parser_workers(self, files_parsed, recycled):
+        manager = DagFileProcessorManager(max_runs=1)
+        manager._parser_worker_max_files = 2
+        file = DagFileInfo(bundle_name="testing", rel_path=Path("a.py"), bundle_path=TEST_DAGS_FOLDER)
+        manager._file_stats[file] = DagFileStat()
+        manager._bundle_versions["testing"] = "v1"
+
+        proc, read_end = self.mock_processor(start_time=time.monotonic() - 1)
+        proc.parser_worker = True
+        proc.files_parsed = files_parsed
+        proc.parsing_result = DagFileParsingResult(fileloc="a.py", serialized_dags=[])
+        proc._idle_request_id = 3
+        proc._process.TimeoutExpired = psutil.TimeoutExpired
+        proc._process.wait.side_effect = psutil.TimeoutExpired(0)
+        manager._processors = {file: proc}
+
+        with mock.patch.object(manager, "persist_parsing_result"):
+            manager._collect_results()
+
+        assert manager._processors == {}
+        assert manager._idle_parser_workers == ([] if recycled else [proc])
+        assert manager._stopping_parser_workers == ([proc] if recycled else [])
+        if recycled:
+            # The worker is told to exit with an empty reply
+            assert not proc.is_idle
+            read_end.settimeout(1)
+            assert read_end.recv(4096)
+        proc.logger_filehandle.close.assert_not_called()
+
+    def test_start_new_processes_reuses_idle_parser_worker(self):
+        manager = DagFileProcessorManager(max_runs=1)
+        manager._parser_worker_max_files = 10
+        file = DagFileInfo(bundle_name="testing", rel_path=Path("b.py"), bundle_path=TEST_DAGS_FOLDER)
+        manager._file_queue = OrderedDict.fromkeys([file])
+
+        proc, read_end = self.mock_processor(start_time=time.monotonic() - 100)
+        proc.parser_worker = True
+        proc._idle_request_id = 3
+        proc._process.TimeoutExpired = psutil.TimeoutExpired
+        proc._process.wait.side_effect = psutil.TimeoutExpired(0)
+        manager._idle_parser_workers = [proc]
+
+        with (
+            mock.patch.object(manager, "_open_log_file") as mock_open_log_file,
+            mock.patch.object(manager, "_create_process") as mock_create_process,
+        ):
+            manager._start_new_processes()
+
+        mock_create_process.assert_not_called()
+        assert manager._processors == {file: proc}
+        assert manager._idle_parser_workers == []
+        assert proc.dag_file_rel_path == "b.py"
+        assert time.monotonic() - proc.start_time < 100
+        mock_open_log_file.assert_called_once_with(file)
+        read_end.settimeout(1)
+        assert b"DagFileParseRequest" in read_end.recv(4096)
+
     @pytest.mark.usefixtures("testing_dag_bundle")
     @pytest.mark.parametrize(
         ("callbacks", "path", "expected_body"),
@@ -2122,6 +2275,7 @@ class TestDagFileProcessorManager:
                     logger_filehandle=mock_filehandle,
                     subprocess_logs_to_stdout=False,
                     client=mock.ANY,
+                    parser_worker=False,
                 ),
                 mock.call(
                     id=mock.ANY,
@@ -2135,6 +2289,7 @@ class TestDagFileProcessorManager:
                     logger_filehandle=mock_filehandle,
                     subprocess_logs_to_stdout=False,
                     client=mock.ANY,
+                    parser_worker=False,
                 ),
             ]
             # And removed from the queue
@@ -19,7 +19,9 @@ from __future__ import annotations
 
 import inspect
 import logging
+import os
 import pathlib
+import selectors
 import sys
 import textwrap
 import typing
@@ -55,6 +57,7 @@ from airflow.dag_processing.processor import (
     DagFileParseRequest,
     DagFileParsingResult,
     DagFileProcessorProcess,
+    ParserWorkerLogFile,
     ToDagProcessor,
     ToManager,
     _execute_callbacks,
@@ -63,12 +66,21 @@ from airflow.dag_processing.processor import (
     _execute_task_callbacks,
     _parse_file,
     _parse_file_entrypoint,
+    _parser_worker_entrypoint,
     _pre_import_airflow_modules,
+    _unload_bundle_modules,
 )
 from airflow.models import DagRun
+from airflow.models.serialized_dag import SerializedDagModel
 from airflow.sdk import DAG, BaseOperator
 from airflow.sdk.api.client import Client
-from airflow.sdk.api.datamodels._generated import ConnectionResponse, DagRunState, VariableResponse
+from airflow.sdk.api.datamodels._generated import (
+    ConnectionResponse,
+    DagRunState,
+    VariableResponse,
+    XComBatchItem,
+    XComBatchResponse,
+)
 from airflow.sdk.execution_time import comms, supervisor
 from airflow.sdk.execution_time.comms import (
     GetConnection,
@@ -76,6 +88,7 @@ from airflow.sdk.execution_time.comms import (
     GetTICount,
     GetVariable,
     GetXCom,
+    GetXComBatch,
     GetXComSequenceSlice,
     TaskStatesResult,
     TICount,
@@ -417,6 +430,103 @@ class TestDagFileProcessor:
         assert result.import_errors == {}
         assert result.serialized_dags[0].dag_id == "dag_name"
 
+    def test_parser_worker_parses_files_until_stopped(self, tmp_path: pathlib.Path, inprocess_client):
+        paths = []
+        for name in ("first", "second"):
+            path = tmp_path.joinpath(f"{name}.py")
+            path.write_text(f"from airflow.sdk import DAG\n\nwith DAG('{name}'):\n    pass\n")
+            paths.append(path)
+
+        proc = DagFileProcessorProcess.start(
+            id=1,
+            path=paths[0],
+            bundle_path=tmp_path,
+            bundle_name="testing",
+            dag_file_rel_path="first.py",
+            callbacks=[],
+            logger=MagicMock(spec=FilteringBoundLogger),
+            logger_filehandle=ParserWorkerLogFile(MagicMock(spec=BinaryIO)),
+            client=inprocess_client,
+            parser_worker=True,
+        )
+        while not proc.is_ready:
+            proc._service_subprocess(0.1)
+
+        assert proc.is_idle
+        assert proc.parsing_result is not None
+        assert proc.parsing_result.serialized_dags[0].dag_id == "first"
+
+        second_log = MagicMock(spec=BinaryIO)
+        proc.parse_next_file(
+            path=paths[1],
+            bundle_path=tmp_path,
+            bundle_name="testing",
+            dag_file_rel_path="second.py",
+            callbacks=[],
+            logger_filehandle=second_log,
+        )
+        assert not proc.is_idle
+        assert proc.logger_filehandle.filehandle is second_log
+        while not proc.is_ready:
+            proc._service_subprocess(0.1)
+
+        assert proc.files_parsed == 2
+        assert proc.parsing_result is not None
+        assert proc.parsing_result.serialized_dags[0].dag_id == "second"
+
+        proc.stop_worker()
+        while not proc.is_ready:
+            proc._service_subprocess(0.1)
+        assert proc._exit_code == 0
+
+    def test_parser_worker_drains_output_before_switching_log(self, tmp_path: pathlib.Path, inprocess_client):
+        path = tmp_path.joinpath("noisy.py")
+        path.write_text(
+            "import sys\n\nfrom airflow.sdk import DAG\n\n"
+            "sys.stdout.write('noisy output\\n' * 50000)\nsys.stdout.flush()\n\n"
+            "with DAG('noisy'):\n    pass\n"
+        )
+        proc = DagFileProcessorProcess.start(
+            id=1,
+            path=path,
+            bundle_path=tmp_path,
+            bundle_name="testing",
+            dag_file_rel_path="noisy.py",
+            callbacks=[],
+            logger=MagicMock(spec=FilteringBoundLogger),
+            logger_filehandle=ParserWorkerLogFile(MagicMock(spec=BinaryIO)),
+            client=inprocess_client,
+            parser_worker=True,
+        )
+        while not proc.is_ready:
+            proc._service_subprocess(0.1)
+
+        log_sockets = [sock for sock, kind in proc._open_sockets.items() if kind != "requests"]
+
+        def switch_to(filehandle):
+            # Nothing the worker wrote while parsing the previous file is left unread.
+            with selectors.DefaultSelector() as selector:
+                for sock in log_sockets:
+                    selector.register(sock, selectors.EVENT_READ)
+                assert selector.select(timeout=0) == []
+
+        with patch.object(ParserWorkerLogFile, "switch_to", side_effect=switch_to) as mock_switch_to:
+            proc.parse_next_file(
+                path=path,
+                bundle_path=tmp_path,
+                bundle_name="testing",
+                dag_file_rel_path="noisy.py",
+                callbacks=[],
+                logger_filehandle=MagicMock(spec=BinaryIO),
+            )
+        mock_switch_to.assert_called_once()
+
+        while not proc.is_ready:
+            proc._service_subprocess(0.1)
+        proc.stop_worker()
+        while not proc.is_ready:
+            proc._service_subprocess(0.1)
+
     def test__pre_import_airflow_modules_when_disabled(self):
         logger = MagicMock(spec=FilteringBoundLogger)
         with (
@@ -487,6 +597,7 @@ class TestDagFileProcessor:
     [
         (True, _parse_file_entrypoint, True),
         (False, _parse_file_entrypoint, False),
+        (True, _parser_worker_entrypoint, True),
         (True, lambda: None, False),
     ],
 )
@@ -664,6 +775,87 @@ def test_parse_file_with_task_callbacks(spy_agency):
     assert called is True
 
 
+def test_parse_file_fingerprints_result(tmp_path):
+    dag_file = tmp_path / "test_fingerprint.py"
+    dag_file.write_text(
+        "from airflow.sdk import DAG\n"
+        "from airflow.providers.standard.operators.empty import EmptyOperator\n"
+        "with DAG('test_fingerprint', schedule=None):\n"
+        "    EmptyOperator(task_id='task')\n"
+    )
+
+    def parse():
+        return _parse_file(
+            DagFileParseRequest(file=os.fspath(dag_file), bundle_path=tmp_path, bundle_name="testing"),
+            log=structlog.get_logger(),
+        )
+
+    result = parse()
+    [dag] = result.serialized_dags
+    assert dag.dag_hash == SerializedDagModel.hash(dag.data)
+    assert result.fingerprint is not None
+    assert parse().fingerprint == result.fingerprint
+
+    # Touching the file changes the fingerprint even though the Dag is the same.
+    os.utime(dag_file, ns=(0, 0))
+    touched = parse()
+    assert touched.serialized_dags[0].dag_hash == dag.dag_hash
+    assert touched.fingerprint != result.fingerprint
+
+
+def test_parse_file_records_imported_bundle_modules(tmp_path):
+    tmp_path.joinpath("imported_bundle_helpers").mkdir()
+    tmp_path.joinpath("imported_bundle_helpers", "__init__.py").write_text("")
+    tmp_path.joinpath("imported_bundle_helpers", "names.py").write_text("NAME = 'imported_helpers'")
+    dag_file = tmp_path / "dag.py"
+    dag_file.write_text(
+        "from imported_bundle_helpers.names import NAME\n"
+        "from airflow.sdk import DAG\n"
+        "with DAG(NAME, schedule=None):\n"
+        "    pass\n"
+    )
+
+    try:
+        result = _parse_file(
+            DagFileParseRequest(file=os.fspath(dag_file), bundle_path=tmp_path, bundle_name="testing"),
+            log=structlog.get_logger(),
+        )
+        assert "imported_bundle_helpers.names" in sys.modules
+    finally:
+        _unload_bundle_modules(tmp_path)
+
+    assert result is not None
+    assert result.serialized_dags[0].dag_id == "imported_helpers"
+    assert result.imported_modules == [
+        os.path.join("imported_bundle_helpers", "__init__.py"),
+        os.path.join("imported_bundle_helpers", "names.py"),
+    ]
+    assert "imported_bundle_helpers.names" not in sys.modules
+
+
+def test_parse_file_records_bundle_modules_that_failed_to_import(tmp_path):
+    tmp_path.joinpath("broken_bundle_helper.py").write_text("raise RuntimeError('broken helper')")
+    dag_file = tmp_path / "dag.py"
+    dag_file.write_text(
+        "import broken_bundle_helper\nfrom airflow.sdk import DAG\nwith DAG('broken', schedule=None):\n    pass\n"
+    )
+
+    try:
+        result = _parse_file(
+            DagFileParseRequest(file=os.fspath(dag_file), bundle_path=tmp_path, bundle_name="testing"),
+            log=structlog.get_logger(),
+        )
+    finally:
+        _unload_bundle_modules(tmp_path)
+
+    assert result is not None
+    [import_error] = result.import_errors.values()
+    assert "broken helper" in import_error
+    # The import is recorded all the same, so the Dag file is parsed again once the helper is fixed.
+    assert result.imported_modules == ["broken_bundle_helper.py"]
+    assert "broken_bundle_helper" not in sys.modules
+
+
 @conf_vars({("dag_processor", "dag_version_inflation_check_level"): "error"})
 def test_parse_file_static_check_with_error():
     result = _parse_file(
@@ -2252,6 +2444,36 @@ class TestDagFileProcessorProcess:
             "type": "ConnectionResult",
         }
 
+    def test_handle_request_get_xcom_batch(self, proc):
+        proc.client.xcoms.get_batch.return_value = XComBatchResponse(
+            xcoms=[XComBatchItem(task_id="a", map_index=-1, value="test")]
+        )
+
+        with patch.object(DagFileProcessorProcess, "send_msg", autospec=True) as mock_send_msg:
+            proc._handle_request(
+                GetXComBatch(
+                    key="return_value",
+                    dag_id="test_dag",
+                    run_id="test_run",
+                    task_ids=["a", "b"],
+                    map_indexes=[-1],
+                ),
+                structlog.get_logger(),
+                req_id=789,
+            )
+
+        proc.client.xcoms.get_batch.assert_called_once_with(
+            "test_dag", "test_run", "return_value", ["a", "b"], [-1], False
+        )
+        mock_send_msg.assert_called_once()
+        _, args, kwargs = mock_send_msg.mock_calls[0]
+        assert kwargs["request_id"] == 789
+        assert kwargs["error"] is None
+        assert args[1].model_dump() == {
+            "xcoms": [{"task_id": "a", "map_index": -1, "value": "test"}],
+            "type": "XComBatchResult",
+        }
+
     def test_handle_request_get_variable_masks_value_with_key(self, proc):
         proc.client.variables.get.return_value = VariableResponse(
             key="test_key",
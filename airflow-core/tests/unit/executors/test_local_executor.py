@@ -17,6 +17,7 @@
 # under the License.
 from __future__ import annotations
 
+import ctypes
 import gc
 import multiprocessing
 import os
@@ -30,7 +31,7 @@ from uuid6 import uuid7
 from airflow._shared.timezones import timezone
 from airflow.executors import workloads
 from airflow.executors.base_executor import BaseExecutor, ExecutorConf, get_execution_api_server_url
-from airflow.executors.local_executor import LocalExecutor
+from airflow.executors.local_executor import LocalExecutor, _run_worker
 from airflow.executors.workloads.base import BundleInfo
 from airflow.executors.workloads.callback import CallbackDTO
 from airflow.executors.workloads.task import TaskInstanceDTO
@@ -239,6 +240,140 @@ class TestLocalExecutor:
             assert executor.event_buffer[ti.key][0] == State.SUCCESS
         assert executor.event_buffer[fail_ti.key][0] == State.FAILED
 
+    @mock.patch.object(gc, "freeze")
+    @mock.patch("airflow.sdk.execution_time.supervisor.preload_task_modules")
+    @mock.patch("airflow.executors.base_executor.BaseExecutor.run_workload")
+    def test_worker_preloads_and_exits_after_max_tasks(self, mock_run_workload, mock_preload, mock_freeze):
+        activity_queue = multiprocessing.SimpleQueue()
+        result_queue = multiprocessing.SimpleQueue()
+        unread_messages = multiprocessing.Value(ctypes.c_uint)
+        task_workloads = [_make_task_workload() for _ in range(3)]
+        for workload in task_workloads:
+            activity_queue.put(workload)
+        unread_messages.value = 3
+
+        with conf_vars({("workers", "local_executor_worker_max_tasks"): "2"}):
+            _run_worker(
+                logger_name="test",
+                input=activity_queue,
+                output=result_queue,
+                unread_messages=unread_messages,
+                team_conf=ExecutorConf(team_name=None),
+            )
+
+        mock_preload.assert_called_once()
+        mock_freeze.assert_called_once()
+        assert mock_run_workload.call_count == 2
+        # The third workload is left on the queue for the worker that replaces this one
+        assert unread_messages.value == 1
+        assert activity_queue.get().ti.id == task_workloads[2].ti.id
+
+    @mock.patch.object(gc, "freeze")
+    @mock.patch("airflow.sdk.execution_time.supervisor.preload_task_modules")
+    @mock.patch("airflow.executors.base_executor.BaseExecutor.run_workload")
+    def test_worker_exits_after_max_memory_growth(self, mock_run_workload, mock_preload, mock_freeze):
+        activity_queue = multiprocessing.SimpleQueue()
+        activity_queue.put(_make_task_workload())
+        activity_queue.put(_make_task_workload())
+        unread_messages = multiprocessing.Value(ctypes.c_uint)
+        unread_messages.value = 2
+
+        memory_info = mock.Mock(side_effect=[mock.Mock(rss=rss) for rss in (100 << 20, 101 << 20, 200 << 20)])
+        with (
+            conf_vars({("workers", "local_executor_worker_max_memory_growth"): "64"}),
+            mock.patch("airflow.executors.local_executor.psutil.Process") as mock_process,
+        ):
+            mock_process.return_value.memory_info = memory_info
+            _run_worker(
+                logger_name="test",
+                input=activity_queue,
+                output=multiprocessing.SimpleQueue(),
+                unread_messages=unread_messages,
+                team_conf=ExecutorConf(team_name=None),
+            )
+
+        mock_run_workload.assert_called_once()
+        assert unread_messages.value == 1
+
+    @mock.patch.object(gc, "freeze")
+    @mock.patch("airflow.sdk.execution_time.supervisor.preload_task_modules")
+    @mock.patch("airflow.executors.base_executor.BaseExecutor.run_workload")
+    def test_worker_relays_heartbeats_to_executor(self, mock_run_workload, mock_preload, mock_freeze):
+        from airflow.sdk.execution_time import heartbeat
+
+        activity_queue = multiprocessing.SimpleQueue()
+        activity_queue.put(None)
+        ours, theirs = multiprocessing.Pipe()
+        try:
+            _run_worker(
+                logger_name="test",
+                input=activity_queue,
+                output=multiprocessing.SimpleQueue(),
+                unread_messages=multiprocessing.Value(ctypes.c_uint),
+                team_conf=ExecutorConf(team_name=None),
+                heartbeat_conn=theirs,
+            )
+
+            relay = heartbeat.get_heartbeat_relay()
+            assert relay is not None
+            assert relay.conn is theirs
+        finally:
+            heartbeat.set_heartbeat_relay(None)
+
+    @skip_non_fork_mp_start
+    @mock.patch.object(gc, "unfreeze")
+    @mock.patch.object(gc, "freeze")
+    def test_executor_aggregates_worker_heartbeats(self, mock_freeze, mock_unfreeze):
+        with (
+            conf_vars({("workers", "local_executor_heartbeat_batch_interval"): "1"}),
+            mock.patch("airflow.sdk.execution_time.heartbeat.HeartbeatAggregator") as mock_aggregator_class,
+        ):
+            executor = LocalExecutor(parallelism=2)
+            executor.start()
+            aggregator = mock_aggregator_class.return_value
+            try:
+                mock_aggregator_class.assert_called_once_with(
+                    server=get_execution_api_server_url(executor.conf), interval=1.0
+                )
+                aggregator.start.assert_called_once()
+                # Each worker gets its own pipe to the aggregator
+                assert aggregator.connect.call_count == 2
+            finally:
+                executor.end()
+        aggregator.stop.assert_called_once()
+        assert executor._heartbeat_aggregator is None
+
+    @skip_non_fork_mp_start
+    @mock.patch.object(gc, "unfreeze")
+    @mock.patch.object(gc, "freeze")
+    def test_executor_clamps_heartbeat_batch_interval(self, mock_freeze, mock_unfreeze, caplog):
+        with (
+            conf_vars(
+                {
+                    ("workers", "local_executor_heartbeat_batch_interval"): "30",
+                    ("workers", "min_heartbeat_interval"): "10",
+                }
+            ),
+            mock.patch("airflow.sdk.execution_time.heartbeat.HeartbeatAggregator") as mock_aggregator_class,
+        ):
+            executor = LocalExecutor(parallelism=1)
+            executor.start()
+            try:
+                mock_aggregator_class.assert_called_once_with(
+                    server=get_execution_api_server_url(executor.conf), interval=5.0
+                )
+            finally:
+                executor.end()
+        assert "must be lower than [workers] min_heartbeat_interval" in caplog.text
+
+    def test_executor_heartbeats_directly_by_default(self):
+        executor = LocalExecutor(parallelism=1)
+        executor.start()
+        try:
+            assert executor._heartbeat_aggregator is None
+        finally:
+            executor.end()
+
     @mock.patch("airflow.executors.local_executor.LocalExecutor.sync")
     @mock.patch("airflow.executors.base_executor.BaseExecutor.trigger_tasks")
     @mock.patch("airflow.executors.base_executor.stats.gauge")
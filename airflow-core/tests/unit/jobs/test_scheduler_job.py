@@ -2487,6 +2487,145 @@ class TestSchedulerJob:
             assert len(res) == 1
             session.rollback()
 
+    @conf_vars({("scheduler", "concurrency_map_reseed_interval"): "600"})
+    def test_find_executable_task_instances_incremental_concurrency_map(self, dag_maker, session):
+        """The incremental concurrency map is seeded once and then follows queueing and executor events."""
+        with dag_maker(dag_id="test_incremental_concurrency_map", max_active_tasks=16, session=session):
+            task1 = EmptyOperator(task_id="dummy", max_active_tis_per_dag=1)
+
+        executor = MockExecutor(do_update=False)
+        self.job_runner = SchedulerJobRunner(job=Job(), executors=[executor])
+        concurrency_map = self.job_runner._concurrency_map
+        assert concurrency_map is not None
+
+        dr1 = dag_maker.create_dagrun(run_type=DagRunType.SCHEDULED, session=session)
+        dr2 = dag_maker.create_dagrun_after(dr1, run_type=DagRunType.SCHEDULED, session=session)
+        ti1 = dr1.get_task_instance(task1.task_id, session=session)
+        ti2 = dr2.get_task_instance(task1.task_id, session=session)
+        ti1.state = ti2.state = State.SCHEDULED
+        session.merge(ti1)
+        session.merge(ti2)
+        session.flush()
+
+        with mock.patch.object(concurrency_map, "load", wraps=concurrency_map.load) as load:
+            res = self.job_runner._executable_task_instances_to_queued(max_tis=32, session=session)
+            assert [ti.run_id for ti in res] == [dr1.run_id]
+            assert concurrency_map.task_concurrency_map[(ti1.dag_id, ti1.task_id)] == 1
+            assert concurrency_map.pool_slots_map[(ti1.pool, TaskInstanceState.QUEUED)] == 1
+
+            # The queued TI still holds the only slot for the task.
+            assert self.job_runner._executable_task_instances_to_queued(max_tis=32, session=session) == []
+
+            ti1.refresh_from_db(session=session)
+            ti1.state = State.SUCCESS
+            session.merge(ti1)
+            session.flush()
+            executor.event_buffer[ti1.key] = State.SUCCESS, None
+            self.job_runner._process_executor_events(executor=executor, session=session)
+            assert concurrency_map.task_concurrency_map[(ti1.dag_id, ti1.task_id)] == 0
+
+            res = self.job_runner._executable_task_instances_to_queued(max_tis=32, session=session)
+            assert [ti.run_id for ti in res] == [dr2.run_id]
+
+        # Seeded only on the first pass.
+        assert load.call_count == 1
+        session.rollback()
+
+    def test_incremental_concurrency_map_refresh(self, dag_maker, session):
+        """Task instances queued by another scheduler are picked up, and a due re-seed drops stale ones."""
+        from airflow.jobs.scheduler_job_runner import IncrementalConcurrencyMap
+
+        with dag_maker(dag_id="test_incremental_concurrency_map_refresh", session=session):
+            EmptyOperator(task_id="a", pool_slots=2)
+            EmptyOperator(task_id="b")
+        dr = dag_maker.create_dagrun(session=session)
+        ti_a = dr.get_task_instance("a", session=session)
+        ti_b = dr.get_task_instance("b", session=session)
+
+        concurrency_map = IncrementalConcurrencyMap(reseed_interval=600)
+        ti_a.state = TaskInstanceState.DEFERRED
+        session.merge(ti_a)
+        session.flush()
+        concurrency_map.refresh(session=session)
+        assert concurrency_map.task_concurrency_map[(dr.dag_id, "a")] == 1
+        assert concurrency_map.pool_slots_map[(ti_a.pool, TaskInstanceState.DEFERRED)] == 2
+        # Deferred task instances do not count towards the Dag run's active tasks.
+        assert concurrency_map.dag_run_active_tasks_map[(dr.dag_id, dr.run_id)] == 0
+
+        ti_b.state = TaskInstanceState.QUEUED
+        ti_b.queued_dttm = timezone.utcnow()
+        session.merge(ti_b)
+        session.flush()
+        concurrency_map.refresh(session=session)
+        assert concurrency_map.task_concurrency_map[(dr.dag_id, "b")] == 1
+        assert concurrency_map.dag_run_active_tasks_map[(dr.dag_id, dr.run_id)] == 1
+
+        # Task instances queued by other schedulers are followed until they leave the execution states,
+        # while the resumed deferred task instance is only dropped on re-seed.
+        ti_a.state = TaskInstanceState.SCHEDULED
+        session.merge(ti_a)
+        ti_b.state = TaskInstanceState.SUCCESS
+        session.merge(ti_b)
+        session.flush()
+        concurrency_map.refresh(session=session)
+        assert concurrency_map.task_concurrency_map[(dr.dag_id, "a")] == 1
+        assert concurrency_map.task_concurrency_map[(dr.dag_id, "b")] == 0
+        assert concurrency_map.dag_run_active_tasks_map[(dr.dag_id, dr.run_id)] == 0
+
+        concurrency_map.reseed_interval = 0
+        concurrency_map.refresh(session=session)
+        assert concurrency_map.task_concurrency_map[(dr.dag_id, "a")] == 0
+        assert (ti_a.pool, TaskInstanceState.DEFERRED) not in concurrency_map.pool_slots_map
+        session.rollback()
+
+    def test_incremental_concurrency_map_follows_other_schedulers(self, dag_maker, session):
+        """Only task instances queued by another scheduler are released once they finish or are deleted."""
+        from airflow.jobs.scheduler_job_runner import IncrementalConcurrencyMap
+
+        with dag_maker(dag_id="test_incremental_concurrency_map_follows", session=session):
+            EmptyOperator(task_id="a")
+            EmptyOperator(task_id="b")
+            EmptyOperator(task_id="c")
+        dr = dag_maker.create_dagrun(session=session)
+        ti_a = dr.get_task_instance("a", session=session)
+        ti_b = dr.get_task_instance("b", session=session)
+
+        ti_c = dr.get_task_instance("c", session=session)
+
+        concurrency_map = IncrementalConcurrencyMap(reseed_interval=600)
+        concurrency_map.load(session=session, job_id=1)
+        for ti, queued_by_job_id in ((ti_a, 2), (ti_b, 2), (ti_c, 1)):
+            ti.state = TaskInstanceState.QUEUED
+            ti.queued_dttm = timezone.utcnow()
+            ti.queued_by_job_id = queued_by_job_id
+            session.merge(ti)
+        session.flush()
+        concurrency_map.refresh(session=session, job_id=1)
+        assert concurrency_map.dag_run_active_tasks_map[(dr.dag_id, dr.run_id)] == 3
+        assert concurrency_map.pool_slots_map[(ti_a.pool, TaskInstanceState.QUEUED)] == 3
+
+        ti_a.state = TaskInstanceState.RUNNING
+        session.merge(ti_a)
+        session.delete(ti_b)
+        # Reported back by the executors of this scheduler instead.
+        ti_c.state = TaskInstanceState.SUCCESS
+        session.merge(ti_c)
+        session.flush()
+        concurrency_map.refresh(session=session, job_id=1)
+        assert concurrency_map.task_concurrency_map[(dr.dag_id, "a")] == 1
+        assert concurrency_map.task_concurrency_map[(dr.dag_id, "b")] == 0
+        assert concurrency_map.task_concurrency_map[(dr.dag_id, "c")] == 1
+        assert concurrency_map.pool_slots_map[(ti_a.pool, TaskInstanceState.RUNNING)] == 1
+        assert concurrency_map.pool_slots_map[(ti_a.pool, TaskInstanceState.QUEUED)] == 1
+
+        ti_a.state = TaskInstanceState.FAILED
+        session.merge(ti_a)
+        session.flush()
+        concurrency_map.refresh(session=session, job_id=1)
+        assert concurrency_map.task_concurrency_map[(dr.dag_id, "a")] == 0
+        assert (ti_a.pool, TaskInstanceState.RUNNING) not in concurrency_map.pool_slots_map
+        session.rollback()
+
     def test_find_executable_task_instances_max_active_tis_per_dag_deferred_blocks(self, dag_maker, session):
         """
         A DEFERRED TI should count against max_active_tis_per_dag.
@@ -6556,6 +6695,56 @@ class TestSchedulerJob:
 
             assert mock_schedule.call_count == 1
 
+    @conf_vars({("scheduler", "dag_run_scheduling_workers"): "2"})
+    def test_schedule_dag_runs_in_parallel_partitions_by_dag(self, dag_maker, session):
+        """All runs of a Dag go to the same worker, and the work is spread over the worker threads."""
+        run_ids_by_dag: dict[str, set[int]] = {}
+        for dag_id, num_runs in (("busy_dag", 2), ("quiet_dag_1", 1), ("quiet_dag_2", 1)):
+            with dag_maker(dag_id=dag_id, schedule="@daily", session=session):
+                EmptyOperator(task_id="task")
+            dr = dag_maker.create_dagrun(
+                run_type=DagRunType.SCHEDULED,
+                state=DagRunState.RUNNING,
+                logical_date=DEFAULT_DATE,
+                session=session,
+            )
+            run_ids_by_dag[dag_id] = {dr.id}
+            for _ in range(num_runs - 1):
+                dr = dag_maker.create_dagrun_after(
+                    dr, run_type=DagRunType.SCHEDULED, state=DagRunState.RUNNING, session=session
+                )
+                run_ids_by_dag[dag_id].add(dr.id)
+        session.flush()
+
+        self.job_runner = SchedulerJobRunner(job=Job(), executors=[self.null_exec])
+        with patch.object(self.job_runner, "_schedule_dag_run_partition", autospec=True) as mock_partition:
+            try:
+                self.job_runner._schedule_dag_runs_in_parallel(session)
+            finally:
+                self.job_runner._dag_run_scheduling_pool.shutdown()
+
+        partitions = [set(call.args[0]) for call in mock_partition.call_args_list]
+        assert sorted(map(len, partitions)) == [2, 2]
+        assert set().union(*partitions) == set().union(*run_ids_by_dag.values())
+        assert any(run_ids_by_dag["busy_dag"] == partition for partition in partitions)
+
+    def test_schedule_dag_run_partition(self, dag_maker, session):
+        """A worker locks and schedules only its own Dag runs, on its own session."""
+        with dag_maker(dag_id="partition_dag", schedule="@once", session=session):
+            BashOperator(task_id="task", bash_command="true")
+        scheduled_run = dag_maker.create_dagrun(state=DagRunState.RUNNING, session=session)
+        with dag_maker(dag_id="other_partition_dag", schedule="@once", session=session):
+            BashOperator(task_id="task", bash_command="true")
+        other_run = dag_maker.create_dagrun(state=DagRunState.RUNNING, session=session)
+        session.commit()
+
+        self.job_runner = SchedulerJobRunner(job=Job(), executors=[self.null_exec])
+        self.job_runner._schedule_dag_run_partition([scheduled_run.id])
+
+        session.expire_all()
+        assert scheduled_run.get_task_instance("task", session=session).state == TaskInstanceState.SCHEDULED
+        assert other_run.get_task_instance("task", session=session).state is None
+
     def test_bulk_write_to_db_external_trigger_dont_skip_scheduled_run(self, dag_maker, testing_dag_bundle):
         """
         Test that externally triggered Dag Runs should not affect (by skipping) next
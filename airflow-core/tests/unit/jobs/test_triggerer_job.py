@@ -3031,6 +3031,34 @@ async def test_connection_close_cancels_pending(decoder_pair):
         await asyncio.wait_for(task, timeout=5)
 
 
+@pytest.mark.asyncio
+@pytest.mark.execution_timeout(15)
+async def test_large_xcom_is_sent_inline_from_trigger(decoder_pair, monkeypatch):
+    """The trigger comms can't pass files, so a large XCom set by a trigger is sent inline."""
+    from airflow.sdk.bases.xcom import BaseXCom
+    from airflow.sdk.execution_time import task_runner
+
+    decoder, server_sock = decoder_pair
+    monkeypatch.setattr(task_runner, "SUPERVISOR_COMMS", decoder, raising=False)
+    frames = []
+
+    def supervisor():
+        frame = _read_frame_sync(server_sock)
+        frames.append(frame)
+        server_sock.sendall(_ResponseFrame(id=frame.id, body={"type": "OKResponse", "ok": True}).as_bytes())
+
+    sup = threading.Thread(target=supervisor, daemon=True)
+    sup.start()
+    with conf_vars({("workers", "xcom_file_transfer_threshold"): "10"}):
+        await BaseXCom.aset(key="k", value="x" * 100, dag_id="d", task_id="t", run_id="r")
+    sup.join(timeout=5)
+
+    [frame] = frames
+    assert frame.body["type"] == "SetXCom"
+    assert frame.body["value"] == "x" * 100
+    assert not frame.body.get("value_in_file")
+
+
 @pytest.mark.asyncio
 async def test_unknown_frame_id_doesnt_crash_reader(decoder_pair):
     """An orphan response frame (no matching pending future) is silently dropped; reader stays alive."""
@@ -4676,6 +4676,26 @@ def test_get_running_dag_runs_to_examine_eager_loads_dag_tags(dag_maker, session
     assert dr.stats_tags == {"dag_id": "eager_tag_dag", "run_type": dr.run_type, "env": "prod"}
 
 
+def test_get_running_dag_run_ids_to_examine(dag_maker, session):
+    """Listing the runs to examine does not lock them, and the ids restrict the locking query."""
+    with dag_maker("examine_dag_1", session=session):
+        pass
+    dr1 = dag_maker.create_dagrun(state=DagRunState.RUNNING)
+    with dag_maker("examine_dag_2", session=session):
+        pass
+    dr2 = dag_maker.create_dagrun(state=DagRunState.RUNNING)
+    session.commit()
+
+    assert set(DagRun.get_running_dag_run_ids_to_examine(session=session)) == {
+        ("examine_dag_1", dr1.id),
+        ("examine_dag_2", dr2.id),
+    }
+    locked = DagRun.get_running_dag_runs_to_examine(
+        session=session, eagerly_load_dag_tags=False, dag_run_ids=[dr2.id]
+    )
+    assert [dr.id for dr in locked] == [dr2.id]
+
+
 class TestClearPartitionRuns:
     """Direct unit tests for the clear_partition_runs model-layer function."""
 
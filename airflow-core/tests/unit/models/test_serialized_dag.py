@@ -20,6 +20,7 @@
 from __future__ import annotations
 
 import logging
+import zlib
 from datetime import timedelta
 from unittest import mock
 
@@ -527,6 +528,57 @@ class TestSerializedDagModel:
         dependencies = SDM.get_dag_dependencies(session=session)
         assert dag_id not in dependencies
 
+    @pytest.mark.parametrize("compress", [False, True])
+    def test_msgpack_storage_format(self, dag_maker, session, monkeypatch, compress):
+        monkeypatch.setattr("airflow.models.serialized_dag._COMPRESS_SERIALIZED_DAGS", compress)
+        with dag_maker("json_dag", schedule=Asset("a")):
+            BashOperator(task_id="task", bash_command="echo {{ params.x }}", params={"x": 1})
+        monkeypatch.setattr("airflow.models.serialized_dag._SERIALIZED_DAG_STORAGE_FORMAT", "msgpack")
+        with dag_maker("msgpack_dag", schedule=Asset("a")):
+            BashOperator(task_id="task", bash_command="echo {{ params.x }}", params={"x": 1})
+        session.expunge_all()
+
+        json_row = SDM.get("json_dag", session=session)
+        msgpack_row = SDM.get("msgpack_dag", session=session)
+        assert msgpack_row._data is None
+        assert msgpack_row._data_compressed[:1] == (b"\x78" if compress else b"\x82")
+        # Rows written in either format are read back to the same data, with the same hash.
+        assert msgpack_row.data["dag"]["tasks"] == json_row.data["dag"]["tasks"]
+        assert msgpack_row.dag_hash == SDM.hash(msgpack_row.data)
+        assert msgpack_row.dag.get_task("task").params["x"] == 1
+
+        dependencies = SDM.get_dag_dependencies(session=session)
+        assert set(dependencies) == {"json_dag", "msgpack_dag"}
+
+        # Switching back to uncompressed JSON does not rewrite the existing rows.
+        monkeypatch.setattr("airflow.models.serialized_dag._COMPRESS_SERIALIZED_DAGS", False)
+        monkeypatch.setattr("airflow.models.serialized_dag._SERIALIZED_DAG_STORAGE_FORMAT", "json")
+        assert SDM.get_dag_dependencies(session=session) == dependencies
+
+    @pytest.mark.parametrize("compress", [False, True])
+    def test_reencode_msgpack_serialized_dags(self, dag_maker, session, monkeypatch, compress):
+        from airflow.utils.db import _reencode_msgpack_serialized_dags
+
+        monkeypatch.setattr("airflow.models.serialized_dag._COMPRESS_SERIALIZED_DAGS", compress)
+        with dag_maker("json_dag"):
+            BashOperator(task_id="task", bash_command="echo")
+        monkeypatch.setattr("airflow.models.serialized_dag._SERIALIZED_DAG_STORAGE_FORMAT", "msgpack")
+        with dag_maker("msgpack_dag"):
+            BashOperator(task_id="task", bash_command="echo")
+        session.expunge_all()
+        json_data_compressed = SDM.get("json_dag", session=session)._data_compressed
+        msgpack_data = SDM.get("msgpack_dag", session=session).data
+        session.expunge_all()
+
+        _reencode_msgpack_serialized_dags(session=session)
+
+        json_row = SDM.get("json_dag", session=session)
+        msgpack_row = SDM.get("msgpack_dag", session=session)
+        # Rows that are JSON already are left alone.
+        assert json_row._data_compressed == json_data_compressed
+        # Migrations before 3.4 read the column as compressed JSON.
+        assert json.loads(zlib.decompress(msgpack_row._data_compressed)) == msgpack_data
+
     def test_get_dependencies_with_asset_ref(self, dag_maker, session):
         asset_name = "name"
         asset_uri = "test://asset1"
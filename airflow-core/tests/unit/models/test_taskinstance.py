@@ -1193,6 +1193,7 @@ class TestTaskInstance:
             assert isinstance(set_teardown, bool)
 
         monkeypatch.setattr(_UpstreamTIStates, "calculate", lambda *_: upstream_states)
+        monkeypatch.setattr(_UpstreamTIStates, "calculate_from_task_counts", lambda *_: upstream_states)
 
         # sanity checks
         s = upstream_states
@@ -1329,6 +1330,7 @@ class TestTaskInstance:
         dr = dag_maker.create_dagrun()
         dag_maker.session.commit()
         monkeypatch.setattr(_UpstreamTIStates, "calculate", lambda *_: upstream_states)
+        monkeypatch.setattr(_UpstreamTIStates, "calculate_from_task_counts", lambda *_: upstream_states)
         ti = dr.get_task_instance("do_something_else", session=session)
         ti.map_index = 0
         base_task = ti.task
@@ -0,0 +1,74 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from airflow.providers.standard.operators.empty import EmptyOperator
+from airflow.sdk import DAG, task
+
+from tests_common.test_utils.dag import create_scheduler_dag
+
+
+def _build_dag():
+    with DAG("test_graph", schedule=None) as dag:
+        setup = EmptyOperator(task_id="setup").as_setup()
+        teardown = EmptyOperator(task_id="teardown").as_teardown(setups=setup)
+        other_setup = EmptyOperator(task_id="other_setup").as_setup()
+        work_1 = EmptyOperator(task_id="work_1")
+        work_2 = EmptyOperator(task_id="work_2")
+
+        @task
+        def mapped(x):
+            return x
+
+        setup >> work_1 >> [work_2, mapped.expand(x=[1, 2])] >> teardown
+        other_setup >> work_2
+    return create_scheduler_dag(dag)
+
+
+class TestSerializedDagGraph:
+    def test_dagrun_state_leaves(self):
+        dag = _build_dag()
+        graph = dag.graph
+
+        assert graph.task_ids == tuple(dag.task_dict)
+        # The teardown does not fail the Dag run, so the tasks before it decide its state.
+        assert graph.dagrun_state_leaf_task_ids == {"work_2", "mapped"}
+
+    def test_dagrun_state_leaves_of_teardown_only_dag(self):
+        with DAG("test_graph_teardowns", schedule=None) as dag:
+            (
+                EmptyOperator(task_id="teardown_1").as_teardown()
+                >> EmptyOperator(task_id="teardown_2").as_teardown()
+            )
+
+        assert create_scheduler_dag(dag).graph.dagrun_state_leaf_task_ids == {"teardown_2"}
+
+    def test_relevant_setup_task_ids(self):
+        dag = _build_dag()
+
+        for task_id, op in dag.task_dict.items():
+            assert set(dag.graph.relevant_setup_task_ids(task_id)) == {
+                t.task_id for t in op.get_upstreams_only_setups()
+            }
+
+    def test_graph_is_cached_and_not_shared_with_subsets(self):
+        dag = _build_dag()
+
+        assert dag.graph is dag.graph
+        subset = dag.partial_subset(task_ids=["work_1"], include_upstream=False)
+        assert subset.graph is not dag.graph
+        assert set(subset.graph.task_ids) == set(subset.task_dict)
@@ -21,9 +21,12 @@ import json
 import math
 import pickle
 import sys
+import threading
+import time
 from collections.abc import Iterator
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING
+from unittest import mock
 
 import pendulum
 import pytest
@@ -1273,6 +1276,74 @@ class TestSerializedBaseOperator:
         assert isinstance(result, datetime)
         assert result.timestamp() == timestamp
 
+    def test_deferred_fields_are_decoded_on_first_access(self):
+        from airflow.serialization.serialized_objects import DagSerialization, OperatorSerialization
+
+        with DAG(DAG_ID, start_date=DEFAULT_DATE) as dag:
+            PythonOperator(
+                task_id="op",
+                python_callable=lambda: None,
+                params={"p": 1},
+                executor_config={"key": "value"},
+                outlets=[Asset("s3://bucket/key")],
+            )
+
+        encoded = DagSerialization.serialize_dag(dag)
+        task = DagSerialization.deserialize_dag(encoded).task_dict["op"]
+        assert set(task.__dict__["_deferred_fields"]) >= {"params", "executor_config", "outlets"}
+        assert "params" not in task.__dict__
+
+        assert task.params["p"] == 1
+        assert task.executor_config == {"key": "value"}
+        assert [outlet.uri for outlet in task.outlets] == ["s3://bucket/key"]
+        assert task.inlets == []
+        assert "params" not in task.__dict__["_deferred_fields"]
+
+        # Setting a field drops its encoded value
+        task.executor_config = {}
+        assert "executor_config" not in task.__dict__["_deferred_fields"]
+        assert task.executor_config == {}
+
+        with mock.patch.object(OperatorSerialization, "_deserialize_lazily", False):
+            eager_task = DagSerialization.deserialize_dag(encoded).task_dict["op"]
+        assert "_deferred_fields" not in eager_task.__dict__
+        assert eager_task.params["p"] == 1
+        assert eager_task.outlets == task.outlets
+
+    def test_deferred_fields_are_decoded_once_across_threads(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        from airflow.serialization.serialized_objects import DagSerialization, OperatorSerialization
+
+        with DAG(DAG_ID, start_date=DEFAULT_DATE) as dag:
+            PythonOperator(task_id="op", python_callable=lambda: None, params={"p": 1})
+        task = DagSerialization.deserialize_dag(DagSerialization.serialize_dag(dag)).task_dict["op"]
+
+        num_threads = 8
+        barrier = threading.Barrier(num_threads)
+        deserialize = OperatorSerialization.deserialize_deferred_field
+
+        def slow_deserialize(name, value):
+            # Give the other threads time to read the field while it is being decoded.
+            time.sleep(0.05)
+            return deserialize(name, value)
+
+        def read_params(_):
+            barrier.wait()
+            return task.params
+
+        with (
+            mock.patch.object(
+                OperatorSerialization, "deserialize_deferred_field", side_effect=slow_deserialize
+            ) as mock_deserialize,
+            ThreadPoolExecutor(max_workers=num_threads) as pool,
+        ):
+            results = list(pool.map(read_params, range(num_threads)))
+
+        mock_deserialize.assert_called_once()
+        assert all(params is results[0] for params in results)
+        assert results[0]["p"] == 1
+
 
 class TestRetryPolicySerialization:
     """Test that retry_policy is serialized as a boolean flag (has_retry_policy)."""
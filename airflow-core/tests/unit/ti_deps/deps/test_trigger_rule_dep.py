@@ -94,6 +94,7 @@ def get_task_instance(monkeypatch, session, dag_maker):
             success_setup=success_setup,
         )
         monkeypatch.setattr(_UpstreamTIStates, "calculate", lambda *_: fake_upstream_states)
+        monkeypatch.setattr(_UpstreamTIStates, "calculate_from_task_counts", lambda *_: fake_upstream_states)
 
         return ti
 
@@ -1412,6 +1413,15 @@ class TestTriggerRuleDep:
         assert _UpstreamTIStates.calculate(_get_finished_tis("op4")) == (1, 0, 1, 0, 0, 2, 0, 0)
         assert _UpstreamTIStates.calculate(_get_finished_tis("op5")) == (2, 0, 1, 0, 0, 3, 0, 0)
 
+        # the per-task aggregate shared across a scheduling pass gives the same counts
+        dep_context = DepContext(finished_tis=list(tis.values()))
+        state_counts = dep_context.ensure_finished_ti_state_counts(dr, session=session)
+        for task_id in ("op2", "op4", "op5"):
+            upstream_tasks = {t.task_id: t for t in tis[task_id].task.upstream_list}
+            assert _UpstreamTIStates.calculate_from_task_counts(
+                state_counts, upstream_tasks
+            ) == _UpstreamTIStates.calculate(_get_finished_tis(task_id))
+
         dr.update_state(session=session)
         assert dr.state == DagRunState.SUCCESS
 
@@ -1444,6 +1454,7 @@ class TestTriggerRuleDep:
             success_setup=0,
         )
         monkeypatch.setattr(_UpstreamTIStates, "calculate", lambda *_: upstream_states)
+        monkeypatch.setattr(_UpstreamTIStates, "calculate_from_task_counts", lambda *_: upstream_states)
 
         _test_trigger_rule(
             ti=ti,
@@ -1481,6 +1492,7 @@ class TestTriggerRuleDep:
             success_setup=0,
         )
         monkeypatch.setattr(_UpstreamTIStates, "calculate", lambda *_: upstream_states)
+        monkeypatch.setattr(_UpstreamTIStates, "calculate_from_task_counts", lambda *_: upstream_states)
 
         _test_trigger_rule(ti=ti, session=session, flag_upstream_failed=flag_upstream_failed)
 
@@ -1517,6 +1529,7 @@ class TestTriggerRuleDep:
             success_setup=0,
         )
         monkeypatch.setattr(_UpstreamTIStates, "calculate", lambda *_: upstream_states)
+        monkeypatch.setattr(_UpstreamTIStates, "calculate_from_task_counts", lambda *_: upstream_states)
 
         _test_trigger_rule(ti=ti, session=session, flag_upstream_failed=flag_upstream_failed)
 
@@ -1556,6 +1569,7 @@ class TestTriggerRuleDep:
             success_setup=0,
         )
         monkeypatch.setattr(_UpstreamTIStates, "calculate", lambda *_: upstream_states)
+        monkeypatch.setattr(_UpstreamTIStates, "calculate_from_task_counts", lambda *_: upstream_states)
 
         _test_trigger_rule(
             ti=ti,
@@ -1653,6 +1667,7 @@ class TestTriggerRuleDep:
             normal_tasks=["upstream_1", "upstream_2", "upstream_3", "upstream_4", "upstream_5"],
         )
         monkeypatch.setattr(_UpstreamTIStates, "calculate", lambda *_: upstream_states)
+        monkeypatch.setattr(_UpstreamTIStates, "calculate_from_task_counts", lambda *_: upstream_states)
         _test_trigger_rule(ti=ti, session=session, flag_upstream_failed=flag_upstream_failed)
 
 
@@ -36,6 +36,7 @@ from sqlalchemy import Column, Integer, MetaData, Table, select
 from airflow import settings
 from airflow.models import Base as airflow_base
 from airflow.utils.db import (
+    _REVISION_HEADS_MAP,
     AutocommitEngineForMySQL,
     LazySelectSequence,
     _get_alembic_config,
@@ -363,6 +364,13 @@ class TestDb:
         actual = mock_om.call_args.kwargs["revision"]
         assert actual == "abc"
 
+    @pytest.mark.parametrize(("version", "reencoded"), [("3.3.0", True), ("3.4.0", False)])
+    def test_downgrade_reencodes_msgpack_serialized_dags(self, mocker, version, reencoded):
+        mocker.patch("alembic.command.downgrade")
+        mock_reencode = mocker.patch("airflow.utils.db._reencode_msgpack_serialized_dags")
+        downgrade(to_revision=_REVISION_HEADS_MAP[version])
+        assert mock_reencode.called is reencoded
+
     def test_resetdb_logging_level(self):
         unset_logging_level = logging.root.level
         logging.root.setLevel(logging.DEBUG)
@@ -0,0 +1,100 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import gc
+import statistics
+import time
+import tracemalloc
+from unittest import mock
+
+import rich_click as click
+
+
+def build_encoded_dag(num_tasks: int) -> dict:
+    """Serialize a linear DAG of ``num_tasks`` Python tasks with params, outlets and an executor config."""
+    from airflow.providers.standard.operators.python import PythonOperator
+    from airflow.sdk import DAG, Asset, chain
+    from airflow.serialization.serialized_objects import DagSerialization
+
+    with DAG(dag_id="dag_deserialization_timing", schedule=None, params={"run_param": 1}) as dag:
+        tasks = [
+            PythonOperator(
+                task_id=f"task_{i}",
+                python_callable=print,
+                op_kwargs={"i": i, "values": list(range(10))},
+                params={"task_param": i},
+                executor_config={"queue": f"queue_{i % 10}"},
+                outlets=[Asset(f"s3://bucket/task_{i}")],
+            )
+            for i in range(num_tasks)
+        ]
+        chain(*tasks)
+    return DagSerialization.serialize_dag(dag)
+
+
+def measure(encoded_dag: dict, lazily: bool, repeat: int) -> tuple[list[float], int]:
+    """Time the deserialization and measure the memory the deserialized DAG holds."""
+    from airflow.serialization.serialized_objects import DagSerialization, OperatorSerialization
+
+    times = []
+    with mock.patch.object(OperatorSerialization, "_deserialize_lazily", lazily):
+        for _ in range(repeat):
+            gc.disable()
+            start = time.perf_counter()
+            DagSerialization.deserialize_dag(encoded_dag)
+            times.append(time.perf_counter() - start)
+            gc.enable()
+
+        gc.collect()
+        tracemalloc.start()
+        dag = DagSerialization.deserialize_dag(encoded_dag)
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    del dag
+    return times, size
+
+
+def format_times(times: list[float]) -> str:
+    if len(times) > 1:
+        return f"{statistics.mean(times):.4f}s (±{statistics.stdev(times):.3f}s)"
+    return f"{times[0]:.4f}s"
+
+
+@click.command()
+@click.option("--num-tasks", default=3000, help="number of tasks in the DAG")
+@click.option("--repeat", default=3, help="number of times to run test, to reduce variance")
+def main(num_tasks, repeat):
+    """
+    Compare eager and lazy deserialization of the operators of a serialized DAG.
+
+    Lazy deserialization leaves params, inlets, outlets, the executor config and operator specific
+    fields encoded until they are first read, which most scheduler code paths never do. The memory
+    reported is what the deserialized DAG holds right after loading, the time is for
+    ``DagSerialization.deserialize_dag`` alone.
+    """
+    encoded_dag = build_encoded_dag(num_tasks)
+
+    for lazily in (False, True):
+        times, size = measure(encoded_dag, lazily, repeat)
+        print(f"{'lazy' if lazily else 'eager'} ({num_tasks} tasks):")
+        print(f"  time:   {format_times(times)}")
+        print(f"  memory: {size / 1024 / 1024:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
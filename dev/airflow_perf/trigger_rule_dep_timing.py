@@ -0,0 +1,131 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import gc
+import os
+import statistics
+import time
+from types import SimpleNamespace
+
+import rich_click as click
+
+# The performance DAG file builds its DAGs from the environment at import time, we only want its
+# shape functions.
+os.environ.setdefault("PERF_DAGS_COUNT", "0")
+os.environ.setdefault("PERF_TASKS_COUNT", "0")
+os.environ.setdefault("PERF_START_DATE", "")
+os.environ.setdefault("PERF_SHAPE", "no_structure")
+
+SHAPES = ("no_structure", "linear", "binary_tree", "star", "grid")
+
+
+def build_dag(shape: str, num_tasks: int):
+    """Build a scheduler DAG of ``num_tasks`` tasks chained like the ``performance`` DAG of ``shape``."""
+    from performance_dags.performance_dag.performance_dag import (
+        chain_as_binary_tree,
+        chain_as_grid,
+        chain_as_star,
+    )
+
+    from airflow.providers.standard.operators.empty import EmptyOperator
+    from airflow.sdk import DAG, chain
+    from airflow.serialization.serialized_objects import DagSerialization
+
+    shape_function_map = {
+        "linear": chain,
+        "binary_tree": chain_as_binary_tree,
+        "star": chain_as_star,
+        "grid": chain_as_grid,
+    }
+    with DAG(dag_id=f"trigger_rule_dep_timing__{shape}", schedule=None) as dag:
+        tasks = [EmptyOperator(task_id=f"task_{i}") for i in range(num_tasks)]
+        if shape in shape_function_map:
+            shape_function_map[shape](*tasks)
+    return DagSerialization.deserialize_dag(DagSerialization.serialize_dag(dag))
+
+
+def finished_tis_for(dag, ratio: float) -> list[SimpleNamespace]:
+    """Stand-ins for the finished task instances of a run in which the first ``ratio`` of tasks succeeded."""
+    tasks = dag.task_group.topological_sort()
+    return [
+        SimpleNamespace(task_id=task.task_id, task=task, state="success", map_index=-1)
+        for task in tasks[: int(len(tasks) * ratio)]
+    ]
+
+
+def time_it(code_to_test, repeat: int) -> list[float]:
+    times = []
+    for _ in range(repeat):
+        gc.disable()
+        start = time.perf_counter()
+        code_to_test()
+        times.append(time.perf_counter() - start)
+        gc.enable()
+    return times
+
+
+def format_times(times: list[float]) -> str:
+    if len(times) > 1:
+        return f"{statistics.mean(times):.4f}s (±{statistics.stdev(times):.3f}s)"
+    return f"{times[0]:.4f}s"
+
+
+@click.command()
+@click.option("--num-tasks", default=5000, help="number of tasks in each DAG")
+@click.option("--finished-ratio", default=0.5, help="fraction of the tasks that already finished")
+@click.option("--repeat", default=3, help="number of times to run test, to reduce variance")
+@click.argument("shapes", nargs=-1, type=click.Choice(SHAPES))
+def main(num_tasks, finished_ratio, repeat, shapes):
+    """
+    Compare the two ways TriggerRuleDep can count the finished upstreams of every task in a Dag run.
+
+    "scan" is the per task instance filter over all the finished task instances of the run, which is
+    what task instances in a mapped task group still do. "counts" aggregates the finished task
+    instances per task once, as DepContext does for a scheduling pass, and then reads the counts of
+    each upstream task.
+
+    The DAGs have the shapes of the ``performance`` DAG (all of them when no shape is given), and the
+    task instances are in memory, so only the counting is timed, not the database.
+    """
+    from airflow.ti_deps.dep_context import DepContext
+    from airflow.ti_deps.deps.trigger_rule_dep import _UpstreamTIStates
+
+    for shape in shapes or SHAPES:
+        dag = build_dag(shape, num_tasks)
+        finished_tis = finished_tis_for(dag, finished_ratio)
+        upstreams = [
+            (task.upstream_task_ids, {t.task_id: t for t in task.upstream_list}) for task in dag.tasks
+        ]
+
+        def scan():
+            for upstream_ids, _ in upstreams:
+                _UpstreamTIStates.calculate(ti for ti in finished_tis if ti.task_id in upstream_ids)
+
+        def counts():
+            dep_context = DepContext(finished_tis=finished_tis)
+            state_counts = dep_context.ensure_finished_ti_state_counts(dag_run=None, session=None)
+            for _, upstream_tasks in upstreams:
+                _UpstreamTIStates.calculate_from_task_counts(state_counts, upstream_tasks)
+
+        print(f"{shape} ({len(dag.tasks)} tasks, {len(finished_tis)} finished):")
+        print(f"  scan:   {format_times(time_it(scan, repeat))}")
+        print(f"  counts: {format_times(time_it(counts, repeat))}")
+
+
+if __name__ == "__main__":
+    main()
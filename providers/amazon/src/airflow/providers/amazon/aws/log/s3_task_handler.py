@@ -39,12 +39,17 @@ if TYPE_CHECKING:
     from airflow.utils.log.file_task_handler import LogMessages, LogSourceInfo
 
 
+# Suffix of the objects holding the parts of a task log uploaded while the task runs
+PART_SUFFIX = ".part-"
+
+
 @attrs.define
 class S3RemoteLogIO(LoggingMixin):  # noqa: D101
     remote_base: str
     base_log_folder: pathlib.Path = attrs.field(converter=pathlib.Path)
     delete_local_copy: bool
     acl_policy: str | None = None
+    _parts: dict[str, int] = attrs.field(factory=dict, init=False)
 
     processors = ()
 
@@ -87,12 +92,57 @@ class S3RemoteLogIO(LoggingMixin):  # noqa: D101
         if local_loc.is_file():
             # read log and remove old logs to get just the latest additions
             log = local_loc.read_text()
-            has_uploaded = self.write(log, remote_loc)
+            if self._appends_enabled() and self._last_part(remote_loc):
+                # The log was uploaded in parts while the task ran; the rest goes in one more part
+                has_uploaded = not log or self._write_part(log, remote_loc)
+                self._parts.pop(remote_loc, None)
+            else:
+                has_uploaded = self.write(log, remote_loc)
             if has_uploaded and self.delete_local_copy:
                 shutil.rmtree(os.path.dirname(local_loc))
             elif has_uploaded:
                 local_loc.write_text("")
 
+    def append(self, path: os.PathLike | str, log: str, ti: RuntimeTI | None = None) -> bool:
+        """
+        Add the given log lines to the remote log of the given log path, while the task is running.
+
+        The lines are uploaded as a new object next to the log, named after it with a numbered
+        ``.part-NNNNNN`` suffix, instead of rewriting the whole log each time. :meth:`read` lists and joins
+        them in order, after the log itself.
+        """
+        path = pathlib.Path(path)
+        if path.is_absolute():
+            path = path.relative_to(self.base_log_folder)
+        return self._write_part(log, os.path.join(self.remote_base, path))
+
+    @staticmethod
+    def _appends_enabled() -> bool:
+        return (
+            conf.getfloat("logging", "remote_log_upload_interval", fallback=0) > 0
+            or conf.getint("logging", "remote_log_upload_chunk_size", fallback=0) > 0
+        )
+
+    def _last_part(self, remote_log_location: str) -> int:
+        """Return the number of the last part of the given remote log, listing them on first use."""
+        if remote_log_location not in self._parts:
+            # A previous run of the task with the same log, such as a rescheduled sensor, may have left parts
+            bucket, prefix = self.hook.parse_s3_url(f"{remote_log_location}{PART_SUFFIX}")
+            numbers = (key[len(prefix) :] for key in self.hook.list_keys(bucket_name=bucket, prefix=prefix))
+            self._parts[remote_log_location] = max((int(n) for n in numbers if n.isdigit()), default=0)
+        return self._parts[remote_log_location]
+
+    def _write_part(self, log: str, remote_log_location: str) -> bool:
+        try:
+            part = self._last_part(remote_log_location) + 1
+        except Exception:
+            self.log.exception("Could not list the parts of %s", remote_log_location)
+            return False
+        if not self.write(log, f"{remote_log_location}{PART_SUFFIX}{part:06d}", append=False):
+            return False
+        self._parts[remote_log_location] = part
+        return True
+
     @cached_property
     def hook(self):
         """Returns S3Hook."""
@@ -351,6 +351,30 @@ class TestS3RemoteLogIO:
         body = boto3.resource("s3").Object("bucket", self.remote_log_key).get()["Body"].read()
         assert body == b"cycle 1\ncycle 2\ncycle 3\n"
 
+    @conf_vars({("logging", "remote_log_upload_interval"): "60"})
+    def test_append_uploads_each_chunk_as_a_part(self):
+        self.conn.put_object(Bucket="bucket", Key=f"{self.remote_log_key}.part-000001", Body=b"earlier\n")
+        local_log = self.subject.base_log_folder / "1.log"
+        local_log.parent.mkdir(parents=True, exist_ok=True)
+        local_log.write_text("last\n")
+
+        assert self.subject.append("1.log", "first\n", self.ti)
+        assert self.subject.append(self.subject.base_log_folder / "1.log", "second\n", self.ti)
+        with mock.patch.object(self.subject, "s3_read", wraps=self.subject.s3_read) as mock_s3_read:
+            self.subject.upload(local_log, self.ti)
+
+        # The earlier parts are never read back and rewritten
+        mock_s3_read.assert_not_called()
+        keys = self.conn.list_objects_v2(Bucket="bucket", Prefix=self.remote_log_key)["Contents"]
+        assert [key["Key"].removeprefix(self.remote_log_key) for key in keys] == [
+            ".part-000001",
+            ".part-000002",
+            ".part-000003",
+            ".part-000004",
+        ]
+        _, logs = self.subject.read("1.log", self.ti)
+        assert logs == ["earlier\n", "first\n", "second\n", "last\n"]
+
     def test_write_raises(self, caplog):
         url = "s3://nonexistentbucket/foo"
         with caplog.at_level(logging.ERROR):
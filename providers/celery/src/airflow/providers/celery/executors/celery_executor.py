@@ -54,15 +54,20 @@ CELERY_SEND_ERR_MSG_HEADER = "Error sending Celery workload"
 
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Mapping, Sequence
 
     from celery.result import AsyncResult
 
     from airflow.cli.cli_config import GroupCommand
     from airflow.executors import workloads
+    from airflow.executors.base_executor import EventBufferValueType
     from airflow.models.taskinstance import TaskInstance
     from airflow.models.taskinstancekey import TaskInstanceKey
-    from airflow.providers.celery.executors.celery_executor_utils import TaskTuple, WorkloadInCelery
+    from airflow.providers.celery.executors.celery_executor_utils import (
+        TaskEventCollector,
+        TaskTuple,
+        WorkloadInCelery,
+    )
 
     if AIRFLOW_V_3_2_PLUS:
         from airflow.executors.workloads.types import (
@@ -152,12 +157,23 @@ class CeleryExecutor(BaseExecutor):
         from airflow.providers.celery.executors.celery_executor_utils import BulkStateFetcher
 
         self.bulk_state_fetcher = BulkStateFetcher(self._sync_parallelism, celery_app=self.celery_app)
+        # With task events, the states fetched from the result backend only reconcile the ones missed
+        self.task_event_collector: TaskEventCollector | None = None
+        if self.conf.getboolean("celery", "sync_with_task_events", fallback=False):
+            from airflow.providers.celery.executors.celery_executor_utils import TaskEventCollector
+
+            self.task_event_collector = TaskEventCollector(self.celery_app)
+        self.state_reconcile_interval = self.conf.getint("celery", "state_reconcile_interval", fallback=300)
+        self._last_state_reconcile: float | None = None
         self.workloads: dict[WorkloadKey, AsyncResult] = {}
         self.workload_publish_retries: Counter[WorkloadKey] = Counter()
         self.workload_publish_max_retries = self.conf.getint("celery", "task_publish_max_retries", fallback=3)
+        self.bulk_publish = self.conf.getboolean("celery", "bulk_publish", fallback=False)
 
     def start(self) -> None:
         self.log.debug("Starting Celery Executor using %s processes for syncing", self._sync_parallelism)
+        if self.task_event_collector:
+            self.task_event_collector.start()
 
     def _num_workloads_per_send_process(self, to_send_count: int) -> int:
         """
@@ -239,7 +255,13 @@ class CeleryExecutor(BaseExecutor):
                 self.event_buffer[key] = (TaskInstanceState.QUEUED, result.task_id)
 
     def _send_workloads_to_celery(self, workload_tuples_to_send: Sequence[WorkloadInCelery]):
-        from airflow.providers.celery.executors.celery_executor_utils import send_workload_to_executor
+        from airflow.providers.celery.executors.celery_executor_utils import (
+            send_workload_to_executor,
+            send_workloads_to_executor_in_bulk,
+        )
+
+        if self.bulk_publish:
+            return send_workloads_to_executor_in_bulk(workload_tuples_to_send)
 
         if len(workload_tuples_to_send) == 1 or self._sync_parallelism == 1:
             # One tuple, or max one process -> send it in the main thread.
@@ -261,6 +283,9 @@ class CeleryExecutor(BaseExecutor):
     def sync(self) -> None:
         if not self.workloads:
             self.log.debug("No workload to query celery, skipping sync")
+            if self.task_event_collector:
+                # Drop the states of the tasks of other schedulers
+                self.task_event_collector.pop_states()
             return
         self.update_all_workload_states()
 
@@ -275,12 +300,29 @@ class CeleryExecutor(BaseExecutor):
 
     def update_all_workload_states(self) -> None:
         """Update states of the workloads."""
-        self.log.debug("Inquiring about %s celery workload(s)", len(self.workloads))
-        state_and_info_by_celery_task_id = self.bulk_state_fetcher.get_many(self.workloads.values())
-
-        self.log.debug("Inquiries completed.")
+        state_and_info_by_celery_task_id: Mapping[str, EventBufferValueType] = {}
+        reconcile = True
+        if self.task_event_collector:
+            state_and_info_by_celery_task_id, missed_events = self.task_event_collector.pop_states()
+            reconcile = (
+                missed_events
+                or self._last_state_reconcile is None
+                or time.monotonic() - self._last_state_reconcile >= self.state_reconcile_interval
+            )
+        if reconcile:
+            self.log.debug("Inquiring about %s celery workload(s)", len(self.workloads))
+            self._last_state_reconcile = time.monotonic()
+            # The events only report final states, which are never outdated by the fetched ones
+            state_and_info_by_celery_task_id = {
+                **self.bulk_state_fetcher.get_many(self.workloads.values()),
+                **state_and_info_by_celery_task_id,
+            }
+            self.log.debug("Inquiries completed.")
+
+        if not state_and_info_by_celery_task_id:
+            return
         for key, async_result in list(self.workloads.items()):
-            state, info = state_and_info_by_celery_task_id.get(async_result.task_id)
+            state, info = state_and_info_by_celery_task_id.get(async_result.task_id, (None, None))
             if state:
                 self.update_task_state(cast("TaskInstanceKey", key), state, info)
 
@@ -309,9 +351,12 @@ class CeleryExecutor(BaseExecutor):
             ):
                 time.sleep(5)
         self.sync()
+        if self.task_event_collector:
+            self.task_event_collector.stop()
 
     def terminate(self):
-        pass
+        if self.task_event_collector:
+            self.task_event_collector.stop()
 
     def try_adopt_task_instances(self, tis: Sequence[TaskInstance]) -> Sequence[TaskInstance]:
         # The scheduler pre-assigns external_executor_id at queuing time (committed to DB
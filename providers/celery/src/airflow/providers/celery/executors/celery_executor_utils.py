@@ -29,8 +29,10 @@ import math
 import os
 import subprocess
 import sys
+import threading
 import traceback
-from collections.abc import Collection, Mapping, MutableMapping, Sequence
+from collections import defaultdict
+from collections.abc import Callable, Collection, Mapping, MutableMapping, Sequence
 from concurrent.futures import ProcessPoolExecutor
 from functools import cache
 from importlib import import_module
@@ -39,6 +41,7 @@ from typing import TYPE_CHECKING, Any
 from celery import Celery, states as celery_states
 from celery.backends.base import BaseKeyValueStoreBackend
 from celery.backends.database import DatabaseBackend, Task as TaskDb, retry, session_cleanup
+from celery.events.receiver import EventReceiver
 from celery.signals import import_modules as celery_import_modules, worker_ready
 from sqlalchemy import select
 
@@ -71,6 +74,7 @@ if TYPE_CHECKING:
     from typing import TypeAlias
 
     from celery.result import AsyncResult
+    from kombu import Producer
 
     from airflow.configuration import AirflowConfigParser
     from airflow.executors import workloads
@@ -210,6 +214,14 @@ def on_celery_import_modules(*args, **kwargs):
     with contextlib.suppress(ImportError):
         import kubernetes.client  # noqa: F401
 
+    try:
+        from airflow.sdk.execution_time.supervisor import preload_task_modules
+    except ImportError:
+        # Older Task SDK versions
+        pass
+    else:
+        preload_task_modules()
+
     # To prevent memory increase by COW in celery's ForkPoolWorker.
     gc.freeze()
 
@@ -403,6 +415,7 @@ class ExceptionWithTraceback:
 
 def send_workload_to_executor(
     workload_tuple: WorkloadInCelery,
+    producer: Producer | None = None,
 ) -> WorkloadInCeleryResult:
     """
     Send workload to executor (serialized and executed as a Celery task).
@@ -414,6 +427,10 @@ def send_workload_to_executor(
     the main benefit is the scheduler-inline path where the cache persists across publish cycles.
     In the ProcessPoolExecutor path, each subprocess is recreated per publish batch and the cache
     only lasts for that single batch.
+
+    :param workload_tuple: The workload to send
+    :param producer: The producer to publish the Celery task with, by default one is acquired from the
+        producer pool of the Celery app for each call
     """
     key, args, queue, team_name = workload_tuple
 
@@ -449,7 +466,9 @@ def send_workload_to_executor(
 
     try:
         with timeout(seconds=OPERATION_TIMEOUT):
-            result = celery_task.apply_async(args=args, queue=queue, task_id=celery_task_id)
+            result = celery_task.apply_async(
+                args=args, queue=queue, task_id=celery_task_id, producer=producer
+            )
     except (Exception, AirflowTaskTimeout) as e:
         exception_traceback = f"Celery Task ID: {key}\n{traceback.format_exc()}"
         result = ExceptionWithTraceback(e, exception_traceback)
@@ -459,6 +478,42 @@ def send_workload_to_executor(
     return key, args, result
 
 
+def send_workloads_to_executor_in_bulk(
+    workload_tuples: Sequence[WorkloadInCelery],
+) -> list[WorkloadInCeleryResult]:
+    """
+    Send workloads to executor, publishing the ones of each team over a single broker connection.
+
+    This function runs inline in the scheduler process, so that the Celery apps cached by
+    :func:`_get_celery_app_for_workload` and the connections of their producer pools are reused across
+    publish cycles, instead of being created again in publisher subprocesses for each batch.
+
+    :param workload_tuples: The workloads to send
+    :return: The results of :func:`send_workload_to_executor`, in the order of the workloads
+    """
+    indexes_by_team: dict[str | None, list[int]] = defaultdict(list)
+    for index, (_, _, _, team_name) in enumerate(workload_tuples):
+        indexes_by_team[team_name].append(index)
+
+    results: dict[int, WorkloadInCeleryResult] = {}
+    for team_name, indexes in indexes_by_team.items():
+        celery_app = _get_celery_app_for_workload(team_name)
+        try:
+            with celery_app.producer_or_acquire() as producer:
+                for index in indexes:
+                    results[index] = send_workload_to_executor(workload_tuples[index], producer=producer)
+        except Exception:
+            # The producer could not be acquired or released. Each workload not sent yet is published on
+            # its own instead, so that it gets its own result.
+            log.warning(
+                "Could not publish the workloads of team %s over one producer", team_name, exc_info=True
+            )
+            for index in indexes:
+                if index not in results:
+                    results[index] = send_workload_to_executor(workload_tuples[index])
+    return [results[index] for index in range(len(workload_tuples))]
+
+
 def fetch_celery_task_state(async_result: AsyncResult) -> tuple[str, str | ExceptionWithTraceback, Any]:
     """
     Fetch and return the state of the given celery task (workload execution).
@@ -583,3 +638,98 @@ class BulkStateFetcher(LoggingMixin):
                 else:
                     states_and_info_by_task_id[task_id] = state_or_exception, info
         return states_and_info_by_task_id
+
+
+class _TaskEventReceiver(EventReceiver):
+    """Event receiver which calls ``on_ready`` once it consumes the events sent from then on."""
+
+    def __init__(self, *args, on_ready: Callable[[], None], **kwargs):
+        super().__init__(*args, **kwargs)
+        self._on_ready = on_ready
+
+    def on_consume_ready(self, connection, channel, consumers, **kwargs):
+        super().on_consume_ready(connection, channel, consumers, **kwargs)
+        self._on_ready()
+
+
+class TaskEventCollector(LoggingMixin):
+    """
+    Collects the final states of Celery tasks from the task events sent by the Celery workers.
+
+    A daemon thread consumes the events from the broker into an in-memory table of the states of the tasks
+    which completed, which :meth:`pop_states` hands over to the executor. Events sent while the thread is not
+    consuming them, before it starts or while it reconnects to the broker, are lost: :meth:`pop_states` then
+    tells that the states must be fetched from the result backend.
+    """
+
+    RECONNECT_DELAY = 5.0
+
+    _STATE_BY_EVENT_TYPE = {
+        "task-succeeded": celery_states.SUCCESS,
+        "task-failed": celery_states.FAILURE,
+        "task-revoked": celery_states.REVOKED,
+    }
+
+    def __init__(self, celery_app: Celery):
+        super().__init__()
+        self.celery_app = celery_app
+        self._lock = threading.Lock()
+        self._states: dict[str, EventBufferValueType] = {}
+        self._missed_events = True
+        self._stopped = threading.Event()
+        self._receiver: EventReceiver | None = None
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start consuming the task events in a daemon thread."""
+        self._thread = threading.Thread(target=self._run, name="celery-task-events", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop consuming the task events."""
+        self._stopped.set()
+        if self._receiver is not None:
+            self._receiver.should_stop = True
+        if self._thread is not None:
+            self._thread.join(timeout=self.RECONNECT_DELAY)
+
+    def pop_states(self) -> tuple[dict[str, EventBufferValueType], bool]:
+        """
+        Take the states of the tasks which completed since the last call.
+
+        :return: The state and info of the tasks by Celery task id, and whether events may have been missed
+            since the last call.
+        """
+        with self._lock:
+            states, self._states = self._states, {}
+            missed_events, self._missed_events = self._missed_events, False
+        return states, missed_events
+
+    def _mark_missed_events(self) -> None:
+        with self._lock:
+            self._missed_events = True
+
+    def _on_event(self, event: dict[str, Any]) -> None:
+        state = self._STATE_BY_EVENT_TYPE[event["type"]]
+        info = event.get("exception") if state == celery_states.FAILURE else None
+        with self._lock:
+            self._states[event["uuid"]] = state, info
+
+    def _run(self) -> None:
+        handlers = {event_type: self._on_event for event_type in self._STATE_BY_EVENT_TYPE}
+        while not self._stopped.is_set():
+            try:
+                with self.celery_app.connection_for_read() as connection:
+                    self._receiver = _TaskEventReceiver(
+                        connection,
+                        handlers=handlers,
+                        app=self.celery_app,
+                        on_ready=self._mark_missed_events,
+                    )
+                    if self._stopped.is_set():
+                        break
+                    self._receiver.capture(limit=None, timeout=None, wakeup=False)
+            except Exception:
+                self.log.exception("Error consuming Celery task events, reconnecting")
+                self._mark_missed_events()
+                self._stopped.wait(self.RECONNECT_DELAY)
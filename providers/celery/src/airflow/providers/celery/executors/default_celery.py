@@ -125,6 +125,7 @@ def get_default_celery_config(team_conf) -> dict[str, Any]:
         "task_default_queue": team_conf.get("operators", "DEFAULT_QUEUE"),
         "task_default_exchange": team_conf.get("operators", "DEFAULT_QUEUE"),
         "task_track_started": team_conf.getboolean("celery", "task_track_started", fallback=True),
+        "worker_send_task_events": team_conf.getboolean("celery", "sync_with_task_events", fallback=False),
         "broker_url": broker_url,
         "broker_transport_options": broker_transport_options,
         "broker_connection_retry_on_startup": team_conf.getboolean(
@@ -176,6 +176,20 @@ def get_provider_info():
                         "example": None,
                         "default": "0",
                     },
+                    "sync_with_task_events": {
+                        "description": "Collect the states of the Celery tasks from the task events sent by the Celery workers, instead of\nfetching the states of all running tasks from the result backend in each scheduler loop. The workers\nsend the task events when started with this option set as well. The states are still fetched from the\nresult backend every ``state_reconcile_interval`` seconds, and when events may have been missed.\n",
+                        "version_added": "3.24.0",
+                        "type": "boolean",
+                        "example": None,
+                        "default": "False",
+                    },
+                    "state_reconcile_interval": {
+                        "description": "Number of seconds between the fetches of the states of all running tasks from the result backend\nwhen ``sync_with_task_events`` is enabled.\n",
+                        "version_added": "3.24.0",
+                        "type": "integer",
+                        "example": None,
+                        "default": "300",
+                    },
                     "celery_config_options": {
                         "description": "Import path for celery configuration options\n",
                         "version_added": None,
@@ -253,6 +267,13 @@ def get_provider_info():
                         "example": None,
                         "default": "3",
                     },
+                    "bulk_publish": {
+                        "description": "Send the workloads from the scheduler process, publishing the ones of each team over a single\nbroker connection, instead of sending them from ``sync_parallelism`` subprocesses started for each\nbatch, which each create their own Celery app and broker connection.\n",
+                        "version_added": "3.24.0",
+                        "type": "boolean",
+                        "example": None,
+                        "default": "False",
+                    },
                     "extra_celery_config": {
                         "description": 'Extra celery configs to include in the celery worker.\nAny of the celery config can be added to this config and it\nwill be applied while starting the celery worker. e.g. {"worker_max_tasks_per_child": 10}\nSee also:\nhttps://docs.celeryq.dev/en/stable/userguide/configuration.html#configuration-and-defaults\n',
                         "version_added": None,
@@ -29,7 +29,7 @@ from unittest import mock
 import celery.contrib.testing.tasks  # noqa: F401
 import pytest
 import time_machine
-from celery import Celery
+from celery import Celery, states as celery_states
 from celery.result import AsyncResult
 from kombu.asynchronous import set_event_loop
 
@@ -477,6 +477,58 @@ class TestCeleryExecutor:
         assert not executor.has_task(ti)
         mock_fail.assert_not_called()
 
+    @conf_vars({("celery", "sync_with_task_events"): "True", ("celery", "state_reconcile_interval"): "60"})
+    def test_sync_with_task_events(self):
+        key_a = TaskInstanceKey("dag", "task_a", "run", 1, -1)
+        key_b = TaskInstanceKey("dag", "task_b", "run", 1, -1)
+        executor = celery_executor.CeleryExecutor()
+        collector = executor.task_event_collector
+        assert collector is not None
+        executor.workloads = {key_a: mock.Mock(task_id="a"), key_b: mock.Mock(task_id="b")}
+        executor.bulk_state_fetcher = mock.MagicMock()
+        executor.bulk_state_fetcher.get_many.return_value = {
+            "a": (celery_states.STARTED, None),
+            "b": (celery_states.STARTED, None),
+        }
+
+        with mock.patch.object(executor, "update_task_state") as mock_update_task_state:
+            # No event was received yet, so the states are fetched from the result backend
+            executor.sync()
+            assert executor.bulk_state_fetcher.get_many.call_count == 1
+            assert mock_update_task_state.call_count == 2
+
+            # Until the next reconcile, only the states of the tasks with events are updated
+            mock_update_task_state.reset_mock()
+            collector._on_event({"type": "task-failed", "uuid": "b", "exception": "ValueError()"})
+            collector._on_event({"type": "task-succeeded", "uuid": "other"})
+            executor.sync()
+            assert executor.bulk_state_fetcher.get_many.call_count == 1
+            mock_update_task_state.assert_called_once_with(key_b, celery_states.FAILURE, "ValueError()")
+
+            mock_update_task_state.reset_mock()
+            executor.sync()
+            mock_update_task_state.assert_not_called()
+
+            executor._last_state_reconcile -= 61
+            executor.sync()
+            assert executor.bulk_state_fetcher.get_many.call_count == 2
+            assert mock_update_task_state.call_count == 2
+
+            # Events may have been missed while reconnecting to the broker
+            collector._mark_missed_events()
+            executor.sync()
+            assert executor.bulk_state_fetcher.get_many.call_count == 3
+
+    def test_task_event_collector_pop_states(self):
+        collector = celery_executor_utils.TaskEventCollector(mock.MagicMock())
+        collector._on_event({"type": "task-succeeded", "uuid": "a", "result": "None"})
+        collector._on_event({"type": "task-revoked", "uuid": "b"})
+
+        states, missed_events = collector.pop_states()
+        assert states == {"a": (celery_states.SUCCESS, None), "b": (celery_states.REVOKED, None)}
+        assert missed_events
+        assert collector.pop_states() == ({}, False)
+
     @conf_vars({("celery", "result_backend_sqlalchemy_engine_options"): '{"pool_recycle": 1800}'})
     def test_result_backend_sqlalchemy_engine_options(self):
         import importlib
@@ -611,11 +663,87 @@ def test_send_workload_uses_external_executor_id_as_celery_task_id():
         )
 
     mock_celery_task.apply_async.assert_called_once_with(
-        args=("{}",), queue="default", task_id=pre_assigned_id
+        args=("{}",), queue="default", task_id=pre_assigned_id, producer=None
     )
     assert result.task_id == pre_assigned_id
 
 
+def test_send_workloads_to_executor_in_bulk():
+    """Workloads are published over one producer per team, and their results keep their order."""
+    apps = {}
+    for team_name in ("team-a", "team-b"):
+        celery_task = mock.Mock()
+        celery_task.apply_async.side_effect = lambda *, task_id, **_: mock.Mock(task_id=task_id)
+        app = mock.MagicMock()
+        app.tasks = {"execute_workload" if AIRFLOW_V_3_0_PLUS else "execute_command": celery_task}
+        apps[team_name] = app
+
+    workload_tuples = []
+    for index, team_name in enumerate(["team-a", "team-b", "team-a"]):
+        key = TaskInstanceKey(dag_id="test_dag", task_id=f"task_{index}", run_id="test_run", try_number=1)
+        if AIRFLOW_V_3_0_PLUS:
+            workload = mock.Mock()
+            workload.ti.external_executor_id = f"celery-{index}"
+            workload.model_dump_json.return_value = "{}"
+        else:
+            workload = ["airflow", "tasks", "run", "test_dag", f"task_{index}", "test_run"]
+        workload_tuples.append((key, workload, "default", team_name))
+
+    with mock.patch.object(
+        celery_executor_utils, "create_celery_app", side_effect=[apps["team-a"], apps["team-b"]]
+    ):
+        results = celery_executor_utils.send_workloads_to_executor_in_bulk(workload_tuples)
+
+    assert [key for key, _, _ in results] == [key for key, _, _, _ in workload_tuples]
+    if AIRFLOW_V_3_0_PLUS:
+        assert [result.task_id for _, _, result in results] == ["celery-0", "celery-1", "celery-2"]
+    for team_name, publish_count in (("team-a", 2), ("team-b", 1)):
+        app = apps[team_name]
+        app.producer_or_acquire.assert_called_once_with()
+        producer = app.producer_or_acquire.return_value.__enter__.return_value
+        celery_task = next(iter(app.tasks.values()))
+        assert celery_task.apply_async.call_count == publish_count
+        assert all(call.kwargs["producer"] is producer for call in celery_task.apply_async.call_args_list)
+
+
+def test_send_workloads_to_executor_in_bulk_publishes_each_workload_when_producer_unavailable():
+    """Without a shared producer, each workload is published on its own and keeps its own result."""
+    celery_task = mock.Mock()
+    celery_task.apply_async.side_effect = [ConnectionError("broker down"), mock.Mock(task_id="celery-1")]
+    app = mock.MagicMock()
+    app.tasks = {"execute_workload" if AIRFLOW_V_3_0_PLUS else "execute_command": celery_task}
+    app.producer_or_acquire.side_effect = ConnectionError("no producer")
+    workload_tuples = []
+    for index in range(2):
+        key = TaskInstanceKey(dag_id="test_dag", task_id=f"task_{index}", run_id="test_run", try_number=1)
+        if AIRFLOW_V_3_0_PLUS:
+            workload = mock.Mock()
+            workload.ti.external_executor_id = f"celery-{index}"
+            workload.model_dump_json.return_value = "{}"
+        else:
+            workload = ["airflow", "tasks", "run", "test_dag", f"task_{index}", "test_run"]
+        workload_tuples.append((key, workload, "default", None))
+
+    with mock.patch.object(celery_executor_utils, "create_celery_app", return_value=app):
+        results = celery_executor_utils.send_workloads_to_executor_in_bulk(workload_tuples)
+
+    assert [key for key, _, _ in results] == [key for key, _, _, _ in workload_tuples]
+    assert all(call.kwargs["producer"] is None for call in celery_task.apply_async.call_args_list)
+    assert isinstance(results[0][2], celery_executor_utils.ExceptionWithTraceback)
+    assert isinstance(results[0][2].exception, ConnectionError)
+    assert results[1][2].task_id == "celery-1"
+
+
+@conf_vars({("celery", "bulk_publish"): "True"})
+@mock.patch.object(celery_executor_utils, "send_workloads_to_executor_in_bulk")
+def test_send_workloads_to_celery_in_bulk(mock_send_in_bulk):
+    executor = celery_executor.CeleryExecutor()
+    workload_tuples = [(mock.Mock(), mock.Mock(), "default", None) for _ in range(3)]
+
+    assert executor._send_workloads_to_celery(workload_tuples) is mock_send_in_bulk.return_value
+    mock_send_in_bulk.assert_called_once_with(workload_tuples)
+
+
 @pytest.mark.parametrize("team_name", [None, "team-a"])
 def test_get_celery_app_for_workload_reuses_cache_for_same_team(team_name):
     first_app = mock.Mock()
@@ -81,6 +81,7 @@ if TYPE_CHECKING:
     from airflow.models.taskinstancekey import TaskInstanceKey
     from airflow.providers.cncf.kubernetes.executors.kubernetes_executor_utils import (
         AirflowKubernetesScheduler,
+        KubernetesPodInformer,
     )
 
 
@@ -176,7 +177,22 @@ class KubernetesExecutor(BaseExecutor):
         if not hasattr(self, "team_name"):
             self.team_name = None
 
+    def _synced_pod_informer(self) -> KubernetesPodInformer | None:
+        """Return the pod informer of the scheduler if it is enabled and holds its pods of all namespaces."""
+        if not self.kube_config.pod_informer or self.kube_scheduler is None:
+            return None
+        pod_informer = self.kube_scheduler.pod_informer
+        if pod_informer is None or not pod_informer.has_synced():
+            return None
+        return pod_informer
+
     def _list_pods(self, query_kwargs):
+        pod_informer = self._synced_pod_informer()
+        if pod_informer and pod_informer.covers(query_kwargs.get("label_selector")):
+            return pod_informer.list_pods(
+                label_selector=query_kwargs.get("label_selector"),
+                field_selector=query_kwargs.get("field_selector"),
+            )
         query_kwargs["header_params"] = {
             "Accept": "application/json;as=PartialObjectMetadataList;v=v1;g=meta.k8s.io"
         }
@@ -896,10 +912,14 @@ class KubernetesExecutor(BaseExecutor):
                 airflow_worker=ti.queued_by_job_id,
             )
             namespace = self._get_pod_namespace(ti)
-            pod_list = client.list_namespaced_pod(
-                namespace=namespace,
-                label_selector=selector,
-            ).items
+            pod_informer = self._synced_pod_informer()
+            if pod_informer and pod_informer.covers(selector):
+                pod_list = pod_informer.list_pods(label_selector=selector, namespace=namespace)
+            else:
+                pod_list = client.list_namespaced_pod(
+                    namespace=namespace,
+                    label_selector=selector,
+                ).items
             if not pod_list:
                 raise RuntimeError("Cannot find pod for ti %s", ti)
             if len(pod_list) > 1:
@@ -20,7 +20,11 @@ import asyncio
 import contextlib
 import json
 import multiprocessing
+import re
+import threading
 import time
+from functools import cache
+from http import HTTPStatus
 from queue import Empty, Queue
 from typing import TYPE_CHECKING, Any, Literal, cast
 
@@ -70,123 +74,36 @@ class ResourceVersion:
         return cls._instance
 
 
-class KubernetesJobWatcher(multiprocessing.Process, LoggingMixin):
-    """Watches for Kubernetes jobs."""
-
-    def __init__(
-        self,
-        namespace: str,
-        watcher_queue: Queue[KubernetesWatch],
-        resource_version: str | None,
-        scheduler_job_id: str,
-        kube_config: Configuration,
-    ):
-        super().__init__()
-        self.namespace = namespace
-        self.scheduler_job_id = scheduler_job_id
-        self.watcher_queue = watcher_queue
-        self.resource_version = resource_version
-        self.kube_config = kube_config
-
-    def run(self) -> None:
-        """Perform watching."""
-        if TYPE_CHECKING:
-            assert self.scheduler_job_id
-
-        kube_client: client.CoreV1Api = get_kube_client()
-        while True:
-            try:
-                self.resource_version = self._run(
-                    kube_client, self.resource_version, self.scheduler_job_id, self.kube_config
-                )
-            except ReadTimeoutError:
-                self.log.info("Kubernetes watch timed out waiting for events. Restarting watch.")
-                time.sleep(1)
-            except Exception:
-                self.log.exception("Unknown error in KubernetesJobWatcher. Failing")
-                self.resource_version = "0"
-                ResourceVersion().resource_version[self.namespace] = "0"
-                raise
-            else:
-                self.log.warning(
-                    "Watch died gracefully, starting back up with: last resource_version: %s",
-                    self.resource_version,
-                )
-
-    def _pod_events(self, kube_client: client.CoreV1Api, query_kwargs: dict):
-        watcher = watch.Watch()
-        try:
-            if self.namespace == ALL_NAMESPACES:
-                return watcher.stream(kube_client.list_pod_for_all_namespaces, **query_kwargs)
-            return watcher.stream(kube_client.list_namespaced_pod, self.namespace, **query_kwargs)
-        except ApiException as e:
-            if str(e.status) == "410":  # Resource version is too old
-                if self.namespace == ALL_NAMESPACES:
-                    pods = kube_client.list_pod_for_all_namespaces(watch=False)
-                else:
-                    pods = kube_client.list_namespaced_pod(namespace=self.namespace, watch=False)
-                resource_version = pods.metadata.resource_version
-                query_kwargs["resource_version"] = resource_version
-                return self._pod_events(kube_client=kube_client, query_kwargs=query_kwargs)
-            raise
-
-    def _run(
-        self,
-        kube_client: client.CoreV1Api,
-        resource_version: str | None,
-        scheduler_job_id: str,
-        kube_config: Any,
-    ) -> str | None:
-        self.log.info("Event: and now my watch begins starting at resource_version: %s", resource_version)
+class KubernetesPodEventHandler(LoggingMixin):
+    """Turns the events of the worker pods of a scheduler into the watches put in its watcher queue."""
 
-        kwargs: dict[str, Any] = {
-            "label_selector": f"airflow-worker={scheduler_job_id},{POD_EXECUTOR_DONE_KEY}!=True",
-        }
-        if resource_version:
-            kwargs["resource_version"] = resource_version
-        if kube_config.kube_client_request_args:
-            for key, value in kube_config.kube_client_request_args.items():
-                kwargs[key] = value
-
-        last_resource_version: str | None = None
-
-        # For info about k8s timeout settings see
-        # https://github.com/kubernetes-client/python/blob/v29.0.0/examples/watch/timeout-settings.md
-        # and https://github.com/kubernetes-client/python/blob/v29.0.0/kubernetes/client/api_client.py#L336-L339
-        if "_request_timeout" not in kwargs:
-            kwargs["_request_timeout"] = 30
-        if "timeout_seconds" not in kwargs:
-            kwargs["timeout_seconds"] = 3600
+    watcher_queue: Queue[KubernetesWatch]
+    kube_config: Any
 
+    def process_event(self, event: Any) -> None:
+        """Process an event of a worker pod."""
+        task = event["object"]
+        annotations = task.metadata.annotations
         logical_date_key = get_logical_date_key()
-        for event in self._pod_events(kube_client=kube_client, query_kwargs=kwargs):
-            task = event["object"]
-            self.log.debug("Event: %s had an event of type %s", task.metadata.name, event["type"])
-            if event["type"] == "ERROR":
-                return self.process_error(event)
-            annotations = task.metadata.annotations
-            task_instance_related_annotations = {
-                "dag_id": annotations["dag_id"],
-                "task_id": annotations["task_id"],
-                logical_date_key: annotations.get(logical_date_key),
-                "run_id": annotations.get("run_id"),
-                "try_number": annotations["try_number"],
-            }
-            map_index = annotations.get("map_index")
-            if map_index is not None:
-                task_instance_related_annotations["map_index"] = map_index
-
-            self.process_status(
-                pod_name=task.metadata.name,
-                namespace=task.metadata.namespace,
-                status=task.status.phase,
-                annotations=task_instance_related_annotations,
-                resource_version=task.metadata.resource_version,
-                event=event,
-            )
-            last_resource_version = task.metadata.resource_version
-
-        return last_resource_version
+        task_instance_related_annotations = {
+            "dag_id": annotations["dag_id"],
+            "task_id": annotations["task_id"],
+            logical_date_key: annotations.get(logical_date_key),
+            "run_id": annotations.get("run_id"),
+            "try_number": annotations["try_number"],
+        }
+        map_index = annotations.get("map_index")
+        if map_index is not None:
+            task_instance_related_annotations["map_index"] = map_index
+
+        self.process_status(
+            pod_name=task.metadata.name,
+            namespace=task.metadata.namespace,
+            status=task.status.phase,
+            annotations=task_instance_related_annotations,
+            resource_version=task.metadata.resource_version,
+            event=event,
+        )
 
     def process_error(self, event: Any) -> str:
         """Process error response."""
@@ -361,6 +278,409 @@ class KubernetesJobWatcher(multiprocessing.Process, LoggingMixin):
             )
 
 
+class KubernetesJobWatcher(multiprocessing.Process, KubernetesPodEventHandler):
+    """Watches for Kubernetes jobs."""
+
+    def __init__(
+        self,
+        namespace: str,
+        watcher_queue: Queue[KubernetesWatch],
+        resource_version: str | None,
+        scheduler_job_id: str,
+        kube_config: Configuration,
+    ):
+        super().__init__()
+        self.namespace = namespace
+        self.scheduler_job_id = scheduler_job_id
+        self.watcher_queue = watcher_queue
+        self.resource_version = resource_version
+        self.kube_config = kube_config
+
+    def run(self) -> None:
+        """Perform watching."""
+        if TYPE_CHECKING:
+            assert self.scheduler_job_id
+
+        kube_client: client.CoreV1Api = get_kube_client()
+        while True:
+            try:
+                self.resource_version = self._run(
+                    kube_client, self.resource_version, self.scheduler_job_id, self.kube_config
+                )
+            except ReadTimeoutError:
+                self.log.info("Kubernetes watch timed out waiting for events. Restarting watch.")
+                time.sleep(1)
+            except Exception:
+                self.log.exception("Unknown error in KubernetesJobWatcher. Failing")
+                self.resource_version = "0"
+                ResourceVersion().resource_version[self.namespace] = "0"
+                raise
+            else:
+                self.log.warning(
+                    "Watch died gracefully, starting back up with: last resource_version: %s",
+                    self.resource_version,
+                )
+
+    def _pod_events(self, kube_client: client.CoreV1Api, query_kwargs: dict):
+        watcher = watch.Watch()
+        try:
+            if self.namespace == ALL_NAMESPACES:
+                return watcher.stream(kube_client.list_pod_for_all_namespaces, **query_kwargs)
+            return watcher.stream(kube_client.list_namespaced_pod, self.namespace, **query_kwargs)
+        except ApiException as e:
+            if str(e.status) == "410":  # Resource version is too old
+                if self.namespace == ALL_NAMESPACES:
+                    pods = kube_client.list_pod_for_all_namespaces(watch=False)
+                else:
+                    pods = kube_client.list_namespaced_pod(namespace=self.namespace, watch=False)
+                resource_version = pods.metadata.resource_version
+                query_kwargs["resource_version"] = resource_version
+                return self._pod_events(kube_client=kube_client, query_kwargs=query_kwargs)
+            raise
+
+    def _run(
+        self,
+        kube_client: client.CoreV1Api,
+        resource_version: str | None,
+        scheduler_job_id: str,
+        kube_config: Any,
+    ) -> str | None:
+        self.log.info("Event: and now my watch begins starting at resource_version: %s", resource_version)
+
+        kwargs: dict[str, Any] = {
+            "label_selector": f"airflow-worker={scheduler_job_id},{POD_EXECUTOR_DONE_KEY}!=True",
+        }
+        if resource_version:
+            kwargs["resource_version"] = resource_version
+        if kube_config.kube_client_request_args:
+            for key, value in kube_config.kube_client_request_args.items():
+                kwargs[key] = value
+
+        last_resource_version: str | None = None
+
+        # For info about k8s timeout settings see
+        # https://github.com/kubernetes-client/python/blob/v29.0.0/examples/watch/timeout-settings.md
+        # and https://github.com/kubernetes-client/python/blob/v29.0.0/kubernetes/client/api_client.py#L336-L339
+        if "_request_timeout" not in kwargs:
+            kwargs["_request_timeout"] = 30
+        if "timeout_seconds" not in kwargs:
+            kwargs["timeout_seconds"] = 3600
+
+        for event in self._pod_events(kube_client=kube_client, query_kwargs=kwargs):
+            task = event["object"]
+            self.log.debug("Event: %s had an event of type %s", task.metadata.name, event["type"])
+            if event["type"] == "ERROR":
+                return self.process_error(event)
+            self.process_event(event)
+            last_resource_version = task.metadata.resource_version
+
+        return last_resource_version
+
+
+_SELECTOR_REQUIREMENT = re.compile(
+    r"^\s*(?P<absent>!)?\s*(?P<key>[^\s!=,()]+)\s*"
+    r"(?:(?P<op>==|=|!=)\s*(?P<value>[^\s,()]*)|\s(?P<set_op>in|notin)\s*\((?P<values>[^)]*)\))?\s*$"
+)
+
+_POD_FIELDS = {
+    "metadata.name": lambda pod: pod.metadata.name,
+    "metadata.namespace": lambda pod: pod.metadata.namespace,
+    "status.phase": lambda pod: pod.status.phase if pod.status else None,
+}
+
+
+@cache
+def _parse_selector(selector: str) -> tuple[tuple[str, str, frozenset[str]], ...]:
+    """
+    Parse a Kubernetes label or field selector into ``(key, operator, values)`` requirements.
+
+    The operator is one of ``=``, ``!=``, ``in``, ``notin``, ``exists`` and ``!``.
+    """
+    requirements: list[tuple[str, str, frozenset[str]]] = []
+    for requirement in re.split(r",(?![^(]*\))", selector):
+        if not requirement.strip():
+            continue
+        match = _SELECTOR_REQUIREMENT.match(requirement)
+        if match is None:
+            raise ValueError(f"Unsupported selector requirement {requirement!r} in {selector!r}")
+        key = match["key"]
+        if match["absent"]:
+            requirements.append((key, "!", frozenset()))
+        elif match["op"]:
+            requirements.append((key, "!=" if match["op"] == "!=" else "=", frozenset([match["value"]])))
+        elif match["set_op"]:
+            values = frozenset(value.strip() for value in match["values"].split(","))
+            requirements.append((key, match["set_op"], values))
+        else:
+            requirements.append((key, "exists", frozenset()))
+    return tuple(requirements)
+
+
+def _matches_selector(values: dict[str, Any], selector: str | None) -> bool:
+    for key, operator, selected in _parse_selector(selector or ""):
+        value = values.get(key)
+        value = None if value is None else str(value)
+        if operator == "exists":
+            matches = value is not None
+        elif operator == "!":
+            matches = value is None
+        elif operator in ("=", "in"):
+            matches = value in selected
+        else:
+            matches = value not in selected
+        if not matches:
+            return False
+    return True
+
+
+def pod_matches_selectors(
+    pod: k8s.V1Pod, label_selector: str | None = None, field_selector: str | None = None
+) -> bool:
+    """
+    Check whether a pod matches a label and a field selector, as the Kubernetes API would.
+
+    Only the ``metadata.name``, ``metadata.namespace`` and ``status.phase`` fields are supported in field
+    selectors, the fields the executor selects pods by.
+    """
+    if not _matches_selector(pod.metadata.labels or {}, label_selector):
+        return False
+    if not field_selector:
+        return True
+    fields = {}
+    for key, _, _ in _parse_selector(field_selector):
+        if key not in _POD_FIELDS:
+            raise ValueError(f"Unsupported field {key!r} in field selector {field_selector!r}")
+        fields[key] = _POD_FIELDS[key](pod)
+    return _matches_selector(fields, field_selector)
+
+
+class KubernetesPodInformer(KubernetesPodEventHandler):
+    """
+    Cache of the worker pods of this scheduler, kept up to date by watching them.
+
+    A thread per namespace lists the pods labelled ``airflow-worker`` with the id of this scheduler once, then
+    watches them from the resource version of that list, so that the cache follows the changes of the pods
+    instead of listing them again each time the executor looks for them. The pods are listed again every
+    ``[kubernetes_executor] pod_informer_resync_interval`` seconds, when the resource version expired, and
+    after an error. Only the lookups of this scheduler's pods can be answered from the cache, see
+    :meth:`covers`.
+
+    The events of the pods are handled like :class:`KubernetesJobWatcher` handles them, so the informer
+    replaces the watcher processes of the scheduler.
+    """
+
+    RETRY_DELAY = 5.0
+    STOP_TIMEOUT = 5.0
+
+    def __init__(
+        self,
+        namespaces: list[str],
+        watcher_queue: Queue[KubernetesWatch],
+        scheduler_job_id: str,
+        kube_config: Any,
+        kube_client: client.CoreV1Api,
+    ):
+        super().__init__()
+        self.namespaces = namespaces
+        self.watcher_queue = watcher_queue
+        self.scheduler_job_id = scheduler_job_id
+        self.kube_config = kube_config
+        self.kube_client = kube_client
+        self.resync_interval = kube_config.pod_informer_resync_interval
+        self.label_selector = f"airflow-worker={scheduler_job_id}"
+        self._pods: dict[tuple[str, str], k8s.V1Pod] = {}
+        self._lock = threading.Lock()
+        self._synced = {namespace: threading.Event() for namespace in namespaces}
+        self._stopped = threading.Event()
+        self._threads: dict[str, threading.Thread] = {}
+        self._watches: dict[str, watch.Watch] = {}
+
+    def start(self) -> None:
+        """Start the threads watching the namespaces, or restart those which died."""
+        for namespace in self.namespaces:
+            thread = self._threads.get(namespace)
+            if thread is not None:
+                if thread.is_alive():
+                    continue
+                self.log.error("Pod informer thread for namespace %s died, restarting it", namespace)
+            thread = threading.Thread(
+                target=self._run, args=(namespace,), name=f"pod-informer-{namespace}", daemon=True
+            )
+            thread.start()
+            self._threads[namespace] = thread
+
+    def stop(self) -> None:
+        """Stop watching the pods."""
+        self._stopped.set()
+        for watcher in list(self._watches.values()):
+            watcher.stop()
+        deadline = time.monotonic() + self.STOP_TIMEOUT
+        for thread in self._threads.values():
+            thread.join(timeout=max(deadline - time.monotonic(), 0))
+            if thread.is_alive():
+                self.log.debug("Pod informer thread %s did not stop in time", thread.name)
+
+    def has_synced(self) -> bool:
+        """Return whether the pods of all namespaces were listed, so that the cache can be queried."""
+        return all(synced.is_set() for synced in self._synced.values())
+
+    def covers(self, label_selector: str | None) -> bool:
+        """Return whether the pods matching the label selector are all in the cache, being this scheduler's."""
+        return any(
+            key == "airflow-worker" and operator in ("=", "in") and selected == {self.scheduler_job_id}
+            for key, operator, selected in _parse_selector(label_selector or "")
+        )
+
+    def list_pods(
+        self,
+        label_selector: str | None = None,
+        field_selector: str | None = None,
+        namespace: str | None = None,
+    ) -> list[k8s.V1Pod]:
+        """
+        Return the cached pods matching the selectors, as listing them from the Kubernetes API would.
+
+        Only this scheduler's pods are cached, check that the label selector :meth:`covers` the pods to list.
+
+        :param label_selector: Kubernetes label selector of the pods
+        :param field_selector: Kubernetes field selector of the pods, see :func:`pod_matches_selectors`
+        :param namespace: namespace of the pods, None for all watched namespaces
+        """
+        with self._lock:
+            pods = list(self._pods.values())
+        return [
+            pod
+            for pod in pods
+            if (namespace is None or pod.metadata.namespace == namespace)
+            and pod_matches_selectors(pod, label_selector, field_selector)
+        ]
+
+    def _run(self, namespace: str) -> None:
+        resource_version: str | None = None
+        next_resync = 0.0
+        while not self._stopped.is_set():
+            try:
+                if resource_version is None or time.monotonic() >= next_resync:
+                    resource_version = self._resync(namespace)
+                    next_resync = time.monotonic() + self.resync_interval
+                resource_version = self._watch(
+                    namespace, resource_version, max(int(next_resync - time.monotonic()), 1)
+                )
+            except ReadTimeoutError:
+                self.log.debug("Watch of the pods in namespace %s timed out, restarting it", namespace)
+            except Exception:
+                if self._stopped.is_set():
+                    break
+                self.log.exception("Failed to watch the pods in namespace %s, listing them again", namespace)
+                resource_version = None
+                self._stopped.wait(self.RETRY_DELAY)
+
+    def _request_kwargs(self) -> dict[str, Any]:
+        kwargs: dict[str, Any] = {"label_selector": self.label_selector}
+        if self.kube_config.kube_client_request_args:
+            kwargs.update(self.kube_config.kube_client_request_args)
+        kwargs.setdefault("_request_timeout", 30)
+        return kwargs
+
+    def _list_func(self, namespace: str) -> tuple[Any, tuple[str, ...]]:
+        if namespace == ALL_NAMESPACES:
+            return self.kube_client.list_pod_for_all_namespaces, ()
+        return self.kube_client.list_namespaced_pod, (namespace,)
+
+    def _resync(self, namespace: str) -> str:
+        """List the pods of a namespace, update the cache and return the resource version of the list."""
+        func, args = self._list_func(namespace)
+        pod_list = func(*args, **self._request_kwargs())
+        listed = {(pod.metadata.namespace, pod.metadata.name) for pod in pod_list.items}
+        with self._lock:
+            vanished = [
+                self._pods.pop(key)
+                for key in list(self._pods)
+                if (namespace == ALL_NAMESPACES or key[0] == namespace) and key not in listed
+            ]
+            changed = []
+            for pod in pod_list.items:
+                cached = self._pods.get((pod.metadata.namespace, pod.metadata.name))
+                if cached is None:
+                    changed.append(("ADDED", pod))
+                elif cached.metadata.resource_version != pod.metadata.resource_version:
+                    changed.append(("MODIFIED", pod))
+        # The watch missed the deletion of the vanished pods, or them leaving this scheduler
+        for pod in vanished:
+            if self._is_watched(pod):
+                self._handle_event("DELETED", pod, None)
+        for event_type, pod in changed:
+            self._on_event(event_type, pod)
+        self._synced[namespace].set()
+        self.log.debug(
+            "Listed %d pods in namespace %s, %d changed, %d vanished",
+            len(listed),
+            namespace,
+            len(changed),
+            len(vanished),
+        )
+        return pod_list.metadata.resource_version
+
+    def _watch(self, namespace: str, resource_version: str, timeout_seconds: int) -> str | None:
+        """Apply the changes of the pods of a namespace to the cache, return None once the list is too old."""
+        kwargs = self._request_kwargs()
+        kwargs["resource_version"] = resource_version
+        kwargs["timeout_seconds"] = timeout_seconds
+        func, args = self._list_func(namespace)
+        watcher = watch.Watch()
+        self._watches[namespace] = watcher
+        try:
+            for event in watcher.stream(func, *args, **kwargs):
+                if event["type"] in ("ADDED", "MODIFIED", "DELETED"):
+                    self._on_event(event["type"], event["object"], event["raw_object"])
+                resource_version = event["object"].metadata.resource_version
+        except ApiException as e:
+            if e.status == HTTPStatus.GONE:
+                self.log.info(
+                    "Resource version of the pods in namespace %s is too old, listing them again", namespace
+                )
+                return None
+            raise
+        finally:
+            self._watches.pop(namespace, None)
+        return resource_version
+
+    def _is_watched(self, pod: k8s.V1Pod) -> bool:
+        """Whether the pod is selected by the watch of :class:`KubernetesJobWatcher` for this scheduler."""
+        labels = pod.metadata.labels or {}
+        return (
+            str(labels.get("airflow-worker")) == self.scheduler_job_id
+            and str(labels.get(POD_EXECUTOR_DONE_KEY)) != "True"
+        )
+
+    def _on_event(self, event_type: str, pod: k8s.V1Pod, raw_object: dict | None = None) -> None:
+        key = (pod.metadata.namespace, pod.metadata.name)
+        with self._lock:
+            previous = self._pods.get(key)
+            if event_type == "DELETED":
+                self._pods.pop(key, None)
+            else:
+                self._pods[key] = pod
+
+        # The API server reports a pod leaving this scheduler, because another scheduler adopted it, as
+        # deleted. The cache also holds the pods marked done, which the watcher does not select: a pod being
+        # marked done is reported as deleted the same way.
+        if event_type != "DELETED" and self._is_watched(pod):
+            self._handle_event(event_type, pod, raw_object)
+        elif (previous is not None and self._is_watched(previous)) or (
+            event_type == "DELETED" and previous is None and self._is_watched(pod)
+        ):
+            self._handle_event("DELETED", pod, raw_object)
+
+    def _handle_event(self, event_type: str, pod: k8s.V1Pod, raw_object: dict | None) -> None:
+        if raw_object is None:
+            raw_object = self.kube_client.api_client.sanitize_for_serialization(pod)
+        try:
+            self.process_event({"type": event_type, "object": pod, "raw_object": raw_object})
+        except Exception:
+            self.log.exception("Failed to process the event of pod %s", pod.metadata.name)
+
+
 def collect_pod_failure_details(pod: k8s.V1Pod, logger) -> FailureDetails | None:
     """
     Collect detailed failure information from a failed pod.
@@ -491,7 +811,8 @@ class AirflowKubernetesScheduler(LoggingMixin):
         self._manager = multiprocessing.Manager()
         self.watcher_queue = self._manager.Queue()
         self.scheduler_job_id = scheduler_job_id
-        self.kube_watchers = self._make_kube_watchers()
+        self.pod_informer = self._make_pod_informer() if self.kube_config.pod_informer else None
+        self.kube_watchers = {} if self.pod_informer else self._make_kube_watchers()
         self.team_name = team_name
         # Async pod-creation state; populated lazily, only used when async_pod_creation is enabled.
         self._async_loop: asyncio.AbstractEventLoop | None = None
@@ -546,22 +867,35 @@ class AirflowKubernetesScheduler(LoggingMixin):
         watcher.start()
         return watcher
 
-    def _make_kube_watchers(self) -> dict[str, KubernetesJobWatcher]:
-        watchers = {}
+    def _namespaces_to_watch(self) -> list[str]:
         if self.kube_config.multi_namespace_mode:
-            namespaces_to_watch = (
+            return (
                 self.kube_config.multi_namespace_mode_namespace_list
                 if self.kube_config.multi_namespace_mode_namespace_list
                 else [ALL_NAMESPACES]
             )
-        else:
-            namespaces_to_watch = [self.kube_config.kube_namespace]
+        return [self.kube_config.kube_namespace]
 
-        for namespace in namespaces_to_watch:
+    def _make_kube_watchers(self) -> dict[str, KubernetesJobWatcher]:
+        watchers = {}
+        for namespace in self._namespaces_to_watch():
             watchers[namespace] = self._make_kube_watcher(namespace)
         return watchers
 
+    def _make_pod_informer(self) -> KubernetesPodInformer:
+        pod_informer = KubernetesPodInformer(
+            namespaces=self._namespaces_to_watch(),
+            watcher_queue=self.watcher_queue,
+            scheduler_job_id=self.scheduler_job_id,
+            kube_config=self.kube_config,
+            kube_client=self.kube_client,
+        )
+        pod_informer.start()
+        return pod_informer
+
     def _health_check_kube_watchers(self):
+        if self.pod_informer is not None:
+            self.pod_informer.start()
         for namespace, kube_watcher in self.kube_watchers.items():
             if kube_watcher.is_alive():
                 self.log.debug("KubeJobWatcher for namespace %s alive, continuing", namespace)
@@ -859,6 +1193,9 @@ class AirflowKubernetesScheduler(LoggingMixin):
     def terminate(self) -> None:
         """Terminates the watcher."""
         self._close_async_pod_client()
+        if self.pod_informer is not None:
+            self.log.debug("Stopping pod_informer...")
+            self.pod_informer.stop()
         self.log.debug("Terminating kube_watchers...")
         for kube_watcher in self.kube_watchers.values():
             kube_watcher.terminate()
@@ -250,6 +250,20 @@ def get_provider_info():
                         "example": None,
                         "default": "",
                     },
+                    "pod_informer": {
+                        "description": "Keep the worker pods of the scheduler in a cache, kept up to date by watching them with a thread\nper namespace instead of a watcher process per namespace. Looking up the scheduler's own pods, such\nas when revoking tasks, then uses the cache instead of listing them from the Kubernetes API, so that\nthe load on the API server follows the changes of the pods rather than their number. The cache only\nholds the pods labelled ``airflow-worker`` with the id of the scheduler; the pods of other\nschedulers are still listed from the Kubernetes API when adopting them.\n",
+                        "version_added": "10.22.0",
+                        "type": "boolean",
+                        "example": None,
+                        "default": "False",
+                    },
+                    "pod_informer_resync_interval": {
+                        "description": "How often, in seconds, the pod cache enabled by ``pod_informer`` lists all the pods again,\nto recover changes its watch could have missed. Has no effect when ``pod_informer`` is False.\n",
+                        "version_added": "10.22.0",
+                        "type": "integer",
+                        "example": None,
+                        "default": "300",
+                    },
                     "in_cluster": {
                         "description": "Use the service account kubernetes gives to pods to connect to kubernetes cluster.\nIt's intended for clients that expect to be running inside a pod running on kubernetes.\nIt will raise an exception if called from a process not running in a kubernetes environment.\n",
                         "version_added": None,
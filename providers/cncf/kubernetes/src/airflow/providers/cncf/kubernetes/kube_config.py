@@ -103,6 +103,10 @@ class KubeConfig:
             self.multi_namespace_mode_namespace_list: list[str] | None = multi_ns_list.split(",")
         else:
             self.multi_namespace_mode_namespace_list = None
+        self.pod_informer = self._conf.getboolean(self.kubernetes_section, "pod_informer", fallback=False)
+        self.pod_informer_resync_interval = self._conf.getint(
+            self.kubernetes_section, "pod_informer_resync_interval", fallback=300
+        )
         # The Kubernetes Namespace in which pods will be created by the executor. Note
         # that if your
         # cluster has RBAC enabled, your workers may need service account permissions to
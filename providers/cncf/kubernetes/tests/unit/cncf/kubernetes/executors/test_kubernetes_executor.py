@@ -16,6 +16,7 @@
 # under the License.
 from __future__ import annotations
 
+import copy
 import random
 import re
 import string
@@ -27,7 +28,7 @@ from unittest import mock
 import pytest
 import yaml
 from aiohttp import ClientConnectionError
-from kubernetes.client import models as k8s
+from kubernetes.client import ApiClient, models as k8s
 from kubernetes.client.rest import ApiException
 from sqlalchemy import inspect
 from urllib3 import HTTPConnectionPool, HTTPResponse
@@ -43,6 +44,7 @@ from airflow.providers.cncf.kubernetes.executors.kubernetes_executor import (
 )
 from airflow.providers.cncf.kubernetes.executors.kubernetes_executor_types import (
     ADOPTED,
+    POD_EXECUTOR_DONE_KEY,
     KubernetesJob,
     KubernetesResults,
     KubernetesWatch,
@@ -50,8 +52,10 @@ from airflow.providers.cncf.kubernetes.executors.kubernetes_executor_types impor
 from airflow.providers.cncf.kubernetes.executors.kubernetes_executor_utils import (
     AirflowKubernetesScheduler,
     KubernetesJobWatcher,
+    KubernetesPodInformer,
     ResourceVersion,
     get_base_pod_from_template,
+    pod_matches_selectors,
 )
 from airflow.providers.cncf.kubernetes.kubernetes_helper_functions import (
     add_unique_suffix,
@@ -3759,6 +3763,310 @@ class TestKubernetesJobWatcher:
         assert executor.kube_config.worker_pod_pending_fatal_container_state_reasons == expected_result
 
 
+class FakeKubernetesApi:
+    """In-memory stand-in for the pod endpoints of the Kubernetes API, with a watch cache of limited history."""
+
+    def __init__(self):
+        self.api_client = ApiClient()
+        self.pods: dict[tuple[str, str], k8s.V1Pod] = {}
+        self.events: list[tuple[int, str, k8s.V1Pod]] = []
+        self.resource_version = 0
+        self.compacted_resource_version = 0
+        self.list_calls = 0
+
+    def _change(self, event_type, pod):
+        self.resource_version += 1
+        pod = copy.deepcopy(pod)
+        pod.metadata.resource_version = str(self.resource_version)
+        if event_type == "DELETED":
+            del self.pods[(pod.metadata.namespace, pod.metadata.name)]
+        else:
+            self.pods[(pod.metadata.namespace, pod.metadata.name)] = pod
+        self.events.append((self.resource_version, event_type, pod))
+        return pod
+
+    def create_pod(self, name, namespace="airflow", airflow_worker="123", phase="Running", **labels):
+        return self._change(
+            "ADDED",
+            k8s.V1Pod(
+                metadata=k8s.V1ObjectMeta(
+                    name=name,
+                    namespace=namespace,
+                    labels={"kubernetes_executor": "True", "airflow-worker": airflow_worker, **labels},
+                    annotations={"dag_id": "dag", "task_id": name, "run_id": "run_id", "try_number": "1"},
+                ),
+                status=k8s.V1PodStatus(phase=phase),
+            ),
+        )
+
+    def update_pod(self, name, namespace="airflow", phase=None, **labels):
+        pod = copy.deepcopy(self.pods[(namespace, name)])
+        if phase:
+            pod.status.phase = phase
+        pod.metadata.labels.update(labels)
+        return self._change("MODIFIED", pod)
+
+    def delete_pod(self, name, namespace="airflow"):
+        return self._change("DELETED", self.pods[(namespace, name)])
+
+    def list_namespaced_pod(self, namespace, label_selector=None, **kwargs):
+        self.list_calls += 1
+        return k8s.V1PodList(
+            items=[
+                copy.deepcopy(pod)
+                for (pod_namespace, _), pod in self.pods.items()
+                if pod_namespace == namespace and pod_matches_selectors(pod, label_selector)
+            ],
+            metadata=k8s.V1ListMeta(resource_version=str(self.resource_version)),
+        )
+
+    def watch(self):
+        api = self
+
+        class Watch:
+            def stream(self, func, namespace, resource_version, label_selector=None, **kwargs):
+                if int(resource_version) < api.compacted_resource_version:
+                    raise ApiException(status=410, reason="Expired: too old resource version")
+                # Like the API server, report pods starting to match the selector as added, and pods that
+                # stop matching it as deleted
+                selected = set()
+                for event_resource_version, event_type, pod in api.events:
+                    if pod.metadata.namespace != namespace:
+                        continue
+                    key = pod.metadata.name
+                    was_selected = key in selected
+                    if event_type != "DELETED" and pod_matches_selectors(pod, label_selector):
+                        selected.add(key)
+                        reported_type = event_type if was_selected else "ADDED"
+                    elif was_selected:
+                        selected.discard(key)
+                        reported_type = "DELETED"
+                    else:
+                        continue
+                    if event_resource_version > int(resource_version):
+                        raw_object = api.api_client.sanitize_for_serialization(pod)
+                        yield {"type": reported_type, "object": copy.deepcopy(pod), "raw_object": raw_object}
+
+            def stop(self):
+                pass
+
+        return Watch()
+
+
+class TestKubernetesPodInformer:
+    def setup_method(self):
+        self.api = FakeKubernetesApi()
+        self.kube_config = mock.MagicMock(
+            kube_client_request_args={},
+            pod_informer_resync_interval=300,
+            worker_pod_pending_fatal_container_state_reasons=[],
+        )
+        self.informer = KubernetesPodInformer(
+            namespaces=["airflow"],
+            watcher_queue=mock.MagicMock(),
+            scheduler_job_id="123",
+            kube_config=self.kube_config,
+            kube_client=self.api,
+        )
+
+    def _watch(self, resource_version):
+        with mock.patch(
+            "airflow.providers.cncf.kubernetes.executors.kubernetes_executor_utils.watch.Watch",
+            side_effect=self.api.watch,
+        ):
+            return self.informer._watch("airflow", resource_version, 60)
+
+    def _states(self):
+        return [
+            (watch.pod_name, watch.state) for ((watch,), _) in self.informer.watcher_queue.put.call_args_list
+        ]
+
+    def test_resync_and_watch_follow_pods_without_listing_again(self):
+        self.api.create_pod("running")
+        self.api.create_pod("succeeded", phase="Succeeded")
+        self.api.create_pod("other-scheduler", airflow_worker="456", phase="Succeeded")
+
+        resource_version = self.informer._resync("airflow")
+
+        assert self.informer.has_synced()
+        # Only the pods of this scheduler are cached
+        assert {pod.metadata.name for pod in self.informer.list_pods()} == {"running", "succeeded"}
+        assert self._states() == [("succeeded", None)]
+
+        self.informer.watcher_queue.reset_mock()
+        self.api.delete_pod("other-scheduler")
+        self.api.update_pod("running", phase="Failed")
+        self.api.create_pod("new")
+        resource_version = self._watch(resource_version)
+
+        assert resource_version == str(self.api.resource_version)
+        assert self.api.list_calls == 1
+        assert {pod.metadata.name for pod in self.informer.list_pods()} == {"running", "succeeded", "new"}
+        assert self.informer.list_pods(field_selector="status.phase=Failed")[0].metadata.name == "running"
+        assert self._states() == [("running", TaskInstanceState.FAILED)]
+
+    def test_pods_leaving_the_scheduler_are_reported_as_adopted(self):
+        self.api.create_pod("adopted")
+        self.api.create_pod("done")
+        resource_version = self.informer._resync("airflow")
+
+        self.api.update_pod("adopted", **{"airflow-worker": "456"})
+        self.api.update_pod("done", **{POD_EXECUTOR_DONE_KEY: "True"})
+        self._watch(resource_version)
+
+        assert self._states() == [("adopted", ADOPTED), ("done", ADOPTED)]
+        # The pods marked done stay cached until they are deleted
+        assert [pod.metadata.name for pod in self.informer.list_pods()] == ["done"]
+
+    def test_resync_applies_missed_changes(self):
+        self.api.create_pod("running")
+        self.api.create_pod("deleted")
+        self.informer._resync("airflow")
+
+        self.api.update_pod("running", phase="Succeeded")
+        self.api.delete_pod("deleted")
+        self.api.compacted_resource_version = self.api.resource_version
+        self.informer.watcher_queue.reset_mock()
+
+        assert self.informer._resync("airflow") == str(self.api.resource_version)
+        assert [pod.metadata.name for pod in self.informer.list_pods()] == ["running"]
+        # The missed deletion frees the slot of the pod, as a deletion reported by the watch would
+        assert self._states() == [("deleted", ADOPTED), ("running", None)]
+
+    def test_resync_does_not_report_vanished_pods_marked_done(self):
+        self.api.create_pod("done", **{POD_EXECUTOR_DONE_KEY: "True"})
+        self.informer._resync("airflow")
+
+        self.api.delete_pod("done")
+
+        self.informer._resync("airflow")
+        assert self.informer.list_pods() == []
+        assert self._states() == []
+
+    @pytest.mark.parametrize(
+        ("label_selector", "expected"),
+        [
+            pytest.param("airflow-worker=123", True, id="equal"),
+            pytest.param("dag_id=dag,airflow-worker==123", True, id="double-equal"),
+            pytest.param("airflow-worker in (123)", True, id="in"),
+            pytest.param("airflow-worker in (123,456)", False, id="in-other-schedulers"),
+            pytest.param("airflow-worker=456", False, id="other-scheduler"),
+            pytest.param("airflow-worker!=123", False, id="not-equal"),
+            pytest.param("kubernetes_executor=True", False, id="all-schedulers"),
+            pytest.param(None, False, id="none"),
+        ],
+    )
+    def test_covers(self, label_selector, expected):
+        assert self.informer.covers(label_selector) is expected
+
+    def test_watch_returns_none_when_resource_version_expired(self):
+        self.api.create_pod("running")
+        resource_version = self.informer._resync("airflow")
+        self.api.update_pod("running", phase="Succeeded")
+        self.api.compacted_resource_version = self.api.resource_version
+
+        assert self._watch(resource_version) is None
+
+    def test_start_and_stop(self):
+        self.api.create_pod("succeeded", phase="Succeeded")
+
+        with mock.patch(
+            "airflow.providers.cncf.kubernetes.executors.kubernetes_executor_utils.watch.Watch",
+            side_effect=self.api.watch,
+        ):
+            self.informer.start()
+            try:
+                assert self.informer._synced["airflow"].wait(timeout=10)
+            finally:
+                self.informer.stop()
+
+        assert not self.informer._threads["airflow"].is_alive()
+        assert self._states() == [("succeeded", None)]
+
+    @pytest.mark.parametrize(
+        ("label_selector", "field_selector", "expected"),
+        [
+            pytest.param("airflow-worker=123", None, True, id="equal"),
+            pytest.param("airflow-worker==123,dag_id==dag", None, True, id="double-equal"),
+            pytest.param("airflow-worker!=123", None, False, id="not-equal"),
+            pytest.param("airflow_executor_done!=True", None, True, id="not-equal-missing-label"),
+            pytest.param("airflow-worker notin (1,123)", None, False, id="notin"),
+            pytest.param("airflow-worker in (1,123),dag_id=dag", None, True, id="in"),
+            pytest.param("airflow-worker", None, True, id="exists"),
+            pytest.param("!airflow-worker", None, False, id="not-exists"),
+            pytest.param(None, "status.phase=Running", True, id="field"),
+            pytest.param("airflow-worker=123", "status.phase!=Running", False, id="field-not-equal"),
+        ],
+    )
+    def test_pod_matches_selectors(self, label_selector, field_selector, expected):
+        pod = k8s.V1Pod(
+            metadata=k8s.V1ObjectMeta(labels={"airflow-worker": "123", "dag_id": "dag"}),
+            status=k8s.V1PodStatus(phase="Running"),
+        )
+        assert pod_matches_selectors(pod, label_selector, field_selector) is expected
+
+    @mock.patch("airflow.providers.cncf.kubernetes.executors.kubernetes_executor.DynamicClient")
+    def test_executor_looks_up_pods_in_pod_informer(self, mock_dynamic_client):
+        self.api.create_pod("task", airflow_worker="5")
+        self.api.create_pod("adoptable", airflow_worker="3", phase="Succeeded")
+        self.informer = KubernetesPodInformer(
+            namespaces=["airflow"],
+            watcher_queue=mock.MagicMock(),
+            scheduler_job_id="5",
+            kube_config=self.kube_config,
+            kube_client=self.api,
+        )
+        self.informer._resync("airflow")
+        executor = KubernetesExecutor()
+        executor.job_id = 5
+        executor.scheduler_job_id = "5"
+        executor.kube_config.pod_informer = True
+        executor.kube_scheduler = mock.MagicMock(pod_informer=self.informer)
+        executor.kube_client = mock.MagicMock()
+        kube_client = mock.MagicMock()
+
+        pod_map = executor.get_pod_combined_search_str_to_pod_map()
+
+        assert list(pod_map) == ["dag_id=dag,task_id=task,run_id=run_id"]
+        mock_dynamic_client.assert_not_called()
+        assert self.api.list_calls == 1
+
+        # The pods of other schedulers are not cached, so they are listed from the API to adopt them
+        mock_dynamic_client.return_value.get.return_value.items = [self.api.pods[("airflow", "adoptable")]]
+        with mock.patch.object(executor, "_alive_other_scheduler_job_ids", return_value=set()):
+            executor._adopt_completed_pods(kube_client)
+
+        assert mock_dynamic_client.return_value.get.call_args.kwargs["label_selector"] == (
+            f"kubernetes_executor=True,airflow-worker!=5,{POD_EXECUTOR_DONE_KEY}!=True"
+        )
+        kube_client.patch_namespaced_pod.assert_called_once_with(
+            name="adoptable", namespace="airflow", body={"metadata": {"labels": {"airflow-worker": "5"}}}
+        )
+
+    @mock.patch("airflow.providers.cncf.kubernetes.executors.kubernetes_executor_utils.KubernetesPodInformer")
+    @mock.patch("airflow.providers.cncf.kubernetes.executors.kubernetes_executor_utils.KubernetesJobWatcher")
+    @mock.patch("airflow.providers.cncf.kubernetes.kube_client.get_kube_client")
+    def test_pod_informer_replaces_watchers(self, mock_get_kube_client, mock_watcher, mock_informer):
+        with conf_vars({("kubernetes_executor", "pod_informer"): "True"}):
+            executor = KubernetesExecutor()
+        executor.job_id = 5
+        executor.start()
+        try:
+            assert executor.kube_scheduler.kube_watchers == {}
+            mock_watcher.assert_not_called()
+            mock_informer.assert_called_once_with(
+                namespaces=["default"],
+                watcher_queue=executor.kube_scheduler.watcher_queue,
+                scheduler_job_id="5",
+                kube_config=executor.kube_config,
+                kube_client=mock_get_kube_client.return_value,
+            )
+            mock_informer.return_value.start.assert_called_once()
+        finally:
+            executor.end()
+        mock_informer.return_value.stop.assert_called_once()
+
+
 class TestKubernetesExecutorMultiTeam:
     """Tests for AIP-67 multi-team support in KubernetesExecutor."""
 
@@ -37,7 +37,9 @@ from airflow.providers.edge3.models.edge_worker import (
 )
 from airflow.providers.edge3.worker_api.datamodels import (
     EdgeJobFetched,
+    EdgeJobsFetched,
     PushLogsBody,
+    WorkerFetchBody,
     WorkerQueuesBody,
     WorkerRegistrationReturn,
     WorkerSetStateReturn,
@@ -188,6 +190,24 @@ async def jobs_fetch(
     return None
 
 
+async def jobs_fetch_batch(
+    hostname: str,
+    queues: list[str] | None,
+    free_concurrency: int,
+    team_name: str | None = None,
+    wait_seconds: float = 0,
+) -> list[EdgeJobFetched]:
+    """Fetch the jobs that fit in the free concurrency of the edge worker, waiting up to ``wait_seconds`` for one."""
+    result = await _make_generic_request(
+        "POST",
+        f"jobs/fetch_batch/{quote(hostname)}",
+        WorkerFetchBody(
+            queues=queues, free_concurrency=free_concurrency, team_name=team_name, wait_seconds=wait_seconds
+        ).model_dump_json(exclude_unset=True),
+    )
+    return EdgeJobsFetched(**result).jobs
+
+
 async def jobs_set_state(key: TaskInstanceKey, state: TaskInstanceState) -> None:
     """Set the state of a job."""
     await _make_generic_request(
@@ -44,6 +44,7 @@ from airflow.providers.common.compat.sdk import conf, timezone
 from airflow.providers.edge3 import __version__ as edge_provider_version
 from airflow.providers.edge3.cli.api_client import (
     jobs_fetch,
+    jobs_fetch_batch,
     jobs_set_state,
     logs_push,
     worker_register,
@@ -125,6 +126,10 @@ class EdgeWorker:
     """Comments for maintenance mode."""
     versions_match: bool = True
     """Whether the worker and the server have matching versions of Airflow and the Edge Provider."""
+    fetching: bool = False
+    """Flag if a request for new jobs is in flight, so that no other one claims the same free concurrency."""
+    batch_fetch_supported: bool = True
+    """Whether the API server hands out several jobs per request, which older versions do not."""
     background_tasks: set[Task] = set()
 
     def __init__(
@@ -157,6 +162,7 @@ class EdgeWorker:
             self.conf = conf
 
         self.job_poll_interval = self.conf.getint("edge", "job_poll_interval")
+        self.job_fetch_wait = self.conf.getint("edge", "job_fetch_wait", fallback=0)
         self.hb_interval = self.conf.getint("edge", "heartbeat_interval")
         self.drain_timeout_sec = self.conf.getint("edge", "drain_timeout_sec")
         self.drain_kill_grace_sec = self.conf.getint("edge", "drain_kill_grace_sec")
@@ -669,30 +675,69 @@ class EdgeWorker:
 
             await self.interruptible_sleep()
 
-    async def fetch_and_run_job(self) -> None:
-        """Fetch, start and monitor a new job."""
-        logger.debug("Attempting to fetch a new job...")
+    async def _fetch_jobs(self) -> list[EdgeJobFetched]:
+        if self.batch_fetch_supported:
+            try:
+                return await jobs_fetch_batch(
+                    self.hostname, self.queues, self.free_concurrency, self.team_name, self.job_fetch_wait
+                )
+            except ClientResponseError as e:
+                if e.status != HTTPStatus.NOT_FOUND:
+                    raise
+                # Either the API server does not know the route yet, or it does not know this worker, in which
+                # case fetching a single job fails the same
+                edge_job = await jobs_fetch(self.hostname, self.queues, self.free_concurrency, self.team_name)
+                logger.warning("The API server hands out one job per request, please consider upgrading it.")
+                self.batch_fetch_supported = False
+                return [edge_job] if edge_job else []
         edge_job = await jobs_fetch(self.hostname, self.queues, self.free_concurrency, self.team_name)
-        if not edge_job:
+        return [edge_job] if edge_job else []
+
+    async def fetch_and_run_job(self) -> None:
+        """Fetch new jobs, then start and monitor them."""
+        if self.fetching:
+            return
+        logger.debug("Attempting to fetch new jobs...")
+        self.fetching = True
+        try:
+            edge_jobs = await self._fetch_jobs()
+        finally:
+            self.fetching = False
+        if not edge_jobs:
             logger.debug(
                 "No new job to process%s",
                 f", {len(self.jobs)} still running" if self.jobs else "",
             )
             return
 
-        logger.info("Received job: %s", edge_job.identifier)
+        # Start all jobs before monitoring any, so that the free concurrency accounts for all of them
+        monitors = []
+        for i, edge_job in enumerate(edge_jobs):
+            logger.info("Received job: %s", edge_job.identifier)
+            workload: ExecuteTypeBody = edge_job.command
+            if TYPE_CHECKING:
+                assert workload.log_path  # We need to assume this is defined in here
+            logfile = Path(self.base_log_folder, workload.log_path)
+            job = self._launch_job(edge_job, workload, logfile)
+            self.jobs.append(job)
+            task = create_task(self.run_job(job, fetch_next=i == 0))
+            self.background_tasks.add(task)
+            task.add_done_callback(self.background_tasks.discard)
+            monitors.append(task)
+        await gather(*monitors)
 
-        workload: ExecuteTypeBody = edge_job.command
-        if TYPE_CHECKING:
-            assert workload.log_path  # We need to assume this is defined in here
-        logfile = Path(self.base_log_folder, workload.log_path)
-        job = self._launch_job(edge_job, workload, logfile)
-        self.jobs.append(job)
+    async def run_job(self, job: Job, fetch_next: bool) -> None:
+        """
+        Monitor a started job until it completes.
+
+        :param fetch_next: Whether to directly fetch more jobs once the job is running, if there is free
+            concurrency.
+        """
         try:
-            await jobs_set_state(edge_job.key, TaskInstanceState.RUNNING)
+            await jobs_set_state(job.edge_job.key, TaskInstanceState.RUNNING)
 
-            # As we got one job, directly fetch another one if possible
-            if self.free_concurrency > 0:
+            # As we got jobs, directly fetch more if possible
+            if fetch_next and self.free_concurrency > 0:
                 task = create_task(self.fetch_and_run_job())
                 self.background_tasks.add(task)
                 task.add_done_callback(self.background_tasks.discard)
@@ -60,6 +60,13 @@ def get_provider_info():
                         "example": "5",
                         "default": "5",
                     },
+                    "job_fetch_wait": {
+                        "description": "Number of seconds a request of the Edge Worker for new jobs waits on the API server for a job\nto be queued when there is none, so that the worker receives it right away instead of at its\nnext poll. The API server waits at most 60 seconds. 0 to return right away.\nEach request fetches as many jobs as fit in the free concurrency of the worker.\n",
+                        "version_added": "4.4.0",
+                        "type": "integer",
+                        "example": "30",
+                        "default": "0",
+                    },
                     "heartbeat_interval": {
                         "description": "Edge Worker continuously reports status to the central site. This parameter defines\nhow often a status with heartbeat should be sent.\nDuring heartbeat status is reported as well as it is checked if a running task is to be terminated.\n",
                         "version_added": None,
@@ -116,6 +123,13 @@ def get_provider_info():
                         "example": "True",
                         "default": "True",
                     },
+                    "log_sink": {
+                        "description": "Class the API server uses to store the log chunks Edge Workers push for their jobs.\n\n``airflow.providers.edge3.worker_api.log_sink.LocalLogSink`` appends them to the log file of the task\nin the base log folder. ``airflow.providers.edge3.worker_api.log_sink.RemoteLogSink`` does the same and\nuploads the file to remote logging once the job finished. Only use the latter if the Edge Workers do\nnot upload the logs to remote logging themselves, or the logs end up twice in remote logging. A\ncustom subclass of ``airflow.providers.edge3.worker_api.log_sink.EdgeLogSink`` can be given as well.\n",
+                        "version_added": "4.4.0",
+                        "type": "string",
+                        "example": "airflow.providers.edge3.worker_api.log_sink.RemoteLogSink",
+                        "default": "airflow.providers.edge3.worker_api.log_sink.LocalLogSink",
+                    },
                     "worker_umask": {
                         "description": "The default umask to use for edge worker when run in daemon mode\n\nThis controls the file-creation mode mask which determines the initial value of file permission bits\nfor newly created files.\n\nThis value is treated as an octal-integer.\n",
                         "version_added": None,
@@ -37,13 +37,9 @@ class EdgeLogsModel(Base, LoggingMixin):
     """
     Temporary collected logs from a Edge Worker while job runs on remote site.
 
-    As the Edge Worker in most cases has a local file system and the web UI no access
-    to read files from remote site, Edge Workers will send incremental chunks of logs
-    of running jobs to the central site. As log storage backends in most cloud cases can not
-    append logs, the table is used as buffer to receive. Upon task completion logs can be
-    flushed to task log handler.
-
-    Log data therefore is collected in chunks and is only temporary.
+    No longer written: the log chunks Edge Workers send to the central site are passed to the
+    log sink configured in ``[edge] log_sink`` instead. The table is kept so that rows written
+    by earlier versions are still purged with their jobs.
     """
 
     __tablename__ = "edge_logs"
@@ -121,6 +121,24 @@ class WorkerQueuesBody(WorkerQueuesBase):
     free_concurrency: Annotated[int, Field(description="Number of free concurrency slots on the worker.")]
 
 
+class WorkerFetchBody(WorkerQueuesBody):
+    """Queues and capacity of a worker fetching jobs, and how long it waits for one."""
+
+    wait_seconds: Annotated[
+        float,
+        Field(
+            ge=0,
+            description="Seconds to wait for a job if none is queued, the API server waits at most 60.",
+        ),
+    ] = 0
+
+
+class EdgeJobsFetched(BaseModel):
+    """Jobs that are to be executed on the edge worker."""
+
+    jobs: Annotated[list[EdgeJobFetched], Field(description="The jobs fetched, oldest first.")]
+
+
 class WorkerStateBody(WorkerQueuesBase):
     """Details of the worker state sent to the scheduler."""
 
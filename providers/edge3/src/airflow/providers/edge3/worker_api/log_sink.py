@@ -0,0 +1,135 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Sinks for the log chunks Edge Workers push for their jobs.
+
+The sink used by the API server is selected with ``[edge] log_sink``.
+"""
+
+from __future__ import annotations
+
+import logging
+from functools import cache
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from airflow.models.taskinstance import TaskInstance
+from airflow.providers.common.compat.module_loading import import_string
+from airflow.providers.common.compat.sdk import conf
+from airflow.utils.log.file_task_handler import FileTaskHandler
+from airflow.utils.session import NEW_SESSION, provide_session
+
+if TYPE_CHECKING:
+    from airflow.logging.remote import RemoteLogIO
+    from airflow.providers.common.compat.sdk import TaskInstanceKey
+
+logger = logging.getLogger(__name__)
+
+
+@cache
+@provide_session
+def task_logfile_path(task: TaskInstanceKey, *, session=NEW_SESSION) -> str:
+    """Elaborate the (relative) path and filename to expect from task execution."""
+    ti = TaskInstance.get_task_instance(
+        dag_id=task.dag_id,
+        run_id=task.run_id,
+        task_id=task.task_id,
+        map_index=task.map_index,
+        session=session,
+    )
+    if TYPE_CHECKING:
+        assert ti
+        assert isinstance(ti, TaskInstance)
+    return FileTaskHandler(".")._render_filename(ti, task.try_number)
+
+
+class EdgeLogSink:
+    """
+    Receives the log chunks Edge Workers push for the jobs they run.
+
+    Chunks of a job are pushed in order while it runs, and :meth:`complete` is called once the job finished.
+    """
+
+    def append(self, task: TaskInstanceKey, data: str) -> None:
+        """
+        Store a log chunk of a job.
+
+        :param task: The task instance the job runs, :func:`task_logfile_path` gives the path of its log file.
+        :param data: The log chunk.
+        """
+        raise NotImplementedError
+
+    def complete(self, task: TaskInstanceKey) -> None:
+        """Complete the logs of a job which finished, no more chunks will be pushed for it."""
+
+
+class LocalLogSink(EdgeLogSink):
+    """Append the log chunks to the log file of the task in the base log folder of the API server."""
+
+    def __init__(self) -> None:
+        self.base_log_folder = conf.get("logging", "base_log_folder", fallback="NOT AVAILABLE")
+        self.new_folder_permissions = int(
+            conf.get("logging", "file_task_handler_new_folder_permissions", fallback="0o775"), 8
+        )
+
+    def append(self, task: TaskInstanceKey, data: str) -> None:
+        logfile_path = Path(self.base_log_folder, task_logfile_path(task))
+        if not logfile_path.exists():
+            logfile_path.parent.mkdir(parents=True, exist_ok=True, mode=self.new_folder_permissions)
+        with logfile_path.open("a") as logfile:
+            logfile.write(data)
+
+
+def _get_remote_task_log() -> RemoteLogIO | None:
+    try:
+        from airflow.logging_config import get_remote_task_log
+    except ImportError:  # Older Airflow versions
+        from airflow import logging_config
+
+        return logging_config.REMOTE_TASK_LOG  # type: ignore[attr-defined]
+    return get_remote_task_log()
+
+
+class RemoteLogSink(LocalLogSink):
+    """
+    Spool the log chunks in the base log folder and upload them to remote logging once the job finished.
+
+    The logs of running jobs are read from the spooled file, and the remote logging removes it after the upload
+    according to ``[logging] delete_local_logs``. Without remote logging configured, this is the same as
+    :class:`LocalLogSink`.
+
+    This is meant for Edge Workers which do not upload the logs to remote logging themselves. If they do, the
+    remote logging appends the spooled file to the log they uploaded, so that it holds every line twice.
+    """
+
+    def complete(self, task: TaskInstanceKey) -> None:
+        remote_task_log = _get_remote_task_log()
+        if remote_task_log is None:
+            return
+        try:
+            remote_task_log.upload(Path(self.base_log_folder, task_logfile_path(task)), None)
+        except Exception:
+            logger.exception("Failed to upload the logs of %s to remote logging", task)
+
+
+@cache
+def get_log_sink() -> EdgeLogSink:
+    """Return the log sink configured in ``[edge] log_sink``."""
+    sink_class = import_string(
+        conf.get("edge", "log_sink", fallback="airflow.providers.edge3.worker_api.log_sink.LocalLogSink")
+    )
+    return sink_class()
@@ -17,38 +17,50 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
 from typing import TYPE_CHECKING, Annotated
 
-from fastapi import Body, Depends, HTTPException, status
+from fastapi import BackgroundTasks, Body, Depends, HTTPException, status
 from sqlalchemy import select, update
 
 from airflow.api_fastapi.common.db.common import SessionDep  # noqa: TC001
 from airflow.api_fastapi.common.router import AirflowRouter
 from airflow.api_fastapi.core_api.openapi.exceptions import create_openapi_http_exception_doc
 from airflow.executors.workloads import ExecuteTask
-from airflow.providers.common.compat.sdk import Stats, timezone
+from airflow.providers.common.compat.sdk import Stats, TaskInstanceKey, timezone
 from airflow.providers.edge3.models.edge_job import EdgeJobModel
 from airflow.providers.edge3.models.edge_worker import EdgeWorkerModel
+from airflow.providers.edge3.models.types import EXECUTE_CALLBACK_TAG
 from airflow.providers.edge3.version_compat import AIRFLOW_V_3_3_PLUS
 from airflow.providers.edge3.worker_api.auth import jwt_token_authorization_rest
 from airflow.providers.edge3.worker_api.datamodels import (
     EdgeJobFetched,
+    EdgeJobsFetched,
     WorkerApiDocs,
+    WorkerFetchBody,
     WorkerQueuesBody,
 )
+from airflow.providers.edge3.worker_api.log_sink import get_log_sink
 from airflow.utils.helpers import prune_dict
 from airflow.utils.state import TaskInstanceState
 
 if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
     from airflow.providers.edge3.models.types import ExecuteTypeBody
 
 jobs_router = AirflowRouter(tags=["Jobs"], prefix="/jobs")
 
+FETCH_WAIT_POLL_INTERVAL = 1.0
+"""Seconds between the checks for queued jobs made on behalf of the fetch requests waiting for a job."""
+FETCH_MAX_WAIT = 60.0
+"""Longest time in seconds a fetch request waits for a job, to stay well within HTTP client timeouts."""
+
 
 def parse_command(command: str, dag_id: str, run_id: str) -> ExecuteTypeBody:
     if AIRFLOW_V_3_3_PLUS:
         from airflow.executors.workloads import ExecuteCallback
-        from airflow.providers.edge3.models.types import EXECUTE_CALLBACK_TAG
 
         if dag_id == EXECUTE_CALLBACK_TAG and run_id.startswith(EXECUTE_CALLBACK_TAG):
             return ExecuteCallback.model_validate_json(command)  # type: ignore[return-value]
@@ -56,6 +68,97 @@ def parse_command(command: str, dag_id: str, run_id: str) -> ExecuteTypeBody:
     return ExecuteTask.model_validate_json(command)
 
 
+def _claim_jobs(
+    worker_name: str, team_name: str | None, body: WorkerQueuesBody, limit: int, session: Session
+) -> list[EdgeJobFetched]:
+    """Claim the oldest queued jobs, up to ``limit`` of them, that fit in the free concurrency of a worker."""
+    query = (
+        select(EdgeJobModel)
+        .where(
+            EdgeJobModel.state == TaskInstanceState.QUEUED,
+            EdgeJobModel.concurrency_slots <= body.free_concurrency,
+        )
+        .order_by(EdgeJobModel.queued_dttm)
+    )
+    if body.queues:
+        query = query.where(EdgeJobModel.queue.in_(body.queues))
+    if team_name is not None:
+        query = query.where(EdgeJobModel.team_name == team_name)
+    query = query.limit(limit)
+    query = query.with_for_update(skip_locked=True)
+    jobs: list[EdgeJobModel] = []
+    free_concurrency = body.free_concurrency
+    for job in session.scalars(query):
+        # Jobs that do not fit anymore are left for the next fetch, their row lock is released on commit
+        if job.concurrency_slots > free_concurrency:
+            continue
+        free_concurrency -= job.concurrency_slots
+        job.state = TaskInstanceState.RESTARTING  # keep this intermediate state until worker sets to running
+        job.edge_worker = worker_name
+        job.last_update = timezone.utcnow()
+        jobs.append(job)
+    session.commit()
+
+    fetched = []
+    for job in jobs:
+        # Edge worker does not backport emitted Airflow metrics, so export some metrics
+        tags = prune_dict(
+            {"dag_id": job.dag_id, "task_id": job.task_id, "queue": job.queue, "team_name": job.team_name}
+        )
+        Stats.incr("edge_worker.ti.start", tags=tags)
+        fetched.append(
+            EdgeJobFetched(
+                dag_id=job.dag_id,
+                task_id=job.task_id,
+                run_id=job.run_id,
+                map_index=job.map_index,
+                try_number=job.try_number,
+                command=parse_command(job.command, job.dag_id, job.run_id),
+                concurrency_slots=job.concurrency_slots,
+            )
+        )
+    return fetched
+
+
+class _QueuedJobQueues:
+    """
+    Queues that have queued jobs, along with the team of the jobs, for the fetch requests waiting for a job.
+
+    They are read from the database at most once per :data:`FETCH_WAIT_POLL_INTERVAL` however many requests
+    wait, and a waiting request only tries to claim jobs again once some are queued in its queues.
+    """
+
+    def __init__(self) -> None:
+        self._lock = asyncio.Lock()
+        self._queues: set[tuple[str, str | None]] = set()
+        self._read_at = float("-inf")
+
+    async def has_jobs(self, queues: list[str] | None, team_name: str | None, session: Session) -> bool:
+        async with self._lock:
+            if time.monotonic() - self._read_at >= FETCH_WAIT_POLL_INTERVAL:
+                self._queues = await asyncio.to_thread(self._read, session)
+                self._read_at = time.monotonic()
+        return any(
+            (not queues or queue in queues) and (team_name is None or job_team_name == team_name)
+            for queue, job_team_name in self._queues
+        )
+
+    @staticmethod
+    def _read(session: Session) -> set[tuple[str, str | None]]:
+        query = (
+            select(EdgeJobModel.queue, EdgeJobModel.team_name)
+            .where(EdgeJobModel.state == TaskInstanceState.QUEUED)
+            .distinct()
+        )
+        queues = {(queue, team_name) for queue, team_name in session.execute(query)}
+        # End the transaction, so that the request does not hold a database connection while it waits
+        session.commit()
+        return queues
+
+
+_queued_job_queues = _QueuedJobQueues()
+
+
 @jobs_router.post(
     "/fetch/{worker_name}",
     dependencies=[Depends(jwt_token_authorization_rest)],
@@ -83,41 +186,59 @@ def fetch(
     if not worker:
         raise HTTPException(status.HTTP_404_NOT_FOUND, "Worker not found")
 
-    query = (
-        select(EdgeJobModel)
-        .where(
-            EdgeJobModel.state == TaskInstanceState.QUEUED,
-            EdgeJobModel.concurrency_slots <= body.free_concurrency,
-        )
-        .order_by(EdgeJobModel.queued_dttm)
-    )
-    if body.queues:
-        query = query.where(EdgeJobModel.queue.in_(body.queues))
-    if worker.team_name is not None:
-        query = query.where(EdgeJobModel.team_name == worker.team_name)
-    query = query.limit(1)
-    query = query.with_for_update(skip_locked=True)
-    job: EdgeJobModel | None = session.scalar(query)
-    if not job:
-        return None
-    job.state = TaskInstanceState.RESTARTING  # keep this intermediate state until worker sets to running
-    job.edge_worker = worker_name
-    job.last_update = timezone.utcnow()
-    session.commit()
-    # Edge worker does not backport emitted Airflow metrics, so export some metrics
-    tags = prune_dict(
-        {"dag_id": job.dag_id, "task_id": job.task_id, "queue": job.queue, "team_name": job.team_name}
-    )
-    Stats.incr("edge_worker.ti.start", tags=tags)
-    return EdgeJobFetched(
-        dag_id=job.dag_id,
-        task_id=job.task_id,
-        run_id=job.run_id,
-        map_index=job.map_index,
-        try_number=job.try_number,
-        command=parse_command(job.command, job.dag_id, job.run_id),
-        concurrency_slots=job.concurrency_slots,
+    jobs = _claim_jobs(worker_name, worker.team_name, body, 1, session)
+    return jobs[0] if jobs else None
+
+
+@jobs_router.post(
+    "/fetch_batch/{worker_name}",
+    dependencies=[Depends(jwt_token_authorization_rest)],
+    responses=create_openapi_http_exception_doc(
+        [
+            status.HTTP_400_BAD_REQUEST,
+            status.HTTP_403_FORBIDDEN,
+            status.HTTP_404_NOT_FOUND,
+        ]
+    ),
+)
+async def fetch_batch(
+    worker_name: str,
+    body: Annotated[
+        WorkerFetchBody,
+        Body(
+            title="Fetch request",
+            description="The queues and capacity from which the worker can fetch jobs.",
+        ),
+    ],
+    session: SessionDep,
+) -> EdgeJobsFetched:
+    """
+    Fetch as many jobs as fit in the free concurrency of the edge worker.
+
+    When there is no job to hand out, the request waits up to ``wait_seconds`` for one to be queued.
+    """
+    worker = await asyncio.to_thread(
+        session.scalar, select(EdgeWorkerModel).where(EdgeWorkerModel.worker_name == worker_name)
     )
+    if not worker:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, "Worker not found")
+    team_name = worker.team_name
+
+    deadline = time.monotonic() + min(body.wait_seconds, FETCH_MAX_WAIT)
+    while True:
+        # Every job takes at least one slot
+        jobs = await asyncio.to_thread(
+            _claim_jobs, worker_name, team_name, body, body.free_concurrency, session
+        )
+        if jobs:
+            return EdgeJobsFetched(jobs=jobs)
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return EdgeJobsFetched(jobs=[])
+            await asyncio.sleep(min(FETCH_WAIT_POLL_INTERVAL, remaining))
+            if await _queued_job_queues.has_jobs(body.queues, team_name, session):
+                break
 
 
 @jobs_router.patch(
@@ -137,12 +258,13 @@ def state(
     try_number: Annotated[int, WorkerApiDocs.try_number],
     map_index: Annotated[int, WorkerApiDocs.map_index],
     state: Annotated[TaskInstanceState, WorkerApiDocs.state],
+    background_tasks: BackgroundTasks,
     session: SessionDep,
 ) -> None:
     """Update the state of a job running on the edge worker."""
     # execute query to catch the queue and check if state toggles to success or failed
     # otherwise possible that Executor resets orphaned jobs and stats are exported 2 times
-    if state in [TaskInstanceState.SUCCESS, state == TaskInstanceState.FAILED]:
+    if state in [TaskInstanceState.SUCCESS, TaskInstanceState.FAILED]:
         query = select(EdgeJobModel).where(
             EdgeJobModel.dag_id == dag_id,
             EdgeJobModel.task_id == task_id,
@@ -164,6 +286,14 @@ def state(
             }
             Stats.incr("edge_worker.ti.finish", tags=prune_dict(tags))
 
+            if job.dag_id != EXECUTE_CALLBACK_TAG:
+                # The worker pushed all logs of the job before reporting its final state. Completing them may
+                # upload them to remote logging, which is done once the response is sent.
+                task = TaskInstanceKey(
+                    dag_id=dag_id, task_id=task_id, run_id=run_id, try_number=try_number, map_index=map_index
+                )
+                background_tasks.add_task(get_log_sink().complete, task)
+
     query2 = (
         update(EdgeJobModel)
         .where(
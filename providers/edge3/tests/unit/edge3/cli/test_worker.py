@@ -489,7 +489,7 @@ class TestEdgeWorker:
         assert error_file_path.exists()
         assert "supervisor crashed" in error_file_path.read_text()
 
-    @patch("airflow.providers.edge3.cli.worker.jobs_fetch")
+    @patch("airflow.providers.edge3.cli.worker.jobs_fetch_batch")
     @patch("airflow.providers.edge3.cli.worker.EdgeWorker._launch_job")
     @pytest.mark.asyncio
     async def test_fetch_and_run_job_no_job(
@@ -498,7 +498,7 @@ class TestEdgeWorker:
         mock_jobs_fetch,
         worker_with_job: EdgeWorker,
     ):
-        mock_jobs_fetch.return_value = None
+        mock_jobs_fetch.return_value = []
 
         await worker_with_job.fetch_and_run_job()
 
@@ -506,7 +506,7 @@ class TestEdgeWorker:
         assert len(worker_with_job.jobs) == 1  # no new job added
         mock_launch_job.assert_not_called()
 
-    @patch("airflow.providers.edge3.cli.worker.jobs_fetch")
+    @patch("airflow.providers.edge3.cli.worker.jobs_fetch_batch")
     @patch("airflow.providers.edge3.cli.worker.EdgeWorker._launch_job")
     @patch("airflow.providers.edge3.cli.worker.jobs_set_state")
     @patch("airflow.providers.edge3.cli.worker.EdgeWorker._push_logs_in_chunks")
@@ -533,7 +533,7 @@ class TestEdgeWorker:
             concurrency_slots=1,
             command=MOCK_COMMAND,  # type: ignore[arg-type]
         )
-        mock_jobs_fetch.side_effect = [edge_job, None]
+        mock_jobs_fetch.side_effect = [[edge_job], []]
         mock_launch_job.return_value = Job(edge_job, _MockProcess(), tmp_path / "mock.log")
         worker_with_job.concurrency = 1  # only one job at a time
         assert worker_with_job.free_concurrency == 0
@@ -551,7 +551,80 @@ class TestEdgeWorker:
         assert len(worker_with_job.jobs) == 1  # no new job added (was removed at the end...)
         mock_logs_push.assert_not_called()
 
+    @patch("airflow.providers.edge3.cli.worker.jobs_fetch_batch")
+    @patch("airflow.providers.edge3.cli.worker.EdgeWorker._launch_job")
+    @patch("airflow.providers.edge3.cli.worker.jobs_set_state")
+    @patch("airflow.providers.edge3.cli.worker.EdgeWorker._push_logs_in_chunks")
+    @patch.object(Job, "is_running", property(lambda _: False))
+    @patch.object(Job, "is_success", property(lambda _: True))
+    @pytest.mark.asyncio
+    async def test_fetch_and_run_job_several_jobs(
+        self,
+        mock_push_log_chunks,
+        mock_jobs_set_state,
+        mock_launch_job,
+        mock_jobs_fetch,
+        tmp_path: Path,
+        worker_with_job: EdgeWorker,
+    ):
+        edge_jobs = [
+            EdgeJobFetched(
+                dag_id="test",
+                task_id=f"test_{i}",
+                run_id="test",
+                map_index=-1,
+                try_number=1,
+                concurrency_slots=1,
+                command=MOCK_COMMAND,  # type: ignore[arg-type]
+            )
+            for i in range(2)
+        ]
+        mock_jobs_fetch.return_value = edge_jobs
+        mock_launch_job.side_effect = lambda edge_job, *_: Job(
+            edge_job, _MockProcess(), tmp_path / "mock.log"
+        )
+        worker_with_job.concurrency = 3  # both fit, leaving no free concurrency
+
+        await worker_with_job.fetch_and_run_job()
+
+        mock_jobs_fetch.assert_called_once()
+        assert mock_jobs_fetch.call_args.args[2] == 2  # free concurrency
+        assert [c.args[0] for c in mock_launch_job.call_args_list] == edge_jobs
+        assert mock_jobs_set_state.call_count == 4
+        assert len(worker_with_job.jobs) == 1  # both jobs were removed at the end
+
     @patch("airflow.providers.edge3.cli.worker.jobs_fetch")
+    @patch("airflow.providers.edge3.cli.worker.jobs_fetch_batch")
+    @pytest.mark.asyncio
+    async def test_fetch_and_run_job_falls_back_to_single_fetch(
+        self, mock_jobs_fetch_batch, mock_jobs_fetch, worker_with_job: EdgeWorker
+    ):
+        mock_jobs_fetch_batch.side_effect = ClientResponseError(
+            request_info=RequestInfo(url=URL("mock.com"), method="POST", headers=None),  # type:ignore[arg-type]
+            history=(),
+            status=404,
+        )
+        mock_jobs_fetch.return_value = None
+
+        await worker_with_job.fetch_and_run_job()
+        await worker_with_job.fetch_and_run_job()
+
+        mock_jobs_fetch_batch.assert_called_once()
+        assert mock_jobs_fetch.call_count == 2
+        assert worker_with_job.batch_fetch_supported is False
+
+    @patch("airflow.providers.edge3.cli.worker.jobs_fetch_batch")
+    @pytest.mark.asyncio
+    async def test_fetch_and_run_job_skipped_while_fetching(
+        self, mock_jobs_fetch, worker_with_job: EdgeWorker
+    ):
+        worker_with_job.fetching = True
+
+        await worker_with_job.fetch_and_run_job()
+
+        mock_jobs_fetch.assert_not_called()
+
+    @patch("airflow.providers.edge3.cli.worker.jobs_fetch_batch")
     @patch("airflow.providers.edge3.cli.worker.jobs_set_state")
     @patch("airflow.providers.edge3.cli.worker.EdgeWorker._push_logs_in_chunks")
     @patch("airflow.providers.edge3.cli.worker.logs_push")
@@ -574,7 +647,7 @@ class TestEdgeWorker:
             concurrency_slots=1,
             command=MOCK_COMMAND,  # type: ignore[arg-type]
         )
-        mock_jobs_fetch.return_value = edge_job
+        mock_jobs_fetch.return_value = [edge_job]
         worker_with_job.concurrency = 1
         process = _MockProcess(returncode=1)
         error_file_path = tmp_path / "fork-error.log"
@@ -594,7 +667,7 @@ class TestEdgeWorker:
         assert "RuntimeError: supervisor crashed" in log_chunk_data
         assert not error_file_path.exists()
 
-    @patch("airflow.providers.edge3.cli.worker.jobs_fetch")
+    @patch("airflow.providers.edge3.cli.worker.jobs_fetch_batch")
     @patch("airflow.providers.edge3.cli.worker.EdgeWorker._launch_job")
     @patch("airflow.providers.edge3.cli.worker.jobs_set_state")
     @patch("airflow.providers.edge3.cli.worker.EdgeWorker._push_logs_in_chunks")
@@ -621,7 +694,7 @@ class TestEdgeWorker:
             concurrency_slots=1,
             command=MOCK_COMMAND,  # type: ignore[arg-type]
         )
-        mock_jobs_fetch.side_effect = [edge_job, None]
+        mock_jobs_fetch.side_effect = [[edge_job], []]
         mock_launch_job.return_value = Job(edge_job, _MockProcess(), tmp_path / "mock.log")
         worker_with_job.concurrency = 1  # only one job at a time
         assert worker_with_job.free_concurrency == 0
@@ -637,7 +710,7 @@ class TestEdgeWorker:
         assert len(worker_with_job.jobs) == 1  # no new job added (was removed at the end...)
         mock_logs_push.assert_called_once()
 
-    @patch("airflow.providers.edge3.cli.worker.jobs_fetch")
+    @patch("airflow.providers.edge3.cli.worker.jobs_fetch_batch")
     @patch("airflow.providers.edge3.cli.worker.jobs_set_state")
     @patch("airflow.providers.edge3.cli.worker.EdgeWorker._push_logs_in_chunks")
     @patch("airflow.providers.edge3.cli.worker.logs_push")
@@ -660,7 +733,7 @@ class TestEdgeWorker:
             concurrency_slots=1,
             command=MOCK_COMMAND,  # type: ignore[arg-type]
         )
-        mock_jobs_fetch.return_value = edge_job
+        mock_jobs_fetch.return_value = [edge_job]
         worker_with_job.concurrency = 1
         process = _MockPopen(returncode=1, pid=5678)
         stderr_file_path = tmp_path / "subprocess-stderr.log"
@@ -679,7 +752,7 @@ class TestEdgeWorker:
         assert not stderr_file_path.exists()
 
     @patch("airflow.providers.edge3.cli.worker.jobs_set_state", side_effect=RuntimeError("set state failed"))
-    @patch("airflow.providers.edge3.cli.worker.jobs_fetch")
+    @patch("airflow.providers.edge3.cli.worker.jobs_fetch_batch")
     @pytest.mark.asyncio
     async def test_fetch_and_run_job_cleans_up_when_mark_running_fails(
         self,
@@ -697,7 +770,7 @@ class TestEdgeWorker:
             concurrency_slots=1,
             command=MOCK_COMMAND,  # type: ignore[arg-type]
         )
-        mock_jobs_fetch.return_value = edge_job
+        mock_jobs_fetch.return_value = [edge_job]
         stderr_file_path = tmp_path / "cleanup-marker.log"
         stderr_file_path.write_text("cleanup me")
         launched_job = Job(
@@ -16,23 +16,25 @@
 # under the License.
 from __future__ import annotations
 
+import asyncio
 import json
+from datetime import timedelta
 from pathlib import Path
 from typing import TYPE_CHECKING
 from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
-from fastapi import HTTPException, status
+from fastapi import BackgroundTasks, HTTPException, status
 from sqlalchemy import delete, select
 
 from airflow.executors.workloads import BundleInfo, ExecuteTask
-from airflow.providers.common.compat.sdk import Stats
+from airflow.providers.common.compat.sdk import Stats, TaskInstanceKey, timezone
 from airflow.providers.edge3.models.edge_job import EdgeJobModel
 from airflow.providers.edge3.models.edge_worker import EdgeWorkerModel, EdgeWorkerState
 from airflow.providers.edge3.models.types import EXECUTE_CALLBACK_TAG
-from airflow.providers.edge3.worker_api.datamodels import WorkerQueuesBody
-from airflow.providers.edge3.worker_api.routes.jobs import fetch, parse_command, state
+from airflow.providers.edge3.worker_api.datamodels import WorkerFetchBody, WorkerQueuesBody
+from airflow.providers.edge3.worker_api.routes.jobs import fetch, fetch_batch, parse_command, state
 from airflow.utils.session import create_session
 from airflow.utils.state import TaskInstanceState
 
@@ -85,8 +87,9 @@ class TestJobsApiRoutes:
         session.execute(delete(EdgeWorkerModel))
         session.commit()
 
+    @patch("airflow.providers.edge3.worker_api.routes.jobs.get_log_sink")
     @patch(f"{Stats.__module__}.Stats.incr")
-    def test_state(self, mock_stats_incr, session: Session):
+    def test_state(self, mock_stats_incr, mock_get_log_sink, session: Session):
         with create_session() as session:
             job = EdgeJobModel(
                 dag_id=DAG_ID,
@@ -102,6 +105,7 @@ class TestJobsApiRoutes:
             )
             session.add(job)
             session.commit()
+            background_tasks = BackgroundTasks()
             state(
                 dag_id=DAG_ID,
                 task_id=TASK_ID,
@@ -109,10 +113,12 @@ class TestJobsApiRoutes:
                 try_number=1,
                 map_index=-1,
                 state=TaskInstanceState.RUNNING,
+                background_tasks=background_tasks,
                 session=session,
             )
 
             mock_stats_incr.assert_not_called()
+            assert background_tasks.tasks == []
 
             state(
                 dag_id=DAG_ID,
@@ -121,6 +127,7 @@ class TestJobsApiRoutes:
                 try_number=1,
                 map_index=-1,
                 state=TaskInstanceState.SUCCESS,
+                background_tasks=background_tasks,
                 session=session,
             )
 
@@ -135,6 +142,11 @@ class TestJobsApiRoutes:
                 },
             )
             assert mock_stats_incr.call_count == 1
+            # The logs are completed once the response is sent
+            mock_get_log_sink.return_value.complete.assert_not_called()
+            (task,) = background_tasks.tasks
+            assert task.func is mock_get_log_sink.return_value.complete
+            assert task.args == (TaskInstanceKey(DAG_ID, TASK_ID, RUN_ID, 1, -1),)
 
             db_job: EdgeJobModel | None = session.scalar(select(EdgeJobModel))
             assert db_job is not None
@@ -164,6 +176,7 @@ class TestJobsApiRoutes:
                 try_number=1,
                 map_index=-1,
                 state=TaskInstanceState.SUCCESS,
+                background_tasks=BackgroundTasks(),
                 session=session,
             )
 
@@ -292,6 +305,82 @@ class TestJobsApiRoutes:
             )
             assert mock_stats_incr.call_count == 2
 
+    @staticmethod
+    def _queued_job(task_id: str, concurrency_slots: int = 1, minutes_ago: int = 0) -> EdgeJobModel:
+        return EdgeJobModel(
+            dag_id=DAG_ID,
+            task_id=task_id,
+            run_id=RUN_ID,
+            try_number=1,
+            map_index=-1,
+            state=TaskInstanceState.QUEUED,
+            queue=QUEUE,
+            concurrency_slots=concurrency_slots,
+            command=MOCK_COMMAND_STR,
+            queued_dttm=timezone.utcnow() - timedelta(minutes=minutes_ago),
+        )
+
+    @patch(f"{Stats.__module__}.Stats.incr")
+    @pytest.mark.asyncio
+    async def test_fetch_batch_claims_the_jobs_that_fit(self, mock_stats_incr, session: Session):
+        with create_session() as session:
+            session.add(EdgeWorkerModel(worker_name="worker1", state=EdgeWorkerState.IDLE, queues=[QUEUE]))
+            session.add_all(
+                [
+                    self._queued_job("oldest", concurrency_slots=2, minutes_ago=3),
+                    self._queued_job("too_big", concurrency_slots=2, minutes_ago=2),
+                    self._queued_job("newest", concurrency_slots=1, minutes_ago=1),
+                ]
+            )
+            session.commit()
+
+            body = WorkerFetchBody(free_concurrency=3, queues=[QUEUE])
+            result = await fetch_batch("worker1", body, session)
+
+            assert [job.task_id for job in result.jobs] == ["oldest", "newest"]
+            assert mock_stats_incr.call_count == 2
+            states = dict(session.execute(select(EdgeJobModel.task_id, EdgeJobModel.state)).all())
+            assert states == {
+                "oldest": TaskInstanceState.RESTARTING,
+                "too_big": TaskInstanceState.QUEUED,
+                "newest": TaskInstanceState.RESTARTING,
+            }
+
+    @pytest.mark.asyncio
+    async def test_fetch_batch_returns_no_job_once_wait_is_over(self, session: Session):
+        with create_session() as session:
+            session.add(EdgeWorkerModel(worker_name="worker1", state=EdgeWorkerState.IDLE, queues=[QUEUE]))
+            session.commit()
+
+            body = WorkerFetchBody(free_concurrency=1, queues=[QUEUE], wait_seconds=0.2)
+            with patch(f"{fetch_batch.__module__}.FETCH_WAIT_POLL_INTERVAL", 0.05):
+                result = await fetch_batch("worker1", body, session)
+
+            assert result.jobs == []
+
+    @pytest.mark.asyncio
+    async def test_fetch_batch_waits_for_a_job(self, session: Session):
+        with create_session() as session:
+            session.add(EdgeWorkerModel(worker_name="worker1", state=EdgeWorkerState.IDLE, queues=[QUEUE]))
+            session.commit()
+
+        def queue_job():
+            with create_session() as other_session:
+                other_session.add(self._queued_job("late"))
+
+        body = WorkerFetchBody(free_concurrency=1, queues=[QUEUE], wait_seconds=30)
+        with (
+            create_session() as session,
+            patch(f"{fetch_batch.__module__}.FETCH_WAIT_POLL_INTERVAL", 0.05),
+        ):
+            fetching = asyncio.create_task(fetch_batch("worker1", body, session))
+            await asyncio.sleep(0.2)
+            assert not fetching.done()
+            await asyncio.to_thread(queue_job)
+            result = await asyncio.wait_for(fetching, timeout=5)
+
+        assert [job.task_id for job in result.jobs] == ["late"]
+
 
 @pytest.mark.skipif(not AIRFLOW_V_3_3_PLUS, reason="The tests should be skipped for Airflow < 3.3")
 class TestParseCommand:
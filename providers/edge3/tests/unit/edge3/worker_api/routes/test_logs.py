@@ -16,19 +16,21 @@
 # under the License.
 from __future__ import annotations
 
-from collections.abc import Sequence
 from pathlib import Path
 from typing import TYPE_CHECKING
+from unittest.mock import MagicMock, patch
 
 import pytest
-from sqlalchemy import delete, select
+from sqlalchemy import delete, func, select
 
-from airflow.providers.common.compat.sdk import timezone
+from airflow.providers.common.compat.sdk import TaskInstanceKey, timezone
 from airflow.providers.edge3.models.edge_logs import EdgeLogsModel
 from airflow.providers.edge3.worker_api.datamodels import PushLogsBody
+from airflow.providers.edge3.worker_api.log_sink import RemoteLogSink, get_log_sink
 from airflow.providers.edge3.worker_api.routes.logs import logfile_path, push_logs
 from airflow.providers.standard.operators.empty import EmptyOperator
-from airflow.utils.session import create_session
+
+from tests_common.test_utils.config import conf_vars
 
 if TYPE_CHECKING:
     from sqlalchemy.orm import Session
@@ -57,25 +59,47 @@ class TestLogsApiRoutes:
         assert str(Path(f"dag_id={DAG_ID}") / f"run_id={RUN_ID}" / f"task_id={TASK_ID}" / "attempt=1") in p
         assert "-1" not in Path(p).parts
 
-    def test_push_logs(self, session: Session):
-        log_data = PushLogsBody(
-            log_chunk_data="This is Lorem Ipsum log data", log_chunk_time=timezone.utcnow()
+    @pytest.fixture
+    def base_log_folder(self, tmp_path):
+        get_log_sink.cache_clear()
+        with conf_vars({("logging", "base_log_folder"): str(tmp_path)}):
+            yield tmp_path
+        get_log_sink.cache_clear()
+
+    def _push(self, data: str) -> None:
+        push_logs(
+            dag_id=DAG_ID,
+            task_id=TASK_ID,
+            run_id=RUN_ID,
+            try_number=1,
+            map_index=-1,
+            body=PushLogsBody(log_chunk_data=data, log_chunk_time=timezone.utcnow()),
         )
-        with create_session() as session:
-            push_logs(
-                dag_id=DAG_ID,
-                task_id=TASK_ID,
-                run_id=RUN_ID,
-                try_number=1,
-                map_index=-1,
-                body=log_data,
-                session=session,
-            )
-        logs: Sequence[EdgeLogsModel] = session.scalars(select(EdgeLogsModel)).all()
-        assert len(logs) == 1
-        assert logs[0].dag_id == DAG_ID
-        assert logs[0].task_id == TASK_ID
-        assert logs[0].run_id == RUN_ID
-        assert logs[0].try_number == 1
-        assert logs[0].map_index == -1
-        assert "Lorem Ipsum" in logs[0].log_chunk_data
+
+    def test_push_logs(self, base_log_folder: Path, session: Session):
+        self._push("This is Lorem Ipsum log data\n")
+        self._push("and more of it\n")
+
+        p = logfile_path(dag_id=DAG_ID, task_id=TASK_ID, run_id=RUN_ID, try_number=1, map_index=-1)
+        assert (base_log_folder / p).read_text() == "This is Lorem Ipsum log data\nand more of it\n"
+        assert session.scalar(select(func.count()).select_from(EdgeLogsModel)) == 0
+
+    @pytest.mark.parametrize("remote_configured", [True, False])
+    def test_remote_log_sink_uploads_completed_logs(self, base_log_folder: Path, remote_configured: bool):
+        remote_task_log = MagicMock() if remote_configured else None
+        with (
+            conf_vars({("edge", "log_sink"): f"{RemoteLogSink.__module__}.RemoteLogSink"}),
+            patch(
+                "airflow.providers.edge3.worker_api.log_sink._get_remote_task_log",
+                return_value=remote_task_log,
+            ),
+        ):
+            self._push("This is Lorem Ipsum log data\n")
+            sink = get_log_sink()
+            assert isinstance(sink, RemoteLogSink)
+            sink.complete(TaskInstanceKey(DAG_ID, TASK_ID, RUN_ID, 1, -1))
+
+        p = logfile_path(dag_id=DAG_ID, task_id=TASK_ID, run_id=RUN_ID, try_number=1, map_index=-1)
+        assert (base_log_folder / p).read_text() == "This is Lorem Ipsum log data\n"
+        if remote_task_log:
+            remote_task_log.upload.assert_called_once_with(base_log_folder / p, None)
@@ -74,6 +74,19 @@ class RemoteLogStreamIO(RemoteLogIO, Protocol):
         ...
 
 
+@runtime_checkable
+class RemoteLogAppendIO(RemoteLogIO, Protocol):
+    """Interface for remote task loggers that can add to the remote log of a task while it is running."""
+
+    def append(self, path: os.PathLike | str, log: str, ti: RuntimeTI | None = None) -> bool:
+        """
+        Add the given log lines to the end of the remote log of the given log path.
+
+        :return: whether the lines were written.
+        """
+        ...
+
+
 def discover_remote_log_handler(
     logging_class_path: str,
     fallback_path: str,
@@ -19,7 +19,7 @@ from __future__ import annotations
 
 from unittest import mock
 
-from airflow_shared.logging.remote import RemoteLogStreamIO, discover_remote_log_handler
+from airflow_shared.logging.remote import RemoteLogAppendIO, RemoteLogStreamIO, discover_remote_log_handler
 
 
 class DummyRemoteLogIO:
@@ -167,6 +167,14 @@ class TestRemoteLogIOProtocol:
         handler = DummyRemoteLogIO()
         assert not isinstance(handler, RemoteLogStreamIO)
 
+    def test_append_io_protocol_runtime_check(self):
+        class AppendHandler(DummyRemoteLogIO):
+            def append(self, path, log, ti=None):
+                return True
+
+        assert isinstance(AppendHandler(), RemoteLogAppendIO)
+        assert not isinstance(DummyRemoteLogIO(), RemoteLogAppendIO)
+
     def test_upload_accepts_none_ti(self):
         handler = DummyRemoteLogIO()
         handler.upload("/some/path", ti=None)
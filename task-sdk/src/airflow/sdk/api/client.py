@@ -18,13 +18,14 @@
 from __future__ import annotations
 
 import logging
+import os
 import ssl
 import sys
 import uuid
 from datetime import datetime
 from functools import cache
 from http import HTTPStatus
-from typing import TYPE_CHECKING, Any, TypeVar
+from typing import TYPE_CHECKING, Any, BinaryIO, TypeVar
 from urllib.parse import quote
 
 import certifi
@@ -44,6 +45,7 @@ from tenacity import (
 from uuid6 import uuid7
 
 from airflow.sdk import __version__
+from airflow.sdk._shared.observability.metrics import stats
 from airflow.sdk.api.datamodels._generated import (
     API_VERSION,
     AssetEventsResponse,
@@ -71,6 +73,9 @@ from airflow.sdk.api.datamodels._generated import (
     TaskStateStoreResponse,
     TerminalStateNonSuccess,
     TIAwaitingInputStatePayload,
+    TIBatchHeartbeatItem,
+    TIBatchHeartbeatPayload,
+    TIBatchHeartbeatResponse,
     TIDeferredStatePayload,
     TIEnterRunningPayload,
     TIHeartbeatInfo,
@@ -85,6 +90,8 @@ from airflow.sdk.api.datamodels._generated import (
     VariableKeysResponse,
     VariablePostBody,
     VariableResponse,
+    XComBatchRequest,
+    XComBatchResponse,
     XComResponse,
     XComSequenceIndexResponse,
     XComSequenceSliceResponse,
@@ -108,6 +115,7 @@ from airflow.sdk.execution_time.comms import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from datetime import datetime
     from typing import ParamSpec
 
@@ -325,6 +333,17 @@ class TaskInstanceOperations:
         body = TIHeartbeatInfo(pid=pid, hostname=get_hostname())
         self.client.put(f"task-instances/{id}/heartbeat", content=body.model_dump_json())
 
+    def heartbeat_batch(self, heartbeats: list[TIBatchHeartbeatItem]) -> TIBatchHeartbeatResponse:
+        """
+        Heartbeat many TIs in one request, each authorized by its own execution token.
+
+        Heartbeats the server rejects are returned as failures rather than raised, carrying the status
+        code and detail that ``heartbeat`` would have raised for that TI.
+        """
+        body = TIBatchHeartbeatPayload(heartbeats=heartbeats)
+        resp = self.client.put("task-instances/heartbeats", content=body.model_dump_json())
+        return TIBatchHeartbeatResponse.model_validate_json(resp.read())
+
     def skip_downstream_tasks(self, id: uuid.UUID, msg: SkipDownstreamTasks):
         """Tell the API server to skip the downstream tasks of this TI."""
         body = TISkippedDownstreamTasksStatePayload(tasks=msg.tasks)
@@ -620,6 +639,42 @@ class XComOperations:
         mapped_length: int | None = None,
     ) -> OKResponse:
         """Set a XCom value via the API server."""
+        params = self._set_params(map_index, dag_result=dag_result, mapped_length=mapped_length)
+        self.client.post(f"xcoms/{dag_id}/{run_id}/{task_id}/{key}", params=params, json=value)
+        # Any error from the server will anyway be propagated down to the supervisor,
+        # so we choose to send a generic response to the supervisor over the server response to
+        # decouple from the server response string
+        return OKResponse(ok=True)
+
+    def set_from_file(
+        self,
+        dag_id: str,
+        run_id: str,
+        task_id: str,
+        key: str,
+        value_file: BinaryIO,
+        map_index: int | None = None,
+        *,
+        dag_result: bool = False,
+        mapped_length: int | None = None,
+    ) -> OKResponse:
+        """
+        Set a XCom value via the API server, streaming the JSON encoded value from a file.
+
+        The value is never read into memory as a whole, so this is used for values too large to be sent inline.
+        """
+        params = self._set_params(map_index, dag_result=dag_result, mapped_length=mapped_length)
+        headers = {"content-type": "application/json", "content-length": str(value_file.seek(0, os.SEEK_END))}
+        self.client.post(
+            f"xcoms/{dag_id}/{run_id}/{task_id}/{key}",
+            params=params,
+            content=_FileContent(value_file),
+            headers=headers,
+        )
+        return OKResponse(ok=True)
+
+    @staticmethod
+    def _set_params(map_index: int | None, *, dag_result: bool, mapped_length: int | None) -> dict[str, Any]:
         params: dict[str, Any] = {}
         if dag_result:
             params["dag_result"] = dag_result
@@ -627,11 +682,7 @@ class XComOperations:
             params["map_index"] = map_index
         if mapped_length is not None and mapped_length >= 0:
             params["mapped_length"] = mapped_length
-        self.client.post(f"xcoms/{dag_id}/{run_id}/{task_id}/{key}", params=params, json=value)
-        # Any error from the server will anyway be propagated down to the supervisor,
-        # so we choose to send a generic response to the supervisor over the server response to
-        # decouple from the server response string
-        return OKResponse(ok=True)
+        return params
 
     def delete(
         self,
@@ -710,6 +761,26 @@ class XComOperations:
         resp = self.client.get(f"xcoms/{dag_id}/{run_id}/{task_id}/{key}/slice", params=params)
         return XComSequenceSliceResponse.model_validate_json(resp.read())
 
+    def get_batch(
+        self,
+        dag_id: str,
+        run_id: str,
+        key: str,
+        task_ids: list[str],
+        map_indexes: list[int] | None,
+        include_prior_dates: bool = False,
+    ) -> XComBatchResponse:
+        """
+        Get the XComs of every combination of the given tasks and map indexes in one request.
+
+        Pass *None* as ``map_indexes`` to get the XComs of all the map indexes of the tasks.
+        """
+        body = XComBatchRequest(
+            key=key, task_ids=task_ids, map_indexes=map_indexes, include_prior_dates=include_prior_dates
+        )
+        resp = self.client.post(f"xcoms/{dag_id}/{run_id}", content=body.model_dump_json())
+        return XComBatchResponse.model_validate_json(resp.read())
+
 
 class TaskStateStoreOperations:
     __slots__ = ("client",)
@@ -1091,6 +1162,25 @@ class ConnectionTestOperations:
         self.client.patch(f"connection-tests/{id}", content=body.model_dump_json())
 
 
+class _FileContent:
+    """
+    Request content streamed from a file in chunks.
+
+    Every iteration starts from the beginning of the file, so that a retried request sends the whole file again,
+    which a generator could not do.
+    """
+
+    chunk_size = 64 * 1024
+
+    def __init__(self, file: BinaryIO):
+        self.file = file
+
+    def __iter__(self) -> Iterator[bytes]:
+        self.file.seek(0)
+        while chunk := self.file.read(self.chunk_size):
+            yield chunk
+
+
 class BearerAuth(httpx.Auth):
     def __init__(self, token: str):
         self.token: str = token
@@ -1138,6 +1228,21 @@ API_TIMEOUT = conf.getfloat("workers", "execution_api_timeout")
 API_CLIENT_SSL_CERT = conf.get("api", "client_ssl_cert", fallback=None)
 API_CLIENT_SSL_KEY = conf.get("api", "client_ssl_key", fallback=None)
 API_CLIENT_USE_PUBLIC_CERTS = conf.getboolean("api", "client_use_public_certs", fallback=True)
+API_SHARE_CONNECTIONS = conf.getboolean("workers", "execution_api_share_connections")
+API_HTTP2 = conf.getboolean("workers", "execution_api_http2")
+
+
+@cache
+def _use_http2() -> bool:
+    """Whether to talk HTTP/2 to the Execution API, which needs the h2 package to be installed."""
+    if not API_HTTP2:
+        return False
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        log.warning("execution_api_http2 is enabled but the h2 package is not installed, using HTTP/1.1")
+        return False
+    return True
 
 
 def _should_retry_api_request(exception: BaseException) -> bool:
@@ -1148,6 +1253,47 @@ def _should_retry_api_request(exception: BaseException) -> bool:
     return isinstance(exception, httpx.RequestError)
 
 
+class _SharedTransport(httpx.BaseTransport):
+    """
+    Connection pool to the Execution API shared by all the clients of a process.
+
+    A worker process supervises one task after another, each with its own client. Sharing the pool lets
+    those clients reuse the open (and, with HTTP/2, multiplexed) connections instead of connecting and
+    completing a TLS handshake for every task. Closing a client leaves the pool open for the next one.
+    """
+
+    _instance: _SharedTransport | None = None
+
+    def __init__(self, *, verify: ssl.SSLContext, cert: tuple[str, str] | None, http2: bool):
+        self.pid = os.getpid()
+        self.verify = verify
+        self.cert = cert
+        self.transport = httpx.HTTPTransport(verify=verify, cert=cert, http2=http2)
+
+    @classmethod
+    def get(cls, *, verify: ssl.SSLContext, cert: tuple[str, str] | None, http2: bool) -> _SharedTransport:
+        shared = cls._instance
+        # The connections of a pool inherited over fork belong to the parent, so a child starts its own.
+        if (
+            shared is not None
+            and shared.pid == os.getpid()
+            and (shared.verify, shared.cert) == (verify, cert)
+        ):
+            stats.incr("execution_api_client.shared_pool_reused")
+            return shared
+
+        cls._instance = cls(verify=verify, cert=cert, http2=http2)
+        return cls._instance
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        with stats.timer("execution_api_client.request_duration"):
+            return self.transport.handle_request(request)
+
+    def close(self) -> None:
+        # The pool outlives the clients using it; it is closed when the process exits.
+        pass
+
+
 class Client(httpx.Client):
     @lru_cache()
     @staticmethod
@@ -1189,6 +1335,13 @@ class Client(httpx.Client):
 
                 kwargs["cert"] = (API_CLIENT_SSL_CERT, API_CLIENT_SSL_KEY)
 
+            kwargs["http2"] = _use_http2()
+            if API_SHARE_CONNECTIONS and "transport" not in kwargs:
+                kwargs.pop("limits", None)
+                kwargs["transport"] = _SharedTransport.get(
+                    verify=kwargs.pop("verify"), cert=kwargs.pop("cert", None), http2=kwargs.pop("http2")
+                )
+
         # Set timeout if not explicitly provided
         kwargs.setdefault("timeout", API_TIMEOUT)
 
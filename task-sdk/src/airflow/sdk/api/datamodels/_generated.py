@@ -27,7 +27,7 @@ from uuid import UUID
 
 from pydantic import AwareDatetime, BaseModel, ConfigDict, Field, JsonValue, RootModel
 
-API_VERSION: Final[str] = "2026-06-30"
+API_VERSION: Final[str] = "2026-10-18"
 
 
 class AssetAliasReferenceAssetEventDagRun(BaseModel):
@@ -261,6 +261,31 @@ class TIAwaitingInputStatePayload(BaseModel):
     rendered_map_index: Annotated[str | None, Field(title="Rendered Map Index")] = None
 
 
+class TIBatchHeartbeatItem(BaseModel):
+    """
+    Heartbeat of a single TaskInstance in a batch heartbeat.
+    """
+
+    model_config = ConfigDict(
+        extra="forbid",
+    )
+    hostname: Annotated[str, Field(title="Hostname")]
+    pid: Annotated[int, Field(title="Pid")]
+    id: Annotated[UUID, Field(title="Id")]
+    token: Annotated[str, Field(title="Token")]
+
+
+class TIBatchHeartbeatPayload(BaseModel):
+    """
+    Schema for the TaskInstance batch heartbeat endpoint.
+    """
+
+    model_config = ConfigDict(
+        extra="forbid",
+    )
+    heartbeats: Annotated[list[TIBatchHeartbeatItem], Field(title="Heartbeats")]
+
+
 class TIDeferredStatePayload(BaseModel):
     """
     Schema for updating TaskInstance to a deferred state.
@@ -294,6 +319,16 @@ class TIEnterRunningPayload(BaseModel):
     start_date: Annotated[AwareDatetime, Field(title="Start Date")]
 
 
+class TIHeartbeatFailure(BaseModel):
+    """
+    A heartbeat in a batch that was rejected, with the error the single heartbeat endpoint would return.
+    """
+
+    id: Annotated[UUID, Field(title="Id")]
+    status_code: Annotated[int, Field(title="Status Code")]
+    detail: Annotated[dict[str, Any], Field(title="Detail")]
+
+
 class TIHeartbeatInfo(BaseModel):
     """
     Schema for TaskInstance heartbeat endpoint.
@@ -513,6 +548,38 @@ class VariableResponse(BaseModel):
     value: Annotated[str | None, Field(title="Value")]
 
 
+class XComBatchItem(BaseModel):
+    """
+    The XCom value of one task and map index in a batch response.
+    """
+
+    task_id: Annotated[str, Field(title="Task Id")]
+    map_index: Annotated[int, Field(title="Map Index")]
+    value: JsonValue | None
+
+
+class XComBatchRequest(BaseModel):
+    """
+    Schema for fetching the XComs of several tasks and map indexes in one request.
+    """
+
+    model_config = ConfigDict(
+        extra="forbid",
+    )
+    key: Annotated[str, Field(min_length=1, title="Key")]
+    task_ids: Annotated[list[str], Field(min_length=1, title="Task Ids")]
+    map_indexes: Annotated[list[int] | None, Field(title="Map Indexes")] = [-1]
+    include_prior_dates: Annotated[bool | None, Field(title="Include Prior Dates")] = False
+
+
+class XComBatchResponse(BaseModel):
+    """
+    XCom values of several tasks and map indexes, fetched in one request.
+    """
+
+    xcoms: Annotated[list[XComBatchItem], Field(title="Xcoms")]
+
+
 class XComResponse(BaseModel):
     """
     XCom schema for responses with fields that are needed for Runtime.
@@ -697,6 +764,15 @@ class HTTPValidationError(BaseModel):
     detail: Annotated[list[ValidationError] | None, Field(title="Detail")] = None
 
 
+class TIBatchHeartbeatResponse(BaseModel):
+    """
+    Response of the TaskInstance batch heartbeat endpoint.
+    """
+
+    failures: Annotated[list[TIHeartbeatFailure], Field(title="Failures")]
+    refreshed_tokens: Annotated[dict[str, str] | None, Field(title="Refreshed Tokens")] = {}
+
+
 class TITerminalStatePayload(BaseModel):
     """
     Schema for updating TaskInstance to a terminal state except SUCCESS state.
@@ -18,15 +18,21 @@
 from __future__ import annotations
 
 import collections
-from typing import Any, Protocol
+import io
+import json
+import os
+import tempfile
+from typing import Any, BinaryIO, Protocol
 
 import structlog
 
 from airflow.sdk.execution_time.comms import (
     DeleteXCom,
     GetXCom,
+    GetXComBatch,
     GetXComSequenceSlice,
     SetXCom,
+    XComBatchResult,
     XComResult,
     XComSequenceSliceResult,
 )
@@ -37,6 +43,47 @@ _XComValueWrapper = collections.namedtuple("_XComValueWrapper", "value")
 log = structlog.get_logger(logger_name="task")
 
 
+def _encode_to_file(value: Any) -> BinaryIO | None:
+    """
+    JSON encode a serialized XCom value into an anonymous file if it is too large to be sent inline.
+
+    The value is encoded incrementally, so a large value is never held in memory a second time as a string.
+    Returns *None* if the value is below ``[workers] xcom_file_transfer_threshold``, or if files can't be
+    passed to the supervisor.
+    """
+    from airflow.sdk.configuration import conf
+    from airflow.sdk.execution_time.comms import send_fds
+    from airflow.sdk.execution_time.task_runner import SUPERVISOR_COMMS
+
+    threshold = conf.getint("workers", "xcom_file_transfer_threshold")
+    if threshold <= 0 or send_fds is None:
+        return None
+
+    # Encoded the way httpx encodes a value that is sent inline to the API server
+    chunks = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), allow_nan=False).iterencode(value)
+    head = []
+    size = 0
+    for chunk in chunks:
+        head.append(chunk)
+        size += len(chunk)
+        if size > threshold:
+            break
+    else:
+        return None
+    if not getattr(SUPERVISOR_COMMS, "supports_fds", False):
+        return None
+
+    if hasattr(os, "memfd_create"):
+        file: BinaryIO = open(os.memfd_create("xcom"), "w+b")
+    else:
+        file = tempfile.TemporaryFile()
+    writer = io.TextIOWrapper(file, encoding="utf-8")
+    writer.writelines(head)
+    writer.writelines(chunks)
+    writer.flush()
+    return writer.detach()  # type: ignore[return-value]
+
+
 class TIKeyProtocol(Protocol):
     dag_id: str
     task_id: str
@@ -84,18 +131,25 @@ class BaseXCom:
             map_index=map_index,
         )
 
-        SUPERVISOR_COMMS.send(
-            SetXCom(
-                key=key,
-                value=value,
-                dag_id=dag_id,
-                task_id=task_id,
-                run_id=run_id,
-                map_index=map_index,
-                dag_result=dag_result,
-                mapped_length=_mapped_length,
-            ),
+        if (value_file := _encode_to_file(value)) is not None:
+            # Don't hold on to the serialized value while the supervisor uploads it
+            value = None
+        msg = SetXCom(
+            key=key,
+            value=value,
+            dag_id=dag_id,
+            task_id=task_id,
+            run_id=run_id,
+            map_index=map_index,
+            dag_result=dag_result,
+            mapped_length=_mapped_length,
+            value_in_file=value_file is not None,
         )
+        if value_file is None:
+            SUPERVISOR_COMMS.send(msg)
+            return
+        with value_file:
+            SUPERVISOR_COMMS.send(msg, fds=[value_file.fileno()])
 
     @classmethod
     async def aset(
@@ -132,18 +186,25 @@ class BaseXCom:
             map_index=map_index,
         )
 
-        await SUPERVISOR_COMMS.asend(
-            SetXCom(
-                key=key,
-                value=value,
-                dag_id=dag_id,
-                task_id=task_id,
-                run_id=run_id,
-                map_index=map_index,
-                dag_result=dag_result,
-                mapped_length=_mapped_length,
-            ),
+        if (value_file := _encode_to_file(value)) is not None:
+            # Don't hold on to the serialized value while the supervisor uploads it
+            value = None
+        msg = SetXCom(
+            key=key,
+            value=value,
+            dag_id=dag_id,
+            task_id=task_id,
+            run_id=run_id,
+            map_index=map_index,
+            dag_result=dag_result,
+            mapped_length=_mapped_length,
+            value_in_file=value_file is not None,
         )
+        if value_file is None:
+            await SUPERVISOR_COMMS.asend(msg)
+            return
+        with value_file:
+            await SUPERVISOR_COMMS.asend(msg, fds=[value_file.fileno()])
 
     @classmethod
     def _set_xcom_in_db(
@@ -413,6 +474,83 @@ class BaseXCom:
         )
         return None
 
+    @classmethod
+    def get_batch(
+        cls,
+        *,
+        key: str,
+        dag_id: str,
+        run_id: str,
+        task_ids: list[str],
+        map_indexes: list[int],
+        include_prior_dates: bool = False,
+    ) -> dict[tuple[str, int], Any]:
+        """
+        Retrieve the XCom values of every combination of the given tasks and map indexes in one request.
+
+        This method returns "full" XCom values (i.e. uses ``deserialize_value``
+        from the XCom backend).
+
+        :param key: The key of the XComs.
+        :param dag_id: Dag ID.
+        :param run_id: Dag run ID for the tasks.
+        :param task_ids: IDs of the tasks to pull XComs from.
+        :param map_indexes: Map indexes to pull XComs from, ``-1`` for unmapped tasks.
+        :param include_prior_dates: If *False* (default), only XComs from the
+            specified Dag run are returned. If *True*, the latest matching XComs are
+            returned regardless of the run they belong to.
+        :returns: The values by ``(task_id, map_index)``. Combinations without an XCom are left out.
+        """
+        from airflow.sdk.execution_time.task_runner import SUPERVISOR_COMMS
+
+        msg = SUPERVISOR_COMMS.send(
+            GetXComBatch(
+                key=key,
+                dag_id=dag_id,
+                run_id=run_id,
+                task_ids=task_ids,
+                map_indexes=map_indexes,
+                include_prior_dates=include_prior_dates,
+            ),
+        )
+        return cls._deserialize_batch(msg)
+
+    @classmethod
+    async def aget_batch(
+        cls,
+        *,
+        key: str,
+        dag_id: str,
+        run_id: str,
+        task_ids: list[str],
+        map_indexes: list[int],
+        include_prior_dates: bool = False,
+    ) -> dict[tuple[str, int], Any]:
+        """Retrieve the XCom values of several tasks and map indexes asynchronously, see :meth:`get_batch`."""
+        from airflow.sdk.execution_time.task_runner import SUPERVISOR_COMMS
+
+        msg = await SUPERVISOR_COMMS.asend(
+            GetXComBatch(
+                key=key,
+                dag_id=dag_id,
+                run_id=run_id,
+                task_ids=task_ids,
+                map_indexes=map_indexes,
+                include_prior_dates=include_prior_dates,
+            ),
+        )
+        return cls._deserialize_batch(msg)
+
+    @classmethod
+    def _deserialize_batch(cls, msg: Any) -> dict[tuple[str, int], Any]:
+        if not isinstance(msg, XComBatchResult):
+            raise TypeError(f"Expected XComBatchResult, received: {type(msg)} {msg}")
+        return {
+            (xcom.task_id, xcom.map_index): cls.deserialize_value(xcom)
+            for xcom in msg.xcoms
+            if xcom.value is not None
+        }
+
     @classmethod
     def get_all(
         cls,
@@ -515,6 +653,78 @@ class BaseXCom:
 
         return [cls.deserialize_value(_XComValueWrapper(value)) for value in msg.root]
 
+    @classmethod
+    def get_all_batch(
+        cls,
+        *,
+        key: str,
+        dag_id: str,
+        run_id: str,
+        task_ids: list[str],
+        include_prior_dates: bool = False,
+    ) -> dict[str, list[Any]]:
+        """
+        Retrieve the XCom values of all the map indexes of several tasks in one request.
+
+        This is :meth:`get_all` for several tasks at once.
+
+        :param key: The key of the XComs.
+        :param dag_id: Dag ID.
+        :param run_id: Dag run ID for the tasks.
+        :param task_ids: IDs of the tasks to pull XComs from.
+        :param include_prior_dates: If *False* (default), only XComs from the
+            specified Dag run are returned. If *True*, matching XComs are
+            returned regardless of the run they belong to.
+        :returns: The values of each task ordered by map index. Tasks without an XCom are left out.
+        """
+        from airflow.sdk.execution_time.task_runner import SUPERVISOR_COMMS
+
+        msg = SUPERVISOR_COMMS.send(
+            GetXComBatch(
+                key=key,
+                dag_id=dag_id,
+                run_id=run_id,
+                task_ids=task_ids,
+                map_indexes=None,
+                include_prior_dates=include_prior_dates,
+            ),
+        )
+        return cls._deserialize_all_batch(msg)
+
+    @classmethod
+    async def aget_all_batch(
+        cls,
+        *,
+        key: str,
+        dag_id: str,
+        run_id: str,
+        task_ids: list[str],
+        include_prior_dates: bool = False,
+    ) -> dict[str, list[Any]]:
+        """Retrieve the XCom values of all the map indexes of several tasks asynchronously, see :meth:`get_all_batch`."""
+        from airflow.sdk.execution_time.task_runner import SUPERVISOR_COMMS
+
+        msg = await SUPERVISOR_COMMS.asend(
+            GetXComBatch(
+                key=key,
+                dag_id=dag_id,
+                run_id=run_id,
+                task_ids=task_ids,
+                map_indexes=None,
+                include_prior_dates=include_prior_dates,
+            ),
+        )
+        return cls._deserialize_all_batch(msg)
+
+    @classmethod
+    def _deserialize_all_batch(cls, msg: Any) -> dict[str, list[Any]]:
+        if not isinstance(msg, XComBatchResult):
+            raise TypeError(f"Expected XComBatchResult, received: {type(msg)} {msg}")
+        values: dict[str, list[Any]] = {}
+        for xcom in msg.xcoms:
+            values.setdefault(xcom.task_id, []).append(cls.deserialize_value(_XComValueWrapper(xcom.value)))
+        return values
+
     @staticmethod
     def serialize_value(
         value: Any,
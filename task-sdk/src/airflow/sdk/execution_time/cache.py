@@ -17,35 +17,54 @@
 # under the License.
 from __future__ import annotations
 
-import datetime
-import multiprocessing
+import hashlib
+import mmap
+import struct
+import time
+from typing import NamedTuple
+
+# Each entry of the cache lives in a slot of this many bytes: a header followed by the entry's name and value.
+# Entries that do not fit in a slot are not cached.
+_SLOT_SIZE = 4096
+# Header of a slot: sequence number, expiry (monotonic ns), whether a value is stored (as opposed to a cached
+# miss), name length, value length and a digest of all of those along with the name and value.
+_SLOT_HEADER = struct.Struct("<Qq?xHI16s")
+_SLOT_SEQ = struct.Struct("<Q")
+_DIGESTED_HEADER = struct.Struct("<q?HI")
+_MAX_DATA_SIZE = _SLOT_SIZE - _SLOT_HEADER.size
+# Number of consecutive slots an entry can be stored in, starting from the one its name hashes to.
+_PROBE_LENGTH = 4
+
+
+class _Entry(NamedTuple):
+    name: bytes
+    value: str | None
+    expires_at: int
 
 
 class SecretCache:
-    """A static class to manage the global secret cache."""
+    """
+    A static class to manage the global secret cache.
 
-    __manager: multiprocessing.managers.SyncManager | None = None
-    _cache: dict[str, _CacheValue] | None = None
-    _ttl: datetime.timedelta
+    The cache is kept in an anonymous shared memory mapping, created by :meth:`init` and inherited by the
+    processes forked afterwards, so that they all share the same entries without any IPC. The mapping is
+    divided in fixed-size slots which are read without any lock: a writer marks the slot it updates with an
+    odd sequence number, and every entry carries a digest, so that readers can tell a torn or concurrently
+    updated slot apart and treat it as a miss.
+    """
+
+    _cache: mmap.mmap | None = None
+    _num_slots: int = 0
+    _ttl_ns: int = 0
 
     class NotPresentException(Exception):
         """Raised when a key is not present in the cache."""
 
-    class _CacheValue:
-        def __init__(self, value: str | None) -> None:
-            from airflow.sdk import timezone
-
-            self.value = value
-            self.date = timezone.utcnow()
-
-        def is_expired(self, ttl: datetime.timedelta) -> bool:
-            from airflow.sdk import timezone
+    class NotFoundException(NotPresentException):
+        """Raised when the cache remembers that a connection could not be found in any secrets backend."""
 
-            return timezone.utcnow() - self.date > ttl
-
-    _VARIABLE_PREFIX = "__v_"
-    _CONNECTION_PREFIX = "__c_"
-    _TEAM_PATTERN = "_{}_"
+    _VARIABLE_KIND = b"v"
+    _CONNECTION_KIND = b"c"
 
     @classmethod
     def init(cls):
@@ -61,13 +80,11 @@ class SecretCache:
         use_cache = conf.getboolean(section="secrets", key="use_cache", fallback=False)
         if not use_cache:
             return
-        if cls.__manager is None:
-            # it is not really necessary to save the manager, but doing so allows to reuse it between tests,
-            # making them run a lot faster because this operation takes ~300ms each time
-            cls.__manager = multiprocessing.Manager()
-        cls._cache = cls.__manager.dict()
+        cls._num_slots = conf.getint(section="secrets", key="cache_max_entries", fallback=4096)
         ttl_seconds = conf.getint(section="secrets", key="cache_ttl_seconds", fallback=15 * 60)
-        cls._ttl = datetime.timedelta(seconds=ttl_seconds)
+        cls._ttl_ns = ttl_seconds * 1_000_000_000
+        # Anonymous mappings are shared with forked children, and zero-filled, i.e. all slots start empty
+        cls._cache = mmap.mmap(-1, cls._num_slots * _SLOT_SIZE)
 
     @classmethod
     def reset(cls):
@@ -85,7 +102,7 @@ class SecretCache:
         :return: The saved value (which can be None) if present in cache and not expired,
             a NotPresent exception otherwise.
         """
-        return cls._get(key, cls._VARIABLE_PREFIX, team_name=team_name)
+        return cls._get(key, cls._VARIABLE_KIND, team_name=team_name).value
 
     @classmethod
     def get_connection_uri(cls, conn_id: str, team_name: str | None = None) -> str:
@@ -96,30 +113,35 @@ class SecretCache:
         :param team_name: The team name associated to the connection (if any).
 
         :return: The saved uri if present in cache and not expired,
+            a NotFound exception if the connection is cached as missing,
             a NotPresent exception otherwise.
         """
-        val = cls._get(conn_id, cls._CONNECTION_PREFIX, team_name=team_name)
+        val = cls._get(conn_id, cls._CONNECTION_KIND, team_name=team_name).value
+        if val is None:
+            raise cls.NotFoundException
         if val:  # there shouldn't be any empty entries in the connections cache, but we enforce it here.
             return val
         raise cls.NotPresentException
 
     @classmethod
-    def _get(cls, key: str, prefix: str, team_name: str | None = None) -> str | None:
-        if cls._cache is None:
+    def _get(cls, key: str, kind: bytes, team_name: str | None = None) -> _Entry:
+        if (cache := cls._cache) is None:
             # using an exception for misses allow to meaningfully cache None values
             raise cls.NotPresentException
 
-        team = cls._TEAM_PATTERN.format(team_name) if team_name else ""
-
-        val = cls._cache.get(f"{prefix}{team}{key}")
-        if val and not val.is_expired(cls._ttl):
-            return val.value
+        name = cls._entry_name(key, kind, team_name)
+        for index in cls._probe(name):
+            entry = cls._read_slot(cache, index)
+            if entry is not None and entry.name == name:
+                if time.monotonic_ns() < entry.expires_at:
+                    return entry
+                break
         raise cls.NotPresentException
 
     @classmethod
     def save_variable(cls, key: str, value: str | None, team_name: str | None = None):
         """Save the value for that key in the cache, if initialized."""
-        cls._save(key, value, cls._VARIABLE_PREFIX, team_name=team_name)
+        cls._save(key, value, cls._VARIABLE_KIND, team_name=team_name)
 
     @classmethod
     def save_connection_uri(cls, conn_id: str, uri: str, team_name: str | None = None):
@@ -127,18 +149,103 @@ class SecretCache:
         if uri is None:
             # connections raise exceptions if not present, so we shouldn't have any None value to save.
             return
-        cls._save(conn_id, uri, cls._CONNECTION_PREFIX, team_name=team_name)
+        cls._save(conn_id, uri, cls._CONNECTION_KIND, team_name=team_name)
 
     @classmethod
-    def _save(cls, key: str, value: str | None, prefix: str, team_name: str | None = None):
-        if cls._cache is not None:
-            team = cls._TEAM_PATTERN.format(team_name) if team_name else ""
-            cls._cache[f"{prefix}{team}{key}"] = cls._CacheValue(value)
+    def save_connection_not_found(cls, conn_id: str, team_name: str | None = None):
+        """Remember that the connection could not be found in any secrets backend, if initialized."""
+        cls._save(conn_id, None, cls._CONNECTION_KIND, team_name=team_name)
+
+    @classmethod
+    def _save(cls, key: str, value: str | None, kind: bytes, team_name: str | None = None):
+        if (cache := cls._cache) is None:
+            return
+        name = cls._entry_name(key, kind, team_name)
+        encoded_value = b"" if value is None else value.encode()
+        if len(name) + len(encoded_value) > _MAX_DATA_SIZE:
+            return
+        now = time.monotonic_ns()
+
+        # Reuse the slot of the entry if it is already cached, otherwise take a free or expired slot, or evict
+        # the entry closest to expiring.
+        candidates: list[tuple[int, int]] = []
+        for index in cls._probe(name):
+            entry = cls._read_slot(cache, index)
+            if entry is None or entry.name == name:
+                break
+            if entry.expires_at <= now:
+                break
+            candidates.append((entry.expires_at, index))
+        else:
+            index = min(candidates)[1]
+
+        cls._write_slot(cache, index, name, value is not None, encoded_value, now + cls._ttl_ns)
 
     @classmethod
     def invalidate_variable(cls, key: str, team_name: str | None = None):
         """Invalidate (actually removes) the value stored in the cache for that Variable."""
-        if cls._cache is not None:
-            team = cls._TEAM_PATTERN.format(team_name) if team_name else ""
-            # second arg ensures no exception if key is absent
-            cls._cache.pop(f"{cls._VARIABLE_PREFIX}{team}{key}", None)
+        if (cache := cls._cache) is None:
+            return
+        name = cls._entry_name(key, cls._VARIABLE_KIND, team_name)
+        for index in cls._probe(name):
+            entry = cls._read_slot(cache, index)
+            if entry is not None and entry.name == name:
+                cls._write_slot(cache, index, b"", False, b"", 0)
+
+    @staticmethod
+    def _entry_name(key: str, kind: bytes, team_name: str | None) -> bytes:
+        # The team is length-prefixed, so that no key of one team (or of no team) can be mistaken for another's
+        team = (team_name or "").encode()
+        return kind + len(team).to_bytes(2, "little") + team + key.encode()
+
+    @classmethod
+    def _probe(cls, name: bytes) -> list[int]:
+        start = int.from_bytes(hashlib.blake2b(name, digest_size=8).digest(), "little")
+        return [(start + i) % cls._num_slots for i in range(min(_PROBE_LENGTH, cls._num_slots))]
+
+    @staticmethod
+    def _digest(expires_at: int, has_value: bool, name: bytes, encoded_value: bytes) -> bytes:
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(_DIGESTED_HEADER.pack(expires_at, has_value, len(name), len(encoded_value)))
+        digest.update(name)
+        digest.update(encoded_value)
+        return digest.digest()
+
+    @classmethod
+    def _read_slot(cls, cache: mmap.mmap, index: int) -> _Entry | None:
+        offset = index * _SLOT_SIZE
+        seq, expires_at, has_value, name_len, value_len, digest = _SLOT_HEADER.unpack_from(cache, offset)
+        if seq & 1 or not name_len or name_len + value_len > _MAX_DATA_SIZE:
+            # Being written, empty, or garbage left by a writer that died halfway
+            return None
+        start = offset + _SLOT_HEADER.size
+        name = cache[start : start + name_len]
+        encoded_value = cache[start + name_len : start + name_len + value_len]
+        if _SLOT_SEQ.unpack_from(cache, offset)[0] != seq:
+            return None
+        if digest != cls._digest(expires_at, has_value, name, encoded_value):
+            # Another process updated the slot while we were reading it
+            return None
+        return _Entry(name, encoded_value.decode() if has_value else None, expires_at)
+
+    @classmethod
+    def _write_slot(
+        cls,
+        cache: mmap.mmap,
+        index: int,
+        name: bytes,
+        has_value: bool,
+        encoded_value: bytes,
+        expires_at: int,
+    ) -> None:
+        offset = index * _SLOT_SIZE
+        # An odd sequence number tells readers the slot is being written
+        seq = _SLOT_SEQ.unpack_from(cache, offset)[0] | 1
+        _SLOT_SEQ.pack_into(cache, offset, seq)
+        start = offset + _SLOT_HEADER.size
+        cache[start : start + len(name) + len(encoded_value)] = name + encoded_value
+        digest = cls._digest(expires_at, has_value, name, encoded_value)
+        _SLOT_HEADER.pack_into(
+            cache, offset, seq, expires_at, has_value, len(name), len(encoded_value), digest
+        )
+        _SLOT_SEQ.pack_into(cache, offset, seq + 1)
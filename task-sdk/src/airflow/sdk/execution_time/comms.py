@@ -27,6 +27,10 @@ Communication protocol between the Supervisor and the task process
   be running user's code, so we can't read from stdin until we enter our code, such as when requesting an XCom
   value etc.)
 * Every request returns a response, even if the frame is otherwise empty.
+* The supervisor handles requests in the order they were sent. With ``[workers] pipeline_supervisor_requests``
+  set, the task process writes requests whose response it does not need (such as ``SetXCom``) without waiting
+  for that response, and reads the responses of those requests, matching them by id, before its next other
+  request.
 * Requests are written by the subprocess to fd0/stdin. This is making use of the fact that stdin is a
   bi-directional socket, and thus we can write to it and don't need a dedicated extra socket for sending
   requests.
@@ -52,7 +56,8 @@ import asyncio
 import itertools
 import threading
 import traceback
-from collections.abc import Iterator
+from collections import deque
+from collections.abc import Iterator, Sequence
 from contextlib import suppress
 from datetime import datetime
 from functools import cached_property
@@ -96,6 +101,7 @@ from airflow.sdk.api.datamodels._generated import (
     TriggerDAGRunPayload,
     UpdateHITLDetailPayload,
     VariableResponse,
+    XComBatchResponse,
     XComResponse,
     XComSequenceIndexResponse,
     XComSequenceSliceResponse,
@@ -103,10 +109,11 @@ from airflow.sdk.api.datamodels._generated import (
 from airflow.sdk.exceptions import ErrorType
 
 try:
-    from socket import recv_fds
+    from socket import recv_fds, send_fds
 except ImportError:
     # Available on Unix and Windows (so "everywhere") but lets be safe
     recv_fds = None  # type: ignore[assignment]
+    send_fds = None  # type: ignore[assignment]
 
 from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
 
@@ -211,6 +218,16 @@ class _ResponseFrame(_FrameMixin, msgspec.Struct, array_like=True, frozen=True,
     error: dict[str, Any] | None = None
 
 
+# Requests whose response carries nothing the task needs, so that they can be acknowledged asynchronously when
+# the requests are pipelined
+_PIPELINED_REQUEST_TYPES = frozenset(
+    {"SetXCom", "DeleteXCom", "PutVariable", "SetRenderedFields", "SetRenderedMapIndex"}
+)
+# Bound on the pipelined requests awaiting their response, so that the responses always fit in the socket
+# buffer and the supervisor never blocks writing them while we are still writing requests
+_MAX_PIPELINED_REQUESTS = 128
+
+
 @attrs.define()
 class CommsDecoder(Generic[ReceiveMsgType, SendMsgType]):
     """Handle communication between the task in this process and the supervisor parent process."""
@@ -231,9 +248,22 @@ class CommsDecoder(Generic[ReceiveMsgType, SendMsgType]):
 
     err_decoder: TypeAdapter[ErrorResponse] = attrs.field(factory=lambda: TypeAdapter(ToTask), repr=False)
 
+    pipelined: bool = False
+    """
+    Whether to send the requests whose response the task does not need without waiting for that response.
+
+    The responses of those requests are read before the next other request is sent, and any error in them is
+    raised by :meth:`flush`.
+    """
+
+    supports_fds: ClassVar[bool] = True
+    """Whether :meth:`send` and :meth:`asend` can pass file descriptors to the supervisor."""
+
     _thread_lock: threading.Lock = attrs.field(factory=threading.Lock, repr=False)
     _async_lock: asyncio.Lock = attrs.field(factory=asyncio.Lock, repr=False)
     _loop_thread_id: int | None = attrs.field(default=None, repr=False, init=False)
+    _pending: deque[tuple[int, str]] = attrs.field(factory=deque, repr=False, init=False)
+    _pipelined_error: Exception | None = attrs.field(default=None, repr=False, init=False)
 
     def _make_frame(self, msg: SendMsgType) -> _RequestFrame:
         carrier: dict[str, str] = {}
@@ -247,9 +277,23 @@ class CommsDecoder(Generic[ReceiveMsgType, SendMsgType]):
                 return bool(asyncio.get_running_loop())
         return False
 
-    def send(self, msg: SendMsgType) -> ReceiveMsgType | None:
-        """Send a request to the parent and block until the response is received."""
-        frame_bytes = self._make_frame(msg).as_bytes()
+    def _should_pipeline(self, msg: SendMsgType, fds: Sequence[int]) -> bool:
+        # Requests passing fds carry large values, whose upload outweighs the round trip, so are not pipelined
+        return self.pipelined and not fds and getattr(msg, "type", None) in _PIPELINED_REQUEST_TYPES
+
+    def send(self, msg: SendMsgType, fds: Sequence[int] = ()) -> ReceiveMsgType | None:
+        """
+        Send a request to the parent and block until the response is received.
+
+        When :attr:`pipelined`, requests whose response the task does not need return None as soon as they are
+        written instead.
+
+        :param fds: File descriptors to pass to the parent along with the request, such as the file holding a
+            large XCom value. The caller keeps ownership of them and closes them once this returns.
+        """
+        request = self._make_frame(msg)
+        frame_bytes = request.as_bytes()
+        pipeline = self._should_pipeline(msg, fds)
 
         # When called from the event loop thread, use non-blocking acquire to detect
         # an imminent deadlock: an asend() coroutine currently holds _thread_lock and
@@ -257,17 +301,25 @@ class CommsDecoder(Generic[ReceiveMsgType, SendMsgType]):
         if not self._thread_lock.acquire(blocking=not self._is_on_loop_thread):
             raise DeadlockImminentError(msg)
         try:
-            self.socket.sendall(frame_bytes)
+            if not pipeline or len(self._pending) >= _MAX_PIPELINED_REQUESTS:
+                self._read_pending_responses()
+            if fds:
+                self._send_with_fds(frame_bytes, fds)
+            else:
+                self.socket.sendall(frame_bytes)
+            if pipeline:
+                self._pending.append((request.id, type(msg).__name__))
+                return None
             if isinstance(msg, ResendLoggingFD):
                 if recv_fds is None:
                     return None
                 # We need special handling here! The server can't send us the fd number, as the number on the
                 # supervisor will be different to in this process, so we have to mutate the message ourselves here.
-                frame, fds = self._read_frame(maxfds=1)
+                frame, received_fds = self._read_frame(maxfds=1)
                 resp = self._from_frame(frame)
                 if TYPE_CHECKING:
                     assert isinstance(resp, SentFDs)
-                resp.fds = fds
+                resp.fds = received_fds
                 # Since we know this is an explicit ResendLoggingFD, and since this class is generic SentFDs might not
                 # always be in the return type union
                 return resp  # type: ignore[return-value]
@@ -276,33 +328,46 @@ class CommsDecoder(Generic[ReceiveMsgType, SendMsgType]):
         finally:
             self._thread_lock.release()
 
-    async def asend(self, msg: SendMsgType) -> ReceiveMsgType | None:
+    async def asend(self, msg: SendMsgType, fds: Sequence[int] = ()) -> ReceiveMsgType | None:
         """
         Send a request to the parent without blocking.
 
         Uses async lock for coroutine safety and thread lock for socket safety.
+
+        :param fds: File descriptors to pass to the parent along with the request, see :meth:`send`.
         """
         self._loop_thread_id = threading.get_ident()
 
-        frame_bytes = self._make_frame(msg).as_bytes()
+        request = self._make_frame(msg)
+        frame_bytes = request.as_bytes()
+        pipeline = self._should_pipeline(msg, fds)
 
         async with self._async_lock:
             # Acquire the threading lock without blocking the event loop
             loop = asyncio.get_running_loop()
             await loop.run_in_executor(None, self._thread_lock.acquire)
             try:
-                # Async write to socket
-                await loop.sock_sendall(self.socket, frame_bytes)
+                if self._pending and (not pipeline or len(self._pending) >= _MAX_PIPELINED_REQUESTS):
+                    await asyncio.to_thread(self._read_pending_responses)
+                if fds:
+                    # There is no async sendmsg, so hand the fds over with a blocking write in a thread
+                    await asyncio.to_thread(self._send_with_fds, frame_bytes, fds)
+                else:
+                    # Async write to socket
+                    await loop.sock_sendall(self.socket, frame_bytes)
+                if pipeline:
+                    self._pending.append((request.id, type(msg).__name__))
+                    return None
 
                 if isinstance(msg, ResendLoggingFD):
                     if recv_fds is None:
                         return None
                     # Blocking read in a thread
-                    frame, fds = await asyncio.to_thread(self._read_frame, maxfds=1)
+                    frame, received_fds = await asyncio.to_thread(self._read_frame, maxfds=1)
                     resp = self._from_frame(frame)
                     if TYPE_CHECKING:
                         assert isinstance(resp, SentFDs)
-                    resp.fds = fds
+                    resp.fds = received_fds
                     return resp  # type: ignore[return-value]
 
                 # Normal blocking read in a thread
@@ -311,6 +376,42 @@ class CommsDecoder(Generic[ReceiveMsgType, SendMsgType]):
             finally:
                 self._thread_lock.release()
 
+    def flush(self) -> None:
+        """
+        Wait for the responses of all the pipelined requests.
+
+        :raises AirflowRuntimeError: the error of the first pipelined request that failed since the last flush.
+        """
+        with self._thread_lock:
+            self._read_pending_responses()
+            error, self._pipelined_error = self._pipelined_error, None
+        if error is not None:
+            raise error
+
+    def _read_pending_responses(self) -> None:
+        from airflow.sdk.exceptions import AirflowRuntimeError
+
+        while self._pending:
+            req_id, req_type = self._pending.popleft()
+            frame = self._read_frame()
+            if frame.id != req_id:
+                raise RuntimeError(f"Expected the response to request {req_id}, got the one to {frame.id}")
+            try:
+                self._from_frame(frame)
+            except AirflowRuntimeError as e:
+                self.log.error("Pipelined request failed", request=req_type, error=e.error)
+                if self._pipelined_error is None:
+                    self._pipelined_error = e
+
+    def _send_with_fds(self, frame_bytes: bytearray, fds: Sequence[int]) -> None:
+        if send_fds is None:
+            raise RuntimeError("send_fds is not available on this platform")
+        self.socket.setblocking(True)
+        view = memoryview(frame_bytes)
+        # The fds travel with the length prefix, which is where the supervisor looks for them
+        send_fds(self.socket, [view[:4]], fds)
+        self.socket.sendall(view[4:])
+
     @overload
     def _read_frame(self, maxfds: None = None) -> _ResponseFrame: ...
 
@@ -548,6 +649,16 @@ class XComResult(XComResponse):
         return cls(**xcom_response.model_dump(exclude_defaults=True), type="XComResult")
 
 
+class XComBatchResult(XComBatchResponse):
+    """Response to GetXComBatch request."""
+
+    type: Literal["XComBatchResult"] = "XComBatchResult"
+
+    @classmethod
+    def from_api_response(cls, response: XComBatchResponse) -> XComBatchResult:
+        return cls(xcoms=response.xcoms, type="XComBatchResult")
+
+
 class XComCountResponse(BaseModel):
     len: int
     type: Literal["XComCountResponse"] = "XComCountResponse"
@@ -831,6 +942,7 @@ ToTask = Annotated[
     | TaskStatesResult
     | VariableResult
     | VariableKeysResult
+    | XComBatchResult
     | XComCountResponse
     | XComResult
     | XComSequenceIndexResult
@@ -909,6 +1021,19 @@ class GetXCom(BaseModel):
     type: Literal["GetXCom"] = "GetXCom"
 
 
+class GetXComBatch(BaseModel):
+    """Get the XComs of every combination of the given tasks and map indexes in one request."""
+
+    key: str
+    dag_id: str
+    run_id: str
+    task_ids: list[str]
+    map_indexes: list[int] | None
+    """The map indexes to get, or *None* for all the map indexes of the tasks."""
+    include_prior_dates: bool = False
+    type: Literal["GetXComBatch"] = "GetXComBatch"
+
+
 class GetXComCount(BaseModel):
     """Get the number of (mapped) XCom values available."""
 
@@ -949,6 +1074,9 @@ class SetXCom(BaseModel):
     map_index: int | None = None
     dag_result: bool = False
     mapped_length: int | None = None
+    # Large values are JSON encoded into a file that is passed along with the request instead of being put in
+    # ``value``, so they are not copied into the frame and the supervisor can stream them to the API server.
+    value_in_file: bool = False
     type: Literal["SetXCom"] = "SetXCom"
 
 
@@ -1274,6 +1402,7 @@ ToSupervisor = Annotated[
     | GetVariable
     | GetVariableKeys
     | GetXCom
+    | GetXComBatch
     | GetXComCount
     | GetXComSequenceItem
     | GetXComSequenceSlice
@@ -230,12 +230,15 @@ def _get_connection(conn_id: str) -> Connection:
         conn = Connection.from_uri(uri, conn_id=conn_id)
         _mask_connection_secrets(conn)
         return conn
+    except SecretCache.NotFoundException:
+        raise AirflowNotFoundException(f"The conn_id `{conn_id}` isn't defined") from None
     except SecretCache.NotPresentException:
         pass  # continue to backends
 
     # Iterate over configured backends (which may include SupervisorCommsSecretsBackend
     # in worker contexts or MetastoreBackend in API server contexts)
     backends = ensure_secrets_backend_loaded()
+    backend_failed = False
     for secrets_backend in backends:
         try:
             conn = secrets_backend.get_connection(conn_id=conn_id)  # type: ignore[assignment]
@@ -247,6 +250,7 @@ def _get_connection(conn_id: str) -> Connection:
             # Authoritative deny — must NOT fall through to a less-restrictive backend.
             raise
         except Exception:
+            backend_failed = True
             log.debug(
                 "Unable to retrieve connection from secrets backend (%s). "
                 "Checking subsequent secrets backend.",
@@ -255,7 +259,8 @@ def _get_connection(conn_id: str) -> Connection:
             )
 
     # If no backend found the connection, raise an error
-
+    if not backend_failed:
+        SecretCache.save_connection_not_found(conn_id)
     raise AirflowNotFoundException(f"The conn_id `{conn_id}` isn't defined")
 
 
@@ -278,6 +283,8 @@ async def _async_get_connection(conn_id: str) -> Connection:
         conn = Connection.from_uri(uri, conn_id=conn_id)
         await _amask_connection_secrets(conn)
         return conn
+    except SecretCache.NotFoundException:
+        raise AirflowNotFoundException(f"The conn_id `{conn_id}` isn't defined") from None
     except SecretCache.NotPresentException:
         pass  # continue to backends
 
@@ -285,6 +292,7 @@ async def _async_get_connection(conn_id: str) -> Connection:
 
     # Try secrets backends
     backends = ensure_secrets_backend_loaded()
+    backend_failed = False
     for secrets_backend in backends:
         try:
             # Use async method if available, otherwise wrap sync method
@@ -305,6 +313,7 @@ async def _async_get_connection(conn_id: str) -> Connection:
             raise
         except Exception:
             # If one backend fails, try the next one
+            backend_failed = True
             log.debug(
                 "Unable to retrieve connection from secrets backend (%s). "
                 "Checking subsequent secrets backend.",
@@ -313,7 +322,8 @@ async def _async_get_connection(conn_id: str) -> Connection:
             )
 
     # If no backend found the connection, raise an error
-
+    if not backend_failed:
+        SecretCache.save_connection_not_found(conn_id)
     raise AirflowNotFoundException(f"The conn_id `{conn_id}` isn't defined")
 
 
@@ -335,18 +345,25 @@ def _mask_and_deserialize_variable(raw: str, key: str, deserialize_json: bool) -
 
 
 def _get_variable(key: str, deserialize_json: bool) -> Any:
+    from airflow.sdk.exceptions import AirflowRuntimeError, ErrorType
     from airflow.sdk.execution_time.cache import SecretCache
     from airflow.sdk.execution_time.supervisor import ensure_secrets_backend_loaded
 
     # Check cache first
     try:
         var_val = SecretCache.get_variable(key)
-        if var_val is not None:
-            return _mask_and_deserialize_variable(var_val, key, deserialize_json)
     except SecretCache.NotPresentException:
         pass  # Continue to check backends
+    else:
+        if var_val is not None:
+            return _mask_and_deserialize_variable(var_val, key, deserialize_json)
+        # The variable is cached as missing
+        raise AirflowRuntimeError(
+            ErrorResponse(error=ErrorType.VARIABLE_NOT_FOUND, detail={"message": f"Variable {key} not found"})
+        )
 
     backends = ensure_secrets_backend_loaded()
+    backend_failed = False
 
     # Iterate over backends if not in cache (or expired)
     for secrets_backend in backends:
@@ -360,14 +377,15 @@ def _get_variable(key: str, deserialize_json: bool) -> Any:
             # Authoritative deny — must NOT fall through to a less-restrictive backend.
             raise
         except Exception:
+            backend_failed = True
             log.exception(
                 "Unable to retrieve variable from secrets backend (%s). Checking subsequent secrets backend.",
                 type(secrets_backend).__name__,
             )
 
     # If no backend found the variable, raise a not found error (mirrors _get_connection)
-    from airflow.sdk.exceptions import AirflowRuntimeError, ErrorType
-
+    if not backend_failed:
+        SecretCache.save_variable(key, None)
     raise AirflowRuntimeError(
         ErrorResponse(error=ErrorType.VARIABLE_NOT_FOUND, detail={"message": f"Variable {key} not found"})
     )
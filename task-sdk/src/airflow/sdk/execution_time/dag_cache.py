@@ -0,0 +1,242 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+On-disk cache of the DAGs parsed by task processes.
+
+Every task process parses the DAG file of its task to find the task object. With ``[workers]
+parsed_dag_cache_folder`` set, a task process that parsed a file of a bundle listed in ``[workers]
+parsed_dag_cache_bundles`` stores its DAGs there, pickled, and the next task processes of the worker load them
+instead of running the DAG file again. Entries are keyed by the bundle, its version and the content of the DAG
+file, and also record the modules of the bundle the file imported: an entry is only used while they are
+unchanged too. Only Python modules are tracked; a change to any other file the DAG file reads, such as a YAML
+file it builds DAGs from, goes unnoticed until the bundle version changes.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import os
+import pickle
+import stat
+import sys
+import tempfile
+import time
+from collections.abc import Mapping
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+from airflow.sdk import __version__
+
+if TYPE_CHECKING:
+    from structlog.typing import FilteringBoundLogger as Logger
+
+    from airflow.sdk import DAG
+
+# Change when the entries change shape, so that the ones written by other versions are not used
+_FORMAT_VERSION = 1
+
+# Touched whenever the folder is pruned, to prune it at most once per interval
+_PRUNE_MARKER = ".pruned"
+_MAX_PRUNE_INTERVAL = 3600
+
+
+class _Entry(NamedTuple):
+    dependencies: dict[str, str]
+    """Digest of each module of the bundle the DAG file imported, by path"""
+    payload: bytes
+    """The DAGs of the file by id, pickled with ``cloudpickle``"""
+
+
+def _file_digest(path: str | os.PathLike[str]) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(1024 * 1024):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def check_folder(folder: str, log: Logger) -> bool:
+    """
+    Create the cache folder if it is missing, and return whether entries can safely be loaded from it.
+
+    The entries are loaded with ``pickle``, so the folder must be owned by the current user and not writable by
+    anyone else.
+    """
+    try:
+        os.makedirs(folder, mode=0o700, exist_ok=True)
+        folder_stat = os.stat(folder)
+    except OSError:
+        log.warning("Could not create the parsed DAG cache folder", folder=folder, exc_info=True)
+        return False
+    if folder_stat.st_uid != os.getuid() or folder_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        log.warning(
+            "Not using the parsed DAG cache folder, as it is not owned by the current user "
+            "or is writable by others",
+            folder=folder,
+        )
+        return False
+    return True
+
+
+def prune(folder: str, max_age: float, log: Logger) -> None:
+    """
+    Remove the entries that were not used for ``max_age`` seconds.
+
+    The folder is scanned at most once every ``max_age`` seconds, or every hour if that is shorter.
+    """
+    now = time.time()
+    marker = os.path.join(folder, _PRUNE_MARKER)
+    try:
+        if now - os.stat(marker).st_mtime < min(max_age, _MAX_PRUNE_INTERVAL):
+            return
+    except FileNotFoundError:
+        pass
+    except OSError:
+        return
+    try:
+        Path(marker).touch()
+        with os.scandir(folder) as it:
+            for entry in it:
+                # Temporary files are those of writers that died before renaming them
+                if entry.name.endswith((".pickle", ".tmp")) and now - entry.stat().st_mtime > max_age:
+                    with contextlib.suppress(FileNotFoundError):
+                        os.unlink(entry.path)
+    except OSError:
+        log.warning("Could not prune the parsed DAG cache folder", folder=folder, exc_info=True)
+
+
+def entry_path(folder: str, bundle_name: str, bundle_version: str | None, dag_file: str) -> Path:
+    """
+    Return the path of the cache entry for the current content of a DAG file.
+
+    :raises OSError: if the DAG file cannot be read.
+    """
+    key = (
+        _FORMAT_VERSION,
+        sys.version_info[:2],
+        __version__,
+        bundle_name,
+        bundle_version,
+        dag_file,
+        _file_digest(dag_file),
+    )
+    return Path(folder, f"{hashlib.sha256(repr(key).encode()).hexdigest()}.pickle")
+
+
+def load_dags(path: Path, bundle_path: str | os.PathLike[str], log: Logger) -> dict[str, DAG] | None:
+    """Load the DAGs stored in a cache entry, or return None if it is missing, stale or unusable."""
+    try:
+        with open(path, "rb") as f:
+            entry = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        log.warning("Ignoring unreadable parsed DAG cache entry", path=os.fspath(path), exc_info=True)
+        return None
+    if not isinstance(entry, _Entry):
+        return None
+
+    for module_file, digest in entry.dependencies.items():
+        try:
+            if _file_digest(module_file) != digest:
+                return None
+        except OSError:
+            return None
+
+    # The DAGs refer to the modules of the bundle they imported, which are imported again as they are loaded
+    if os.fspath(bundle_path) not in sys.path:
+        sys.path.append(os.fspath(bundle_path))
+    try:
+        dags = pickle.loads(entry.payload)
+    except Exception:
+        log.warning(
+            "Ignoring parsed DAG cache entry that failed to load", path=os.fspath(path), exc_info=True
+        )
+        return None
+    # Entries are pruned once unused for a while, see prune()
+    with contextlib.suppress(OSError):
+        os.utime(path)
+    return dags
+
+
+def store_dags(
+    path: Path,
+    dags: Mapping[str, DAG],
+    dag_file: str,
+    bundle_path: str | os.PathLike[str],
+    log: Logger,
+) -> None:
+    """
+    Store the DAGs parsed from a file in its cache entry.
+
+    The module created from the DAG file is pickled by value, as it cannot be imported by name; the modules of
+    the bundle the file imported are pickled by reference, and recorded so that the entry is not used once
+    they change. DAGs that cannot be pickled, for instance because they hold a lock or a client, are not cached.
+    """
+    try:
+        import cloudpickle
+    except ImportError:
+        log.warning(
+            "The parsed DAG cache requires the `cloudpickle` module. "
+            "Please install it with: pip install 'apache-airflow[cloudpickle]'"
+        )
+        return
+
+    bundle_dir = os.path.join(os.fspath(bundle_path), "")
+    dag_modules = []
+    dependencies = {}
+    try:
+        for module in list(sys.modules.values()):
+            module_file = getattr(module, "__file__", None)
+            if not isinstance(module_file, str):
+                continue
+            if module_file == dag_file:
+                dag_modules.append(module)
+            elif module_file.startswith(bundle_dir):
+                dependencies[module_file] = _file_digest(module_file)
+    except OSError:
+        # A module loaded from a zip file, or removed since
+        return
+    if not dag_modules:
+        return
+
+    for module in dag_modules:
+        cloudpickle.register_pickle_by_value(module)
+    try:
+        payload = cloudpickle.dumps(dict(dags), protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        log.info("Not caching the parsed DAGs, as they cannot be pickled", exc_info=True)
+        return
+    finally:
+        for module in dag_modules:
+            cloudpickle.unregister_pickle_by_value(module)
+
+    # Write the entry under a temporary name first, so that other task processes never read a partial one
+    tmp_name = None
+    try:
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=path.parent, suffix=".tmp", delete=False) as f:
+            tmp_name = f.name
+            pickle.dump(_Entry(dependencies, payload), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_name, path)
+    except OSError:
+        log.warning("Could not write parsed DAG cache entry", path=os.fspath(path), exc_info=True)
+        if tmp_name is not None:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_name)
@@ -0,0 +1,198 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Coalescing of task instance heartbeats.
+
+The supervisors running on a node each hand their heartbeats to a :class:`HeartbeatRelay`, which passes
+them on to a :class:`HeartbeatAggregator` running in a process of the executor. The aggregator sends the
+heartbeats of all the supervisors in one batch heartbeat request every so often, and relays the outcome of
+each heartbeat back to the supervisor that sent it.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import multiprocessing
+import multiprocessing.connection
+import threading
+import time
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any, NamedTuple, cast
+
+import structlog
+
+from airflow.sdk.api.client import Client, get_hostname
+from airflow.sdk.api.datamodels._generated import TIBatchHeartbeatItem
+
+if TYPE_CHECKING:
+    from multiprocessing.connection import Connection
+    from uuid import UUID
+
+__all__ = [
+    "HeartbeatAggregator",
+    "HeartbeatOutcome",
+    "HeartbeatRelay",
+    "get_heartbeat_relay",
+    "set_heartbeat_relay",
+]
+
+log = structlog.get_logger(logger_name=__name__)
+
+
+class HeartbeatOutcome(NamedTuple):
+    """Outcome of a heartbeat sent through a :class:`HeartbeatAggregator`."""
+
+    ti_id: UUID
+    status_code: int
+    """``200`` if the heartbeat was recorded, the status code the API server rejected it with otherwise,
+    or ``0`` if the batch request itself failed."""
+    detail: Any = None
+    refreshed_token: str | None = None
+
+
+class HeartbeatRelay:
+    """Supervisor side of a :class:`HeartbeatAggregator`, which hands heartbeats over a pipe."""
+
+    def __init__(self, conn: Connection):
+        self.conn = conn
+
+    def submit(self, ti_id: UUID, *, pid: int, token: str) -> None:
+        """Hand over a heartbeat, to be sent with the next batch."""
+        self.conn.send((ti_id, get_hostname(), pid, token))
+
+    def poll(self) -> list[HeartbeatOutcome]:
+        """Return the outcomes of the heartbeats received since the last call, without blocking."""
+        outcomes = []
+        while self.conn.poll():
+            outcomes.append(self.conn.recv())
+        return outcomes
+
+
+_relay: HeartbeatRelay | None = None
+
+
+def set_heartbeat_relay(relay: HeartbeatRelay | None) -> None:
+    """Have the supervisors of this process send their heartbeats through ``relay``."""
+    global _relay
+    _relay = relay
+
+
+def get_heartbeat_relay() -> HeartbeatRelay | None:
+    """Return the relay the supervisors of this process send their heartbeats through, if any."""
+    return _relay
+
+
+class HeartbeatAggregator:
+    """
+    Collect the heartbeats of many supervisors and send them with one batch heartbeat request.
+
+    Runs in a thread of the executor. Each supervisor process gets its own pipe from :meth:`connect`, and
+    sends its heartbeats through a :class:`HeartbeatRelay` over it. Heartbeats are sent every ``interval``
+    seconds, each authorized by the execution token of its task instance.
+
+    :param server: Base URL of the Execution API server.
+    :param interval: Number of seconds between two batch heartbeat requests.
+    """
+
+    def __init__(self, *, server: str, interval: float):
+        self.server = server
+        self.interval = interval
+        self._conns: list[Connection] = []
+        self._pending: dict[UUID, tuple[Connection, TIBatchHeartbeatItem]] = {}
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._client: Client | None = None
+
+    def connect(self) -> Connection:
+        """Open a pipe for a new supervisor process, returning the end to hand to that process."""
+        ours, theirs = multiprocessing.Pipe()
+        self._conns.append(ours)
+        return theirs
+
+    def start(self) -> None:
+        self._client = Client(base_url=self.server, token="")
+        self._thread = threading.Thread(target=self._run, name="heartbeat-aggregator", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        for conn in self._conns:
+            conn.close()
+        self._conns.clear()
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def _run(self) -> None:
+        next_flush = time.monotonic() + self.interval
+        while not self._stop.is_set():
+            self._receive(timeout=max(0.0, min(next_flush - time.monotonic(), 1.0)))
+            if time.monotonic() >= next_flush:
+                next_flush = time.monotonic() + self.interval
+                self.flush()
+
+    def _receive(self, timeout: float) -> None:
+        # Pipes opened by connect() meanwhile are picked up on the next call.
+        ready = multiprocessing.connection.wait(list(self._conns), timeout=timeout)
+        for conn in cast("list[Connection]", ready):
+            try:
+                ti_id, hostname, pid, token = conn.recv()
+            except (EOFError, OSError):
+                # The supervisor process is gone
+                self._conns.remove(conn)
+                conn.close()
+                continue
+            # Only the latest heartbeat of a task instance matters.
+            self._pending[ti_id] = (
+                conn,
+                TIBatchHeartbeatItem(id=ti_id, hostname=hostname, pid=pid, token=token),
+            )
+
+    def flush(self) -> None:
+        """Send the heartbeats received since the last flush, and relay their outcomes."""
+        if not self._pending or self._client is None:
+            return
+        pending, self._pending = self._pending, {}
+        heartbeats = [heartbeat for _, heartbeat in pending.values()]
+        outcomes: list[HeartbeatOutcome]
+        try:
+            # The request carries no token of its own: each heartbeat is authorized by its own token.
+            response = self._client.task_instances.heartbeat_batch(heartbeats)
+        except Exception as e:
+            log.warning("Failed to send batch heartbeat", heartbeats=len(heartbeats), exc_info=True)
+            outcomes = [HeartbeatOutcome(ti_id, 0, str(e)) for ti_id in pending]
+        else:
+            failures = {failure.id: failure for failure in response.failures}
+            refreshed_tokens = response.refreshed_tokens or {}
+            outcomes = [
+                HeartbeatOutcome(
+                    ti_id,
+                    failures[ti_id].status_code if ti_id in failures else HTTPStatus.OK,
+                    failures[ti_id].detail if ti_id in failures else None,
+                    refreshed_tokens.get(str(ti_id)),
+                )
+                for ti_id in pending
+            ]
+        for outcome in outcomes:
+            conn = pending[outcome.ti_id][0]
+            # If the supervisor process is gone, its pipe is dropped the next time it is waited on
+            with contextlib.suppress(OSError):
+                conn.send(outcome)
@@ -39,23 +39,48 @@ _XComWrapper = collections.namedtuple("_XComWrapper", "value")
 log = structlog.get_logger(logger_name=__name__)
 
 
+# Iterating forwards reads ahead pages of this many values at most, starting with one value and doubling the
+# page size with every page fetched. Short iterations (e.g. ``next(iter(seq))``) stay cheap, while long ones
+# take a logarithmic number of requests to reach full sized pages.
+_MAX_READ_AHEAD = 1024
+
+
 @attrs.define
 class LazyXComIterator(Iterator[T]):
     seq: LazyXComSequence[T]
     index: int = 0
     dir: Literal[1, -1] = 1
+    _buffer: collections.deque[T] = attrs.field(factory=collections.deque, init=False)
+    _page_size: int = attrs.field(default=1, init=False)
+    _exhausted: bool = attrs.field(default=False, init=False)
 
     def __next__(self) -> T:
         if self.index < 0:
             # When iterating backwards, avoid extra HTTP request
             raise StopIteration()
-        try:
-            val = self.seq[self.index]
-        except IndexError:
-            raise StopIteration from None
+        if self.dir == -1:
+            try:
+                val = self.seq[self.index]
+            except IndexError:
+                raise StopIteration from None
+        else:
+            if not self._buffer:
+                self._read_ahead()
+            if not self._buffer:
+                raise StopIteration()
+            val = self._buffer.popleft()
         self.index += self.dir
         return val
 
+    def _read_ahead(self) -> None:
+        if self._exhausted:
+            return
+        page = self.seq[self.index : self.index + self._page_size]
+        # A short page means we've reached the end, there is no need to ask again
+        self._exhausted = len(page) < self._page_size
+        self._buffer.extend(page)
+        self._page_size = min(self._page_size * 2, _MAX_READ_AHEAD)
+
     def __iter__(self) -> Iterator[T]:
         return self
 
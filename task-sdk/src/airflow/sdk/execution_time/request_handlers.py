@@ -27,6 +27,8 @@ via ``send_msg``.
 
 from __future__ import annotations
 
+import os
+import stat
 from typing import TYPE_CHECKING
 from uuid import UUID
 
@@ -62,6 +64,7 @@ from airflow.sdk.execution_time.comms import (
     GetVariable,
     GetVariableKeys,
     GetXCom,
+    GetXComBatch,
     GetXComCount,
     GetXComSequenceItem,
     GetXComSequenceSlice,
@@ -74,6 +77,7 @@ from airflow.sdk.execution_time.comms import (
     TaskStatesResult,
     VariableKeysResult,
     VariableResult,
+    XComBatchResult,
     XComResult,
     XComSequenceIndexResult,
     XComSequenceSliceResult,
@@ -177,8 +181,34 @@ def handle_get_previous_ti(client: Client, msg: GetPreviousTI) -> tuple[BaseMode
     return resp, {}
 
 
-def handle_set_xcom(client: Client, msg: SetXCom) -> tuple[BaseModel | None, dict[str, bool]]:
-    """Store an XCom value."""
+def handle_set_xcom(
+    client: Client, msg: SetXCom, fds: list[int] | None = None
+) -> tuple[BaseModel | None, dict[str, bool]]:
+    """
+    Store an XCom value.
+
+    :param fds: The fds passed along with the request. A value sent in a file is streamed from the first of
+        them, which this takes ownership of.
+    """
+    if msg.value_in_file:
+        if not fds:
+            raise ValueError("The XCom value was sent in a file, but no file was passed with the request")
+        with open(fds.pop(0), "rb") as value_file:
+            # Anything but a regular file (a pipe, a socket) could block the supervisor indefinitely
+            if not stat.S_ISREG(os.fstat(value_file.fileno()).st_mode):
+                raise ValueError("The XCom value must be sent in a regular file")
+            client.xcoms.set_from_file(
+                msg.dag_id,
+                msg.run_id,
+                msg.task_id,
+                msg.key,
+                value_file,
+                msg.map_index,
+                dag_result=msg.dag_result,
+                mapped_length=msg.mapped_length,
+            )
+        return None, {}
+
     client.xcoms.set(
         msg.dag_id,
         msg.run_id,
@@ -284,6 +314,14 @@ def handle_get_xcom(client: Client, msg: GetXCom) -> tuple[BaseModel | None, dic
     return xcom, {}
 
 
+def handle_get_xcom_batch(client: Client, msg: GetXComBatch) -> tuple[BaseModel | None, dict[str, bool]]:
+    """Fetch the XComs of several tasks and map indexes."""
+    xcoms = client.xcoms.get_batch(
+        msg.dag_id, msg.run_id, msg.key, msg.task_ids, msg.map_indexes, msg.include_prior_dates
+    )
+    return XComBatchResult.from_api_response(xcoms), {}
+
+
 def handle_get_asset_state_store_by_name(
     client: Client, msg: GetAssetStateStoreByName
 ) -> tuple[BaseModel | None, dict[str, bool]]:
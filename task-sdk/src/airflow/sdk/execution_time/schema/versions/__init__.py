@@ -37,8 +37,20 @@ def get_bundle() -> VersionBundle:
     """
     from cadwyn import HeadVersion, Version, VersionBundle
 
+    from airflow.sdk.execution_time.schema.versions.v2026_10_18 import (
+        AddParsingResultFingerprint,
+        AddParsingResultImportedModules,
+        AddSetXComValueInFile,
+    )
+
     return VersionBundle(
         HeadVersion(),
+        Version(
+            "2026-10-18",
+            AddParsingResultFingerprint,
+            AddParsingResultImportedModules,
+            AddSetXComValueInFile,
+        ),
         Version("2026-06-16"),
     )
 
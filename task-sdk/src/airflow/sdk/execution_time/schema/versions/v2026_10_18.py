@@ -0,0 +1,53 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from __future__ import annotations
+
+from cadwyn import VersionChange, schema
+
+from airflow.dag_processing.processor import DagFileParsingResult
+from airflow.sdk.execution_time.comms import SetXCom
+
+
+class AddParsingResultFingerprint(VersionChange):
+    """Add the fingerprint of a parsing result, and the hash of each of its serialized Dags."""
+
+    description = __doc__
+
+    # ``LazyDeserializedDAG.dag_hash`` is added too, but Cadwyn cannot generate versions of that model.
+    # It is optional, so a runtime of an older version leaving it out is not affected.
+    instructions_to_migrate_to_previous_version = (
+        schema(DagFileParsingResult).field("fingerprint").didnt_exist,
+    )
+
+
+class AddParsingResultImportedModules(VersionChange):
+    """Add the bundle modules a Dag file imported to its parsing result."""
+
+    description = __doc__
+
+    instructions_to_migrate_to_previous_version = (
+        schema(DagFileParsingResult).field("imported_modules").didnt_exist,
+    )
+
+
+class AddSetXComValueInFile(VersionChange):
+    """Allow a large XCom value to be passed to the supervisor in a file instead of in the request."""
+
+    description = __doc__
+
+    instructions_to_migrate_to_previous_version = (schema(SetXCom).field("value_in_file").didnt_exist,)
@@ -22,6 +22,7 @@ from __future__ import annotations
 import atexit
 import contextlib
 import functools
+import importlib
 import io
 import logging
 import os
@@ -34,6 +35,7 @@ import time
 import weakref
 from collections import deque
 from collections.abc import Callable, Generator
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from contextlib import contextmanager, suppress
 from datetime import datetime, timezone
 from http import HTTPStatus
@@ -49,8 +51,10 @@ import psutil
 import structlog
 from pydantic import BaseModel, TypeAdapter
 
+from airflow.sdk._shared.logging.remote import RemoteLogAppendIO
 from airflow.sdk._shared.logging.structlog import reconfigure_logger
-from airflow.sdk.api.client import Client, ServerResponseError
+from airflow.sdk._shared.observability.metrics import stats
+from airflow.sdk.api.client import BearerAuth, Client, ServerResponseError
 from airflow.sdk.api.datamodels._generated import (
     AssetResponse,
     ConnectionResponse,
@@ -102,6 +106,7 @@ from airflow.sdk.execution_time.comms import (
     GetVariable,
     GetVariableKeys,
     GetXCom,
+    GetXComBatch,
     GetXComCount,
     GetXComSequenceItem,
     GetXComSequenceSlice,
@@ -129,10 +134,12 @@ from airflow.sdk.execution_time.comms import (
     ToSupervisor,
     TriggerDagRun,
     ValidateInletsAndOutlets,
+    VariableResult,
     _RequestFrame,
     _ResponseFrame,
 )
 from airflow.sdk.execution_time.coordinator import get_coordinator_manager
+from airflow.sdk.execution_time.heartbeat import HeartbeatRelay, get_heartbeat_relay
 from airflow.sdk.execution_time.request_handlers import (
     handle_delete_variable,
     handle_delete_xcom,
@@ -147,6 +154,7 @@ from airflow.sdk.execution_time.request_handlers import (
     handle_get_variable,
     handle_get_variable_keys,
     handle_get_xcom,
+    handle_get_xcom_batch,
     handle_get_xcom_count,
     handle_get_xcom_sequence_item,
     handle_get_xcom_sequence_slice,
@@ -157,8 +165,9 @@ from airflow.sdk.execution_time.request_handlers import (
 from airflow.sdk.execution_time.schema import get_schema_version_migrator, resolve_body_class
 
 try:
-    from socket import send_fds
+    from socket import recv_fds, send_fds
 except ImportError:
+    recv_fds = None  # type: ignore[assignment]
     send_fds = None  # type: ignore[assignment]
 
 from opentelemetry import context as otel_context, trace
@@ -186,6 +195,12 @@ MAX_FAILED_HEARTBEATS: int = conf.getint("workers", "max_failed_heartbeats")
 
 SOCKET_CLEANUP_TIMEOUT: float = conf.getfloat("workers", "socket_cleanup_timeout")
 
+CONNECTION_VARIABLE_CACHE_TTL: float = conf.getfloat("workers", "connection_variable_cache_ttl", fallback=0)
+
+REMOTE_LOG_UPLOAD_INTERVAL: float = conf.getfloat("logging", "remote_log_upload_interval", fallback=0)
+REMOTE_LOG_UPLOAD_CHUNK_SIZE: int = conf.getint("logging", "remote_log_upload_chunk_size", fallback=0) << 20
+REMOTE_LOG_MAX_LOCAL_SIZE: int = conf.getint("logging", "remote_log_max_local_size", fallback=0) << 20
+
 # Maximum possible time (in seconds) that task will have for execution of auxiliary processes
 # like listeners after task is complete.
 TASK_OVERTIME_THRESHOLD: float = conf.getfloat("core", "task_success_overtime")
@@ -517,6 +532,36 @@ def _should_use_exec() -> bool:
     return sys.platform in _FORK_EXEC_PLATFORMS
 
 
+def preload_task_modules() -> None:
+    """
+    Import the task runner and ``[workers] task_preload_modules`` in a process that goes on to supervise tasks.
+
+    Task processes are forked from their supervisor, so when it runs many tasks one after another (as
+    ``LocalExecutor`` workers do) they inherit the modules, copy-on-write, instead of each importing them
+    again. Task processes started in a fresh interpreter (see ``_should_use_exec``) would not benefit, so
+    nothing is imported then.
+    """
+    if _should_use_exec():
+        log.info("Not preloading modules, as task processes do not fork from this process")
+        return
+    configured = conf.get("workers", "task_preload_modules", fallback="") or ""
+    modules = [
+        "airflow.sdk.execution_time.task_runner",
+        *(module.strip() for module in configured.split(",") if module.strip()),
+    ]
+    start = time.monotonic()
+    for module in modules:
+        try:
+            importlib.import_module(module)
+        except Exception:
+            log.exception("Failed to preload module for the task processes", module=module)
+    log.info(
+        "Preloaded modules for the task processes",
+        modules=len(modules),
+        duration_ms=round((time.monotonic() - start) * 1000, 2),
+    )
+
+
 def _resolve_child_target(dotted: str) -> Callable[[], None]:
     """
     Resolve a ``module:qualname`` string to the callable the exec'd child runs.
@@ -661,6 +706,8 @@ class WatchedSubprocess:
     _open_sockets: weakref.WeakKeyDictionary[socket, str] = attrs.field(
         factory=weakref.WeakKeyDictionary, init=False
     )
+    _request_fds: list[int] = attrs.field(factory=list, init=False, repr=False)
+    """File descriptors the subprocess passed along with the request currently being handled."""
 
     selector: selectors.BaseSelector = attrs.field(factory=selectors.DefaultSelector, repr=False)
 
@@ -869,7 +916,9 @@ class WatchedSubprocess:
         self.selector.register(
             requests,
             selectors.EVENT_READ,
-            length_prefixed_frame_reader(self.handle_requests(log), on_close=self._on_socket_closed),
+            length_prefixed_frame_reader(
+                self.handle_requests(log), on_close=self._on_socket_closed, on_fds=self._request_fds.extend
+            ),
         )
 
     def _get_target_loggers(self) -> tuple[FilteringBoundLogger, ...]:
@@ -950,6 +999,7 @@ class WatchedSubprocess:
                 msg = self.decoder.validate_python(self._deserialize_request(request.body))
             except Exception:
                 log.exception("Unable to decode message", body=request.body)
+                self._close_request_fds()
                 continue
 
             # Restore the task runner's trace context so that any outbound HTTP calls made while
@@ -1007,10 +1057,16 @@ class WatchedSubprocess:
             finally:
                 if token is not None:
                     otel_context.detach(token)
+                self._close_request_fds()
 
     def _handle_request(self, msg, log: FilteringBoundLogger, req_id: int) -> None:
         raise NotImplementedError()
 
+    def _close_request_fds(self) -> None:
+        """Close the fds passed with a request that its handler didn't take ownership of."""
+        while self._request_fds:
+            os.close(self._request_fds.pop())
+
     @staticmethod
     def _close_unused_sockets(*sockets):
         """Close unused ends of sockets after fork."""
@@ -1358,6 +1414,160 @@ def _remote_logging_conn(client: Client):
         del client
 
 
+@attrs.define
+class _ConnectionVariableCache:
+    """
+    Read-through cache of the connections and variables a task fetches through its supervisor.
+
+    Rendering templates, or calling ``Variable.get`` in a loop, asks for the same values over and over; they
+    are served from here for ``[workers] connection_variable_cache_ttl`` seconds instead of being fetched from
+    the API server every time. Variables changed by the task itself are dropped from the cache.
+    """
+
+    ttl: float
+    _entries: dict[tuple[str, str], tuple[float, BaseModel, dict[str, bool]]] = attrs.field(
+        factory=dict, init=False
+    )
+
+    @classmethod
+    def from_config(cls) -> _ConnectionVariableCache | None:
+        if CONNECTION_VARIABLE_CACHE_TTL <= 0:
+            return None
+        return cls(ttl=CONNECTION_VARIABLE_CACHE_TTL)
+
+    def get_or_fetch(
+        self, kind: str, key: str, fetch: Callable[[], tuple[BaseModel | None, dict[str, bool]]]
+    ) -> tuple[BaseModel | None, dict[str, bool]]:
+        now = time.monotonic()
+        entry = self._entries.get((kind, key))
+        if entry is not None and now < entry[0]:
+            stats.incr("task_supervisor.connection_variable_cache.hit", tags={"kind": kind})
+            return entry[1], entry[2]
+
+        stats.incr("task_supervisor.connection_variable_cache.miss", tags={"kind": kind})
+        resp, dump_opts = fetch()
+        # Errors, e.g. not found, are not cached
+        if isinstance(resp, (ConnectionResult, VariableResult)):
+            self._entries[kind, key] = (now + self.ttl, resp, dump_opts)
+        return resp, dump_opts
+
+    def invalidate(self, kind: str, key: str) -> None:
+        self._entries.pop((kind, key), None)
+
+
+@attrs.define
+class _RemoteLogUploader:
+    """
+    Upload the log of a running task to the remote storage bit by bit, instead of all at once when it ends.
+
+    A background thread adds the lines written to the local log file since the last upload to the remote log,
+    every ``[logging] remote_log_upload_interval`` seconds or once they add up to ``[logging]
+    remote_log_upload_chunk_size`` MiB, and they are then removed from the local file. Lines are only ever
+    written to the file, whole, from the supervisor's main thread, which also does the removal: the lines
+    written while an upload is in progress are simply kept for the next one. Whatever is left when the task
+    ends is uploaded as before.
+    """
+
+    handler: RemoteLogAppendIO
+    relative_path: str
+    local_path: str
+    client: Client
+    ti: RuntimeTI | None
+    _executor: ThreadPoolExecutor = attrs.field(
+        factory=lambda: ThreadPoolExecutor(max_workers=1, thread_name_prefix="remote-log-upload"), init=False
+    )
+    _upload: Future[bool] | None = attrs.field(default=None, init=False)
+    _upload_size: int = attrs.field(default=0, init=False)
+    _last_upload: float = attrs.field(factory=time.monotonic, init=False)
+
+    @classmethod
+    def from_logger(
+        cls, logger: FilteringBoundLogger, client: Client, ti: RuntimeTI | None
+    ) -> _RemoteLogUploader | None:
+        if REMOTE_LOG_UPLOAD_INTERVAL <= 0 and REMOTE_LOG_UPLOAD_CHUNK_SIZE <= 0:
+            return None
+        from airflow.sdk.log import load_remote_log_handler, relative_path_from_logger
+
+        handler = load_remote_log_handler()
+        if not isinstance(handler, RemoteLogAppendIO):
+            return None
+        raw_logger = getattr(logger, "_logger", None)
+        try:
+            relative_path = relative_path_from_logger(raw_logger)
+        except Exception:
+            return None
+        if not relative_path:
+            return None
+        return cls(
+            handler=handler,
+            relative_path=relative_path.as_posix(),
+            local_path=raw_logger._file.name,  # type: ignore[union-attr]
+            client=client,
+            ti=ti,
+        )
+
+    def maybe_upload(self) -> None:
+        """Collect the upload in progress if it is done, and start the next one if it is due."""
+        if self._upload is not None:
+            if (
+                not self._upload.done()
+                and REMOTE_LOG_MAX_LOCAL_SIZE
+                and self._local_size() > REMOTE_LOG_MAX_LOCAL_SIZE
+            ):
+                # Hold off reading the output of the task for a while, so that it waits for the upload to
+                # catch up instead of filling the disk
+                wait([self._upload], timeout=MIN_HEARTBEAT_INTERVAL)
+            if not self._upload.done():
+                return
+            self._collect_upload()
+
+        size = self._local_size()
+        if not size:
+            return
+        if (REMOTE_LOG_UPLOAD_CHUNK_SIZE and size >= REMOTE_LOG_UPLOAD_CHUNK_SIZE) or (
+            REMOTE_LOG_UPLOAD_INTERVAL > 0
+            and time.monotonic() - self._last_upload >= REMOTE_LOG_UPLOAD_INTERVAL
+        ):
+            self._upload_size = size
+            self._upload = self._executor.submit(self._append, size)
+
+    def close(self) -> None:
+        """Wait for the upload in progress, so that the rest of the log can be uploaded after it."""
+        if self._upload is not None:
+            wait([self._upload])
+            self._collect_upload()
+        self._executor.shutdown()
+
+    def _local_size(self) -> int:
+        try:
+            return os.stat(self.local_path).st_size
+        except OSError:
+            return 0
+
+    def _append(self, size: int) -> bool:
+        with open(self.local_path, "rb") as f:
+            lines = f.read(size)
+        with _remote_logging_conn(self.client):
+            return self.handler.append(self.relative_path, lines.decode(errors="replace"), self.ti)
+
+    def _collect_upload(self) -> None:
+        upload, self._upload = self._upload, None
+        self._last_upload = time.monotonic()
+        try:
+            if not upload or not upload.result():
+                # Keep the lines, to upload them with the next ones
+                return
+        except Exception:
+            log.exception("Failed to upload remote logs of the running task", path=self.relative_path)
+            return
+        with open(self.local_path, "r+b") as f:
+            f.seek(self._upload_size)
+            rest = f.read()
+            f.seek(0)
+            f.write(rest)
+            f.truncate()
+
+
 @attrs.define(kw_only=True)
 class ActivitySubprocess(WatchedSubprocess):
     client: Client
@@ -1380,6 +1590,8 @@ class ActivitySubprocess(WatchedSubprocess):
 
     _last_successful_heartbeat: float = attrs.field(default=0, init=False)
     _last_heartbeat_attempt: float = attrs.field(default=0, init=False)
+    # Whether a heartbeat handed to the heartbeat relay is still waiting for its outcome
+    _relayed_heartbeat_pending: bool = attrs.field(default=False, init=False)
 
     _should_retry: bool = attrs.field(default=False, init=False)
     """Whether the task should retry or not as decided by the API server."""
@@ -1392,6 +1604,11 @@ class ActivitySubprocess(WatchedSubprocess):
     _task_end_time_monotonic: float | None = attrs.field(default=None, init=False)
     _rendered_map_index: str | None = attrs.field(default=None, init=False)
 
+    _connection_variable_cache: _ConnectionVariableCache | None = attrs.field(
+        factory=_ConnectionVariableCache.from_config, init=False
+    )
+    _remote_log_uploader: _RemoteLogUploader | None = attrs.field(default=None, init=False)
+
     decoder: ClassVar[TypeAdapter[ToSupervisor]] = TypeAdapter(ToSupervisor)
 
     ti: RuntimeTI | None = None
@@ -1482,10 +1699,13 @@ class ActivitySubprocess(WatchedSubprocess):
         if self._exit_code is not None:
             return self._exit_code
 
+        self._remote_log_uploader = _RemoteLogUploader.from_logger(self.process_log, self.client, self.ti)
         try:
             self._monitor_subprocess()
         finally:
             self.selector.close()
+            if self._remote_log_uploader is not None:
+                self._remote_log_uploader.close()
 
         # self._monitor_subprocess() will set the exit code when the process has finished
         # If it hasn't, assume it's failed
@@ -1625,6 +1845,9 @@ class ActivitySubprocess(WatchedSubprocess):
             # This listens for activity (e.g., subprocess output) on registered file objects
             alive = self._service_subprocess(max_wait_time=max_wait_time) is None
 
+            if self._remote_log_uploader is not None:
+                self._remote_log_uploader.maybe_upload()
+
             if self._exit_code is not None and self._open_sockets:
                 if (
                     self._process_exit_monotonic
@@ -1666,6 +1889,10 @@ class ActivitySubprocess(WatchedSubprocess):
 
     def _send_heartbeat_if_needed(self):
         """Send a heartbeat to the client if heartbeat interval has passed."""
+        relay = get_heartbeat_relay()
+        if relay is not None:
+            self._receive_relayed_heartbeats(relay)
+
         # Respect the minimum interval between heartbeat attempts
         if (time.monotonic() - self._last_heartbeat_attempt) < MIN_HEARTBEAT_INTERVAL:
             return
@@ -1676,6 +1903,9 @@ class ActivitySubprocess(WatchedSubprocess):
             return
 
         self._last_heartbeat_attempt = time.monotonic()
+        if relay is not None:
+            self._relay_heartbeat(relay)
+            return
         try:
             self.client.task_instances.heartbeat(self.id, pid=self._process.pid)
             # Update the last heartbeat time on success
@@ -1685,25 +1915,66 @@ class ActivitySubprocess(WatchedSubprocess):
             self.failed_heartbeats = 0
         except ServerResponseError as e:
             if e.response.status_code in {HTTPStatus.NOT_FOUND, HTTPStatus.GONE, HTTPStatus.CONFLICT}:
-                log.error(
-                    "Server indicated the task shouldn't be running anymore",
-                    detail=e.detail,
-                    status_code=e.response.status_code,
-                    ti_id=self.id,
-                )
-                self.process_log.error(
-                    "Server indicated the task shouldn't be running anymore. Terminating process",
-                    detail=e.detail,
-                )
-                self.kill(signal.SIGTERM, force=True)
-                self.process_log.error("Task killed!")
-                self._terminal_state = SERVER_TERMINATED
+                self._terminate_on_server_request(e.detail, e.response.status_code)
             else:
                 # If we get any other error, we'll just log it and try again next time
                 self._handle_heartbeat_failures(e)
         except Exception as e:
             self._handle_heartbeat_failures(e)
 
+    def _relay_heartbeat(self, relay: HeartbeatRelay):
+        """Hand a heartbeat to the heartbeat relay, to be sent with the next batch of the executor."""
+        if self._relayed_heartbeat_pending:
+            # The previous heartbeat was never answered, so the aggregator is stuck or gone
+            self._handle_heartbeat_failures(RuntimeError("No outcome received for the previous heartbeat"))
+        token = self.client.auth.token if isinstance(self.client.auth, BearerAuth) else ""
+        try:
+            relay.submit(self.id, pid=self._process.pid, token=token)
+        except OSError as e:
+            self._handle_heartbeat_failures(e)
+            return
+        self._relayed_heartbeat_pending = True
+
+    def _receive_relayed_heartbeats(self, relay: HeartbeatRelay):
+        """Act on the outcomes of the heartbeats sent through the heartbeat relay."""
+        try:
+            outcomes = relay.poll()
+        except (EOFError, OSError):
+            # Nothing more will come; the next heartbeat counts the missing outcome as a failure.
+            return
+        for outcome in outcomes:
+            if outcome.ti_id != self.id:
+                # Left over from a task this process supervised before
+                continue
+            self._relayed_heartbeat_pending = False
+            if outcome.refreshed_token:
+                self.client.auth = BearerAuth(outcome.refreshed_token)
+            if outcome.status_code == HTTPStatus.OK:
+                self._last_successful_heartbeat = time.monotonic()
+                self.failed_heartbeats = 0
+            elif outcome.status_code in {HTTPStatus.NOT_FOUND, HTTPStatus.GONE, HTTPStatus.CONFLICT}:
+                self._terminate_on_server_request(outcome.detail, outcome.status_code)
+            else:
+                self._handle_heartbeat_failures(
+                    RuntimeError(f"Batch heartbeat failed ({outcome.status_code}): {outcome.detail}")
+                )
+
+    def _terminate_on_server_request(self, detail: Any, status_code: int):
+        """Kill the task process because the server indicated the task shouldn't be running anymore."""
+        log.error(
+            "Server indicated the task shouldn't be running anymore",
+            detail=detail,
+            status_code=status_code,
+            ti_id=self.id,
+        )
+        self.process_log.error(
+            "Server indicated the task shouldn't be running anymore. Terminating process",
+            detail=detail,
+        )
+        self.kill(signal.SIGTERM, force=True)
+        self.process_log.error("Task killed!")
+        self._terminal_state = SERVER_TERMINATED
+
     def _handle_heartbeat_failures(self, exc: Exception):
         """Increment the failed heartbeats counter and kill the process if too many failures."""
         self.failed_heartbeats += 1
@@ -1770,13 +2041,25 @@ class ActivitySubprocess(WatchedSubprocess):
             self._rendered_map_index = msg.rendered_map_index
             self._send_terminal_state_msg(msg)
         elif isinstance(msg, GetConnection):
-            resp, dump_opts = handle_get_connection(self.client, msg)
+            if self._connection_variable_cache is not None:
+                resp, dump_opts = self._connection_variable_cache.get_or_fetch(
+                    "connection", msg.conn_id, functools.partial(handle_get_connection, self.client, msg)
+                )
+            else:
+                resp, dump_opts = handle_get_connection(self.client, msg)
         elif isinstance(msg, GetVariable):
-            resp, dump_opts = handle_get_variable(self.client, msg)
+            if self._connection_variable_cache is not None:
+                resp, dump_opts = self._connection_variable_cache.get_or_fetch(
+                    "variable", msg.key, functools.partial(handle_get_variable, self.client, msg)
+                )
+            else:
+                resp, dump_opts = handle_get_variable(self.client, msg)
         elif isinstance(msg, GetVariableKeys):
             resp, dump_opts = handle_get_variable_keys(self.client, msg)
         elif isinstance(msg, GetXCom):
             resp, dump_opts = handle_get_xcom(self.client, msg)
+        elif isinstance(msg, GetXComBatch):
+            resp, dump_opts = handle_get_xcom_batch(self.client, msg)
         elif isinstance(msg, GetXComSequenceItem):
             resp, dump_opts = handle_get_xcom_sequence_item(self.client, msg)
         elif isinstance(msg, GetXComSequenceSlice):
@@ -1792,10 +2075,12 @@ class ActivitySubprocess(WatchedSubprocess):
         elif isinstance(msg, SkipDownstreamTasks):
             self.client.task_instances.skip_downstream_tasks(self.id, msg)
         elif isinstance(msg, SetXCom):
-            resp, dump_opts = handle_set_xcom(self.client, msg)
+            resp, dump_opts = handle_set_xcom(self.client, msg, self._request_fds)
         elif isinstance(msg, DeleteXCom):
             resp, dump_opts = handle_delete_xcom(self.client, msg)
         elif isinstance(msg, PutVariable):
+            if self._connection_variable_cache is not None:
+                self._connection_variable_cache.invalidate("variable", msg.key)
             resp, dump_opts = handle_put_variable(self.client, msg)
         elif isinstance(msg, SetRenderedFields):
             try:
@@ -1885,6 +2170,8 @@ class ActivitySubprocess(WatchedSubprocess):
         elif isinstance(msg, GetPreviousTI):
             resp, dump_opts = handle_get_previous_ti(self.client, msg)
         elif isinstance(msg, DeleteVariable):
+            if self._connection_variable_cache is not None:
+                self._connection_variable_cache.invalidate("variable", msg.key)
             resp, dump_opts = handle_delete_variable(self.client, msg)
         elif isinstance(msg, ValidateInletsAndOutlets):
             inactive_assets_resp = self.client.task_instances.validate_inlets_and_outlets(msg.ti_id)
@@ -2033,6 +2320,9 @@ class InProcessSupervisorComms:
 
         return self._get_response()
 
+    def flush(self) -> None:
+        """Wait for the responses of pipelined requests; requests are never pipelined in process."""
+
 
 @attrs.define
 class TaskRunResult:
@@ -2080,7 +2370,9 @@ class InProcessTestSupervisor(ActivitySubprocess):
         self.selector.register(
             requests,
             selectors.EVENT_READ,
-            length_prefixed_frame_reader(self.handle_requests(log), on_close=self._on_socket_closed),
+            length_prefixed_frame_reader(
+                self.handle_requests(log), on_close=self._on_socket_closed, on_fds=self._request_fds.extend
+            ),
         )
         os.set_inheritable(child_sock.fileno(), True)
         os.environ["__AIRFLOW_SUPERVISOR_FD"] = str(child_sock.fileno())
@@ -2332,8 +2624,16 @@ def make_buffered_socket_reader(
 
 
 def length_prefixed_frame_reader(
-    gen: Generator[None, _RequestFrame, None], on_close: Callable[[socket], None]
+    gen: Generator[None, _RequestFrame, None],
+    on_close: Callable[[socket], None],
+    on_fds: Callable[[list[int]], None] | None = None,
 ):
+    """
+    Read length-prefixed request frames from the socket and send them to ``gen``.
+
+    :param on_fds: Called with any file descriptors the sender passed along with a frame, before the frame is
+        sent to ``gen``. The fds are received with the length prefix, and the receiver owns them.
+    """
     length_needed: int | None = None
     # This will hold our accumulated/partial binary frame if it doesn't come in a single read
     buffer: memoryview | None = None
@@ -2349,7 +2649,14 @@ def length_prefixed_frame_reader(
 
         if length_needed is None:
             # Read the 32bit length of the frame
-            bytes = sock.recv(4)
+            if on_fds is not None and recv_fds is not None:
+                # A request carries at most one fd (the file holding a large XCom value), the kernel discards
+                # any others the sender tries to pass
+                bytes, fds, _, _ = recv_fds(sock, 4, 1)
+                if fds:
+                    on_fds(fds)
+            else:
+                bytes = sock.recv(4)
             if bytes == b"":
                 return False
 
@@ -2538,6 +2845,13 @@ def supervise_task(
     _make_process_nondumpable()
 
     from airflow.sdk._shared.secrets_masker import reset_secrets_masker
+    from airflow.sdk.observability.metrics import stats_utils
+
+    # For the metrics of the supervisor itself, e.g. of its API client and connection and variable cache
+    stats.initialize(
+        factory=stats_utils.get_stats_factory(),
+        export_legacy_names=conf.getboolean("metrics", "legacy_names_on"),
+    )
 
     if not client:
         if dry_run and server:
@@ -84,6 +84,7 @@ from airflow.sdk.exceptions import (
     TaskAwaitingInput,
     TaskDeferred,
 )
+from airflow.sdk.execution_time import dag_cache
 from airflow.sdk.execution_time.callback_runner import create_executable_runner
 from airflow.sdk.execution_time.comms import (
     AssetEventDagRunReferenceResult,
@@ -158,6 +159,7 @@ if TYPE_CHECKING:
     from pendulum.datetime import DateTime
     from structlog.typing import FilteringBoundLogger as Logger
 
+    from airflow.sdk import DAG
     from airflow.sdk.definitions._internal.abstractoperator import AbstractOperator
     from airflow.sdk.definitions.context import Context
     from airflow.sdk.definitions.retry_policy import RetryDecision
@@ -227,6 +229,21 @@ class TaskRunnerMarker:
     """Marker for listener hooks, to properly detect from which component they are called."""
 
 
+def _pulls_xcoms_in_batch(get: Callable, base_get: Callable, num_requests: int) -> bool:
+    """
+    Whether ``xcom_pull`` should fetch several XComs in one request rather than one by one.
+
+    An XCom backend that overrides ``get_one`` or ``get_all`` (or their async versions) keeps being
+    called once per XCom, or once per task.
+    """
+    func = getattr(get, "__func__", None)
+    return num_requests > 1 and func is not None and func is getattr(base_get, "__func__", None)
+
+
+def _unmapped_as_minus_one(map_index: int | None) -> int:
+    return -1 if map_index is None else map_index
+
+
 # TODO: Move this entire class into a separate file:
 #  `airflow/sdk/execution_time/task_instance.py`
 #   or `airflow/sdk/execution_time/runtime_ti.py`
@@ -554,30 +571,56 @@ class RuntimeTaskInstance(TaskInstance):
 
         if not is_arg_set(map_indexes_iterable):
             # map_indexes was not specified — fetch all map indexes for each task
-            for t_id in task_ids:
-                values = XCom.get_all(
-                    run_id=run_id,
+            if _pulls_xcoms_in_batch(XCom.get_all, BaseXCom.get_all, len(task_ids)):
+                values_by_task = XCom.get_all_batch(
                     key=key,
-                    task_id=t_id,
                     dag_id=dag_id,
+                    run_id=run_id,
+                    task_ids=task_ids,
                     include_prior_dates=include_prior_dates,
                 )
-                xcoms.append(None) if values is None else xcoms.extend(values)
+                for t_id in task_ids:
+                    xcoms.extend(values_by_task.get(t_id, [None]))
+            else:
+                for t_id in task_ids:
+                    values = XCom.get_all(
+                        run_id=run_id,
+                        key=key,
+                        task_id=t_id,
+                        dag_id=dag_id,
+                        include_prior_dates=include_prior_dates,
+                    )
+                    xcoms.append(None) if values is None else xcoms.extend(values)
             # For a single task pulling from an unmapped task, return a single value
             if single_task_requested and len(xcoms) == 1:
                 return xcoms[0]
             return xcoms
 
-        for t_id, m_idx in product(task_ids, map_indexes_iterable):
-            value = XCom.get_one(
-                run_id=run_id,
+        map_indexes_list = list(map_indexes_iterable)
+        if _pulls_xcoms_in_batch(XCom.get_one, BaseXCom.get_one, len(task_ids) * len(map_indexes_list)):
+            values = XCom.get_batch(
                 key=key,
-                task_id=t_id,
                 dag_id=dag_id,
-                map_index=m_idx,
+                run_id=run_id,
+                task_ids=task_ids,
+                map_indexes=[_unmapped_as_minus_one(m_idx) for m_idx in map_indexes_list],
                 include_prior_dates=include_prior_dates,
             )
-            xcoms.append(default if value is None else value)
+            xcoms = [
+                values.get((t_id, _unmapped_as_minus_one(m_idx)), default)
+                for t_id, m_idx in product(task_ids, map_indexes_list)
+            ]
+        else:
+            for t_id, m_idx in product(task_ids, map_indexes_list):
+                value = XCom.get_one(
+                    run_id=run_id,
+                    key=key,
+                    task_id=t_id,
+                    dag_id=dag_id,
+                    map_index=m_idx,
+                    include_prior_dates=include_prior_dates,
+                )
+                xcoms.append(default if value is None else value)
 
         if single_task_requested and single_map_index_requested:
             return xcoms[0]
@@ -603,30 +646,56 @@ class RuntimeTaskInstance(TaskInstance):
 
         if not is_arg_set(map_indexes_iterable):
             # map_indexes was not specified — fetch all map indexes for each task
-            for t_id in task_ids:
-                values = await XCom.aget_all(
-                    run_id=run_id,
+            if _pulls_xcoms_in_batch(XCom.aget_all, BaseXCom.aget_all, len(task_ids)):
+                values_by_task = await XCom.aget_all_batch(
                     key=key,
-                    task_id=t_id,
                     dag_id=dag_id,
+                    run_id=run_id,
+                    task_ids=task_ids,
                     include_prior_dates=include_prior_dates,
                 )
-                xcoms.append(None) if values is None else xcoms.extend(values)
+                for t_id in task_ids:
+                    xcoms.extend(values_by_task.get(t_id, [None]))
+            else:
+                for t_id in task_ids:
+                    values = await XCom.aget_all(
+                        run_id=run_id,
+                        key=key,
+                        task_id=t_id,
+                        dag_id=dag_id,
+                        include_prior_dates=include_prior_dates,
+                    )
+                    xcoms.append(None) if values is None else xcoms.extend(values)
             # For a single task pulling from an unmapped task, return a single value
             if single_task_requested and len(xcoms) == 1:
                 return xcoms[0]
             return xcoms
 
-        for t_id, m_idx in product(task_ids, map_indexes_iterable):
-            value = await XCom.aget_one(
-                run_id=run_id,
+        map_indexes_list = list(map_indexes_iterable)
+        if _pulls_xcoms_in_batch(XCom.aget_one, BaseXCom.aget_one, len(task_ids) * len(map_indexes_list)):
+            values = await XCom.aget_batch(
                 key=key,
-                task_id=t_id,
                 dag_id=dag_id,
-                map_index=m_idx,
+                run_id=run_id,
+                task_ids=task_ids,
+                map_indexes=[_unmapped_as_minus_one(m_idx) for m_idx in map_indexes_list],
                 include_prior_dates=include_prior_dates,
             )
-            xcoms.append(default if value is None else value)
+            xcoms = [
+                values.get((t_id, _unmapped_as_minus_one(m_idx)), default)
+                for t_id, m_idx in product(task_ids, map_indexes_list)
+            ]
+        else:
+            for t_id, m_idx in product(task_ids, map_indexes_list):
+                value = await XCom.aget_one(
+                    run_id=run_id,
+                    key=key,
+                    task_id=t_id,
+                    dag_id=dag_id,
+                    map_index=m_idx,
+                    include_prior_dates=include_prior_dates,
+                )
+                xcoms.append(default if value is None else value)
 
         if single_task_requested and single_map_index_requested:
             return xcoms[0]
@@ -1012,12 +1081,53 @@ def _register_deserialization_allowed_classes(dag, log: Logger) -> None:
                     )
 
 
-@detail_span("parse")
-def parse(what: StartupDetails, log: Logger) -> RuntimeTaskInstance:
+def _load_dags(
+    what: StartupDetails, bundle_instance: BaseDagBundle, dag_absolute_path: str, log: Logger
+) -> tuple[dict[str, DAG], bool]:
+    """
+    Load the DAGs of the task's file, and whether they came from the parsed DAG cache.
+
+    The DAG file is parsed when the cache is disabled for the bundle, or has no usable entry for the file.
+    """
     # TODO: Task-SDK:
     # Using BundleDagBag here is about 98% wrong, but it'll do for now
     from airflow.dag_processing.dagbag import BundleDagBag
 
+    cache_entry = None
+    cache_folder = conf.get("workers", "parsed_dag_cache_folder", fallback="")
+    if (
+        cache_folder
+        and what.bundle_info.name in conf.getlist("workers", "parsed_dag_cache_bundles", fallback=[])
+        and dag_cache.check_folder(cache_folder, log)
+    ):
+        try:
+            cache_entry = dag_cache.entry_path(
+                cache_folder, what.bundle_info.name, what.bundle_info.version, dag_absolute_path
+            )
+        except OSError:
+            # Left to the parse to report
+            pass
+        else:
+            dags = dag_cache.load_dags(cache_entry, bundle_instance.path, log)
+            if dags is not None and what.ti.dag_id in dags:
+                return dags, True
+
+    bag = BundleDagBag(
+        dag_folder=dag_absolute_path,
+        safe_mode=False,
+        load_op_links=False,
+        bundle_path=bundle_instance.path,
+        bundle_name=what.bundle_info.name,
+    )
+    if cache_entry is not None and not bag.import_errors and what.ti.dag_id in bag.dags:
+        dag_cache.store_dags(cache_entry, bag.dags, dag_absolute_path, bundle_instance.path, log)
+        if (max_age := conf.getint("workers", "parsed_dag_cache_max_age", fallback=0)) > 0:
+            dag_cache.prune(cache_folder, max_age, log)
+    return bag.dags, False
+
+
+@detail_span("parse")
+def parse(what: StartupDetails, log: Logger) -> RuntimeTaskInstance:
     bundle_info = what.bundle_info
     bundle_prepare_start = time.monotonic()
     bundle_instance = DagBundlesManager().get_bundle(
@@ -1031,19 +1141,13 @@ def parse(what: StartupDetails, log: Logger) -> RuntimeTaskInstance:
 
     dag_absolute_path = os.fspath(Path(bundle_instance.path, what.dag_rel_path))
     dag_file_parse_start = time.monotonic()
-    bag = BundleDagBag(
-        dag_folder=dag_absolute_path,
-        safe_mode=False,
-        load_op_links=False,
-        bundle_path=bundle_instance.path,
-        bundle_name=bundle_info.name,
-    )
+    dags, dags_from_cache = _load_dags(what, bundle_instance, dag_absolute_path, log)
     dag_file_parse_ms = int((time.monotonic() - dag_file_parse_start) * 1000)
     if TYPE_CHECKING:
         assert what.ti.dag_id
 
     try:
-        dag = bag.dags[what.ti.dag_id]
+        dag = dags[what.ti.dag_id]
     except KeyError:
         log.error(
             "Dag not found during start up", dag_id=what.ti.dag_id, bundle=bundle_info, path=what.dag_rel_path
@@ -1090,6 +1194,7 @@ def parse(what: StartupDetails, log: Logger) -> RuntimeTaskInstance:
         dag_id=what.ti.dag_id,
         bundle_prepare_ms=bundle_prepare_ms,
         dag_file_parse_ms=dag_file_parse_ms,
+        dags_from_cache=dags_from_cache,
     )
     return RuntimeTaskInstance.model_construct(
         **what.ti.model_dump(exclude_unset=True),
@@ -1611,25 +1716,34 @@ def _run_task_and_map_outcome(
                     SUPERVISOR_COMMS.send(msg=SetRenderedMapIndex(rendered_map_index=ti.rendered_map_index))
 
         _push_xcom_if_needed(result, ti, log)
+        # Fail the task if one of the requests it did not wait for, such as pushing an XCom, failed. The
+        # outcomes below that do not fail the task check the same before acting on it; an error raised from
+        # their handler fails the task in run().
+        SUPERVISOR_COMMS.flush()
 
         msg, state = _handle_current_task_success(context, ti)
     except DownstreamTasksSkipped as skip:
         log.info("::group::Post Execute")
         log.info("Skipping downstream tasks.")
         tasks_to_skip = skip.tasks if isinstance(skip.tasks, list) else [skip.tasks]
+        SUPERVISOR_COMMS.flush()
         SUPERVISOR_COMMS.send(msg=SkipDownstreamTasks(tasks=tasks_to_skip))
         msg, state = _handle_current_task_success(context, ti)
     except DagRunTriggerException as drte:
         log.info("::group::Post Execute")
+        SUPERVISOR_COMMS.flush()
         msg, state = _handle_trigger_dag_run(drte, context, ti, log)
     except TaskDeferred as defer:
         log.info("::group::Post Execute")
+        SUPERVISOR_COMMS.flush()
         msg, state = _defer_task(defer, ti, log)
     except TaskAwaitingInput as awaiting:
         log.info("::group::Post Execute")
+        SUPERVISOR_COMMS.flush()
         msg, state = _await_input_task(awaiting, ti, log)
     except AirflowSkipException as e:
         log.info("::group::Post Execute")
+        SUPERVISOR_COMMS.flush()
         if e.args:
             log.info("Skipping task.", reason=e.args[0])
         msg = TaskState(
@@ -1640,6 +1754,7 @@ def _run_task_and_map_outcome(
         state = TaskInstanceState.SKIPPED
     except AirflowRescheduleException as reschedule:
         log.info("::group::Post Execute")
+        SUPERVISOR_COMMS.flush()
         log.info("Rescheduling task, marking task as UP_FOR_RESCHEDULE")
         msg = RescheduleTask(
             reschedule_date=reschedule.reschedule_date, end_date=datetime.now(tz=timezone.utc)
@@ -2409,7 +2524,9 @@ def main():
     log = structlog.get_logger(logger_name="task")
 
     global SUPERVISOR_COMMS
-    SUPERVISOR_COMMS = CommsDecoder[ToTask, ToSupervisor](log=log)
+    SUPERVISOR_COMMS = CommsDecoder[ToTask, ToSupervisor](
+        log=log, pipelined=conf.getboolean("workers", "pipeline_supervisor_requests", fallback=False)
+    )
 
     stats.initialize(
         factory=stats_utils.get_stats_factory(),
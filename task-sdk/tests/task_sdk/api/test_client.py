@@ -19,6 +19,7 @@ from __future__ import annotations
 
 import json
 import pickle
+import tempfile
 from datetime import datetime, timezone as dt_timezone
 from typing import TYPE_CHECKING
 from unittest import mock
@@ -32,7 +33,13 @@ from task_sdk import make_client, make_client_w_dry_run, make_client_w_responses
 from uuid6 import uuid7
 
 from airflow.sdk import timezone
-from airflow.sdk.api.client import Client, RemoteValidationError, ServerResponseError
+from airflow.sdk.api.client import (
+    Client,
+    RemoteValidationError,
+    ServerResponseError,
+    _SharedTransport,
+    _use_http2,
+)
 from airflow.sdk.api.datamodels._generated import (
     AssetEventsResponse,
     AssetResponse,
@@ -46,7 +53,10 @@ from airflow.sdk.api.datamodels._generated import (
     HITLUser,
     TaskStateStoreResponse,
     TerminalTIState,
+    TIBatchHeartbeatItem,
     VariableResponse,
+    XComBatchItem,
+    XComBatchResponse,
     XComResponse,
 )
 from airflow.sdk.exceptions import ErrorType, TaskAlreadyRunningError
@@ -441,6 +451,42 @@ class TestTaskInstanceOperations:
         client = make_client(transport=httpx.MockTransport(handle_request))
         client.task_instances.heartbeat(ti_id, 100)
 
+    def test_task_instance_heartbeat_batch(self):
+        # Simulate a batch heartbeat where the server rejects one of the two TIs
+        ti_id, gone_ti_id = uuid6.uuid7(), uuid6.uuid7()
+
+        def handle_request(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/task-instances/heartbeats":
+                actual_body = json.loads(request.read())
+                assert [hb["id"] for hb in actual_body["heartbeats"]] == [str(ti_id), str(gone_ti_id)]
+                assert actual_body["heartbeats"][0] == {
+                    "id": str(ti_id),
+                    "hostname": "host",
+                    "pid": 100,
+                    "token": "token-1",
+                }
+                return httpx.Response(
+                    status_code=200,
+                    json={
+                        "failures": [
+                            {"id": str(gone_ti_id), "status_code": 410, "detail": {"reason": "not_found"}}
+                        ],
+                        "refreshed_tokens": {str(ti_id): "token-1-refreshed"},
+                    },
+                )
+            return httpx.Response(status_code=400, json={"detail": "Bad Request"})
+
+        client = make_client(transport=httpx.MockTransport(handle_request))
+        result = client.task_instances.heartbeat_batch(
+            [
+                TIBatchHeartbeatItem(id=ti_id, hostname="host", pid=100, token="token-1"),
+                TIBatchHeartbeatItem(id=gone_ti_id, hostname="host", pid=101, token="token-2"),
+            ]
+        )
+
+        assert [(f.id, f.status_code) for f in result.failures] == [(gone_ti_id, 410)]
+        assert result.refreshed_tokens == {str(ti_id): "token-1-refreshed"}
+
     @pytest.mark.parametrize("queues_enabled", [False, True])
     def test_task_instance_defer(self, queues_enabled: bool):
         # Simulate a successful response from the server that defers a task
@@ -1004,6 +1050,33 @@ class TestXCOMOperations:
         assert result.key == "test_key"
         assert result.value == "test_value"
 
+    def test_xcom_get_batch(self):
+        def handle_request(request: httpx.Request) -> httpx.Response:
+            if request.method == "POST" and request.url.path == "/xcoms/dag_id/run_id":
+                assert json.loads(request.read()) == {
+                    "key": "key",
+                    "task_ids": ["task_a", "task_b"],
+                    "map_indexes": [0, 1],
+                    "include_prior_dates": False,
+                }
+                return httpx.Response(
+                    status_code=200,
+                    json={"xcoms": [{"task_id": "task_a", "map_index": 1, "value": "test_value"}]},
+                )
+            return httpx.Response(status_code=400, json={"detail": "Bad Request"})
+
+        client = make_client(transport=httpx.MockTransport(handle_request))
+        result = client.xcoms.get_batch(
+            dag_id="dag_id",
+            run_id="run_id",
+            key="key",
+            task_ids=["task_a", "task_b"],
+            map_indexes=[0, 1],
+        )
+        assert result == XComBatchResponse(
+            xcoms=[XComBatchItem(task_id="task_a", map_index=1, value="test_value")]
+        )
+
     def test_xcom_get_500_error(self):
         with time_machine.travel("2023-01-01T00:00:00Z", tick=False):
             # Simulate a successful response from the server returning a 500 error
@@ -1110,6 +1183,35 @@ class TestXCOMOperations:
         )
         assert result == OKResponse(ok=True)
 
+    def test_xcom_set_from_file_streams_the_whole_file_on_every_attempt(self):
+        bodies = []
+
+        def handle_request(request: httpx.Request) -> httpx.Response:
+            assert request.headers["content-type"] == "application/json"
+            assert request.headers["content-length"] == "13"
+            assert "transfer-encoding" not in request.headers
+            bodies.append(request.read())
+            if len(bodies) == 1:
+                return httpx.Response(status_code=500, text="Internal Server Error")
+            return httpx.Response(status_code=201, json={"message": "XCom successfully set"})
+
+        client = make_client(transport=httpx.MockTransport(handle_request))
+        with (
+            time_machine.travel("2023-01-01T00:00:00Z", tick=False),
+            tempfile.TemporaryFile() as value_file,
+        ):
+            value_file.write(b'{"key":"abc"}')
+            result = client.xcoms.set_from_file(
+                dag_id="dag_id",
+                run_id="run_id",
+                task_id="task_id",
+                key="key",
+                value_file=value_file,
+                map_index=2,
+            )
+        assert result == OKResponse(ok=True)
+        assert bodies == [b'{"key":"abc"}'] * 2
+
 
 class TestConnectionOperations:
     """
@@ -1867,6 +1969,66 @@ class TestSSLContextCaching:
         assert info.currsize == 2
 
 
+class TestSharedTransport:
+    @pytest.fixture(autouse=True)
+    def shared_connections(self):
+        _SharedTransport._instance = None
+        with mock.patch("airflow.sdk.api.client.API_SHARE_CONNECTIONS", True):
+            yield
+        _SharedTransport._instance = None
+
+    @pytest.fixture
+    def pool(self):
+        requests = []
+
+        def handle_request(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(status_code=200, json={"ok": True})
+
+        transport = mock.Mock(wraps=httpx.MockTransport(handle_request))
+        with mock.patch.object(httpx, "HTTPTransport", return_value=transport) as transport_cls:
+            yield transport_cls, transport, requests
+
+    def test_clients_share_one_pool(self, pool):
+        transport_cls, transport, requests = pool
+
+        with mock.patch("airflow.sdk.api.client.stats") as stats:
+            first = Client(base_url="http://server", token="first")
+            first.get("variables/a")
+            first.close()
+            second = Client(base_url="http://server", token="second")
+            second.get("variables/b")
+
+        transport_cls.assert_called_once()
+        assert transport_cls.call_args.kwargs["http2"] is False
+        transport.close.assert_not_called()
+        assert [r.headers["Authorization"] for r in requests] == ["Bearer first", "Bearer second"]
+        stats.incr.assert_called_once_with("execution_api_client.shared_pool_reused")
+        assert stats.timer.call_args_list == [mock.call("execution_api_client.request_duration")] * 2
+
+    def test_new_pool_after_fork(self, pool):
+        transport_cls, _, _ = pool
+
+        Client(base_url="http://server", token="parent")
+        with mock.patch("os.getpid", return_value=-1):
+            Client(base_url="http://server", token="child")
+
+        assert transport_cls.call_count == 2
+
+    @mock.patch("airflow.sdk.api.client.API_HTTP2", True)
+    def test_http2_falls_back_without_h2(self, pool):
+        transport_cls, _, _ = pool
+        _use_http2.cache_clear()
+
+        try:
+            with mock.patch.dict("sys.modules", {"h2": None}):
+                Client(base_url="http://server", token="token")
+        finally:
+            _use_http2.cache_clear()
+
+        assert transport_cls.call_args.kwargs["http2"] is False
+
+
 class TestDagsOperations:
     def test_get(self):
         """Test that the client can get a dag."""
@@ -17,6 +17,8 @@
 
 from __future__ import annotations
 
+import json
+import os
 from unittest import mock
 
 import pytest
@@ -26,13 +28,43 @@ from airflow.sdk.execution_time.comms import (
     DeleteXCom,
     GetXCom,
     GetXComSequenceSlice,
+    SetXCom,
     XComResult,
     XComSequenceSliceResult,
 )
 from airflow.sdk.types import TaskInstanceKey
 
+from tests_common.test_utils.config import conf_vars
+
 
 class TestBaseXCom:
+    def test_set_sends_small_value_inline(self, mock_supervisor_comms):
+        with conf_vars({("workers", "xcom_file_transfer_threshold"): "100"}):
+            BaseXCom.set(key="k", value=[1, 2], dag_id="d", task_id="t", run_id="r")
+
+        mock_supervisor_comms.send.assert_called_once_with(
+            SetXCom(key="k", value=[1, 2], dag_id="d", task_id="t", run_id="r", map_index=-1)
+        )
+
+    def test_set_sends_large_value_in_file(self, mock_supervisor_comms):
+        value = {"a": "ü" * 100}
+        sent = []
+
+        def send(msg, fds=()):
+            # The file is closed once send returns, so read it now
+            sent.append((msg, os.pread(fds[0], 1024, 0)))
+
+        mock_supervisor_comms.send.side_effect = send
+        with conf_vars({("workers", "xcom_file_transfer_threshold"): "10"}):
+            BaseXCom.set(key="k", value=value, dag_id="d", task_id="t", run_id="r")
+
+        [(msg, content)] = sent
+        assert msg == SetXCom(
+            key="k", value=None, dag_id="d", task_id="t", run_id="r", map_index=-1, value_in_file=True
+        )
+        assert json.loads(content) == BaseXCom.serialize_value(value)
+        assert content.decode("utf-8").startswith('{"a":"ü')
+
     @pytest.mark.parametrize(
         "map_index",
         [
@@ -16,12 +16,14 @@
 # under the License.
 from __future__ import annotations
 
-import datetime
 import multiprocessing
+import time
+from unittest import mock
 
 import pytest
 
 from airflow.sdk import SecretCache
+from airflow.sdk.execution_time import cache
 
 from tests_common.test_utils.config import conf_vars
 
@@ -105,11 +107,12 @@ class TestSecretCache:
 
         assert SecretCache.get_variable("key") == "some_value"
 
-        SecretCache._ttl = datetime.timedelta(0)  # I don't want to sleep()
-
-        # value is now seen as expired
-        with pytest.raises(SecretCache.NotPresentException):
-            SecretCache.get_variable("key")
+        # I don't want to sleep()
+        later = time.monotonic_ns() + SecretCache._ttl_ns
+        with mock.patch("airflow.sdk.execution_time.cache.time.monotonic_ns", return_value=later):
+            # value is now seen as expired
+            with pytest.raises(SecretCache.NotPresentException):
+                SecretCache.get_variable("key")
 
     @conf_vars({("secrets", "use_cache"): "0"})
     def test_disabled(self):
@@ -174,3 +177,54 @@ class TestSecretCache:
 
         with pytest.raises(SecretCache.NotPresentException):
             SecretCache.get_connection_uri("key")
+
+    def test_connection_not_found(self):
+        SecretCache.save_connection_not_found("conn", team_name="team")
+
+        with pytest.raises(SecretCache.NotFoundException):
+            SecretCache.get_connection_uri("conn", team_name="team")
+        with pytest.raises(SecretCache.NotPresentException):
+            SecretCache.get_connection_uri("conn")
+
+        SecretCache.save_connection_uri("conn", "some_value", team_name="team")
+        assert SecretCache.get_connection_uri("conn", team_name="team") == "some_value"
+
+    def test_team_names_cannot_collide_with_keys(self):
+        SecretCache.save_variable("key", "team_value", team_name="team")
+
+        with pytest.raises(SecretCache.NotPresentException):
+            SecretCache.get_variable("_team_key")
+
+    def test_value_too_large_is_not_cached(self):
+        SecretCache.save_variable("key", "x" * 4096)
+
+        with pytest.raises(SecretCache.NotPresentException):
+            SecretCache.get_variable("key")
+
+    def test_full_slots_evict_the_entry_closest_to_expiring(self):
+        SecretCache.reset()
+        with conf_vars({("secrets", "use_cache"): "true", ("secrets", "cache_max_entries"): "1"}):
+            SecretCache.init()
+
+        SecretCache.save_variable("first", "some_value")
+        SecretCache.save_variable("second", "some_other_value")
+
+        assert SecretCache.get_variable("second") == "some_other_value"
+        with pytest.raises(SecretCache.NotPresentException):
+            SecretCache.get_variable("first")
+
+    def test_slot_being_written_is_a_miss(self):
+        SecretCache.save_variable("key", "some_value")
+        index = SecretCache._probe(SecretCache._entry_name("key", SecretCache._VARIABLE_KIND, None))[0]
+        offset = index * cache._SLOT_SIZE
+
+        # what another process sees while the slot is being updated
+        cache._SLOT_SEQ.pack_into(SecretCache._cache, offset, 3)
+        with pytest.raises(SecretCache.NotPresentException):
+            SecretCache.get_variable("key")
+
+        # or if the slot was left torn, e.g. because its writer died halfway
+        cache._SLOT_SEQ.pack_into(SecretCache._cache, offset, 4)
+        SecretCache._cache[offset + cache._SLOT_HEADER.size + 10] ^= 0xFF
+        with pytest.raises(SecretCache.NotPresentException):
+            SecretCache.get_variable("key")
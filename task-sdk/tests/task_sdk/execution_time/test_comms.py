@@ -17,6 +17,8 @@
 
 from __future__ import annotations
 
+import os
+import tempfile
 import threading
 import uuid
 
@@ -25,17 +27,21 @@ import pytest
 import structlog
 
 from airflow.sdk import timezone
+from airflow.sdk.exceptions import AirflowRuntimeError, ErrorType
 from airflow.sdk.execution_time.comms import (
     BundleInfo,
     CommsDecoder,
     DeadlockImminentError,
+    ErrorResponse,
     GetVariable,
     MaskSecret,
+    SetXCom,
     StartupDetails,
     VariableResult,
     _RequestFrame,
     _ResponseFrame,
 )
+from airflow.sdk.execution_time.supervisor import length_prefixed_frame_reader
 
 
 class TestCommsModels:
@@ -152,6 +158,87 @@ class TestCommsDecoder:
         assert len(msg.value) == 10 * 1024 * 1024 + 1
         assert msg.value[-1] == "b"
 
+    def test_send_passes_fds_with_the_request(self, socket_pair):
+        r, w = socket_pair
+        decoder = CommsDecoder(socket=r, log=structlog.get_logger())
+        msg = SetXCom(key="k", value=None, dag_id="d", run_id="r", task_id="t", value_in_file=True)
+
+        requests = []
+        received_fds: list[int] = []
+
+        def handle_requests():
+            while True:
+                requests.append((yield))
+
+        read_request, _ = length_prefixed_frame_reader(
+            handle_requests(), on_close=lambda sock: None, on_fds=received_fds.extend
+        )
+
+        with tempfile.TemporaryFile() as f:
+            f.write(b'"value"')
+            f.flush()
+            t = threading.Thread(target=decoder.send, args=(msg,), kwargs={"fds": [f.fileno()]})
+            t.start()
+            try:
+                while not requests:
+                    read_request(w)
+                w.sendall(_ResponseFrame(requests[0].id).as_bytes())
+            finally:
+                t.join(2)
+
+        assert requests[0].body == msg.model_dump()
+        assert len(received_fds) == 1
+        try:
+            # The file outlives the sender closing its end
+            assert os.pread(received_fds[0], 100, 0) == b'"value"'
+        finally:
+            os.close(received_fds[0])
+
+    def test_pipelined_requests_do_not_wait_for_their_response(self, socket_pair):
+        r, w = socket_pair
+        decoder = CommsDecoder(socket=r, log=structlog.get_logger(), pipelined=True)
+        # Only the response to the last request is ever waited for
+        w.sendall(_ResponseFrame(0).as_bytes())
+        w.sendall(_ResponseFrame(1).as_bytes())
+        w.sendall(_ResponseFrame(2, {"type": "VariableResult", "key": "k", "value": "v"}).as_bytes())
+
+        assert decoder.send(SetXCom(key="a", value=1, dag_id="d", run_id="r", task_id="t")) is None
+        assert decoder.send(SetXCom(key="b", value=2, dag_id="d", run_id="r", task_id="t")) is None
+        result = decoder.send(GetVariable(key="k"))
+        decoder.flush()
+
+        assert result == VariableResult(key="k", value="v")
+        requests = []
+
+        def handle_requests():
+            while True:
+                requests.append((yield))
+
+        read_request, _ = length_prefixed_frame_reader(handle_requests(), on_close=lambda sock: None)
+        while len(requests) < 3:
+            read_request(w)
+        assert [(req.id, req.body["type"]) for req in requests] == [
+            (0, "SetXCom"),
+            (1, "SetXCom"),
+            (2, "GetVariable"),
+        ]
+
+    def test_flush_raises_the_error_of_a_pipelined_request(self, socket_pair):
+        r, w = socket_pair
+        decoder = CommsDecoder(socket=r, log=structlog.get_logger(), pipelined=True)
+        error = ErrorResponse(error=ErrorType.API_SERVER_ERROR, detail={"status_code": 500})
+        w.sendall(_ResponseFrame(0, error=error.model_dump()).as_bytes())
+        w.sendall(_ResponseFrame(1).as_bytes())
+
+        decoder.send(SetXCom(key="a", value=1, dag_id="d", run_id="r", task_id="t"))
+        decoder.send(SetXCom(key="b", value=2, dag_id="d", run_id="r", task_id="t"))
+
+        with pytest.raises(AirflowRuntimeError) as exc_info:
+            decoder.flush()
+        assert exc_info.value.error == error
+        # The error is only raised once
+        decoder.flush()
+
     def test_send_thread_safety(self, socket_pair):
         r, w = socket_pair
         decoder = CommsDecoder(socket=r, log=structlog.get_logger())
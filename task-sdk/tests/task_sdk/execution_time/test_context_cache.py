@@ -21,6 +21,7 @@ from unittest.mock import AsyncMock, MagicMock, call, patch
 import pytest
 
 from airflow.sdk.definitions.connection import Connection
+from airflow.sdk.exceptions import AirflowNotFoundException, AirflowRuntimeError
 from airflow.sdk.execution_time.cache import SecretCache
 from airflow.sdk.execution_time.comms import ConnectionResult, VariableResult
 from airflow.sdk.execution_time.context import (
@@ -117,6 +118,31 @@ class TestConnectionCacheIntegration:
         assert cached_conn.conn_type == "mysql"
         assert cached_conn.host == "host"
 
+    @patch("airflow.sdk.execution_time.supervisor.ensure_secrets_backend_loaded")
+    def test_get_connection_not_found_is_cached(self, mock_ensure_backends):
+        """Test that a connection missing from every backend is only looked up once."""
+        mock_backend = MagicMock(spec=["get_connection"])
+        mock_backend.get_connection.return_value = None
+        mock_ensure_backends.return_value = [mock_backend]
+
+        for _ in range(2):
+            with pytest.raises(AirflowNotFoundException):
+                _get_connection("missing_conn")
+
+        mock_backend.get_connection.assert_called_once_with(conn_id="missing_conn")
+
+    @patch("airflow.sdk.execution_time.supervisor.ensure_secrets_backend_loaded")
+    def test_get_connection_not_cached_as_missing_when_a_backend_fails(self, mock_ensure_backends):
+        mock_backend = MagicMock(spec=["get_connection"])
+        mock_backend.get_connection.side_effect = RuntimeError("backend unavailable")
+        mock_ensure_backends.return_value = [mock_backend]
+
+        with pytest.raises(AirflowNotFoundException):
+            _get_connection("missing_conn")
+
+        with pytest.raises(SecretCache.NotPresentException):
+            SecretCache.get_connection_uri("missing_conn")
+
     @patch("airflow.sdk.execution_time.context.mask_secret")
     def test_get_connection_masks_secrets(self, mock_mask_secret):
         """Test that connection secrets are masked from logs."""
@@ -184,6 +210,19 @@ class TestVariableCacheIntegration:
         cached_value = SecretCache.get_variable(key)
         assert cached_value == value
 
+    @patch("airflow.sdk.execution_time.supervisor.ensure_secrets_backend_loaded")
+    def test_get_variable_not_found_is_cached(self, mock_ensure_backends):
+        """Test that a variable missing from every backend is only looked up once."""
+        mock_backend = MagicMock(spec=["get_variable"])
+        mock_backend.get_variable.return_value = None
+        mock_ensure_backends.return_value = [mock_backend]
+
+        for _ in range(2):
+            with pytest.raises(AirflowRuntimeError):
+                _get_variable("missing_key", deserialize_json=False)
+
+        mock_backend.get_variable.assert_called_once_with(key="missing_key")
+
     @patch("airflow.sdk.execution_time.supervisor.ensure_secrets_backend_loaded")
     def test_get_variable_from_api_saves_to_cache(self, mock_ensure_backends, mock_supervisor_comms):
         """Test that variable from API server is saved to cache."""
@@ -0,0 +1,183 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import os
+import sys
+import textwrap
+import time
+from unittest import mock
+
+import pytest
+
+from airflow.sdk.execution_time import dag_cache
+
+pytest.importorskip("cloudpickle")
+
+DAG_FILE = """
+import datetime
+
+from airflow.providers.standard.operators.python import PythonOperator
+from airflow.sdk import DAG
+
+from {helper} import OFFSET
+
+
+def add_offset():
+    return OFFSET + 1
+
+
+with DAG("cached", schedule=None, start_date=datetime.datetime(2024, 1, 1)):
+    PythonOperator(task_id="add", python_callable=add_offset)
+"""
+
+
+@pytest.fixture
+def bundle(tmp_path, request):
+    # Each test gets its own helper module, so that none finds another's already imported
+    helper = f"helper_{request.node.name}"
+    bundle_path = tmp_path / "bundle"
+    bundle_path.mkdir()
+    (bundle_path / f"{helper}.py").write_text("OFFSET = 41\n")
+    (bundle_path / "dag.py").write_text(textwrap.dedent(DAG_FILE.format(helper=helper)))
+    yield bundle_path
+    sys.modules.pop(helper, None)
+
+
+def _parse(bundle_path):
+    from airflow.dag_processing.dagbag import BundleDagBag
+
+    bag = BundleDagBag(
+        dag_folder=bundle_path / "dag.py", safe_mode=False, load_op_links=False, bundle_path=bundle_path
+    )
+    return bag.dags
+
+
+def _entry_path(tmp_path, bundle_path):
+    return dag_cache.entry_path(str(tmp_path / "cache"), "bundle", None, str(bundle_path / "dag.py"))
+
+
+def test_store_and_load(tmp_path, bundle):
+    path = _entry_path(tmp_path, bundle)
+    dag_cache.store_dags(path, _parse(bundle), str(bundle / "dag.py"), bundle, mock.Mock())
+
+    dags = dag_cache.load_dags(path, bundle, mock.Mock())
+
+    assert dags is not None
+    task = dags["cached"].task_dict["add"]
+    assert task.dag is dags["cached"]
+    assert task.python_callable() == 42
+
+
+def test_missing_entry(tmp_path, bundle):
+    assert dag_cache.load_dags(_entry_path(tmp_path, bundle), bundle, mock.Mock()) is None
+
+
+def test_entry_path_follows_dag_file_content(tmp_path, bundle):
+    path = _entry_path(tmp_path, bundle)
+    assert _entry_path(tmp_path, bundle) == path
+    assert dag_cache.entry_path(str(tmp_path / "cache"), "bundle", "v2", str(bundle / "dag.py")) != path
+
+    (bundle / "dag.py").write_text((bundle / "dag.py").read_text() + "\n# changed\n")
+    assert _entry_path(tmp_path, bundle) != path
+
+
+def test_entry_not_used_once_bundle_module_changes(tmp_path, bundle):
+    path = _entry_path(tmp_path, bundle)
+    dag_cache.store_dags(path, _parse(bundle), str(bundle / "dag.py"), bundle, mock.Mock())
+
+    next(bundle.glob("helper_*.py")).write_text("OFFSET = 0\n")
+
+    assert dag_cache.load_dags(path, bundle, mock.Mock()) is None
+
+
+def test_unpicklable_dags_are_not_stored(tmp_path, bundle):
+    (bundle / "dag.py").write_text(
+        (bundle / "dag.py").read_text().replace("return OFFSET + 1", "return LOCK")
+        + "\nLOCK = __import__('threading').Lock()\n"
+    )
+    path = _entry_path(tmp_path, bundle)
+    log = mock.Mock()
+
+    dag_cache.store_dags(path, _parse(bundle), str(bundle / "dag.py"), bundle, log)
+
+    assert not path.exists()
+    log.info.assert_called_once()
+
+
+def test_corrupt_entry_is_ignored(tmp_path, bundle):
+    path = _entry_path(tmp_path, bundle)
+    path.parent.mkdir()
+    path.write_bytes(b"not a pickle")
+    log = mock.Mock()
+
+    assert dag_cache.load_dags(path, bundle, log) is None
+    log.warning.assert_called_once()
+
+
+def test_load_marks_entry_as_used(tmp_path, bundle):
+    path = _entry_path(tmp_path, bundle)
+    dag_cache.store_dags(path, _parse(bundle), str(bundle / "dag.py"), bundle, mock.Mock())
+    os.utime(path, (0, 0))
+
+    assert dag_cache.load_dags(path, bundle, mock.Mock()) is not None
+    assert path.stat().st_mtime > 0
+
+
+def test_prune_removes_unused_entries(tmp_path):
+    folder = tmp_path / "cache"
+    folder.mkdir()
+    old, recent, stale_tmp = folder / "old.pickle", folder / "recent.pickle", folder / "dead.tmp"
+    for path in (old, recent, stale_tmp):
+        path.write_bytes(b"")
+    for path in (old, stale_tmp):
+        os.utime(path, (time.time() - 100, time.time() - 100))
+
+    dag_cache.prune(str(folder), 50, mock.Mock())
+
+    assert sorted(p.name for p in folder.iterdir()) == [".pruned", "recent.pickle"]
+
+    # The folder was pruned just now, so it is not scanned again yet
+    os.utime(recent, (time.time() - 100, time.time() - 100))
+    dag_cache.prune(str(folder), 50, mock.Mock())
+    assert recent.exists()
+
+
+@pytest.mark.parametrize("mode", [0o770, 0o702])
+def test_check_folder_refuses_folder_writable_by_others(tmp_path, mode):
+    folder = tmp_path / "cache"
+    folder.mkdir()
+    folder.chmod(mode)
+    log = mock.Mock()
+
+    assert not dag_cache.check_folder(str(folder), log)
+    log.warning.assert_called_once()
+
+
+def test_check_folder_refuses_folder_of_other_user(tmp_path):
+    log = mock.Mock()
+
+    with mock.patch.object(os, "getuid", return_value=os.getuid() + 1):
+        assert not dag_cache.check_folder(str(tmp_path), log)
+    log.warning.assert_called_once()
+
+
+def test_check_folder_creates_private_folder(tmp_path):
+    folder = tmp_path / "cache"
+
+    assert dag_cache.check_folder(str(folder), mock.Mock())
+    assert folder.stat().st_mode & 0o777 == 0o700
@@ -0,0 +1,104 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+from uuid6 import uuid7
+
+from airflow.sdk.api.datamodels._generated import TIBatchHeartbeatResponse, TIHeartbeatFailure
+from airflow.sdk.execution_time.heartbeat import HeartbeatAggregator, HeartbeatOutcome, HeartbeatRelay
+
+
+@pytest.fixture
+def aggregator():
+    with patch("airflow.sdk.execution_time.heartbeat.Client") as client_class:
+        aggregator = HeartbeatAggregator(server="http://localhost:8080/execution/", interval=3600)
+        # Set up the client without starting the thread, to drive the aggregator from the test
+        aggregator._client = client_class.return_value
+        yield aggregator
+        aggregator.stop()
+
+
+class TestHeartbeatAggregator:
+    def test_sends_latest_heartbeat_of_each_task_in_one_batch(self, aggregator):
+        first, second = HeartbeatRelay(aggregator.connect()), HeartbeatRelay(aggregator.connect())
+        first_ti, second_ti = uuid7(), uuid7()
+        first.submit(first_ti, pid=1, token="first-old")
+        first.submit(first_ti, pid=1, token="first")
+        second.submit(second_ti, pid=2, token="second")
+        aggregator._client.task_instances.heartbeat_batch.return_value = TIBatchHeartbeatResponse(
+            failures=[TIHeartbeatFailure(id=second_ti, status_code=409, detail={"reason": "not_running"})],
+            refreshed_tokens={str(first_ti): "first-new"},
+        )
+
+        aggregator._receive(timeout=1)
+        aggregator._receive(timeout=0)
+        aggregator.flush()
+
+        (heartbeats,) = aggregator._client.task_instances.heartbeat_batch.call_args.args
+        assert [(heartbeat.id, heartbeat.pid, heartbeat.token) for heartbeat in heartbeats] == [
+            (first_ti, 1, "first"),
+            (second_ti, 2, "second"),
+        ]
+        assert first.conn.poll(1)
+        assert first.poll() == [HeartbeatOutcome(first_ti, 200, None, "first-new")]
+        assert second.conn.poll(1)
+        assert second.poll() == [HeartbeatOutcome(second_ti, 409, {"reason": "not_running"}, None)]
+
+    def test_failed_batch_fails_every_heartbeat(self, aggregator):
+        relay = HeartbeatRelay(aggregator.connect())
+        ti_id = uuid7()
+        relay.submit(ti_id, pid=1, token="token")
+        aggregator._client.task_instances.heartbeat_batch.side_effect = ConnectionError("boom")
+
+        aggregator._receive(timeout=1)
+        aggregator.flush()
+
+        assert relay.conn.poll(1)
+        assert relay.poll() == [HeartbeatOutcome(ti_id, 0, "boom")]
+        # Nothing is left to send
+        aggregator.flush()
+        aggregator._client.task_instances.heartbeat_batch.assert_called_once()
+
+    def test_drops_pipe_of_exited_supervisor(self, aggregator):
+        conn = aggregator.connect()
+        conn.close()
+
+        aggregator._receive(timeout=1)
+
+        assert aggregator._conns == []
+
+    def test_runs_in_a_thread(self):
+        with patch("airflow.sdk.execution_time.heartbeat.Client") as client_class:
+            client = client_class.return_value
+            client.task_instances.heartbeat_batch.return_value = TIBatchHeartbeatResponse(failures=[])
+            aggregator = HeartbeatAggregator(server="http://localhost:8080/execution/", interval=0.01)
+            relay = HeartbeatRelay(aggregator.connect())
+            aggregator.start()
+            try:
+                ti_id = uuid7()
+                relay.submit(ti_id, pid=1, token="token")
+                assert relay.conn.poll(5)
+                assert relay.poll() == [HeartbeatOutcome(ti_id, 200)]
+            finally:
+                aggregator.stop()
+        client.close.assert_called_once()
+        # The request carries no token of its own, only those of its heartbeats
+        client_class.assert_called_once_with(base_url="http://localhost:8080/execution/", token="")
+        assert client.task_instances.heartbeat_batch.call_args.args[0][0].token == "token"
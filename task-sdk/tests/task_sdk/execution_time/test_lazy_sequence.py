@@ -77,34 +77,53 @@ def test_iter(mock_supervisor_comms, lazy_sequence):
     it = iter(lazy_sequence)
 
     mock_supervisor_comms.send.side_effect = [
-        XComSequenceIndexResult(root="f"),
-        ErrorResponse(error=ErrorType.XCOM_NOT_FOUND, detail={"oops": "sorry!"}),
+        XComSequenceSliceResult(root=["f"]),
+        XComSequenceSliceResult(root=[]),
     ]
     assert list(it) == ["f"]
     mock_supervisor_comms.send.assert_has_calls(
         [
             call(
-                msg=GetXComSequenceItem(
+                GetXComSequenceSlice(
                     key=BaseXCom.XCOM_RETURN_KEY,
                     dag_id="dag",
                     task_id="task",
                     run_id="run",
-                    offset=0,
+                    start=0,
+                    stop=1,
+                    step=None,
                 ),
             ),
             call(
-                msg=GetXComSequenceItem(
+                GetXComSequenceSlice(
                     key=BaseXCom.XCOM_RETURN_KEY,
                     dag_id="dag",
                     task_id="task",
                     run_id="run",
-                    offset=1,
+                    start=1,
+                    stop=3,
+                    step=None,
                 ),
             ),
         ]
     )
 
 
+def test_iter_reads_ahead_in_growing_pages(mock_supervisor_comms, lazy_sequence):
+    mock_supervisor_comms.send.side_effect = [
+        XComSequenceSliceResult(root=["a"]),
+        XComSequenceSliceResult(root=["b", "c"]),
+        XComSequenceSliceResult(root=["d", "e"]),
+    ]
+    assert list(iter(lazy_sequence)) == ["a", "b", "c", "d", "e"]
+    # The last page came back short, so the end was reached without another request.
+    assert [(c.args[0].start, c.args[0].stop) for c in mock_supervisor_comms.send.call_args_list] == [
+        (0, 1),
+        (1, 3),
+        (3, 7),
+    ]
+
+
 def test_getitem_index(mock_supervisor_comms, lazy_sequence):
     mock_supervisor_comms.send.return_value = XComSequenceIndexResult(root="f")
     assert lazy_sequence[4] == "f"
@@ -16,7 +16,9 @@
 # under the License.
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+import os
+import tempfile
+from unittest.mock import ANY, MagicMock
 
 import pytest
 
@@ -34,6 +36,7 @@ from airflow.sdk.execution_time.comms import (
     GetAssetStateStoreByUri,
     SetAssetStateStoreByName,
     SetAssetStateStoreByUri,
+    SetXCom,
 )
 from airflow.sdk.execution_time.request_handlers import (
     handle_clear_asset_state_store_by_name,
@@ -44,6 +47,7 @@ from airflow.sdk.execution_time.request_handlers import (
     handle_get_asset_state_store_by_uri,
     handle_set_asset_state_store_by_name,
     handle_set_asset_state_store_by_uri,
+    handle_set_xcom,
 )
 
 
@@ -165,3 +169,45 @@ def test_asset_store_delegates_to_client(client, handler, msg, call_kwargs, meth
     getattr(client.asset_state_store, method).assert_called_once_with(**call_kwargs)
     assert result is None
     assert dump_opts == {}
+
+
+def _set_xcom_in_file():
+    return SetXCom(key="k", value=None, dag_id="d", run_id="r", task_id="t", value_in_file=True)
+
+
+def test_set_xcom_streams_value_from_passed_file(client):
+    uploaded = []
+    client.xcoms.set_from_file.side_effect = lambda *args, **kwargs: uploaded.append(args[4].read())
+
+    with tempfile.TemporaryFile() as f:
+        f.write(b'{"a":1}')
+        f.seek(0)
+        fds = [os.dup(f.fileno())]
+        result, dump_opts = handle_set_xcom(client, _set_xcom_in_file(), fds)
+
+    client.xcoms.set_from_file.assert_called_once_with(
+        "d", "r", "t", "k", ANY, None, dag_result=False, mapped_length=None
+    )
+    client.xcoms.set.assert_not_called()
+    assert uploaded == [b'{"a":1}']
+    assert (result, dump_opts) == (None, {})
+    # The handler took ownership of the fd and closed it
+    assert fds == []
+
+
+def test_set_xcom_rejects_value_in_a_pipe(client):
+    r, w = os.pipe()
+    os.close(w)
+    fds = [r]
+
+    with pytest.raises(ValueError, match="regular file"):
+        handle_set_xcom(client, _set_xcom_in_file(), fds)
+
+    client.xcoms.set_from_file.assert_not_called()
+    with pytest.raises(OSError, match="Bad file descriptor"):
+        os.fstat(r)
+
+
+def test_set_xcom_in_file_without_fd_fails(client):
+    with pytest.raises(ValueError, match="no file was passed"):
+        handle_set_xcom(client, _set_xcom_in_file(), [])
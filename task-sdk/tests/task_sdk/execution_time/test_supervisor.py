@@ -20,6 +20,7 @@ from __future__ import annotations
 import inspect
 import json
 import logging
+import multiprocessing
 import os
 import re
 import selectors
@@ -27,11 +28,13 @@ import signal
 import socket
 import subprocess
 import sys
+import threading
 import time
 from contextlib import nullcontext
 from dataclasses import dataclass, field
 from datetime import datetime, timezone as dt_timezone
 from operator import attrgetter
+from pathlib import Path
 from random import randint
 from textwrap import dedent
 from time import sleep
@@ -67,6 +70,7 @@ from airflow.sdk.api.datamodels._generated import (
     PreviousTIResponse,
     TaskInstance,
     TaskInstanceState,
+    XComBatchItem,
 )
 from airflow.sdk.exceptions import AirflowRuntimeError, ErrorType, TaskAlreadyRunningError
 from airflow.sdk.execution_time import supervisor, task_runner
@@ -117,6 +121,7 @@ from airflow.sdk.execution_time.comms import (
     GetVariable,
     GetVariableKeys,
     GetXCom,
+    GetXComBatch,
     GetXComCount,
     GetXComSequenceItem,
     GetXComSequenceSlice,
@@ -152,6 +157,7 @@ from airflow.sdk.execution_time.comms import (
     ValidateInletsAndOutlets,
     VariableKeysResult,
     VariableResult,
+    XComBatchResult,
     XComCountResponse,
     XComResult,
     XComSequenceIndexResult,
@@ -159,6 +165,7 @@ from airflow.sdk.execution_time.comms import (
     _RequestFrame,
     _ResponseFrame,
 )
+from airflow.sdk.execution_time.heartbeat import HeartbeatOutcome, HeartbeatRelay
 from airflow.sdk.execution_time.supervisor import (
     SERVER_TERMINATED,
     ActivitySubprocess,
@@ -166,6 +173,7 @@ from airflow.sdk.execution_time.supervisor import (
     InProcessTestSupervisor,
     ProcessTracker,
     WatchedSubprocess,
+    _ConnectionVariableCache,
     _make_process_nondumpable,
     _remote_logging_conn,
     in_process_api_server,
@@ -264,6 +272,32 @@ class TestSupervisor:
             with expectation:
                 supervise_task(**kw)
 
+    def test_supervise_initializes_stats(self, mocker, monkeypatch):
+        """Stats are set up once per supervised task, not by each user of them."""
+        mock_initialize = mocker.patch("airflow.sdk.execution_time.supervisor.stats.initialize")
+        monkeypatch.setattr("airflow.sdk.execution_time.supervisor.CONNECTION_VARIABLE_CACHE_TTL", 10)
+        ti = TaskInstance(
+            id=uuid7(),
+            task_id="a",
+            dag_id="b",
+            run_id="c",
+            try_number=1,
+            dag_version_id=uuid7(),
+        )
+
+        with pytest.raises(ValueError, match="dag_path is required"):
+            supervise_task(
+                ti=ti,
+                dag_rel_path="",
+                token="",
+                bundle_info=BundleInfo(name="my-bundle", version=None),
+                client=MagicMock(spec=sdk_client.Client),
+            )
+        mock_initialize.assert_called_once()
+
+        assert _ConnectionVariableCache.from_config() is not None
+        mock_initialize.assert_called_once()
+
 
 @pytest.mark.usefixtures("disable_capturing")
 class TestWatchedSubprocess:
@@ -1078,6 +1112,48 @@ class TestWatchedSubprocess:
             "loc": mocker.ANY,
         } in captured_logs
 
+    def test_heartbeat_through_relay(self, monkeypatch, mocker):
+        """With a heartbeat relay, heartbeats go through the executor and their outcomes come back later."""
+        monkeypatch.setattr("airflow.sdk.execution_time.supervisor.MIN_HEARTBEAT_INTERVAL", 0)
+        ours, theirs = multiprocessing.Pipe()
+        monkeypatch.setattr(
+            "airflow.sdk.execution_time.supervisor.get_heartbeat_relay", lambda: HeartbeatRelay(theirs)
+        )
+        client = mocker.Mock(auth=sdk_client.BearerAuth("token"))
+        proc = ActivitySubprocess(
+            process_log=mocker.MagicMock(),
+            id=TI_ID,
+            pid=12345,
+            stdin=mocker.MagicMock(),
+            client=client,
+            process=mocker.Mock(pid=12345),
+        )
+
+        proc._send_heartbeat_if_needed()
+        client.task_instances.heartbeat.assert_not_called()
+        assert ours.recv() == (TI_ID, mocker.ANY, 12345, "token")
+
+        # An outcome for a task supervised before by this process is ignored
+        ours.send(HeartbeatOutcome(uuid7(), 404))
+        ours.send(HeartbeatOutcome(TI_ID, 200, refreshed_token="new-token"))
+        proc.failed_heartbeats = 1
+        proc._send_heartbeat_if_needed()
+        assert proc.failed_heartbeats == 0
+        assert proc._terminal_state is None
+        assert client.auth.token == "new-token"
+        assert ours.recv() == (TI_ID, mocker.ANY, 12345, "new-token")
+
+        # A heartbeat left without an outcome counts as failed
+        proc._send_heartbeat_if_needed()
+        assert proc.failed_heartbeats == 1
+        ours.recv()
+
+        mock_kill = mocker.patch("airflow.sdk.execution_time.supervisor.WatchedSubprocess.kill")
+        ours.send(HeartbeatOutcome(TI_ID, 409, {"reason": "not_running"}))
+        proc._send_heartbeat_if_needed()
+        mock_kill.assert_called_once_with(signal.SIGTERM, force=True)
+        assert proc._terminal_state == SERVER_TERMINATED
+
     @pytest.mark.parametrize(
         ("terminal_state", "task_end_time_monotonic", "overtime_threshold", "expected_kill"),
         [
@@ -3094,6 +3170,21 @@ REQUEST_TEST_CASES = [
         ),
         test_id="get_xcom_count",
     ),
+    RequestTestCase(
+        message=GetXComBatch(
+            key="test_key", dag_id="test_dag", run_id="test_run", task_ids=["test_task"], map_indexes=[0, 1]
+        ),
+        expected_body={
+            "xcoms": [{"task_id": "test_task", "map_index": 0, "value": "a"}],
+            "type": "XComBatchResult",
+        },
+        client_mock=ClientMock(
+            method_path="xcoms.get_batch",
+            args=("test_dag", "test_run", "test_key", ["test_task"], [0, 1], False),
+            response=XComBatchResult(xcoms=[XComBatchItem(task_id="test_task", map_index=0, value="a")]),
+        ),
+        test_id="get_xcom_batch",
+    ),
     RequestTestCase(
         message=ResendLoggingFD(),
         expected_body={"fds": mock.ANY, "type": "SentFDs"},
@@ -3413,6 +3504,43 @@ class TestHandleRequest:
             decoder = CommsDecoder(socket=None).body_decoder  # type: ignore[var-annotated, arg-type]
             assert decoder.validate_python(frame.body) == client_mock.response
 
+    @patch("airflow.sdk.execution_time.request_handlers.mask_secret")
+    def test_connection_variable_cache(self, mock_mask_secret, mocker, monkeypatch):
+        monkeypatch.setattr(supervisor, "CONNECTION_VARIABLE_CACHE_TTL", 30)
+        read_end, write_end = socket.socketpair()
+        proc = ActivitySubprocess(
+            process_log=mocker.MagicMock(),
+            id=TI_ID,
+            pid=12345,
+            stdin=write_end,
+            client=mocker.Mock(),
+            process=mocker.Mock(),
+        )
+        proc.client.variables.get.return_value = VariableResult(key="test_key", value="test_value")
+        proc.client.connections.get.return_value = ErrorResponse(error=ErrorType.CONNECTION_NOT_FOUND)
+
+        for _ in range(2):
+            proc._handle_request(GetVariable(key="test_key"), log=mocker.Mock(), req_id=1)
+            proc._handle_request(GetConnection(conn_id="test_conn"), log=mocker.Mock(), req_id=1)
+
+        proc.client.variables.get.assert_called_once_with("test_key")
+        # Errors are not cached
+        assert proc.client.connections.get.call_count == 2
+
+        # Variables set by the task are fetched again
+        proc._handle_request(
+            PutVariable(key="test_key", value="new_value", description=None), log=mocker.Mock(), req_id=1
+        )
+        proc._handle_request(GetVariable(key="test_key"), log=mocker.Mock(), req_id=1)
+        assert proc.client.variables.get.call_count == 2
+
+        # So are expired ones
+        with patch.object(supervisor.time, "monotonic", return_value=time.monotonic() + 30):
+            proc._handle_request(GetVariable(key="test_key"), log=mocker.Mock(), req_id=1)
+        assert proc.client.variables.get.call_count == 3
+        read_end.close()
+        write_end.close()
+
     def test_all_to_supervisor_messages_are_covered(self):
         """Ensure all ToSupervisor message types have test coverage."""
 
@@ -4503,6 +4631,87 @@ class TestResolveChildTarget:
             supervisor.WatchedSubprocess.start(target=lambda: None, use_exec=True)
 
 
+class TestPreloadTaskModules:
+    def test_imports_task_runner_and_configured_modules(self, mocker):
+        mocker.patch.object(supervisor, "_should_use_exec", return_value=False)
+        mocker.patch.object(supervisor.conf, "get", return_value="json, not.a.module,")
+        import_module = mocker.patch.object(
+            supervisor.importlib, "import_module", side_effect=[None, None, ImportError("nope")]
+        )
+
+        # A module that fails to import is logged and does not stop the others
+        supervisor.preload_task_modules()
+
+        assert [call.args[0] for call in import_module.call_args_list] == [
+            "airflow.sdk.execution_time.task_runner",
+            "json",
+            "not.a.module",
+        ]
+
+    def test_does_nothing_when_children_exec(self, mocker):
+        mocker.patch.object(supervisor, "_should_use_exec", return_value=True)
+        import_module = mocker.patch.object(supervisor.importlib, "import_module")
+
+        supervisor.preload_task_modules()
+
+        import_module.assert_not_called()
+
+
+class TestRemoteLogUploader:
+    @pytest.fixture
+    def uploader(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(supervisor, "REMOTE_LOG_UPLOAD_CHUNK_SIZE", 1)
+        monkeypatch.setattr(supervisor, "_remote_logging_conn", lambda client: nullcontext())
+        local_path = tmp_path / "1.log"
+        local_path.write_bytes(b"")
+        handler = mock.Mock(spec=["append", "upload", "read", "processors"])
+        uploader = supervisor._RemoteLogUploader(
+            handler=handler, relative_path="1.log", local_path=str(local_path), client=mock.Mock(), ti=None
+        )
+        yield uploader
+        uploader.close()
+
+    def test_uploads_lines_and_keeps_those_written_meanwhile(self, uploader):
+        release = threading.Event()
+
+        def append(path, lines, ti):
+            release.wait(5)
+            return True
+
+        uploader.handler.append.side_effect = append
+        with open(uploader.local_path, "ab") as f:
+            f.write(b"first\n")
+            f.flush()
+            uploader.maybe_upload()
+            # Written while the first line is being uploaded
+            f.write(b"second\n")
+            f.flush()
+            release.set()
+            uploader.close()
+            f.write(b"third\n")
+
+        uploader.handler.append.assert_called_once_with("1.log", "first\n", None)
+        assert Path(uploader.local_path).read_bytes() == b"second\nthird\n"
+
+    def test_failed_upload_keeps_lines(self, uploader):
+        uploader.handler.append.return_value = False
+        Path(uploader.local_path).write_bytes(b"first\n")
+
+        uploader.maybe_upload()
+        uploader.close()
+
+        assert Path(uploader.local_path).read_bytes() == b"first\n"
+
+    def test_disabled_without_append_support(self, monkeypatch, mocker):
+        monkeypatch.setattr(supervisor, "REMOTE_LOG_UPLOAD_INTERVAL", 30)
+        mocker.patch(
+            "airflow.sdk.log.load_remote_log_handler",
+            return_value=mock.Mock(spec=["upload", "read", "processors"]),
+        )
+
+        assert supervisor._RemoteLogUploader.from_logger(mock.Mock(), mock.Mock(), None) is None
+
+
 @pytest.mark.usefixtures("disable_capturing")
 class TestChildExecMain:
     """Test the macOS fork+exec child entry point."""
@@ -74,6 +74,7 @@ from airflow.sdk.api.datamodels._generated import (
     TaskInstance,
     TaskInstanceState,
     TIRunContext,
+    XComBatchItem,
 )
 from airflow.sdk.bases.operator import ExecutorSafeguard
 from airflow.sdk.bases.xcom import BaseXCom
@@ -132,6 +133,7 @@ from airflow.sdk.execution_time.comms import (
     GetTICount,
     GetVariable,
     GetXCom,
+    GetXComBatch,
     GetXComSequenceSlice,
     InactiveAssetsResult,
     MaskSecret,
@@ -156,6 +158,7 @@ from airflow.sdk.execution_time.comms import (
     TriggerDagRun,
     ValidateInletsAndOutlets,
     VariableResult,
+    XComBatchResult,
     XComResult,
     XComSequenceSliceResult,
 )
@@ -254,6 +257,77 @@ def test_parse(test_dags_dir: Path, make_ti_context):
     assert ti.task.dag
 
 
+def test_parse_uses_parsed_dag_cache(test_dags_dir: Path, make_ti_context, tmp_path):
+    """The DAGs parsed by a task are stored in the cache, and loaded from there by the next task."""
+    what = StartupDetails(
+        ti=TaskInstance(
+            id=uuid7(),
+            task_id="a",
+            dag_id="super_basic",
+            run_id="c",
+            try_number=1,
+            dag_version_id=uuid7(),
+            queue="default",
+        ),
+        dag_rel_path="super_basic.py",
+        bundle_info=BundleInfo(name="my-bundle", version=None),
+        ti_context=make_ti_context(),
+        start_date=timezone.utcnow(),
+        sentry_integration="",
+    )
+
+    with patch.dict(
+        os.environ,
+        {
+            "AIRFLOW__DAG_PROCESSOR__DAG_BUNDLE_CONFIG_LIST": json.dumps(
+                [
+                    {
+                        "name": "my-bundle",
+                        "classpath": "airflow.dag_processing.bundles.local.LocalDagBundle",
+                        "kwargs": {"path": str(test_dags_dir), "refresh_interval": 1},
+                    }
+                ]
+            ),
+            "AIRFLOW__WORKERS__PARSED_DAG_CACHE_FOLDER": str(tmp_path),
+            "AIRFLOW__WORKERS__PARSED_DAG_CACHE_BUNDLES": "other-bundle, my-bundle",
+        },
+    ):
+        first_log = mock.Mock()
+        parse(what, first_log)
+        assert len(list(tmp_path.glob("*.pickle"))) == 1
+
+        second_log = mock.Mock()
+        with mock.patch("airflow.dag_processing.dagbag.BundleDagBag") as mock_dagbag:
+            ti = parse(what, second_log)
+        mock_dagbag.assert_not_called()
+
+    assert ti.task.task_id == "a"
+    assert ti.task.dag.dag_id == "super_basic"
+    assert first_log.info.call_args.kwargs["dags_from_cache"] is False
+    assert second_log.info.call_args.kwargs["dags_from_cache"] is True
+
+    # Bundles not listed are not cached
+    with patch.dict(
+        os.environ,
+        {
+            "AIRFLOW__DAG_PROCESSOR__DAG_BUNDLE_CONFIG_LIST": json.dumps(
+                [
+                    {
+                        "name": "my-bundle",
+                        "classpath": "airflow.dag_processing.bundles.local.LocalDagBundle",
+                        "kwargs": {"path": str(test_dags_dir), "refresh_interval": 1},
+                    }
+                ]
+            ),
+            "AIRFLOW__WORKERS__PARSED_DAG_CACHE_FOLDER": str(tmp_path),
+            "AIRFLOW__WORKERS__PARSED_DAG_CACHE_BUNDLES": "other-bundle",
+        },
+    ):
+        third_log = mock.Mock()
+        parse(what, third_log)
+    assert third_log.info.call_args.kwargs["dags_from_cache"] is False
+
+
 @mock.patch("airflow.dag_processing.dagbag.BundleDagBag")
 def test_parse_dag_bag(mock_dagbag, test_dags_dir: Path, make_ti_context):
     """Test that checks that the BundleDagBag is constructed as expected during parsing"""
@@ -1361,6 +1435,53 @@ def test_run_raises_base_exception(time_machine, create_runtime_ti, mock_supervi
     )
 
 
+def test_run_fails_when_a_pipelined_request_failed(create_runtime_ti, mock_supervisor_comms):
+    """Test that a task whose XCom push failed without it waiting for the response fails."""
+
+    task = PythonOperator(task_id="push", python_callable=lambda: "value")
+    ti = create_runtime_ti(dag_id="pipelined_request_failed", task=task)
+    mock_supervisor_comms.flush.side_effect = AirflowRuntimeError(
+        ErrorResponse(error=ErrorType.API_SERVER_ERROR, detail={"status_code": 500})
+    )
+
+    run(ti, context=ti.get_template_context(), log=mock.MagicMock())
+
+    mock_supervisor_comms.flush.assert_called_once_with()
+    assert ti.state == TaskInstanceState.FAILED
+
+
+@pytest.mark.parametrize(
+    "exception",
+    [
+        pytest.param(AirflowSkipException(), id="skip"),
+        pytest.param(AirflowRescheduleException(reschedule_date=timezone.utcnow()), id="reschedule"),
+        pytest.param(
+            TaskDeferred(trigger=DateTimeTrigger(moment=timezone.datetime(2024, 11, 22)), method_name="exit"),
+            id="defer",
+        ),
+    ],
+)
+def test_run_fails_when_a_pipelined_request_failed_before_state_change(
+    exception, create_runtime_ti, mock_supervisor_comms
+):
+    """Test that a pipelined request failure is raised before a task outcome other than success is reported."""
+
+    def execute(context):
+        raise exception
+
+    task = PythonOperator(task_id="push", python_callable=execute)
+    task.execute = execute
+    ti = create_runtime_ti(dag_id="pipelined_request_failed", task=task)
+    mock_supervisor_comms.flush.side_effect = AirflowRuntimeError(
+        ErrorResponse(error=ErrorType.API_SERVER_ERROR, detail={"status_code": 500})
+    )
+
+    run(ti, context=ti.get_template_context(), log=mock.MagicMock())
+
+    mock_supervisor_comms.flush.assert_called_once_with()
+    assert ti.state == TaskInstanceState.FAILED
+
+
 def test_run_raises_system_exit(time_machine, create_runtime_ti, mock_supervisor_comms):
     """Test running a basic task that exits with SystemExit exception."""
 
@@ -1599,6 +1720,7 @@ def test_startup_and_run_dag_with_rtif(
     run(*startup(get_startup_details()))
     expected_calls = [
         mock.call.send(SetRenderedFields(rendered_fields=expected_rendered_fields)),
+        mock.call.flush(),
         mock.call.send(
             msg=SucceedTask(
                 end_date=instant,
@@ -2580,6 +2702,14 @@ class TestRuntimeTaskInstance:
             print(f"{args=}, {kwargs=}, {msg=}")
             if isinstance(msg, GetXComSequenceSlice):
                 return XComSequenceSliceResult(root=[ser_value])
+            if isinstance(msg, GetXComBatch):
+                return XComBatchResult(
+                    xcoms=[
+                        XComBatchItem(task_id=t_id, map_index=m_idx, value=ser_value)
+                        for t_id in msg.task_ids
+                        for m_idx in (msg.map_indexes if msg.map_indexes is not None else [-1])
+                    ]
+                )
             return XComResult(key="key", value=ser_value)
 
         mock_supervisor_comms.send.side_effect = mock_send_side_effect
@@ -2593,10 +2723,42 @@ class TestRuntimeTaskInstance:
         if not isinstance(map_indexes, Iterable):
             map_indexes = [map_indexes]
 
-        for task_id_raw in task_ids:
-            # Without task_ids (or None) expected behavior is to pull with calling task_id
-            task_id = task_id_raw if is_arg_set(task_id_raw) and task_id_raw is not None else test_task_id
+        # Without task_ids (or None) expected behavior is to pull with calling task_id
+        task_ids = [
+            task_id_raw if is_arg_set(task_id_raw) and task_id_raw is not None else test_task_id
+            for task_id_raw in task_ids
+        ]
+
+        if NOTSET not in map_indexes and len(task_ids) * len(map_indexes) > 1:
+            # Several XComs are pulled together in a single request
+            mock_supervisor_comms.send.assert_any_call(
+                msg=GetXComBatch(
+                    key="key",
+                    dag_id="test_dag",
+                    run_id="test_run",
+                    task_ids=task_ids,
+                    map_indexes=[-1 if map_index is None else map_index for map_index in map_indexes],
+                ),
+            )
+            assert not any(
+                isinstance(c.kwargs.get("msg"), GetXCom) for c in mock_supervisor_comms.send.call_args_list
+            )
+            return
+
+        if NOTSET in map_indexes and len(task_ids) > 1:
+            # All the map indexes of several tasks are pulled together in a single request
+            mock_supervisor_comms.send.assert_any_call(
+                msg=GetXComBatch(
+                    key="key", dag_id="test_dag", run_id="test_run", task_ids=task_ids, map_indexes=None
+                ),
+            )
+            assert not any(
+                isinstance(c.kwargs.get("msg"), GetXComSequenceSlice)
+                for c in mock_supervisor_comms.send.call_args_list
+            )
+            return
 
+        for task_id in task_ids:
             for map_index in map_indexes:
                 if map_index == NOTSET:
                     mock_supervisor_comms.send.assert_any_call(
@@ -2772,6 +2934,58 @@ class TestRuntimeTaskInstance:
             ),
         )
 
+    def test_xcom_pull_all_map_indexes_of_several_tasks_in_one_request(
+        self, create_runtime_ti, mock_supervisor_comms
+    ):
+        """Test xcom_pull fetches all the map indexes of several tasks in one request."""
+        task = BaseOperator(task_id="pull_task")
+        runtime_ti = create_runtime_ti(task=task)
+
+        mock_supervisor_comms.send.return_value = XComBatchResult(
+            xcoms=[
+                XComBatchItem(task_id="task_a", map_index=0, value=BaseXCom.serialize_value("a0")),
+                XComBatchItem(task_id="task_a", map_index=1, value=BaseXCom.serialize_value("a1")),
+                XComBatchItem(task_id="task_c", map_index=-1, value=BaseXCom.serialize_value("c")),
+            ]
+        )
+        result = runtime_ti.xcom_pull(key="key", task_ids=["task_c", "task_b", "task_a"])
+
+        # Like pulling the tasks one by one, a task without XComs gives None
+        assert result == ["c", None, "a0", "a1"]
+        mock_supervisor_comms.send.assert_called_once_with(
+            GetXComBatch(
+                key="key",
+                dag_id=runtime_ti.dag_id,
+                run_id=runtime_ti.run_id,
+                task_ids=["task_c", "task_b", "task_a"],
+                map_indexes=None,
+            ),
+        )
+
+    def test_xcom_pull_multiple_map_indexes_in_one_request(self, create_runtime_ti, mock_supervisor_comms):
+        """Test xcom_pull fetches several XComs in one request, using the default for missing values."""
+        task = BaseOperator(task_id="pull_task")
+        runtime_ti = create_runtime_ti(task=task)
+
+        mock_supervisor_comms.send.return_value = XComBatchResult(
+            xcoms=[
+                XComBatchItem(task_id="task_a", map_index=0, value=BaseXCom.serialize_value("a0")),
+                XComBatchItem(task_id="task_a", map_index=2, value=BaseXCom.serialize_value("a2")),
+            ]
+        )
+        result = runtime_ti.xcom_pull(key="key", task_ids="task_a", map_indexes=[0, 1, 2], default="missing")
+
+        assert result == ["a0", "missing", "a2"]
+        mock_supervisor_comms.send.assert_called_once_with(
+            GetXComBatch(
+                key="key",
+                dag_id=runtime_ti.dag_id,
+                run_id=runtime_ti.run_id,
+                task_ids=["task_a"],
+                map_indexes=[0, 1, 2],
+            ),
+        )
+
     def test_get_param_from_context(
         self, mocked_parse, make_ti_context, mock_supervisor_comms, create_runtime_ti
     ):
@@ -5553,6 +5767,8 @@ class TestTriggerDagRunOperator:
                     map_index=-1,
                 ),
             ),
+            # Pipelined sends are drained before the Dag run is triggered
+            mock.call.flush(),
             mock.call.send(
                 msg=TriggerDagRun(
                     dag_id="test_dag",